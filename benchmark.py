@@ -0,0 +1,307 @@
+# 역할 정의. 카드 DB 적재, 게임 생성, 무작위 게임 처리량, 효과 해결 시간, 게임당 메모리를 측정하고 기준 결과와 비교하여 성능 회귀를 검출하는 벤치마크 스크립트입니다.
+
+import os
+import sys
+import gc
+import json
+import time
+import platform
+import tracemalloc
+from typing import Dict, Any, List, Optional, Tuple
+
+# 절대 경로 설정을 위해 작업 디렉토리를 참조합니다.
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import src.common.card_data as card_data
+from src.common.logger import configure_logging
+from fuzz_runner import create_fuzz_game, play_fuzz_game, game_time_limit, FuzzGameTimeout
+
+CARD_DB_PATH = 'card_database/3_parsed_database/card_database_parsed.json'
+LAZY_LOAD_SECTIONS = ("LEGENDS_RISE_CARD_DATABASE",)  # 지연 적재 측정에서 바로 만들 세트입니다. 나머지 세트는 참조될 때 만듭니다.
+DEFAULT_THRESHOLD = 0.2  # 기준 대비 이 비율 이상 나빠지면 회귀로 판정합니다.
+
+# 회귀 판정에 사용하는 지표와 방향입니다. True면 값이 클수록 좋은 지표입니다.
+TRACKED_METRICS = {
+    "card_db_load_json_ms": False,
+    "card_db_load_snapshot_ms": False,
+    "card_db_load_lazy_ms": False,
+    "game_construction_ms": False,
+    "random_games_per_sec": True,
+    "peak_memory_per_game_kb": False,
+}
+
+# 비율과 관계없이 기준보다 하나라도 늘면 회귀로 판정하는 횟수 지표입니다.
+# 오류나 시간 초과로 끝난 게임이 늘어난 변경은 처리량이 좋아 보여도 통과시키지 않습니다.
+TRACKED_COUNTS = ("random_games_errors", "random_games_timeouts")
+
+GAME_TIMEOUT = "timeout"  # 시간 제한에 걸려 중단된 게임의 결과입니다.
+
+
+def _clear_card_databases():
+    """전역 카드 데이터베이스와 한글명 매핑을 비워 적재를 처음부터 다시 측정할 수 있게 합니다."""
+    for db in (card_data.BASIC_CARD_DATABASE, card_data.LEGENDS_RISE_CARD_DATABASE, card_data.TOKEN_CARD_DATABASE):
+        db.clear()
+    card_data.KOR_NAME_MAP.clear()
+
+
+def _all_cards() -> Dict[str, Any]:
+    """랜덤 덱 생성에 사용하는 카드 풀을 반환합니다."""
+    return {**card_data.BASIC_CARD_DATABASE, **card_data.LEGENDS_RISE_CARD_DATABASE}
+
+
+def measure_card_db_load(repeats: int = 3) -> Dict[str, float]:
+    """카드 DB 적재 시간을 JSON 원본 변환, 컴파일된 스냅샷 적재, 단일 세트 지연 적재로 나누어 측정합니다. 반복 중 최솟값을 밀리초로 반환합니다."""
+    results = {}
+    load_modes = (
+        ("card_db_load_json_ms", {"use_snapshot": False}),
+        ("card_db_load_snapshot_ms", {"use_snapshot": True}),
+        ("card_db_load_lazy_ms", {"sections": LAZY_LOAD_SECTIONS}),
+    )
+    for key, load_kwargs in load_modes:
+        if load_kwargs.get("use_snapshot"):
+            # 스냅샷이 없거나 오래된 경우를 대비해 한 번 적재하여 스냅샷을 준비합니다.
+            _clear_card_databases()
+            card_data.load_card_databases(CARD_DB_PATH)
+        timings = []
+        for _ in range(repeats):
+            _clear_card_databases()
+            start = time.perf_counter()
+            card_data.load_card_databases(CARD_DB_PATH, **load_kwargs)
+            timings.append((time.perf_counter() - start) * 1000)
+        results[key] = min(timings)
+    # 이후 측정은 전체 카드 풀을 쓰므로 즉시 적재로 되돌립니다.
+    _clear_card_databases()
+    card_data.load_card_databases(CARD_DB_PATH)
+    return results
+
+
+def measure_game_construction(seeds: List[int]) -> Dict[str, float]:
+    """시드별 랜덤 덱 게임 인스턴스 생성 시간의 평균을 밀리초로 측정합니다."""
+    all_cards = _all_cards()
+    start = time.perf_counter()
+    for seed in seeds:
+        create_fuzz_game(all_cards, seed)
+    elapsed = time.perf_counter() - start
+    return {"game_construction_ms": elapsed * 1000 / len(seeds)}
+
+
+def _instrument_resolve_effect(game, stats: Dict[str, Dict[str, float]]):
+    """게임의 EffectProcessor.resolve_effect를 감싸 첫 프로세스 타입별 호출 수와 자체 실행 시간을 누적합니다.
+    효과 안에서 다른 효과가 연쇄 해결되면 그 시간은 바깥 효과에서 빼서 중복 집계하지 않습니다."""
+    effect_processor = game.effect_processor
+    original = effect_processor.resolve_effect
+    child_time_stack = []
+
+    def timed_resolve_effect(effect_data, caster_id, game_state_manager, target_id):
+        processes = getattr(effect_data, "processes", None) or []
+        process_type = getattr(processes[0], "process", None) if processes else None
+        key = process_type.name if process_type is not None else "NONE"
+        child_time_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(effect_data, caster_id, game_state_manager, target_id)
+        finally:
+            elapsed = time.perf_counter() - start
+            own_time = elapsed - child_time_stack.pop()
+            if child_time_stack:
+                child_time_stack[-1] += elapsed
+            entry = stats.setdefault(key, {"calls": 0, "total_ms": 0.0})
+            entry["calls"] += 1
+            entry["total_ms"] += own_time * 1000
+
+    effect_processor.resolve_effect = timed_resolve_effect
+
+
+def _play_one(game, max_turns: int, game_timeout: Optional[int]) -> Optional[str]:
+    """게임 하나를 진행하고 정상 종료면 None, 시간 제한에 걸리면 GAME_TIMEOUT, 오류가 나면 예외 타입 이름을 반환합니다."""
+    try:
+        with game_time_limit(game_timeout):
+            play_fuzz_game(game, max_turns)
+    except FuzzGameTimeout:
+        return GAME_TIMEOUT
+    except Exception as e:
+        return type(e).__name__
+    return None
+
+
+def measure_random_games(seeds: List[int], max_turns: int = 20, game_timeout: Optional[int] = 30) -> Tuple[Dict[str, float], Dict[str, Dict[str, float]], Dict[str, int]]:
+    """fuzz_runner의 행동 생성기로 무작위 게임을 진행하여 초당 게임 수와 프로세스 타입별 resolve_effect 시간을 측정합니다.
+    게임 생성 시간은 처리량에서 제외합니다. 처리량과 resolve_effect 시간은 정상 종료한 게임만으로 계산하여
+    시간 제한까지 멈춰 있던 게임이나 일찍 오류로 끝난 게임이 측정을 왜곡하지 않게 하고,
+    오류와 시간 초과는 따로 세어 결과 유형별 발생 횟수와 함께 반환합니다."""
+    all_cards = _all_cards()
+    resolve_stats: Dict[str, Dict[str, float]] = {}
+    errors: Dict[str, int] = {}
+    play_time = 0.0
+    completed = 0
+    for seed in seeds:
+        game = create_fuzz_game(all_cards, seed)
+        game_stats: Dict[str, Dict[str, float]] = {}
+        _instrument_resolve_effect(game, game_stats)
+        start = time.perf_counter()
+        error = _play_one(game, max_turns, game_timeout)
+        elapsed = time.perf_counter() - start
+        if error:
+            errors[error] = errors.get(error, 0) + 1
+            continue
+        completed += 1
+        play_time += elapsed
+        for key, entry in game_stats.items():
+            total = resolve_stats.setdefault(key, {"calls": 0, "total_ms": 0.0})
+            total["calls"] += entry["calls"]
+            total["total_ms"] += entry["total_ms"]
+
+    for entry in resolve_stats.values():
+        entry["mean_us"] = entry["total_ms"] * 1000 / entry["calls"]
+    timeouts = errors.get(GAME_TIMEOUT, 0)
+    metrics = {
+        "random_games_per_sec": completed / play_time if play_time > 0 else 0.0,
+        "random_games_completed": completed,
+        "random_games_errors": sum(errors.values()) - timeouts,
+        "random_games_timeouts": timeouts,
+    }
+    return metrics, dict(sorted(resolve_stats.items(), key=lambda item: -item[1]["total_ms"])), errors
+
+
+def measure_peak_memory(seeds: List[int], max_turns: int = 20, game_timeout: Optional[int] = 30) -> Dict[str, float]:
+    """tracemalloc으로 게임 하나를 생성하고 끝까지 진행하는 동안의 최대 메모리 사용량을 킬로바이트로 측정합니다.
+    tracemalloc은 실행을 크게 느리게 하므로 처리량 측정과 분리하여 적은 수의 시드로 수행합니다."""
+    all_cards = _all_cards()
+    peaks = []
+    for seed in seeds:
+        game = None
+        gc.collect()
+        tracemalloc.start()
+        try:
+            game = create_fuzz_game(all_cards, seed)
+            _play_one(game, max_turns, game_timeout)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peaks.append(peak / 1024)
+        del game
+    return {
+        "peak_memory_per_game_kb": sum(peaks) / len(peaks),
+        "peak_memory_max_kb": max(peaks),
+    }
+
+
+def run_benchmarks(games: int = 20, seed_start: int = 0, max_turns: int = 20, memory_games: int = 3,
+                   load_repeats: int = 3, game_timeout: Optional[int] = 30, log_level: str = "OFF") -> Dict[str, Any]:
+    """모든 벤치마크를 실행하고 JSON으로 저장할 수 있는 결과 딕셔너리를 반환합니다.
+
+    매개변수
+    ----------
+    games (int) - 게임 생성과 처리량 측정에 사용할 게임 수이며 시드는 seed_start부터 연속으로 부여됩니다.
+    memory_games (int) - 메모리 측정에 사용할 게임 수입니다.
+    load_repeats (int) - 카드 DB 적재 측정 반복 횟수입니다.
+    game_timeout (int) - 게임 하나에 허용하는 최대 초입니다. None이면 제한하지 않습니다.
+    log_level (str) - 측정 중 엔진 로그 레벨입니다. 로그 출력 비용이 결과를 왜곡하지 않도록 기본값은 OFF입니다.
+    """
+    configure_logging(log_level)
+    seeds = list(range(seed_start, seed_start + games))
+
+    metrics: Dict[str, float] = {}
+    metrics.update(measure_card_db_load(load_repeats))
+    metrics.update(measure_game_construction(seeds))
+    game_metrics, resolve_stats, errors = measure_random_games(seeds, max_turns, game_timeout)
+    metrics.update(game_metrics)
+    metrics.update(measure_peak_memory(seeds[:memory_games], max_turns, game_timeout))
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "games": games,
+            "seed_start": seed_start,
+            "max_turns": max_turns,
+            "memory_games": memory_games,
+        },
+        "metrics": metrics,
+        "resolve_effect": resolve_stats,
+        "game_errors": errors,
+    }
+
+
+def compare_with_baseline(result: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """기준 결과와 비교하여 threshold 비율을 넘게 나빠진 지표와 기준보다 늘어난 오류, 시간 초과 횟수 목록을 반환합니다. 빈 목록이면 회귀가 없습니다."""
+    regressions = []
+    current_metrics = result.get("metrics", {})
+    baseline_metrics = baseline.get("metrics", {})
+    for name, higher_is_better in TRACKED_METRICS.items():
+        current = current_metrics.get(name)
+        reference = baseline_metrics.get(name)
+        if current is None or not reference:
+            continue
+        if higher_is_better:
+            change = (reference - current) / reference
+        else:
+            change = (current - reference) / reference
+        if change > threshold:
+            regressions.append({"metric": name, "baseline": reference, "current": current, "regression": change})
+    for name in TRACKED_COUNTS:
+        current = current_metrics.get(name)
+        reference = baseline_metrics.get(name)
+        if current is None or reference is None:
+            continue
+        if current > reference:
+            regressions.append({"metric": name, "baseline": reference, "current": current, "regression": None})
+    return regressions
+
+
+def format_summary(result: Dict[str, Any], regressions: Optional[List[Dict[str, Any]]] = None) -> str:
+    """측정 결과와 회귀 판정을 사람이 읽을 수 있는 문자열로 만듭니다."""
+    lines = ["[벤치마크 결과]"]
+    for name, value in result["metrics"].items():
+        lines.append(f"  {name:<28} {value:12.3f}")
+    lines.append("[resolve_effect 프로세스 타입별 자체 시간 상위 10개]")
+    for name, entry in list(result["resolve_effect"].items())[:10]:
+        lines.append(f"  {name:<28} 호출 {entry['calls']:6d}회  합계 {entry['total_ms']:9.2f}ms  평균 {entry['mean_us']:9.1f}us")
+    if regressions is not None:
+        if regressions:
+            lines.append("[성능 회귀 검출]")
+            for item in regressions:
+                if item["regression"] is None:
+                    lines.append(f"  {item['metric']} 기준 {item['baseline']}회 현재 {item['current']}회 (증가)")
+                else:
+                    lines.append(f"  {item['metric']} 기준 {item['baseline']:.3f} 현재 {item['current']:.3f} ({item['regression'] * 100:.1f}% 악화)")
+        else:
+            lines.append("[기준 대비 성능 회귀 없음]")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SVsim 엔진 성능 벤치마크")
+    parser.add_argument("--games", type=int, default=20, help="게임 생성과 처리량 측정에 사용할 게임 수")
+    parser.add_argument("--seed-start", type=int, default=0, help="첫 게임 시드")
+    parser.add_argument("--max-turns", type=int, default=20, help="게임당 최대 턴 수")
+    parser.add_argument("--memory-games", type=int, default=3, help="메모리 측정에 사용할 게임 수")
+    parser.add_argument("--output", default=None, help="결과 JSON을 저장할 경로이며 생략하면 표준 출력에 기록")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="회귀로 판정할 악화 비율")
+    parser.add_argument("--save-baseline", default=None, help="이번 결과를 기준 결과로 저장할 경로")
+    args = parser.parse_args()
+
+    result = run_benchmarks(args.games, args.seed_start, args.max_turns, args.memory_games)
+
+    regressions = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare_with_baseline(result, json.load(f), args.threshold)
+        result["regressions"] = regressions
+
+    result_json = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(result_json)
+        print(format_summary(result, regressions))
+    else:
+        print(result_json)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(result_json)
+
+    sys.exit(1 if regressions else 0)
@@ -7,216 +7,16 @@ from tkinter import ttk, messagebox, simpledialog
 
 from src.common import card_data
 from src.common.enums import ClassType, CardType
-
-
-# 덱 코드(URL 및 해시) 복구 유틸리티에 사용될 문자 변환 맵입니다.
-custom_char_to_binary_map = {str(i): i for i in range(10)}
-custom_char_to_binary_map.update({chr(ord('A') + i): i + 10 for i in range(26)})
-custom_char_to_binary_map.update({chr(ord('a') + i): i + 36 for i in range(26)})
-custom_char_to_binary_map['-'] = 62
-custom_char_to_binary_map['_'] = 63
-
-reverse_custom_map = [None] * 64
-for char, value in custom_char_to_binary_map.items():
-    reverse_custom_map[value] = char
-
-
-def decode_hash_to_int(encoded_str):
-    """4자리 base64 해시 문자열을 정수 카드 ID로 변환합니다."""
-    if len(encoded_str) != 4:
-        raise ValueError("해시 문자열은 반드시 4글자여야 합니다.")
-    value_24bit = 0
-    for i, char in enumerate(encoded_str):
-        if char not in custom_char_to_binary_map:
-            raise ValueError(f"지원하지 않는 문자가 포함되어 있습니다. {char}")
-        six_bit_value = custom_char_to_binary_map[char]
-        value_24bit |= (six_bit_value << (6 * (3 - i)))
-    return value_24bit
-
-
-def parse_deck_code(url_or_hash):
-    """URL 주소 또는 해시 문자열에서 클래스 ID와 4자리 카드 해시 리스트를 분리하여 반환합니다."""
-    from urllib.parse import urlparse, parse_qs
-    
-    hash_val = url_or_hash
-    if url_or_hash.startswith("http"):
-        parsed = urlparse(url_or_hash)
-        qs = parse_qs(parsed.query)
-        hash_list = qs.get("hash")
-        if not hash_list:
-            raise ValueError("URL 쿼리 매개변수에 hash 값이 없습니다.")
-        hash_val = hash_list[0]
-        
-    parts = hash_val.split(".")
-    if len(parts) < 3:
-        raise ValueError("올바르지 않은 해시 포맷 형식입니다.")
-        
-    class_id = parts[1]
-    hashes = parts[2:]
-    
-    card_ids = []
-    for h in hashes:
-        if len(h) == 4:
-            decoded_id = decode_hash_to_int(h)
-            card_ids.append(str(decoded_id))
-    return class_id, card_ids
-
-
-def build_deck_from_decoded(class_id, card_ids, all_cards):
-    """디코딩 완료된 ID 정보를 토대로 최종 직업, 포맷 감지 결과 및 덱 구성 내역을 딕셔너리로 조립합니다."""
-    # 1번 엘프, 2번 로얄, 3번 위치, 4번 드래곤, 5번 나이트메어, 6번 비숍, 7번 네메시스 순으로 대응합니다.
-    class_map = {
-        "1": ClassType.FORESTCRAFT,
-        "2": ClassType.SWORDCRAFT,
-        "3": ClassType.RUNECRAFT,
-        "4": ClassType.DRAGONCRAFT,
-        "5": ClassType.ABYSSCRAFT,
-        "6": ClassType.HAVENCRAFT,
-        "7": ClassType.PORTALCRAFT
-    }
-    class_type = class_map.get(str(class_id), ClassType.FORESTCRAFT)
-    
-    deck_dict = {}
-    format_type = "Rotation"
-    
-    for cid in card_ids:
-        # DB에 존재하는 카드인지 확인 작업을 선행합니다.
-        # token 카드는 덱 빌딩 시 제외되어야 하므로 검증합니다.
-        card = all_cards.get(cid)
-        if not card:
-            # 기본 DB에 없으면 그냥 넘어갑니다.
-            continue
-            
-        # 팩 ID가 101번인 카드가 단 하나라도 포함되어 있으면 자동으로 Unlimited 포맷으로 감지하여 할당합니다.
-        if cid.startswith("101"):
-            format_type = "Unlimited"
-            
-        deck_dict[cid] = deck_dict.get(cid, 0) + 1
-        
-    return class_type, format_type, deck_dict
-
-
-def filter_cards_by_rules(format_type, class_type, all_cards):
-    """지정된 포맷 및 직업 규칙에 부합하는 카드를 필터링하여 반환합니다."""
-    filtered = []
-    allowed_packs = []
-    
-    if format_type == "Rotation":
-        # 로테이션은 기본 팩인 100 팩과 최신 6개 팩인 102부터 107 팩을 허용합니다.
-        allowed_packs = ["100", "102", "103", "104", "105", "106", "107"]
-    elif format_type == "Unlimited":
-        # 언리미티드는 100부터 107 팩까지의 모든 카드를 허용합니다.
-        allowed_packs = ["100", "101", "102", "103", "104", "105", "106", "107"]
-
-    for card in all_cards.values():
-        card_id_str = str(card.card_id)
-        pack_id = card_id_str[:3]
-        
-        # 900 팩 등의 토큰 카드는 덱 빌딩 목록에서 완전히 제외합니다.
-        if pack_id == "900":
-            continue
-            
-        if pack_id not in allowed_packs:
-            continue
-            
-        # 선택한 직업에 해당하거나 중립인 카드만 노출합니다.
-        if card.class_type == class_type or card.class_type == ClassType.NEUTRAL:
-            filtered.append(card)
-            
-    # 마친가지로 코스트 순서대로 정렬하여 반환합니다.
-    filtered.sort(key=lambda x: x.cost)
-    return filtered
-
-def validate_deck_rules(deck_cards):
-    """현재 덱이 섀도우버스 표준 규칙인 40장 수량 및 동일 카드 최대 3장 제한을 충족하는지 검사합니다."""
-    if not deck_cards:
-        return False
-    
-    total_count = sum(deck_cards.values())
-    if total_count != 40:
-        return False
-        
-    for card_id, count in deck_cards.items():
-        if count <= 0:
-            return False
-        if count > 3:
-            return False
-            
-    return True
-
-
-def generate_random_deck(class_type, all_cards):
-    """지정된 직업과 Rotation 제약을 충족하는 무작위 덱을 생성합니다."""
-    # 덱 구성에 필요한 카드 필터를 진행합니다.
-    filtered = filter_cards_by_rules("Rotation", class_type, all_cards)
-    
-    neutral_pool = [c for c in filtered if c.class_type == ClassType.NEUTRAL]
-    class_pool = [c for c in filtered if c.class_type == class_type]
-    
-    deck_counts = {}
-    
-    def add_cards_from_pool(pool, target_total):
-        """지정된 풀에서 target_total 장이 될 때까지 카드를 임의로 1에서 3장씩 추가합니다."""
-        import random
-        if not pool:
-            return 0
-            
-        current_added = 0
-        shuffled_pool = list(pool)
-        random.shuffle(shuffled_pool)
-        
-        # 1차 시도로 카드 종류를 순회하며 1장에서 3장을 추가합니다.
-        for card in shuffled_pool:
-            card_id_str = str(card.card_id)
-            if current_added >= target_total:
-                break
-            
-            max_add = min(3 - deck_counts.get(card_id_str, 0), target_total - current_added)
-            if max_add <= 0:
-                continue
-            
-            add_num = random.randint(1, max_add)
-            deck_counts[card_id_str] = deck_counts.get(card_id_str, 0) + add_num
-            current_added += add_num
-            
-        # 2차 시도로 한도 3장을 채우기 위해 반복해서 탐색합니다.
-        attempts = 0
-        while current_added < target_total and attempts < 100:
-            attempts += 1
-            for card in shuffled_pool:
-                card_id_str = str(card.card_id)
-                if current_added >= target_total:
-                    break
-                current_count = deck_counts.get(card_id_str, 0)
-                if current_count < 3:
-                    deck_counts[card_id_str] = current_count + 1
-                    current_added += 1
-                    
-        return current_added
-
-    # 중립 카드는 6장을 목표로 하여 채웁니다.
-    neutral_added = add_cards_from_pool(neutral_pool, 6)
-    
-    # 직업 카드는 나머지 장수만큼 채웁니다.
-    target_class_count = 40 - neutral_added
-    class_added = add_cards_from_pool(class_pool, target_class_count)
-    
-    # 총 매수가 부족한 극단적 상황에는 전체에서 부족한 만큼 마구 채웁니다.
-    total_added = neutral_added + class_added
-    if total_added < 40:
-        add_cards_from_pool(filtered, 40 - total_added)
-        
-    # 구성된 카드 정보의 객체 리스트를 만들어 최종 반환합니다.
-    deck_list = []
-    card_by_id = {str(c.card_id): c for c in filtered}
-    for card_id, count in deck_counts.items():
-        card_obj = card_by_id.get(card_id)
-        if card_obj:
-            deck_list.extend([card_obj] * count)
-            
-    import random
-    random.shuffle(deck_list)
-    return deck_list
+from src.common.deck_utils import (
+    decode_hash_to_int,
+    parse_deck_code,
+    build_deck_from_decoded,
+    filter_cards_by_rules,
+    validate_deck_rules,
+    generate_random_deck,
+    custom_char_to_binary_map,
+    reverse_custom_map,
+)
 
 
 class DeckBuilderGUI:
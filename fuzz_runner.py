@@ -1,62 +1,28 @@
-# 역할 정의. GUI를 우회하여 게임 엔진의 자동 랜덤 플레이 시뮬레이션을 수행하고 예외를 감지 및 분석하여 리포트를 생성하는 퍼징 러너 스크립트입니다.
+# 역할 정의. 헤드리스 모드로 게임 엔진의 자동 랜덤 플레이 시뮬레이션을 수행하고 예외를 감지 및 분석하여 리포트를 생성하는 퍼징 러너 스크립트입니다.
 
 import os
 import sys
+import glob
 import json
 import random
+import signal
+import logging
+import contextlib
 import traceback
+import multiprocessing
 from typing import Dict, Any, List, Tuple, Optional
 
 # 절대 경로 설정을 위해 작업 디렉토리를 참조합니다.
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.models.card import Card
 from src.common.enums import Zone, CardType, EffectType, ClassType
-
-
-class MockGUI:
-    """Tkinter GUI 팝업을 차단하고 콘솔 상에서 무작위 선택을 자동으로 처리하는 모의 GUI 클래스입니다."""
-
-    def __init__(self, game_state_manager: Any = None):
-        """MockGUI 인스턴스를 생성하고 게임 상태 매니저를 참조합니다."""
-        self.game_state_manager = game_state_manager
-
-    def update(self):
-        """GUI 화면 갱신 요청을 시뮬레이션하며 실제로는 아무 동작도 수행하지 않습니다."""
-        pass
-
-    def get_user_choice(self, prompt: str, choices: Dict[str, Any]) -> Any:
-        """제시된 무작위 효과나 행동 선택지 중 하나를 무작위로 결정하여 반환합니다."""
-        if not choices:
-            return None
-        selected_key = random.choice(list(choices.keys()))
-        return choices[selected_key]
-
-    def get_mulligan_choices(self, player_id: str, hand_cards: List[Card]) -> List[str]:
-        """멀리건 단계에서 교체할 손패 카드를 0장부터 최대 전체 손패 수 범위 내에서 무작위로 선택합니다."""
-        if not hand_cards:
-            return []
-        num_to_replace = random.randint(0, len(hand_cards))
-        selected_cards = random.sample(hand_cards, num_to_replace)
-        return [c.card_id for c in selected_cards]
-
-    def get_discard_choices(self, player_id: str, hand_cards: List[Card], count: int) -> List[str]:
-        """버려야 할 손패 카드를 요구 수량에 맞춰 무작위로 선택하여 반환합니다."""
-        card_ids = [c.card_id for c in hand_cards]
-        num_to_discard = min(count, len(card_ids))
-        return random.sample(card_ids, num_to_discard)
-
-
-# GUI 창이 생성 단계에서부터 팝업되는 것을 막기 위해 GameGUI 클래스를 MockGUI로 원숭이 패치(Monkey Patch)합니다.
-import ui.gui
-ui.gui.GameGUI = MockGUI
-
-import src.engine.main_game_logic as main_game_logic
-main_game_logic.GameGUI = MockGUI
-
 from src.engine.main_game_logic import Game
+from src.engine.action_generator import action_to_dict
+from src.engine.decision_provider import RandomDecisionProvider
 import src.common.card_data as card_data
-from deck_builder import generate_random_deck
+from src.common.logger import configure_logging
+from src.common.deck_utils import generate_random_deck
+from src.common.rng import make_rng, DECK_STREAM, AGENT_STREAM
 
 
 class Tee:
@@ -116,77 +82,9 @@ class LogMonitor:
 
 
 def get_all_possible_actions(game: Game, current_player: str) -> List[Dict[str, Any]]:
-    """현재 활성화된 플레이어가 수행 가능한 모든 유효한 액션을 수집하여 리스트로 반환합니다."""
-    possible_actions = []
-    opponent_id = game.opponent_id[current_player]
-
-    # 1 패에서 카드를 내는 액션을 수집합니다.
-    use_extra_pp_options = [False]
-    if game.has_extra_pp(current_player):
-        use_extra_pp_options.append(True)
-
-    for use_extra_pp in use_extra_pp_options:
-        hand_cards_id, is_validate = game.get_playable_cards_id(current_player, use_extra_pp)
-        if hand_cards_id:
-            for i, card_id in enumerate(hand_cards_id):
-                if is_validate[i]:
-                    current_pp, _ = game.game_state_manager.get_pp_info(current_player)
-                    enhance_effects = [effect for effect in game.game_state_manager.get_card_effects(card_id, EffectType.ENHANCE)]
-                    enhance_costs_for_card = [effect.enhance_cost for effect in enhance_effects if effect.enhance_cost <= current_pp + (1 if use_extra_pp else 0)]
-                    enhanced_cost = max(enhance_costs_for_card) if enhance_costs_for_card else 0
-
-                    possible_actions.append({
-                        "type": "PLAY_CARD",
-                        "card_id": card_id,
-                        "enhanced_cost": enhanced_cost,
-                        "use_extra_pp": use_extra_pp
-                    })
-
-    # 2 필드에 배치된 카드들을 통해 공격 진화 초진화 카드 활성화 액션을 수집합니다.
-    player_field_card_ids = game.game_state_manager.get_card_ids_in_zone(current_player, Zone.FIELD)
-    opponent_field_card_ids = game.game_state_manager.get_card_ids_in_zone(opponent_id, Zone.FIELD)
-
-    for card_id in player_field_card_ids:
-        available_actions, _ = game.get_available_actions(card_id, current_player)
-
-        # 2-1 추종자 공격 액션을 검증하고 추가합니다.
-        if "추종자 공격" in available_actions:
-            opponent_targets_id = [opp_card_id for opp_card_id in opponent_field_card_ids if game.game_state_manager.get_type(opp_card_id) == CardType.FOLLOWER] + [opponent_id]
-            for target_id in opponent_targets_id:
-                if game.rule_engine.validate_attack(card_id, target_id):
-                    possible_actions.append({
-                        "type": "ATTACK",
-                        "attacker_id": card_id,
-                        "target_id": target_id
-                    })
-
-        # 2-2 추종자 진화 액션을 추가합니다.
-        if "추종자 진화" in available_actions:
-            possible_actions.append({
-                "type": "EVOLVE",
-                "card_id": card_id
-            })
-
-        # 2-3 추종자 초진화 액션을 추가합니다.
-        if "추종자 초진화" in available_actions:
-            possible_actions.append({
-                "type": "SUPER_EVOLVE",
-                "card_id": card_id
-            })
-
-        # 2-4 카드 활성화 액션을 추가합니다.
-        if "카드 활성화(Engage)" in available_actions:
-            possible_actions.append({
-                "type": "ENGAGE",
-                "card_id": card_id
-            })
-
-    # 3 언제나 선택 가능한 턴 종료 액션을 추가합니다.
-    possible_actions.append({
-        "type": "END_TURN"
-    })
-
-    return possible_actions
+    """현재 활성화된 플레이어가 수행 가능한 모든 유효한 액션을 수집하여 리스트로 반환합니다.
+    엔진의 legal_actions가 만든 행동 튜플을 보고서에 기록하기 쉬운 딕셔너리로 변환합니다."""
+    return [action_to_dict(action) for action in game.legal_actions(current_player)]
 
 
 def validate_game_state_invariants(game: Game):
@@ -242,8 +140,107 @@ def validate_game_state_invariants(game: Game):
                                 raise AssertionError(f"직접소환 조건을 만족한 카드 {card.get_display_name()} (ID {card.card_id})가 전장 자리가 존재함에도 필드로 진입하지 못했습니다.")
 
 
-def run_fuzzing(runs: int = 1, max_turns: int = 20) -> Tuple[bool, Optional[Exception]]:
-    """지정된 횟수만큼 게임 세션을 반복 생성하여 퍼징 테스트를 수행합니다. 오류 발생 시 예외 객체를 반환합니다."""
+def create_fuzz_game(all_cards: Dict[str, Any], seed: int) -> Game:
+    """시드 하나로 무작위 직업의 랜덤 덱 두 개와 헤드리스 게임 인스턴스를 생성합니다. 같은 시드면 같은 게임이 만들어집니다."""
+    deck_rng = make_rng(seed, DECK_STREAM)
+
+    # 무작위로 직업을 선택하여 덱을 생성합니다.
+    class_types = [c for c in ClassType if c != ClassType.NEUTRAL]
+    p1_class = deck_rng.choice(class_types)
+    p2_class = deck_rng.choice(class_types)
+    
+    p1_deck = generate_random_deck(p1_class, all_cards, rng=deck_rng)
+    p2_deck = generate_random_deck(p2_class, all_cards, rng=deck_rng)
+    
+    # 게임 클래스 초기화 시 생성된 덱 데이터를 주입합니다.
+    agent_rng = make_rng(seed, AGENT_STREAM)
+    return Game("player1", "player2", p1_deck, p2_deck, decision_provider=RandomDecisionProvider(rng=agent_rng), headless=True, seed=seed)
+
+
+def play_fuzz_game(game: Game, max_turns: int, log_monitor: Optional[LogMonitor] = None):
+    """생성된 게임을 무작위 액션으로 최대 턴 수까지 진행합니다. 불변 조건 위반이나 로그 에러가 발견되면 예외를 발생시킵니다.
+    행동 선택은 게임에 주입된 무작위 의사결정 제공자와 같은 난수 스트림을 사용합니다."""
+    agent_rng = game.decision_provider.rng
+    current_player = "player1"
+    
+    for turn_num in range(1, max_turns + 1):
+        # 승리 조건 등으로 한쪽 플레이어 체력이 0 이하가 되면 조기 종료합니다.
+        p1_hp = game.game_state_manager.players["player1"].current_defense
+        p2_hp = game.game_state_manager.players["player2"].current_defense
+        if p1_hp <= 0 or p2_hp <= 0:
+            break
+
+        action_count = 0
+        max_actions_per_turn = 30
+        
+        while True:
+            # 승리 조건 등으로 한쪽 플레이어 체력이 0 이하가 되면 턴 루프를 빠져나갑니다.
+            p1_hp = game.game_state_manager.players["player1"].current_defense
+            p2_hp = game.game_state_manager.players["player2"].current_defense
+            if p1_hp <= 0 or p2_hp <= 0:
+                break
+
+            # 턴 시작 상태의 특수 카드 선택 효과 등을 먼저 자동 처리합니다.
+            game.process_player_choice()
+
+            # 매 행동 단위 직후 게임 불변 조건(Invariant)을 검증하여 상태 이상을 진단합니다.
+            validate_game_state_invariants(game)
+
+            # 실시간으로 기입된 error.log 파일 내용을 읽어와서 파싱하여 검출된 에러를 감지합니다.
+            logged_error = log_monitor.check_for_errors() if log_monitor else None
+            if logged_error:
+                raise AssertionError(f"error.log 실시간 파싱 중 이상 에러 검출 - {logged_error}")
+
+            # 가능한 모든 유효 액션을 수집합니다.
+            possible_actions = get_all_possible_actions(game, current_player)
+            if not possible_actions:
+                game.end_turn(current_player)
+                break
+
+            # 무한 루프 방지를 위해 일정량 이상 액션이 지속되면 강제로 턴을 종료시킵니다.
+            action_count += 1
+            if action_count > max_actions_per_turn:
+                game.end_turn(current_player)
+                break
+
+            # 무작위 액션 하나를 선택하여 진행합니다.
+            action = agent_rng.choice(possible_actions)
+            
+            if action["type"] == "PLAY_CARD":
+                game.play_card(current_player, action["card_id"], action["enhanced_cost"], action["use_extra_pp"])
+            elif action["type"] == "ATTACK":
+                target_type = game.game_state_manager.get_type(action["target_id"])
+                if target_type == CardType.LEADER:
+                    game.attack_leader(action["attacker_id"])
+                else:
+                    game.attack_follower(action["attacker_id"], action["target_id"])
+            elif action["type"] == "EVOLVE":
+                game.evolve_follower(action["card_id"], current_player)
+            elif action["type"] == "SUPER_EVOLVE":
+                game.super_evolve_follower(action["card_id"], current_player)
+            elif action["type"] == "ENGAGE":
+                game.engage_card(action["card_id"], current_player)
+            elif action["type"] == "END_TURN":
+                game.end_turn(current_player)
+                break
+
+            # 액션 실행 직후 한쪽 플레이어 체력이 0 이하가 되면 루프를 조기 종료합니다.
+            p1_hp = game.game_state_manager.players["player1"].current_defense
+            p2_hp = game.game_state_manager.players["player2"].current_defense
+            if p1_hp <= 0 or p2_hp <= 0:
+                break
+        
+        # 플레이어 턴을 전환합니다.
+        current_player = game.opponent_id[current_player]
+
+
+def run_fuzzing(runs: int = 1, max_turns: int = 20, log_level: str = "WARNING", seed_start: Optional[int] = None) -> Tuple[bool, Optional[Exception]]:
+    """지정된 횟수만큼 게임 세션을 반복 생성하여 퍼징 테스트를 수행합니다. 오류 발생 시 예외 객체를 반환합니다.
+    게임마다 seed_start부터 연속된 시드를 사용하며 seed_start를 생략하면 무작위 시작 시드를 고릅니다."""
+    if seed_start is None:
+        seed_start = random.randrange(2 ** 31)
+    # 에러 감지에 필요한 WARNING 이상만 기록하여 INFO 로그의 포맷팅과 출력 비용을 없앱니다.
+    configure_logging(log_level)
     card_data.load_card_databases('card_database/3_parsed_database/card_database_parsed.json')
     all_cards = {**card_data.BASIC_CARD_DATABASE, **card_data.LEGENDS_RISE_CARD_DATABASE}
     
@@ -269,89 +266,8 @@ def run_fuzzing(runs: int = 1, max_turns: int = 20) -> Tuple[bool, Optional[Exce
         for run_idx in range(runs):
             game = None
             try:
-                # 무작위로 직업을 선택하여 덱을 생성합니다.
-                class_types = [c for c in ClassType if c != ClassType.NEUTRAL]
-                p1_class = random.choice(class_types)
-                p2_class = random.choice(class_types)
-                
-                p1_deck = generate_random_deck(p1_class, all_cards)
-                p2_deck = generate_random_deck(p2_class, all_cards)
-                
-                # 게임 클래스 초기화 시 생성된 덱 데이터를 주입합니다.
-                game = Game("player1", "player2", p1_deck, p2_deck)
-                
-                current_player = "player1"
-                
-                for turn_num in range(1, max_turns + 1):
-                    # 승리 조건 등으로 한쪽 플레이어 체력이 0 이하가 되면 조기 종료합니다.
-                    p1_hp = game.game_state_manager.players["player1"].current_defense
-                    p2_hp = game.game_state_manager.players["player2"].current_defense
-                    if p1_hp <= 0 or p2_hp <= 0:
-                        break
-
-                    action_count = 0
-                    max_actions_per_turn = 30
-                    
-                    while True:
-                        # 승리 조건 등으로 한쪽 플레이어 체력이 0 이하가 되면 턴 루프를 빠져나갑니다.
-                        p1_hp = game.game_state_manager.players["player1"].current_defense
-                        p2_hp = game.game_state_manager.players["player2"].current_defense
-                        if p1_hp <= 0 or p2_hp <= 0:
-                            break
-
-                        # 턴 시작 상태의 특수 카드 선택 효과 등을 먼저 자동 처리합니다.
-                        game.process_player_choice()
-
-                        # 매 행동 단위 직후 게임 불변 조건(Invariant)을 검증하여 상태 이상을 진단합니다.
-                        validate_game_state_invariants(game)
-
-                        # 실시간으로 기입된 error.log 파일 내용을 읽어와서 파싱하여 검출된 에러를 감지합니다.
-                        logged_error = log_monitor.check_for_errors()
-                        if logged_error:
-                            raise AssertionError(f"error.log 실시간 파싱 중 이상 에러 검출 - {logged_error}")
-
-                        # 가능한 모든 유효 액션을 수집합니다.
-                        possible_actions = get_all_possible_actions(game, current_player)
-                        if not possible_actions:
-                            game.end_turn(current_player)
-                            break
-
-                        # 무한 루프 방지를 위해 일정량 이상 액션이 지속되면 강제로 턴을 종료시킵니다.
-                        action_count += 1
-                        if action_count > max_actions_per_turn:
-                            game.end_turn(current_player)
-                            break
-
-                        # 무작위 액션 하나를 선택하여 진행합니다.
-                        action = random.choice(possible_actions)
-                        
-                        if action["type"] == "PLAY_CARD":
-                            game.play_card(current_player, action["card_id"], action["enhanced_cost"], action["use_extra_pp"])
-                        elif action["type"] == "ATTACK":
-                            target_type = game.game_state_manager.get_type(action["target_id"])
-                            if target_type == CardType.LEADER:
-                                game.attack_leader(action["attacker_id"])
-                            else:
-                                game.attack_follower(action["attacker_id"], action["target_id"])
-                        elif action["type"] == "EVOLVE":
-                            game.evolve_follower(action["card_id"], current_player)
-                        elif action["type"] == "SUPER_EVOLVE":
-                            game.super_evolve_follower(action["card_id"], current_player)
-                        elif action["type"] == "ENGAGE":
-                            game.engage_card(action["card_id"], current_player)
-                        elif action["type"] == "END_TURN":
-                            game.end_turn(current_player)
-                            break
-
-                        # 액션 실행 직후 한쪽 플레이어 체력이 0 이하가 되면 루프를 조기 종료합니다.
-                        p1_hp = game.game_state_manager.players["player1"].current_defense
-                        p2_hp = game.game_state_manager.players["player2"].current_defense
-                        if p1_hp <= 0 or p2_hp <= 0:
-                            break
-                    
-                    # 플레이어 턴을 전환합니다.
-                    current_player = game.opponent_id[current_player]
-
+                game = create_fuzz_game(all_cards, seed_start + run_idx)
+                play_fuzz_game(game, max_turns, log_monitor)
             except Exception as e:
                 # 예외 감지 시 현재의 게임 상태와 분석 보고서를 즉시 작성합니다.
                 exc_info = analyze_exception(e)
@@ -375,6 +291,182 @@ def run_fuzzing(runs: int = 1, max_turns: int = 20) -> Tuple[bool, Optional[Exce
     return True, None
 
 
+FARM_SHARD_DIR = "fuzz_shards"  # 팜 워커별 로그와 리포트 샤드를 저장하는 기본 디렉토리입니다.
+
+# 풀 워커 프로세스마다 초기화 시점에 한 번 채워지는 실행 상태입니다.
+_farm_worker_state: Dict[str, Any] = {}
+
+
+class FuzzGameTimeout(Exception):
+    """한 게임의 진행 시간이 제한을 넘었을 때 발생하는 예외입니다."""
+    pass
+
+
+@contextlib.contextmanager
+def game_time_limit(seconds: Optional[int]):
+    """블록 실행 시간이 seconds초를 넘으면 FuzzGameTimeout을 발생시킵니다. SIGALRM이 없는 플랫폼에서는 제한 없이 실행합니다."""
+    if not seconds or not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    def _on_timeout(signum, frame):
+        raise FuzzGameTimeout(f"게임 진행 시간이 제한 {seconds}초를 초과했습니다.")
+
+    previous_handler = signal.signal(signal.SIGALRM, _on_timeout)
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _init_farm_worker(shard_dir: str, max_turns: int, log_level: str, game_timeout: Optional[int]):
+    """프로세스 풀 워커를 초기화합니다. 카드 DB를 적재하고 엔진 로그를 워커 전용 로그 샤드로 보냅니다."""
+    worker_name = f"worker-{os.getpid()}"
+    log_path = os.path.join(shard_dir, f"{worker_name}.log")
+    configure_logging(log_level, handler=logging.FileHandler(log_path, mode="w", encoding="utf-8"))
+
+    card_data.load_card_databases('card_database/3_parsed_database/card_database_parsed.json')
+    log_monitor = LogMonitor(log_path)
+    log_monitor.start()
+
+    _farm_worker_state.update({
+        "worker_name": worker_name,
+        "report_path": os.path.join(shard_dir, f"{worker_name}.jsonl"),
+        "all_cards": {**card_data.BASIC_CARD_DATABASE, **card_data.LEGENDS_RISE_CARD_DATABASE},
+        "log_monitor": log_monitor,
+        "max_turns": max_turns,
+        "game_timeout": game_timeout,
+    })
+
+
+def _run_farm_seed(seed: int) -> Dict[str, Any]:
+    """워커에서 시드 하나로 게임을 진행합니다. 오류가 나면 워커 리포트 샤드에 기록하고 다음 시드를 계속 처리합니다."""
+    state = _farm_worker_state
+    log_monitor = state["log_monitor"]
+    game = None
+    try:
+        with game_time_limit(state["game_timeout"]):
+            game = create_fuzz_game(state["all_cards"], seed)
+            play_fuzz_game(game, state["max_turns"], log_monitor)
+    except Exception as e:
+        finding = {
+            "seed": seed,
+            "worker": state["worker_name"],
+            "analysis": analyze_exception(e),
+            "state": extract_state_snapshot(game),
+        }
+        with open(state["report_path"], "a", encoding="utf-8") as f:
+            f.write(json.dumps(finding, ensure_ascii=False) + "\n")
+        # 다음 게임이 이번 게임에서 남은 에러 로그를 다시 감지하지 않도록 읽기 위치를 파일 끝으로 옮깁니다.
+        log_monitor.start()
+        return {"seed": seed, "ok": False, "error_type": type(e).__name__}
+    return {"seed": seed, "ok": True}
+
+
+def merge_fuzz_shards(shard_dir: str = FARM_SHARD_DIR) -> List[Dict[str, Any]]:
+    """모든 워커 리포트 샤드를 읽어 시드 순으로 정렬된 오류 목록을 반환합니다."""
+    findings = []
+    for shard_path in sorted(glob.glob(os.path.join(shard_dir, "*.jsonl"))):
+        with open(shard_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    findings.append(json.loads(line))
+    findings.sort(key=lambda finding: finding["seed"])
+    return findings
+
+
+def generate_farm_report(findings: List[Dict[str, Any]], total_games: int, filepath: str = "fuzzing_report.md") -> bool:
+    """팜 전체 오류를 유형과 메시지 기준으로 묶어 하나의 마크다운 보고서로 작성합니다."""
+    groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    for finding in findings:
+        analysis = finding["analysis"]
+        key = (analysis.get("error_type", ""), analysis.get("message", "").splitlines()[0] if analysis.get("message") else "")
+        groups.setdefault(key, []).append(finding)
+    ordered_groups = sorted(groups.items(), key=lambda item: -len(item[1]))
+
+    try:
+        content = []
+        content.append("# 퍼징 팜 에러 분석 리포트")
+        content.append("")
+        content.append("## 실행 요약")
+        content.append(f"- **실행 게임 수** {total_games}")
+        content.append(f"- **오류 발생 게임 수** {len(findings)}")
+        content.append(f"- **고유 오류 수** {len(ordered_groups)}")
+        content.append("- **재현 방법** `python fuzz_runner.py --replay <시드>`")
+        content.append("")
+        if ordered_groups:
+            content.append("| 번호 | 에러 유형 | 에러 메시지 | 발생 횟수 | 재현 시드 |")
+            content.append("| --- | --- | --- | --- | --- |")
+            for index, ((error_type, message), group) in enumerate(ordered_groups, start=1):
+                seeds = ", ".join(str(finding["seed"]) for finding in group[:10])
+                if len(group) > 10:
+                    seeds += ", ..."
+                content.append(f"| {index} | {error_type} | {message.replace('|', '/')} | {len(group)} | {seeds} |")
+            content.append("")
+
+        for index, ((error_type, _), group) in enumerate(ordered_groups, start=1):
+            first = group[0]
+            content.append(f"## 오류 {index} {error_type} (대표 시드 {first['seed']})")
+            content.append("")
+            content.extend(build_report_sections(first["analysis"], first["state"], heading="###"))
+
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write("\n".join(content))
+        return True
+    except Exception:
+        return False
+
+
+def run_fuzzing_farm(runs: int = 100, max_turns: int = 20, workers: Optional[int] = None, seed_start: int = 0,
+                     shard_dir: str = FARM_SHARD_DIR, report_path: str = "fuzzing_report.md",
+                     log_level: str = "WARNING", game_timeout: Optional[int] = 60) -> Dict[str, Any]:
+    """시드 범위를 프로세스 풀에 분산하여 퍼징합니다. 오류가 나도 나머지 시드를 계속 진행하며 끝나면 샤드를 하나의 보고서로 병합합니다.
+
+    매개변수
+    ----------
+    runs (int) - 진행할 게임 수이며 시드는 seed_start부터 연속으로 부여됩니다.
+    workers (int) - 워커 프로세스 수입니다. 생략하면 CPU 코어 수를 사용합니다.
+    shard_dir (str) - 워커별 로그와 리포트 샤드를 저장할 디렉토리입니다.
+    game_timeout (int) - 게임 하나에 허용하는 최대 초입니다. None이면 제한하지 않습니다.
+    """
+    seeds = list(range(seed_start, seed_start + runs))
+    workers = workers or os.cpu_count() or 1
+
+    # 이전 실행의 샤드가 병합 결과에 섞이지 않도록 정리합니다.
+    os.makedirs(shard_dir, exist_ok=True)
+    for old_shard in glob.glob(os.path.join(shard_dir, "worker-*")):
+        os.remove(old_shard)
+
+    # 작업 분배 오버헤드를 줄이면서도 워커 간 부하가 고르게 퍼지도록 묶음 크기를 정합니다.
+    chunksize = max(1, len(seeds) // (workers * 8))
+    with multiprocessing.Pool(workers, initializer=_init_farm_worker, initargs=(shard_dir, max_turns, log_level, game_timeout)) as pool:
+        results = list(pool.imap_unordered(_run_farm_seed, seeds, chunksize))
+
+    findings = merge_fuzz_shards(shard_dir)
+    generate_farm_report(findings, len(results), report_path)
+    return {
+        "games": len(results),
+        "failed": sum(1 for result in results if not result["ok"]),
+        "findings": findings,
+    }
+
+
+def replay_fuzz_seed(seed: int, max_turns: int = 20, log_level: str = "INFO") -> Tuple[bool, Optional[Exception]]:
+    """시드 하나의 퍼징 게임을 현재 프로세스에서 그대로 다시 진행합니다. 팜 보고서의 재현 시드를 디버깅할 때 사용합니다."""
+    configure_logging(log_level)
+    card_data.load_card_databases('card_database/3_parsed_database/card_database_parsed.json')
+    all_cards = {**card_data.BASIC_CARD_DATABASE, **card_data.LEGENDS_RISE_CARD_DATABASE}
+    try:
+        game = create_fuzz_game(all_cards, seed)
+        play_fuzz_game(game, max_turns)
+    except Exception as e:
+        traceback.print_exc()
+        return False, e
+    return True, None
+
+
 def analyze_exception(exc: Exception) -> Dict[str, str]:
     """발생한 예외 객체를 파싱하여 예외 종류 메시지 트레이스백 문자열을 추출합니다."""
     tb_str = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
@@ -396,6 +488,7 @@ def extract_state_snapshot(game: Optional[Game]) -> Dict[str, Any]:
         p2 = gsm.players.get("player2")
         
         snapshot = {
+            "seed": game.seed,
             "turn": gsm.turn_number,
             "active_player": gsm.current_turn_player_id,
             "p1_hp": p1.current_defense if p1 else 0,
@@ -414,39 +507,48 @@ def extract_state_snapshot(game: Optional[Game]) -> Dict[str, Any]:
     return snapshot
 
 
+def build_report_sections(analysis_result: Dict[str, str], game_state: Dict[str, Any], heading: str = "##") -> List[str]:
+    """에러 요약, 상태 스냅샷, 트레이스백 섹션을 마크다운 줄 목록으로 만듭니다. heading은 섹션 제목의 마크다운 수준입니다."""
+    sub_heading = heading + "#"
+    content = []
+    content.append(f"{heading} 1 에러 기본 요약")
+    content.append(f"- **에러 유형** {analysis_result.get('error_type')}")
+    content.append(f"- **에러 메시지** {analysis_result.get('message')}")
+    content.append("")
+    content.append(f"{heading} 2 에러 발생 시점 게임 상태 스냅샷")
+    content.append(f"- **게임 시드** {game_state.get('seed')}")
+    content.append(f"- **현재 진행 턴** {game_state.get('turn')}")
+    content.append(f"- **현재 턴 플레이어** {game_state.get('active_player')}")
+    content.append(f"- **플레이어 1 체력** {game_state.get('p1_hp')} (PP {game_state.get('p1_pp')})")
+    content.append(f"- **플레이어 2 체력** {game_state.get('p2_hp')} (PP {game_state.get('p2_pp')})")
+    content.append("")
+    content.append(f"{sub_heading} 플레이어 1 손패 카드 목록")
+    content.append(f"{game_state.get('p1_hand')}")
+    content.append("")
+    content.append(f"{sub_heading} 플레이어 2 손패 카드 목록")
+    content.append(f"{game_state.get('p2_hand')}")
+    content.append("")
+    content.append(f"{sub_heading} 플레이어 1 필드 카드 목록")
+    content.append(f"{game_state.get('p1_field')}")
+    content.append("")
+    content.append(f"{sub_heading} 플레이어 2 필드 카드 목록")
+    content.append(f"{game_state.get('p2_field')}")
+    content.append("")
+    content.append(f"{heading} 3 상세 트레이스백 정보")
+    content.append("```text")
+    content.append(analysis_result.get("traceback", ""))
+    content.append("```")
+    content.append("")
+    return content
+
+
 def generate_report(analysis_result: Dict[str, str], game_state: Dict[str, Any], filepath: str = "fuzzing_report.md") -> bool:
     """분석 결과와 게임 스냅샷 데이터를 기반으로 마크다운 보고서 파일을 생성합니다."""
     try:
         content = []
         content.append("# 퍼징 테스트 에러 분석 리포트")
         content.append("")
-        content.append("## 1 에러 기본 요약")
-        content.append(f"- **에러 유형** {analysis_result.get('error_type')}")
-        content.append(f"- **에러 메시지** {analysis_result.get('message')}")
-        content.append("")
-        content.append("## 2 에러 발생 시점 게임 상태 스냅샷")
-        content.append(f"- **현재 진행 턴** {game_state.get('turn')}")
-        content.append(f"- **현재 턴 플레이어** {game_state.get('active_player')}")
-        content.append(f"- **플레이어 1 체력** {game_state.get('p1_hp')} (PP {game_state.get('p1_pp')})")
-        content.append(f"- **플레이어 2 체력** {game_state.get('p2_hp')} (PP {game_state.get('p2_pp')})")
-        content.append("")
-        content.append("### 플레이어 1 손패 카드 목록")
-        content.append(f"{game_state.get('p1_hand')}")
-        content.append("")
-        content.append("### 플레이어 2 손패 카드 목록")
-        content.append(f"{game_state.get('p2_hand')}")
-        content.append("")
-        content.append("### 플레이어 1 필드 카드 목록")
-        content.append(f"{game_state.get('p1_field')}")
-        content.append("")
-        content.append("### 플레이어 2 필드 카드 목록")
-        content.append(f"{game_state.get('p2_field')}")
-        content.append("")
-        content.append("## 3 상세 트레이스백 정보")
-        content.append("```text")
-        content.append(analysis_result.get("traceback", ""))
-        content.append("```")
-        content.append("")
+        content.extend(build_report_sections(analysis_result, game_state))
         
         with open(filepath, "w", encoding="utf-8") as f:
             f.write("\n".join(content))
@@ -467,17 +569,37 @@ def load_agent_config(filepath: str = "agent.json") -> Dict[str, Any]:
 
 
 if __name__ == "__main__":
+    import argparse
+
     # 에이전트 설정 파일 경로를 탐색하여 로드합니다.
     config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".agents", "agents", "svsim-debug-fuzz", "agent.json")
     config = load_agent_config(config_path)
-    run_count = config.get("parameters", {}).get("run_count", 10)
-    max_turns = config.get("parameters", {}).get("max_turns", 20)
-    
-    print(f"퍼징 테스트를 {run_count}회 시작합니다.")
-    success, error = run_fuzzing(run_count, max_turns)
-    if success:
-        print("퍼징 테스트가 오류 없이 완료되었습니다.")
-        sys.exit(0)
-    else:
-        print(f"퍼징 테스트 도중 오류가 발생했습니다. {error}")
-        sys.exit(1)
+    parameters = config.get("parameters", {})
+
+    parser = argparse.ArgumentParser(description="SVsim 무작위 플레이 퍼징 러너")
+    parser.add_argument("--runs", type=int, default=parameters.get("run_count", 10), help="진행할 게임 수")
+    parser.add_argument("--max-turns", type=int, default=parameters.get("max_turns", 20), help="게임당 최대 턴 수")
+    parser.add_argument("--workers", type=int, default=parameters.get("workers", 1), help="워커 프로세스 수이며 0이면 CPU 코어 수, 1이면 단일 프로세스로 실행")
+    parser.add_argument("--seed-start", type=int, default=parameters.get("seed_start"), help="첫 게임 시드이며 생략하면 단일 모드는 무작위, 팜 모드는 0부터 시작")
+    parser.add_argument("--replay", type=int, default=None, help="지정한 시드의 게임 하나를 로그와 함께 재현")
+    args = parser.parse_args()
+
+    if args.replay is not None:
+        success, error = replay_fuzz_seed(args.replay, args.max_turns)
+        print(f"시드 {args.replay} 재현 결과 {'정상 종료' if success else error}")
+        sys.exit(0 if success else 1)
+
+    if args.workers == 1:
+        print(f"퍼징 테스트를 {args.runs}회 시작합니다.")
+        success, error = run_fuzzing(args.runs, args.max_turns, seed_start=args.seed_start)
+        if success:
+            print("퍼징 테스트가 오류 없이 완료되었습니다.")
+            sys.exit(0)
+        else:
+            print(f"퍼징 테스트 도중 오류가 발생했습니다. {error}")
+            sys.exit(1)
+
+    print(f"퍼징 팜으로 {args.runs}개 시드를 시작합니다.")
+    summary = run_fuzzing_farm(args.runs, args.max_turns, workers=args.workers or None, seed_start=args.seed_start or 0)
+    print(f"퍼징 팜 완료. 게임 {summary['games']}회 중 {summary['failed']}회에서 오류가 발생했습니다.")
+    sys.exit(0 if summary["failed"] == 0 else 1)
@@ -3,29 +3,44 @@
 from src.models.card import Card
 from src.common.enums import Zone, CardType, EffectType, TargetType
 from src.engine.main_game_logic import Game
+from src.engine.mcts_agent import MCTSAgent
 from src.models.player import Player
 from src.common import card_data
+from src.common.deck_utils import load_deck_card_ids
 import os
-import json
 import tkinter as tk
 from tkinter import ttk, messagebox
 
 
+class GuiMCTSAgent(MCTSAgent):
+    """탐색을 GUI의 작업 스레드에서 돌리는 MCTS 에이전트입니다.
+    탐색하는 동안에도 Tk 이벤트 루프가 계속 돌아 창이 멈추지 않으며 고른 행동의 적용과 화면 갱신은 메인 스레드에서 합니다."""
+
+    def __init__(self, gui, **kwargs):
+        """GuiMCTSAgent 클래스의 생성자입니다. gui는 탐색을 맡길 GameGUI이며 나머지 인자는 MCTSAgent에 넘깁니다."""
+        super().__init__(**kwargs)
+        self.gui = gui
+
+    def __getstate__(self):
+        """루트 병렬 탐색 워커에는 GUI를 보내지 않습니다."""
+        state = super().__getstate__()
+        state.pop("gui", None)
+        return state
+
+    def choose_action(self, game, player_id):
+        """MCTSAgent.choose_action을 작업 스레드에서 실행하고 그동안 Tk 이벤트를 처리합니다."""
+        return self.gui.run_in_background(super().choose_action, game, player_id)
+
+
 def load_deck_file(filename, deck_dir="decks"):
     """선택한 덱 파일을 로드하여 CardData 객체 목록으로 변환합니다."""
     if not filename or filename == "기본 예시 덱":
         return None
-    filepath = os.path.join(deck_dir, filename)
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
     cards_list = []
-    for item in data.get("cards", []):
-        card_id = item.get("card_id")
-        count = item.get("count", 1)
+    for card_id in load_deck_card_ids(os.path.join(deck_dir, filename)):
         c_data = card_data.get_card_data_by_id(card_id)
         if c_data:
-            for _ in range(count):
-                cards_list.append(c_data)
+            cards_list.append(c_data)
     return cards_list
 
 
@@ -41,7 +56,7 @@ def select_decks_gui():
 
     root = tk.Tk()
     root.title("SVsim 덱 선택")
-    root.geometry("400x250")
+    root.geometry("400x290")
     
     # 다크 테마 느낌으로 스타일을 통일합니다.
     bg_dark = "#1e1e2e"
@@ -56,6 +71,7 @@ def select_decks_gui():
     style.configure("TLabel", background=bg_dark, foreground=fg_light, font=("맑은 고딕", 10))
     style.configure("Header.TLabel", background=bg_dark, foreground=accent_blue, font=("맑은 고딕", 12, "bold"))
     style.configure("TCombobox", fieldbackground=bg_panel, background=bg_dark, foreground=fg_light)
+    style.configure("TCheckbutton", background=bg_dark, foreground=fg_light, font=("맑은 고딕", 10))
 
     frame = ttk.Frame(root)
     frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -70,6 +86,9 @@ def select_decks_gui():
     p2_combo = ttk.Combobox(frame, textvariable=p2_var, values=choices, state="readonly", width=30)
     p2_combo.pack(fill=tk.X, pady=5)
 
+    ai_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(frame, text="플레이어 2를 MCTS AI로 진행", variable=ai_var).pack(anchor=tk.W, pady=5)
+
     def load_deck_file_with_gui(filename):
         """다이얼로그에서 예외가 발생하면 경고 메시지를 띄우고 기본 덱으로 작동시킵니다."""
         try:
@@ -78,18 +97,20 @@ def select_decks_gui():
             messagebox.showwarning("덱 로드 실패", f"덱 파일 로드 실패로 기본 덱을 사용합니다. {str(e)}")
             return None
 
-    result = {"p1": None, "p2": None}
+    result = {"p1": None, "p2": None, "ai": False}
 
     def start_game():
         """선택한 덱 정보로 게임을 시작합니다."""
         result["p1"] = load_deck_file_with_gui(p1_var.get())
         result["p2"] = load_deck_file_with_gui(p2_var.get())
+        result["ai"] = ai_var.get()
         root.destroy()
 
     def start_fallback():
         """기본 덱 설정을 적용하여 시작합니다."""
         result["p1"] = None
         result["p2"] = None
+        result["ai"] = ai_var.get()
         root.destroy()
 
     btn_frame = ttk.Frame(frame)
@@ -102,19 +123,29 @@ def select_decks_gui():
     fallback_btn.pack(side=tk.RIGHT, padx=5)
 
     root.mainloop()
-    return result["p1"], result["p2"]
+    return result["p1"], result["p2"], result["ai"]
 
 
 # 게임 실행 예시입니다.
 if __name__ == "__main__":
     card_data.load_card_databases('card_database/3_parsed_database/card_database_parsed.json')
-    p1_deck, p2_deck = select_decks_gui()
+    p1_deck, p2_deck, use_ai = select_decks_gui()
     game = Game("player1", "player2", p1_deck, p2_deck)
+    ai_agent = GuiMCTSAgent(game.gui, time_budget=1.0) if use_ai else None
     current_player = "player1"
     opponent_id = game.opponent_id[current_player]
 
     for turn_num in range(1, 21):  # 20턴까지 진행하는 예시입니다.
 
+        # AI가 맡은 플레이어의 턴은 에이전트가 끝까지 진행합니다.
+        if ai_agent is not None and current_player == "player2":
+            ai_agent.play_turn(game, current_player)
+            if game.is_game_over():
+                break
+            current_player = game.opponent_id[current_player]
+            opponent_id = game.opponent_id[current_player]
+            continue
+
         while True:
             # '선택 대기' 상태이면 선택부터 처리합니다.
             game.process_player_choice()
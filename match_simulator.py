@@ -0,0 +1,433 @@
+# 역할 정의. 두 덱을 헤드리스 게임으로 여러 번 대전시켜 승률, 게임 길이, 신뢰구간을 집계하는 배치 매치업 시뮬레이터 스크립트입니다.
+
+import os
+import sys
+import json
+import math
+import multiprocessing
+from collections import Counter
+from statistics import NormalDist
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple, Union
+
+# 절대 경로 설정을 위해 작업 디렉토리를 참조합니다.
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import src.common.card_data as card_data
+from src.common.deck_utils import load_deck_card_ids
+from src.common.logger import configure_logging
+from src.common.rng import make_rng, AGENT_STREAM
+from src.engine.decision_provider import RandomAgent, RandomDecisionProvider
+from src.engine.main_game_logic import Game
+from src.engine.mcts_agent import MCTSAgent
+from fuzz_runner import game_time_limit
+
+CARD_DB_PATH = 'card_database/3_parsed_database/card_database_parsed.json'
+DEFAULT_MAX_TURNS = 20  # 게임당 최대 턴 수입니다. 넘으면 무승부로 처리합니다.
+DEFAULT_GAME_TIMEOUT = 120  # 게임 하나에 허용하는 최대 초입니다. 넘으면 오류 게임으로 처리합니다.
+DEFAULT_CONFIDENCE = 0.95  # 신뢰구간의 기본 신뢰수준입니다.
+ERROR_WARNING_SHARE = 0.2  # 오류 게임 비율이 이 값 이상이면 요약에 경고를 붙입니다.
+TOP_ERROR_TYPES = 3  # 요약에 보여 주는 오류 유형 수입니다.
+MAX_ERROR_MESSAGE_LENGTH = 200  # 오류 유형별로 남기는 예시 메시지의 최대 길이입니다.
+
+# 에이전트 이름별 클래스입니다. 에이전트 사양은 이름 문자열이나 (이름, 생성자 인자 딕셔너리) 쌍입니다.
+AGENT_TYPES = {
+    "random": RandomAgent,
+    "mcts": MCTSAgent,
+}
+
+# 게임 하나의 결과입니다. 오류 게임은 승률과 게임 길이 집계에서 제외합니다.
+OUTCOME_DECK_A = "deck_a"
+OUTCOME_DECK_B = "deck_b"
+OUTCOME_DRAW = "draw"
+OUTCOME_ERROR = "error"
+
+# 적응형 실행의 조기 종료 사유입니다.
+STOP_CI_WIDTH = "ci_width"  # 승률 신뢰구간 폭이 목표 이하로 좁아졌습니다.
+STOP_SPRT_H1 = "sprt_h1"  # SPRT가 덱 A 승률이 p1이라는 가설을 채택했습니다.
+STOP_SPRT_H0 = "sprt_h0"  # SPRT가 덱 A 승률이 p0이라는 가설을 채택했습니다.
+DEFAULT_MIN_GAMES = 20  # 적응형 실행에서 조기 종료를 판정하기 전에 끝내야 하는 최소 게임 수입니다.
+
+AgentSpec = Union[str, Tuple[str, Dict[str, Any]]]
+DeckSpec = Union[str, Sequence[Any]]
+GameError = Tuple[str, str]  # 오류 게임의 (예외 타입 이름, 메시지)입니다.
+
+# 풀 워커 프로세스마다 초기화 시점에 한 번 채워지는 실행 상태입니다.
+_match_worker_state: Dict[str, Any] = {}
+
+
+class MatchupStats:
+    """게임별 기록을 남기지 않고 결과 수와 게임 길이의 평균, 분산만 누적하는 스트리밍 통계입니다.
+    게임 길이는 웰포드 방법으로 갱신하고 승률은 무승부를 반승으로 셉니다.
+    오류 게임은 예외 타입 이름별 개수와 타입별 첫 메시지만 남기므로 오류가 많아도 메모리는 오류 유형 수에만 비례합니다."""
+
+    def __init__(self):
+        """MatchupStats 클래스의 생성자입니다."""
+        self.games = 0
+        self.deck_a_wins = 0
+        self.deck_b_wins = 0
+        self.draws = 0
+        self.errors = 0
+        self.error_types: Counter = Counter()  # 예외 타입 이름별 오류 게임 수입니다.
+        self.error_messages: Dict[str, str] = {}  # 예외 타입 이름별로 처음 받은 오류 메시지입니다.
+        self.first_player_wins = 0
+        self._turns_mean = 0.0
+        self._turns_m2 = 0.0
+
+    def add(self, outcome: str, turns: int, deck_a_first: bool, error: Optional[GameError] = None):
+        """게임 하나의 결과를 누적합니다. 오류 게임이면 error로 받은 예외 타입 이름과 메시지를 유형별로 셉니다."""
+        self.games += 1
+        if outcome == OUTCOME_ERROR:
+            self.errors += 1
+            error_type, message = error or ("Unknown", "")
+            self.error_types[error_type] += 1
+            self.error_messages.setdefault(error_type, message[:MAX_ERROR_MESSAGE_LENGTH])
+            return
+        if outcome == OUTCOME_DECK_A:
+            self.deck_a_wins += 1
+            self.first_player_wins += deck_a_first
+        elif outcome == OUTCOME_DECK_B:
+            self.deck_b_wins += 1
+            self.first_player_wins += not deck_a_first
+        else:
+            self.draws += 1
+        delta = turns - self._turns_mean
+        self._turns_mean += delta / self.completed
+        self._turns_m2 += delta * (turns - self._turns_mean)
+
+    @property
+    def completed(self) -> int:
+        """오류 없이 끝난 게임 수입니다."""
+        return self.games - self.errors
+
+    @property
+    def win_rate(self) -> float:
+        """덱 A의 승률입니다. 끝난 게임이 없으면 0.5를 반환합니다."""
+        if not self.completed:
+            return 0.5
+        return (self.deck_a_wins + 0.5 * self.draws) / self.completed
+
+    def win_rate_interval(self, confidence: float = DEFAULT_CONFIDENCE) -> Tuple[float, float]:
+        """덱 A 승률의 윌슨 점수 신뢰구간을 반환합니다. 끝난 게임이 없으면 (0, 1)입니다."""
+        n = self.completed
+        if not n:
+            return 0.0, 1.0
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        p = self.win_rate
+        denominator = 1 + z * z / n
+        center = (p + z * z / (2 * n)) / denominator
+        half_width = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+        return max(0.0, center - half_width), min(1.0, center + half_width)
+
+    def log_likelihood_ratio(self, p0: float, p1: float) -> float:
+        """덱 A 승률이 p1이라는 가설과 p0이라는 가설의 로그 우도비를 반환합니다. 무승부는 반승 반패로 셉니다."""
+        score = self.deck_a_wins + 0.5 * self.draws
+        return score * math.log(p1 / p0) + (self.completed - score) * math.log((1 - p1) / (1 - p0))
+
+    @property
+    def mean_turns(self) -> float:
+        """끝난 게임의 평균 턴 수입니다."""
+        return self._turns_mean
+
+    @property
+    def turns_std(self) -> float:
+        """끝난 게임 턴 수의 표본 표준편차입니다."""
+        if self.completed < 2:
+            return 0.0
+        return math.sqrt(self._turns_m2 / (self.completed - 1))
+
+    def turns_interval(self, confidence: float = DEFAULT_CONFIDENCE) -> Tuple[float, float]:
+        """평균 턴 수의 정규 근사 신뢰구간을 반환합니다."""
+        if not self.completed:
+            return 0.0, 0.0
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        half_width = z * self.turns_std / math.sqrt(self.completed)
+        return self._turns_mean - half_width, self._turns_mean + half_width
+
+    def to_dict(self, confidence: float = DEFAULT_CONFIDENCE) -> Dict[str, Any]:
+        """집계 결과를 JSON으로 저장할 수 있는 딕셔너리로 반환합니다."""
+        return {
+            "games": self.games,
+            "completed": self.completed,
+            "errors": self.errors,
+            "error_types": dict(self.error_types.most_common()),
+            "error_messages": dict(self.error_messages),
+            "deck_a_wins": self.deck_a_wins,
+            "deck_b_wins": self.deck_b_wins,
+            "draws": self.draws,
+            "deck_a_win_rate": self.win_rate,
+            "deck_a_win_rate_ci": list(self.win_rate_interval(confidence)),
+            "first_player_win_rate": self.first_player_wins / self.completed if self.completed else 0.5,
+            "mean_turns": self.mean_turns,
+            "turns_std": self.turns_std,
+            "turns_ci": list(self.turns_interval(confidence)),
+            "confidence": confidence,
+        }
+
+
+class EarlyStopping:
+    """적응형 매치업 실행의 조기 종료 조건입니다. 게임이 끝날 때마다 check로 더 진행할지 판정합니다.
+
+    target_ci_width가 있으면 덱 A 승률의 윌슨 신뢰구간 폭이 그 이하가 될 때 멈춥니다.
+    sprt가 (p0, p1)이면 덱 A 승률이 p0이라는 가설과 p1이라는 가설 사이의 순차 확률비 검정을 진행하고
+    로그 우도비가 ln((1 - beta) / alpha) 이상이면 p1, ln(beta / (1 - alpha)) 이하이면 p0을 채택하고 멈춥니다.
+    두 조건을 함께 주면 먼저 충족되는 쪽에서 멈추며 min_games판이 끝나기 전에는 판정하지 않습니다.
+    """
+
+    def __init__(self, target_ci_width: Optional[float] = None, sprt: Optional[Tuple[float, float]] = None,
+                 alpha: float = 0.05, beta: float = 0.05, min_games: int = DEFAULT_MIN_GAMES,
+                 confidence: float = DEFAULT_CONFIDENCE):
+        """EarlyStopping 클래스의 생성자입니다. 조건 값이 범위를 벗어나면 ValueError를 발생시킵니다."""
+        if target_ci_width is None and sprt is None:
+            raise ValueError("EarlyStopping needs target_ci_width or sprt.")
+        if target_ci_width is not None and not 0 < target_ci_width < 1:
+            raise ValueError("target_ci_width must be between 0 and 1.")
+        if sprt is not None and not 0 < sprt[0] < sprt[1] < 1:
+            raise ValueError("sprt must be (p0, p1) with 0 < p0 < p1 < 1.")
+        if not (0 < alpha < 1 and 0 < beta < 1):
+            raise ValueError("alpha and beta must be between 0 and 1.")
+        self.target_ci_width = target_ci_width
+        self.sprt = sprt
+        self.min_games = min_games
+        self.confidence = confidence
+        self.upper_bound = math.log((1 - beta) / alpha)
+        self.lower_bound = math.log(beta / (1 - alpha))
+
+    def check(self, stats: MatchupStats) -> Optional[str]:
+        """현재 통계로 조기 종료 여부를 판정하고 멈춰야 하면 종료 사유를, 아니면 None을 반환합니다."""
+        if stats.completed < self.min_games:
+            return None
+        if self.sprt is not None:
+            llr = stats.log_likelihood_ratio(*self.sprt)
+            if llr >= self.upper_bound:
+                return STOP_SPRT_H1
+            if llr <= self.lower_bound:
+                return STOP_SPRT_H0
+        if self.target_ci_width is not None:
+            low, high = stats.win_rate_interval(self.confidence)
+            if high - low <= self.target_ci_width:
+                return STOP_CI_WIDTH
+        return None
+
+
+def build_agent(spec: AgentSpec, rng) -> RandomAgent:
+    """에이전트 사양으로 에이전트를 만듭니다. 알 수 없는 이름이면 ValueError를 발생시킵니다."""
+    name, kwargs = (spec, {}) if isinstance(spec, str) else spec
+    agent_type = AGENT_TYPES.get(name)
+    if agent_type is None:
+        raise ValueError(f"Unknown agent {name!r}. Available agents are {sorted(AGENT_TYPES)}.")
+    return agent_type(rng=rng, **kwargs)
+
+
+def _deck_card_ids(deck: DeckSpec) -> List[str]:
+    """덱 JSON 경로나 card_id 또는 CardData 목록을 워커에 넘길 card_id 목록으로 바꿉니다."""
+    if isinstance(deck, str):
+        return load_deck_card_ids(deck)
+    return [getattr(card, "card_id", card) for card in deck]
+
+
+def _resolve_deck(card_ids: List[str]) -> List[Any]:
+    """card_id 목록을 CardData 목록으로 바꿉니다. 찾을 수 없는 카드가 있으면 ValueError를 발생시킵니다."""
+    deck = []
+    for card_id in card_ids:
+        data = card_data.get_card_data_by_id(card_id)
+        if data is None:
+            raise ValueError(f"Card {card_id!r} in deck was not found in the card database.")
+        deck.append(data)
+    return deck
+
+
+def play_match_game(deck_first: List[Any], deck_second: List[Any], agent_first: AgentSpec, agent_second: AgentSpec,
+                    seed: int, max_turns: int = DEFAULT_MAX_TURNS) -> Tuple[Optional[int], int]:
+    """선공 덱과 후공 덱으로 게임 하나를 끝까지 진행하고 (승자, 진행한 턴 수)를 반환합니다.
+    승자는 선공이면 0, 후공이면 1이며 max_turns 안에 승부가 나지 않거나 두 리더가 함께 쓰러지면 None입니다."""
+    game = Game("player1", "player2", deck_first, deck_second,
+                decision_provider=RandomDecisionProvider(rng=make_rng(seed, AGENT_STREAM)), headless=True, seed=seed)
+    agents = {
+        "player1": build_agent(agent_first, make_rng(seed, AGENT_STREAM, "player1")),
+        "player2": build_agent(agent_second, make_rng(seed, AGENT_STREAM, "player2")),
+    }
+    gsm = game.game_state_manager
+    try:
+        while not game.is_game_over() and gsm.turn_number <= max_turns:
+            player_id = gsm.current_turn_player_id
+            agents[player_id].play_turn(game, player_id)
+    finally:
+        for agent in agents.values():
+            agent.close()
+
+    first_dead = gsm.players["player1"].current_defense <= 0
+    second_dead = gsm.players["player2"].current_defense <= 0
+    turns = min(gsm.turn_number, max_turns)
+    if first_dead == second_dead:
+        return None, turns
+    return (1 if first_dead else 0), turns
+
+
+def _init_match_worker(deck_a_ids: List[str], deck_b_ids: List[str], agents: Tuple[AgentSpec, AgentSpec],
+                       max_turns: int, game_timeout: Optional[int], log_level: str):
+    """매치업 워커를 초기화합니다. 카드 DB를 적재하고 두 덱을 한 번만 CardData 목록으로 바꿔 둡니다."""
+    configure_logging(log_level)
+    card_data.load_card_databases(CARD_DB_PATH)
+    _match_worker_state.update({
+        "deck_a": _resolve_deck(deck_a_ids),
+        "deck_b": _resolve_deck(deck_b_ids),
+        "agents": agents,
+        "max_turns": max_turns,
+        "game_timeout": game_timeout,
+    })
+
+
+def _run_match_game(task: Tuple[int, bool]) -> Tuple[str, int, bool, Optional[GameError]]:
+    """워커에서 (시드, 덱 A 선공 여부) 작업 하나를 진행하고 (결과, 턴 수, 덱 A 선공 여부, 오류)를 반환합니다.
+    엔진 오류나 시간 초과로 끝난 게임은 오류 결과와 (예외 타입 이름, 메시지)로 돌려주고 다음 작업을 계속 처리합니다."""
+    seed, deck_a_first = task
+    state = _match_worker_state
+    agent_a, agent_b = state["agents"]
+    if deck_a_first:
+        decks, agents = (state["deck_a"], state["deck_b"]), (agent_a, agent_b)
+    else:
+        decks, agents = (state["deck_b"], state["deck_a"]), (agent_b, agent_a)
+    try:
+        with game_time_limit(state["game_timeout"]):
+            winner, turns = play_match_game(decks[0], decks[1], agents[0], agents[1], seed, state["max_turns"])
+    except Exception as e:
+        return OUTCOME_ERROR, 0, deck_a_first, (type(e).__name__, str(e))
+    if winner is None:
+        return OUTCOME_DRAW, turns, deck_a_first, None
+    return (OUTCOME_DECK_A if (winner == 0) == deck_a_first else OUTCOME_DECK_B), turns, deck_a_first, None
+
+
+def _match_tasks(n_games: int, seed_start: int, alternate_first: bool) -> Iterator[Tuple[int, bool]]:
+    """게임마다 연속된 시드와 덱 A 선공 여부를 만듭니다. alternate_first이면 짝수 번째 게임만 덱 A가 선공입니다."""
+    for index in range(n_games):
+        yield seed_start + index, (not alternate_first or index % 2 == 0)
+
+
+def simulate_matchups(deck_a: DeckSpec, deck_b: DeckSpec, n_games: int = 100,
+                      agents: Tuple[AgentSpec, AgentSpec] = ("random", "random"), workers: Optional[int] = None,
+                      alternate_first: bool = True, seed_start: int = 0, max_turns: int = DEFAULT_MAX_TURNS,
+                      game_timeout: Optional[int] = DEFAULT_GAME_TIMEOUT, confidence: float = DEFAULT_CONFIDENCE,
+                      log_level: str = "OFF", early_stopping: Optional[EarlyStopping] = None) -> Dict[str, Any]:
+    """덱 A와 덱 B를 n_games번 대전시켜 덱 A 기준 승률, 게임 길이, 신뢰구간을 반환합니다.
+
+    매개변수
+    ----------
+    deck_a, deck_b (str | list) - decks 디렉토리 형식의 덱 JSON 경로이거나 card_id 또는 CardData 목록입니다.
+    agents (tuple) - 덱 A와 덱 B를 조작할 에이전트 사양입니다. 'random', 'mcts' 또는 ('mcts', {'iterations' 200})처럼 이름과 생성자 인자 쌍입니다.
+    workers (int) - 워커 프로세스 수입니다. 생략하거나 0이면 CPU 코어 수, 1이면 현재 프로세스에서 진행합니다.
+    alternate_first (bool) - 게임마다 선공 덱을 번갈아 바꿉니다. False이면 덱 A가 항상 선공입니다.
+    game_timeout (int) - 게임 하나에 허용하는 최대 초입니다. 넘거나 엔진 오류가 나면 오류 게임으로 집계에서 제외합니다.
+    early_stopping (EarlyStopping) - 주면 적응형으로 실행하여 조건이 충족되는 즉시 새 게임 배정을 멈춥니다. 이때 n_games는 최대 게임 수입니다.
+
+    게임 결과는 완료되는 대로 MatchupStats에 누적하고 버리므로 게임 수와 관계없이 메모리 사용량이 일정합니다.
+    시드는 게임마다 seed_start부터 연속으로 부여되어 워커 수와 관계없이 같은 결과가 재현됩니다.
+    적응형 실행은 결과를 시드 순서대로 받아 판정하므로 멈추는 지점도 워커 수와 관계없이 같고, 짧게 끝나는 게임이 먼저 집계되어 판정이 치우치지도 않습니다.
+    """
+    deck_a_ids = _deck_card_ids(deck_a)
+    deck_b_ids = _deck_card_ids(deck_b)
+    initargs = (deck_a_ids, deck_b_ids, tuple(agents), max_turns, game_timeout, log_level)
+    tasks = _match_tasks(n_games, seed_start, alternate_first)
+    workers = workers or os.cpu_count() or 1
+    stats = MatchupStats()
+    stop_reason = None
+
+    if workers == 1:
+        _init_match_worker(*initargs)
+        for task in tasks:
+            stats.add(*_run_match_game(task))
+            if early_stopping and (stop_reason := early_stopping.check(stats)):
+                break
+    else:
+        with multiprocessing.Pool(workers, initializer=_init_match_worker, initargs=initargs) as pool:
+            if early_stopping:
+                # 판정 직후 멈출 수 있도록 한 게임씩 배정하고, 풀을 빠져나가면 진행 중이거나 대기 중인 게임은 종료됩니다.
+                results = pool.imap(_run_match_game, tasks)
+            else:
+                # 작업 분배 오버헤드를 줄이면서도 워커 간 부하가 고르게 퍼지도록 묶음 크기를 정합니다.
+                results = pool.imap_unordered(_run_match_game, tasks, max(1, n_games // (workers * 8)))
+            for result in results:
+                stats.add(*result)
+                if early_stopping and (stop_reason := early_stopping.check(stats)):
+                    break
+
+    summary = stats.to_dict(confidence)
+    summary["agents"] = [agent if isinstance(agent, str) else agent[0] for agent in agents]
+    summary["alternate_first"] = alternate_first
+    summary["stop_reason"] = stop_reason
+    if early_stopping and early_stopping.sprt is not None:
+        summary["sprt_llr"] = stats.log_likelihood_ratio(*early_stopping.sprt)
+    return summary
+
+
+def format_matchup_summary(summary: Dict[str, Any], deck_a_name: str = "덱 A", deck_b_name: str = "덱 B") -> str:
+    """매치업 결과를 사람이 읽기 쉬운 여러 줄 문자열로 만듭니다."""
+    low, high = summary["deck_a_win_rate_ci"]
+    turns_low, turns_high = summary["turns_ci"]
+    confidence = int(round(summary["confidence"] * 100))
+    lines = [
+        f"{deck_a_name} 대 {deck_b_name} ({summary['completed']}판 완료, 오류 {summary['errors']}판)",
+        f"- {deck_a_name} 승 {summary['deck_a_wins']}, {deck_b_name} 승 {summary['deck_b_wins']}, 무승부 {summary['draws']}",
+        f"- {deck_a_name} 승률 {summary['deck_a_win_rate']:.3f} ({confidence}% 신뢰구간 {low:.3f} ~ {high:.3f})",
+        f"- 선공 승률 {summary['first_player_win_rate']:.3f}",
+        f"- 평균 게임 길이 {summary['mean_turns']:.2f}턴 ({confidence}% 신뢰구간 {turns_low:.2f} ~ {turns_high:.2f}, 표준편차 {summary['turns_std']:.2f})",
+    ]
+    if summary["errors"]:
+        top_errors = list(summary["error_types"].items())[:TOP_ERROR_TYPES]
+        messages = summary["error_messages"]
+        lines.append("- 오류 유형 " + ", ".join(f"{error_type} {count}판 ({messages.get(error_type, '')})" for error_type, count in top_errors))
+        share = summary["errors"] / summary["games"]
+        if share >= ERROR_WARNING_SHARE:
+            lines.append(f"- [경고] 전체 {summary['games']}판 중 {summary['errors']}판({share:.0%})이 오류로 끝났습니다. 승률과 게임 길이는 오류 없이 끝난 게임만 반영하므로 치우쳐 있을 수 있습니다.")
+    stop_reason = summary.get("stop_reason")
+    if stop_reason == STOP_CI_WIDTH:
+        lines.append(f"- 승률 신뢰구간 폭이 목표 이하로 좁아져 {summary['games']}판에서 조기 종료")
+    elif stop_reason in (STOP_SPRT_H1, STOP_SPRT_H0):
+        hypothesis = "p1" if stop_reason == STOP_SPRT_H1 else "p0"
+        lines.append(f"- SPRT가 {hypothesis} 가설을 채택하여 {summary['games']}판에서 조기 종료 (로그 우도비 {summary['sprt_llr']:.3f})")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="SVsim 덱 대 덱 배치 매치업 시뮬레이터")
+    parser.add_argument("deck_a", help="덱 A JSON 경로")
+    parser.add_argument("deck_b", help="덱 B JSON 경로")
+    parser.add_argument("--games", type=int, default=100, help="진행할 게임 수이며 적응형 실행에서는 최대 게임 수")
+    parser.add_argument("--workers", type=int, default=0, help="워커 프로세스 수이며 0이면 CPU 코어 수, 1이면 단일 프로세스로 실행")
+    parser.add_argument("--agent-a", choices=sorted(AGENT_TYPES), default="random", help="덱 A를 조작할 에이전트")
+    parser.add_argument("--agent-b", choices=sorted(AGENT_TYPES), default="random", help="덱 B를 조작할 에이전트")
+    parser.add_argument("--mcts-time", type=float, default=0.2, help="MCTS 에이전트의 수마다의 탐색 시간(초)")
+    parser.add_argument("--mcts-iterations", type=int, default=None, help="MCTS 에이전트의 수마다의 최대 탐색 반복 횟수")
+    parser.add_argument("--fixed-first", action="store_true", help="선공을 번갈아 바꾸지 않고 덱 A가 항상 선공")
+    parser.add_argument("--seed-start", type=int, default=0, help="첫 게임 시드")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS, help="게임당 최대 턴 수이며 넘으면 무승부")
+    parser.add_argument("--game-timeout", type=int, default=DEFAULT_GAME_TIMEOUT, help="게임당 최대 초이며 0이면 제한 없음")
+    parser.add_argument("--confidence", type=float, default=DEFAULT_CONFIDENCE, help="신뢰구간의 신뢰수준")
+    parser.add_argument("--target-ci-width", type=float, default=None, help="덱 A 승률 신뢰구간 폭이 이 값 이하가 되면 조기 종료")
+    parser.add_argument("--sprt", type=float, nargs=2, metavar=("P0", "P1"), default=None, help="덱 A 승률이 P0인지 P1인지 SPRT로 판정되면 조기 종료")
+    parser.add_argument("--sprt-alpha", type=float, default=0.05, help="SPRT의 1종 오류율")
+    parser.add_argument("--sprt-beta", type=float, default=0.05, help="SPRT의 2종 오류율")
+    parser.add_argument("--min-games", type=int, default=DEFAULT_MIN_GAMES, help="조기 종료를 판정하기 전에 끝내야 하는 최소 게임 수")
+    parser.add_argument("--output", default=None, help="결과 JSON을 저장할 경로")
+    args = parser.parse_args()
+
+    early_stopping = None
+    if args.target_ci_width is not None or args.sprt is not None:
+        early_stopping = EarlyStopping(args.target_ci_width, tuple(args.sprt) if args.sprt else None, args.sprt_alpha,
+                                       args.sprt_beta, args.min_games, args.confidence)
+
+    def agent_spec(name: str) -> AgentSpec:
+        """명령행 옵션으로 에이전트 사양을 만듭니다."""
+        if name == "mcts":
+            return name, {"time_budget": args.mcts_time, "iterations": args.mcts_iterations}
+        return name
+
+    summary = simulate_matchups(args.deck_a, args.deck_b, args.games, agents=(agent_spec(args.agent_a), agent_spec(args.agent_b)),
+                                workers=args.workers, alternate_first=not args.fixed_first, seed_start=args.seed_start,
+                                max_turns=args.max_turns, game_timeout=args.game_timeout or None, confidence=args.confidence,
+                                early_stopping=early_stopping)
+    print(format_matchup_summary(summary, os.path.splitext(os.path.basename(args.deck_a))[0], os.path.splitext(os.path.basename(args.deck_b))[0]))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
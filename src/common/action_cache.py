@@ -0,0 +1,69 @@
+# 역할 정의. 플레이어별 합법 행동 목록을 구간별로 보관하고 영역, 카드, 자원 변경 알림을 받아 영향받는 구간만 무효화하는 행동 캐시를 정의합니다.
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.common.enums import Zone
+from src.common.journal import Journal, DETACHED_JOURNAL
+
+PLAY_SEGMENT = "play"  # 패의 카드를 내는 행동 구간입니다. 패, 필드 크기, PP가 바뀌면 무효화합니다.
+FIELD_SEGMENT = "field"  # 필드 카드의 공격, 진화, 초진화, 활성화 행동 구간입니다. 양쪽 필드와 PP, EP, SEP가 바뀌면 무효화합니다.
+
+SegmentKey = Tuple[str, str]  # (플레이어 ID, 구간 이름) 형태의 구간 키입니다.
+
+
+class ActionCache:
+    """플레이어별 합법 행동 목록을 구간 단위로 보관하는 캐시입니다.
+    영역 이동은 엔티티 색인이, 카드의 코스트와 공격 가능 상태와 키워드 변경은 카드가, PP와 EP 변경은 플레이어가 알리며
+    알림을 받으면 그 변경이 영향을 주는 구간만 버립니다. 행동 생성기는 버려진 구간만 다시 계산합니다.
+    구간의 저장과 삭제는 저널에 기록되므로 되돌린 뒤에도 그 시점의 국면과 어긋나지 않습니다."""
+
+    def __init__(self, journal: Journal = DETACHED_JOURNAL):
+        """ActionCache 클래스의 생성자입니다."""
+        self._journal = journal
+        self._entity_index: Optional[Dict[str, Tuple[Any, str, Zone]]] = None
+        self.segments: Dict[SegmentKey, List[Any]] = {}
+
+    def bind_entity_index(self, entity_index: Dict[str, Tuple[Any, str, Zone]]):
+        """카드 변경 알림에서 카드가 놓인 영역을 찾을 엔티티 색인을 연결합니다."""
+        self._entity_index = entity_index
+
+    def get(self, player_id: str, segment: str) -> Optional[List[Any]]:
+        """보관 중인 구간의 행동 목록을 반환합니다. 무효화되었으면 None을 반환합니다."""
+        return self.segments.get((player_id, segment))
+
+    def store(self, player_id: str, segment: str, actions: List[Any]):
+        """다시 계산한 구간의 행동 목록을 보관합니다."""
+        self._journal.set_item(self.segments, (player_id, segment), actions)
+
+    def clear(self):
+        """모든 구간을 버립니다. 스냅샷 복원처럼 알림 없이 국면이 통째로 바뀔 때 씁니다."""
+        self.segments.clear()
+
+    def _drop(self, key: SegmentKey):
+        """구간 하나를 버립니다."""
+        if key in self.segments:
+            self._journal.pop_item(self.segments, key)
+
+    def on_zone_changed(self, owner_id: str, zone: Zone):
+        """owner_id의 zone 영역 구성이 바뀌었음을 알립니다.
+        패가 바뀌면 소유자의 카드 플레이 구간을, 필드가 바뀌면 필드 크기를 읽는 소유자의 카드 플레이 구간과
+        공격자와 공격 대상을 모두 읽는 양쪽 플레이어의 필드 구간을 버립니다."""
+        if zone == Zone.HAND:
+            self._drop((owner_id, PLAY_SEGMENT))
+        elif zone == Zone.FIELD:
+            self._drop((owner_id, PLAY_SEGMENT))
+            for key in [key for key in self.segments if key[1] == FIELD_SEGMENT]:
+                self._drop(key)
+
+    def on_card_changed(self, card_id: str):
+        """카드의 행동 판정에 쓰이는 상태가 바뀌었음을 알립니다. 카드가 놓인 영역의 변경으로 처리합니다."""
+        if not self.segments or self._entity_index is None:
+            return
+        entry = self._entity_index.get(card_id)
+        if entry is not None:
+            self.on_zone_changed(entry[1], entry[2])
+
+    def on_resources_changed(self, player_id: str):
+        """플레이어의 PP, 엑스트라 PP, EP, SEP가 바뀌었음을 알립니다. 그 플레이어의 두 구간을 모두 버립니다."""
+        self._drop((player_id, PLAY_SEGMENT))
+        self._drop((player_id, FIELD_SEGMENT))
@@ -1,20 +1,40 @@
 import json
 import os
 import glob
-from typing import List, Any, Dict
+import hashlib
+import pickle
+import re
+from typing import List, Any, Dict, Iterable, Optional, Tuple
 from src.common.enums import CardType, EffectType, TargetType, ProcessType, ClassType, TribeType, EventType
 from src.common.effect import Effect, Process
+from src.common.compiled_effect import compile_card_effects
+from src.common.condition import compile_condition
+from src.common.logger import get_logger
+
+_log = get_logger("data")
 
 KOR_NAME_MAP = {}
 
-def load_kor_names(kor_db_dir: str = 'card_database/2_kor_database'):
+DEFAULT_KOR_DB_DIR = 'card_database/2_kor_database'
+SNAPSHOT_DIR_NAME = '.snapshot'  # 컴파일된 카드 DB 스냅샷을 원본 JSON 옆에 저장할 디렉터리 이름입니다.
+SNAPSHOT_FORMAT_VERSION = 2  # 스냅샷 구조가 바뀌면 올려서 기존 스냅샷을 무효화합니다.
+
+def _resolve_kor_db_dir(kor_db_dir: str = DEFAULT_KOR_DB_DIR) -> Optional[str]:
+    """한글 카드명 디렉터리의 실제 경로를 반환합니다. 찾지 못하면 None을 반환합니다."""
+    if os.path.exists(kor_db_dir):
+        return kor_db_dir
+    kor_db_dir = os.path.join('..', kor_db_dir)
+    if os.path.exists(kor_db_dir):
+        return kor_db_dir
+    return None
+
+def load_kor_names(kor_db_dir: str = DEFAULT_KOR_DB_DIR):
     """한글 카드명 매핑 데이터를 불러옵니다."""
     global KOR_NAME_MAP
-    if not os.path.exists(kor_db_dir):
-        kor_db_dir = os.path.join('..', kor_db_dir)
-        if not os.path.exists(kor_db_dir):
-            return
-    for file_path in glob.glob(os.path.join(kor_db_dir, '*.json')):
+    kor_db_dir = _resolve_kor_db_dir(kor_db_dir)
+    if kor_db_dir is None:
+        return
+    for file_path in sorted(glob.glob(os.path.join(kor_db_dir, '*.json'))):
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -24,24 +44,132 @@ def load_kor_names(kor_db_dir: str = 'card_database/2_kor_database'):
                     if en_name and ko_name:
                         KOR_NAME_MAP[en_name] = ko_name
         except Exception as e:
-            print(f"[WARNING] Failed to load kor names from {file_path} {e}")
+            _log.warning(lambda e=e: f"Failed to load kor names from {file_path} {e}")
+
+# 카드명 앞에 붙어 들어오는 오염된 접두사와 영어 관사 및 수량사 목록입니다.
+CARD_NAME_PREFIXES = (
+    "exact copies of ", "an exact copy of ", "copies of ",
+    "copy of ", "and give them ", "and give it ",
+    "a ", "an ", "the ", "d ", "and "
+)
+
+def strip_card_name_prefixes(text: str) -> str:
+    """오염된 접두사나 영어 관사 및 수량사를 반복적으로 제거하여 순수 카드명을 추출합니다."""
+    clean_name = text.strip()
+    changed = True
+    while changed:
+        changed = False
+        clean_name_lower = clean_name.lower()
+        for prefix in CARD_NAME_PREFIXES:
+            if clean_name_lower.startswith(prefix):
+                clean_name = clean_name[len(prefix):].strip()
+                changed = True
+                break
+    return clean_name
+
+def normalize_card_alias(text: str) -> str:
+    """카드명을 접두사 제거, 소문자화, 공백 정리를 거친 별칭 형태로 정규화합니다."""
+    return " ".join(strip_card_name_prefixes(text).lower().split())
 
 class CardDatabase(dict):
-    """card_id와 name 모두로 검색이 가능한 데이터베이스 클래스입니다."""
+    """card_id와 name 모두로 검색이 가능한 데이터베이스 클래스입니다.
+    영문명, 한글명, 정규화 별칭 보조 인덱스를 삽입 시점에 함께 갱신하여 이름 조회도 전체 순회 없이 처리합니다.
+    이름이 겹치면 먼저 삽입된 카드가 우선합니다."""
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._name_index: Dict[str, str] = {}
+        self._name_ko_index: Dict[str, str] = {}
+        self._alias_index: Dict[str, str] = {}
+        self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        # 인덱스는 항목으로부터 다시 만들 수 있으므로 항목만 직렬화합니다.
+        return (self.__class__, (dict(self),))
+
+    def _index_entries(self, card_data_obj) -> List[tuple]:
+        """카드 데이터가 등록될 (인덱스, 인덱스 키) 쌍 목록을 반환합니다."""
+        entries = []
+        name = getattr(card_data_obj, 'name', None)
+        if name:
+            entries.append((self._name_index, name))
+            entries.append((self._alias_index, normalize_card_alias(name)))
+        name_ko = getattr(card_data_obj, 'name_ko', None)
+        if name_ko:
+            entries.append((self._name_ko_index, name_ko))
+            entries.append((self._alias_index, normalize_card_alias(name_ko)))
+        return entries
+
+    def _index_card(self, key, card_data_obj):
+        """카드를 보조 인덱스에 등록합니다. 이미 같은 키가 있으면 기존 카드를 유지합니다."""
+        for index, index_key in self._index_entries(card_data_obj):
+            index.setdefault(index_key, key)
+
+    def _unindex_card(self, key, card_data_obj):
+        """카드를 보조 인덱스에서 제거하고 같은 이름을 가진 남은 카드가 있으면 대신 등록합니다."""
+        removed = []
+        for index, index_key in self._index_entries(card_data_obj):
+            if index.get(index_key) == key:
+                del index[index_key]
+                removed.append((index, index_key))
+        if not removed:
+            return
+        for other_key, other in self.items():
+            if other_key == key:
+                continue
+            for index, index_key in self._index_entries(other):
+                if (index, index_key) in removed:
+                    index.setdefault(index_key, other_key)
+
+    def __setitem__(self, key, value):
+        old = dict.get(self, key)
+        super().__setitem__(key, value)
+        if old is not None and old is not value:
+            self._unindex_card(key, old)
+        self._index_card(key, value)
+
+    def __delitem__(self, key):
+        old = dict.__getitem__(self, key)
+        super().__delitem__(key)
+        self._unindex_card(key, old)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if not super().__contains__(key):
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def pop(self, key, *default):
+        if not super().__contains__(key):
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = dict.__getitem__(self, key)
+        del self[key]
+        return value
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._unindex_card(key, value)
+        return key, value
+
+    def clear(self):
+        super().clear()
+        self._name_index.clear()
+        self._name_ko_index.clear()
+        self._alias_index.clear()
+
     def __contains__(self, key):
-        if super().__contains__(key):
-            return True
-        for card_data_obj in self.values():
-            if card_data_obj.name == key:
-                return True
-        return False
+        return super().__contains__(key) or key in self._name_index
 
     def __getitem__(self, key):
         if super().__contains__(key):
             return super().__getitem__(key)
-        for card_data_obj in self.values():
-            if card_data_obj.name == key:
-                return card_data_obj
+        card_key = self._name_index.get(key)
+        if card_key is not None:
+            return super().__getitem__(card_key)
         raise KeyError(key)
 
     def get(self, key, default=None):
@@ -50,11 +178,33 @@ class CardDatabase(dict):
         except KeyError:
             return default
 
+    def get_by_name(self, name: str):
+        """영문 카드명으로 카드 데이터를 조회합니다. 없으면 None을 반환합니다."""
+        card_key = self._name_index.get(name)
+        return super().__getitem__(card_key) if card_key is not None else None
+
+    def get_by_name_ko(self, name_ko: str):
+        """한글 카드명으로 카드 데이터를 조회합니다. 없으면 None을 반환합니다."""
+        card_key = self._name_ko_index.get(name_ko)
+        return super().__getitem__(card_key) if card_key is not None else None
+
+    def get_by_alias(self, text: str):
+        """접두사와 대소문자 차이를 무시한 정규화 별칭으로 카드 데이터를 조회합니다. 없으면 None을 반환합니다."""
+        card_key = self._alias_index.get(normalize_card_alias(text))
+        return super().__getitem__(card_key) if card_key is not None else None
+
 # 전역 변수
 BASIC_CARD_DATABASE = CardDatabase()
 LEGENDS_RISE_CARD_DATABASE = CardDatabase()
 TOKEN_CARD_DATABASE = CardDatabase()
 
+_COMBO_PATTERN = re.compile(r"Combo\s*\((\d+)\)", re.IGNORECASE)  # 콤보 발동 조건 수치를 추출합니다.
+_RALLY_PATTERN = re.compile(r"Rally\s*\((\d+)\)", re.IGNORECASE)  # 연계 발동 조건 수치를 추출합니다.
+_VARIABLE_DEFINITION_PATTERN = re.compile(r"X is (.*?)(?:\.|$)", re.IGNORECASE)  # 변수 X의 정의 문구를 추출합니다.
+DEFAULT_COMBO_REQUIREMENT = 3  # 텍스트에 콤보 수치가 없을 때 쓰는 기본 조건입니다.
+DEFAULT_RALLY_REQUIREMENT = 10  # 텍스트에 연계 수치가 없을 때 쓰는 기본 조건입니다.
+
+
 class CardData:
     """카드의 정적 데이터를 정의합니다."""
     def __init__(self, card_id: str, name: str, cost: int,
@@ -76,6 +226,22 @@ class CardData:
         self.required_listeners = required_listeners if required_listeners is not None else []
         self.fuse_condition = fuse_condition
         self.name_ko = name_ko
+        # 카드 참조 해결과 효과 컴파일이 끝났는지 여부입니다. 지연 적재된 카드는 처음 인스턴스화될 때 해결합니다.
+        self.references_resolved = True
+        self._parse_text_parameters()
+
+    def _parse_text_parameters(self):
+        """효과 원문에서 해결 시점에 필요한 수치와 플래그를 미리 추출합니다. 효과 해결 중에는 원문을 다시 읽지 않습니다."""
+        text = self.raw_effects_text or ""
+        text_lower = text.lower()
+        match = _COMBO_PATTERN.search(text)
+        self.combo_requirement = int(match.group(1)) if match else DEFAULT_COMBO_REQUIREMENT
+        match = _RALLY_PATTERN.search(text)
+        self.rally_requirement = int(match.group(1)) if match else DEFAULT_RALLY_REQUIREMENT
+        self.has_instead = "instead" in text_lower  # 다른 효과로 대체되는 효과가 있는지 여부입니다.
+        self.has_discard_trigger = "discarded" in text_lower  # 버려졌을 때 발동하는 효과가 있는지 여부입니다.
+        match = _VARIABLE_DEFINITION_PATTERN.search(text)
+        self.variable_definition = (match.group(1).strip() or None) if match else None  # 원문에 적힌 변수 X의 정의입니다.
 
     def get(self, key: str, default: Any = None) -> Any:
         """객체의 속성 값을 가져옵니다."""
@@ -103,12 +269,12 @@ def _load_process_from_dict(p_dict: Dict[str, Any]) -> Process:
         try:
             attrs["process"] = ProcessType[attrs["process"]]
         except KeyError:
-            print(f"[WARNING] ProcessType '{attrs['process']}' not recognized. Keeping as string.")
+            _log.warning(lambda: f"ProcessType '{attrs['process']}' not recognized. Keeping as string.")
     if "target" in attrs and attrs["target"] is not None:
         try:
             attrs["target"] = TargetType[attrs["target"]]
         except KeyError:
-            print(f"[WARNING] TargetType '{attrs['target']}' not recognized. Keeping as string.")
+            _log.warning(lambda: f"TargetType '{attrs['target']}' not recognized. Keeping as string.")
 
     if isinstance(attrs.get("target"), str):
         original = attrs["target"]
@@ -123,7 +289,7 @@ def _load_process_from_dict(p_dict: Dict[str, Any]) -> Process:
         try:
             attrs["value"] = EffectType[attrs["value"].upper()]
         except KeyError:
-            print(f"[WARNING] EffectType '{attrs['value']}' not found for {attrs['process'].name} process.")
+            _log.warning(lambda: f"EffectType '{attrs['value']}' not found for {attrs['process'].name} process.")
 
     if "value" in attrs and isinstance(attrs["value"], dict):
         attrs["value"] = _load_effect_from_dict(attrs["value"])
@@ -145,7 +311,7 @@ def _load_effect_from_dict(effect_dict: Dict[str, Any]) -> Effect:
         try:
             attrs["type"] = EffectType[attrs["type"]]
         except KeyError:
-            print(f"[WARNING] EffectType '{attrs['type']}' not recognized. Keeping as string.")
+            _log.warning(lambda: f"EffectType '{attrs['type']}' not recognized. Keeping as string.")
 
     if isinstance(attrs.get("type"), str):
         original = attrs["type"]
@@ -356,7 +522,7 @@ def _resolve_single_value(val: str, effect: Any, card_id: str, global_card_db: D
         return _create_dummy_card(val, global_card_db)
     if _is_safe_runtime_directive(val):
         return val
-    print(f"[WARNING] 카드 {card_id}의 프로세스에서 카드 데이터 '{val}'을(를) 찾을 수 없습니다.")
+    _log.warning(lambda: f"카드 {card_id}의 프로세스에서 카드 데이터 '{val}'을(를) 찾을 수 없습니다.")
     return val
 
 
@@ -387,7 +553,7 @@ def _resolve_process_references(process: Process, card_id: str, global_card_db:
                     process.value = Effect(type=keyword_enum, value=None)
                     process.attributes["value"] = process.value
                 except KeyError:
-                    print(f"[WARNING] 카드 {card_id}의 프로세스 {process_name}에 예기치 않은 스트링 입력 {process.value}.")
+                    _log.warning(lambda: f"카드 {card_id}의 프로세스 {process_name}에 예기치 않은 스트링 입력 {process.value}.")
             elif isinstance(process.value, list):
                 resolved_list = []
                 for v in process.value:
@@ -396,7 +562,7 @@ def _resolve_process_references(process: Process, card_id: str, global_card_db:
                             keyword_enum = EffectType[v.upper()]
                             resolved_list.append(Effect(type=keyword_enum, value=None))
                         except KeyError:
-                            print(f"[WARNING] 카드 {card_id}의 프로세스 {process_name}에 예기치 않은 스트링 입력 {v}.")
+                            _log.warning(lambda: f"카드 {card_id}의 프로세스 {process_name}에 예기치 않은 스트링 입력 {v}.")
                     else:
                         resolved_list.append(v)
                 process.value = resolved_list
@@ -435,7 +601,7 @@ def _resolve_process_references(process: Process, card_id: str, global_card_db:
                     ProcessType.SUMMON_COPY,
                 }
                 if process_type not in safe_string_processes:
-                    print(f"[WARNING] 카드 {card_id}의 프로세스 {process_name}에 예기치 않은 스트링 입력 {process.value}.")
+                    _log.warning(lambda: f"카드 {card_id}의 프로세스 {process_name}에 예기치 않은 스트링 입력 {process.value}.")
 
 
 def _resolve_effect_references_recursive(effect: Effect, card_id: str, global_card_db: Dict[str, CardData]):
@@ -477,32 +643,239 @@ def resolve_card_references(card_db: Dict[str, CardData], global_card_db: Dict[s
         for effect in card_data_obj.effects:
             _resolve_effect_references_recursive(effect, card_id, global_card_db)
 
-def load_card_databases(path: str = 'card_database/4_manual_database/card_database_manual.json'):
-    """단일 통합 수동 JSON 파일에서 카드 데이터베이스를 불러옵니다.
-    JSON은 각 데이터베이스에 대한 최상위 키를 포함합니다.
-    모든 카드는 대응하는 전역 데이터베이스로 로드됩니다."""
-    global BASIC_CARD_DATABASE, LEGENDS_RISE_CARD_DATABASE, TOKEN_CARD_DATABASE
-    load_kor_names()
-    import os, json
-    if not os.path.isfile(path):
-        print(f"[WARNING] {path} not found. No card data loaded.")
+# 지연 적재 상태입니다. 아직 CardData로 만들지 않은 카드의 대상 데이터베이스와 원본 딕셔너리를 card_id로 보관합니다.
+_PENDING_CARDS: Dict[str, Tuple['CardDatabase', Dict[str, Any]]] = {}
+_PENDING_NAME_INDEX: Dict[str, str] = {}  # 대기 중인 카드의 영문명, 한글명, 정규화 별칭에서 card_id로의 인덱스입니다.
+_LAZY_DUMMY_CARDS: Dict[str, CardData] = {}  # 지연 참조 해결 중에 만든 누락 토큰 더미 카드입니다.
+
+
+class _LazyReferenceLookup:
+    """지연 참조 해결에 쓰는 card_id 조회 뷰입니다.
+    즉시 적재에서 모든 데이터베이스를 합쳐 만드는 card_id 딕셔너리와 같은 결과를 내되 대기 중인 카드는 조회될 때 CardData로 만듭니다."""
+    def __init__(self, databases: Tuple['CardDatabase', ...]):
+        self.databases = databases
+
+    def __contains__(self, key) -> bool:
+        if key in _LAZY_DUMMY_CARDS or key in _PENDING_CARDS:
+            return True
+        return any(dict.__contains__(db, key) for db in self.databases)
+
+    def __getitem__(self, key) -> CardData:
+        for db in self.databases:
+            if dict.__contains__(db, key):
+                return dict.__getitem__(db, key)
+        card_data_obj = _materialize_pending_card(key)
+        if card_data_obj is not None:
+            return card_data_obj
+        return _LAZY_DUMMY_CARDS[key]
+
+    def __setitem__(self, key, value: CardData):
+        # 누락 토큰 더미 카드만 이 경로로 등록됩니다.
+        _LAZY_DUMMY_CARDS[key] = value
+
+
+_LAZY_REFERENCE_LOOKUP = _LazyReferenceLookup((BASIC_CARD_DATABASE, LEGENDS_RISE_CARD_DATABASE, TOKEN_CARD_DATABASE))
+
+
+def _reset_lazy_state():
+    """대기 중인 카드와 지연 참조 해결용 더미 카드를 비웁니다."""
+    _PENDING_CARDS.clear()
+    _PENDING_NAME_INDEX.clear()
+    _LAZY_DUMMY_CARDS.clear()
+
+
+def _register_pending_card(target_db: 'CardDatabase', card_id: str, card_info: Dict[str, Any]):
+    """카드를 CardData로 만들지 않고 원본 딕셔너리 그대로 대기 목록에 등록합니다."""
+    _PENDING_CARDS[card_id] = (target_db, card_info)
+    name = card_info.get("name")
+    if not name:
         return
+    name_ko = KOR_NAME_MAP.get(name, name)
+    for key in (name, name_ko, normalize_card_alias(name), normalize_card_alias(name_ko)):
+        _PENDING_NAME_INDEX.setdefault(key, card_id)
+
+
+def _materialize_pending_card(card_id: str) -> Optional[CardData]:
+    """대기 중인 카드를 CardData로 만들어 원래 데이터베이스에 넣고 반환합니다. 대기 중이 아니면 None을 반환합니다.
+    카드 참조 해결은 카드가 처음 인스턴스화될 때까지 미룹니다."""
+    pending = _PENDING_CARDS.pop(card_id, None)
+    if pending is None:
+        return None
+    target_db, card_info = pending
+    card_data_obj = _load_card_data_from_dict(card_info)
+    card_data_obj.references_resolved = False
+    target_db[card_id] = card_data_obj
+    return card_data_obj
+
+
+def _find_pending_card(key: str) -> Optional[CardData]:
+    """card_id, 영문명, 한글명, 정규화 별칭으로 대기 중인 카드를 찾아 CardData로 만듭니다. 없으면 None을 반환합니다."""
+    if not _PENDING_CARDS or not isinstance(key, str):
+        return None
+    if key in _PENDING_CARDS:
+        return _materialize_pending_card(key)
+    card_id = _PENDING_NAME_INDEX.get(key) or _PENDING_NAME_INDEX.get(normalize_card_alias(key))
+    return _materialize_pending_card(card_id) if card_id is not None else None
+
+
+def ensure_card_references(card_data_obj: CardData):
+    """지연 적재된 카드의 카드 참조를 해결하고 효과를 컴파일합니다. 이미 해결된 카드는 그대로 둡니다.
+    참조된 카드가 아직 대기 중이면 CardData로만 만들고 그 카드의 참조 해결은 다시 그 카드가 인스턴스화될 때로 미룹니다."""
+    if card_data_obj.references_resolved:
+        return
+    for effect in card_data_obj.effects:
+        _resolve_effect_references_recursive(effect, card_data_obj.card_id, _LAZY_REFERENCE_LOOKUP)
+    compile_card_effects([card_data_obj])
+    card_data_obj.references_resolved = True
+
+
+def _load_card_sections_lazily(path: str, section_map: Dict[str, 'CardDatabase'], sections: set):
+    """sections에 속한 섹션의 카드만 CardData로 만들고 나머지 섹션의 카드는 원본 딕셔너리로 대기 목록에 둡니다.
+    어느 쪽이든 카드 참조 해결과 효과 컴파일은 카드가 처음 인스턴스화될 때 합니다."""
+    load_kor_names()
     with open(path, 'r', encoding='utf-8') as f:
         data = json.load(f)
+    for section_name, card_dict in data.items():
+        target_db = section_map.get(section_name)
+        if target_db is None:
+            _log.warning(lambda: f"Unknown section '{section_name}' in {path}. Skipping.")
+            continue
+        if section_name not in sections:
+            for card_id, card_info in card_dict.items():
+                _register_pending_card(target_db, card_id, card_info)
+            continue
+        for card_id, card_info in card_dict.items():
+            card_data_obj = _load_card_data_from_dict(card_info)
+            card_data_obj.references_resolved = False
+            target_db[card_id] = card_data_obj
+
+def _snapshot_source_files(path: str) -> List[str]:
+    """스냅샷 키 계산에 포함할 원본 파일 목록을 반환합니다.
+    원본 JSON과 한글 카드명 파일 외에 로더 코드도 포함하여 변환 로직이 바뀌면 스냅샷을 다시 만듭니다."""
+    files = [path]
+    kor_db_dir = _resolve_kor_db_dir()
+    if kor_db_dir is not None:
+        files.extend(sorted(glob.glob(os.path.join(kor_db_dir, '*.json'))))
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    files.extend(os.path.join(module_dir, name) for name in ('card_data.py', 'effect.py', 'enums.py'))
+    return files
+
+def compute_snapshot_key(path: str) -> str:
+    """원본 파일들의 내용 해시로 스냅샷 키를 계산합니다. 파일 내용이 하나라도 바뀌면 다른 키가 됩니다."""
+    digest = hashlib.sha256(f"v{SNAPSHOT_FORMAT_VERSION}".encode('utf-8'))
+    for file_path in _snapshot_source_files(path):
+        digest.update(os.path.basename(file_path).encode('utf-8'))
+        with open(file_path, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()[:32]
+
+def get_snapshot_path(path: str, key: str) -> str:
+    """원본 JSON 경로와 스냅샷 키에 대응하는 스냅샷 파일 경로를 반환합니다."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(os.path.dirname(path), SNAPSHOT_DIR_NAME, f"{stem}.{key}.pickle")
+
+def _load_snapshot(snapshot_path: str) -> Optional[Dict[str, Any]]:
+    """스냅샷 파일을 읽어 반환합니다. 파일이 없거나 손상되었으면 None을 반환합니다."""
+    if not os.path.isfile(snapshot_path):
+        return None
+    try:
+        with open(snapshot_path, 'rb') as f:
+            snapshot = pickle.load(f)
+    except Exception as e:
+        _log.warning(lambda e=e: f"Failed to load card database snapshot {snapshot_path} {e}")
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_FORMAT_VERSION:
+        return None
+    return snapshot
+
+def _save_snapshot(snapshot_path: str, snapshot: Dict[str, Any]):
+    """스냅샷을 임시 파일에 쓴 뒤 교체하여 저장하고 같은 원본의 이전 스냅샷을 정리합니다.
+    여러 프로세스가 동시에 불러와도 반쯤 쓰인 파일을 읽지 않도록 원자적으로 교체합니다."""
+    snapshot_dir = os.path.dirname(snapshot_path)
+    tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+    except Exception as e:
+        _log.warning(lambda e=e: f"Failed to save card database snapshot {snapshot_path} {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return
+    stem = os.path.basename(snapshot_path).split('.', 1)[0]
+    for old_path in glob.glob(os.path.join(snapshot_dir, f"{stem}.*.pickle")):
+        if old_path != snapshot_path:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+def load_card_databases(path: str = 'card_database/4_manual_database/card_database_manual.json', use_snapshot: bool = True,
+                        sections: Optional[Iterable[str]] = None):
+    """단일 통합 수동 JSON 파일에서 카드 데이터베이스를 불러옵니다.
+    JSON은 각 데이터베이스에 대한 최상위 키를 포함합니다.
+    모든 카드는 대응하는 전역 데이터베이스로 로드됩니다.
+    use_snapshot이 True이면 원본 파일 내용 해시로 찾은 컴파일된 스냅샷에서 참조 해결까지 끝난 객체를 바로 불러오고,
+    스냅샷이 없거나 원본이 바뀌었으면 JSON에서 새로 만든 뒤 스냅샷을 갱신합니다.
+    sections에 섹션 이름 목록을 주면 지연 적재합니다. 지정한 섹션만 CardData로 만들고 다른 섹션의 카드는 참조되거나 조회될 때 한 장씩 만들며,
+    카드 참조 해결은 카드가 처음 인스턴스화될 때 합니다. 지연 적재는 전체 카드를 담는 스냅샷을 쓰지 않습니다."""
+    global BASIC_CARD_DATABASE, LEGENDS_RISE_CARD_DATABASE, TOKEN_CARD_DATABASE
     section_map = {
         'BASIC_CARD_DATABASE': BASIC_CARD_DATABASE,
         'LEGENDS_RISE_CARD_DATABASE': LEGENDS_RISE_CARD_DATABASE,
         'TOKEN_CARD_DATABASE': TOKEN_CARD_DATABASE,
     }
+    if sections is not None:
+        sections = set(sections)
+        unknown_sections = sections - section_map.keys()
+        if unknown_sections:
+            raise ValueError(f"Unknown card database sections {sorted(unknown_sections)}")
+    _reset_lazy_state()
+    if not os.path.isfile(path):
+        load_kor_names()
+        _log.warning(lambda: f"{path} not found. No card data loaded.")
+        return
+    if sections is not None:
+        _load_card_sections_lazily(path, section_map, sections)
+        return
+
+    snapshot_path = None
+    if use_snapshot:
+        snapshot_path = get_snapshot_path(path, compute_snapshot_key(path))
+        snapshot = _load_snapshot(snapshot_path)
+        if snapshot is not None:
+            # 다른 모듈이 전역 객체를 직접 참조하므로 객체를 바꾸지 않고 내용만 채웁니다.
+            KOR_NAME_MAP.update(snapshot['kor_names'])
+            for section_name, target_db in section_map.items():
+                target_db.update(snapshot['databases'][section_name])
+                compile_card_effects(target_db.values())
+            _log.debug(lambda: f"data - Loaded card database snapshot {snapshot_path}")
+            return
+
+    load_kor_names()
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
     for section_name, card_dict in data.items():
         target_db = section_map.get(section_name)
         if target_db is None:
-            print(f"[WARNING] Unknown section '{section_name}' in {path}. Skipping.")
+            _log.warning(lambda: f"Unknown section '{section_name}' in {path}. Skipping.")
             continue
         for card_id, card_info in card_dict.items():
             target_db[card_id] = _load_card_data_from_dict(card_info)
     resolve_all_card_references()
 
+    if snapshot_path is not None:
+        # 세 데이터베이스를 한 번에 저장해야 카드 간 참조가 같은 객체로 복원됩니다.
+        _save_snapshot(snapshot_path, {
+            'version': SNAPSHOT_FORMAT_VERSION,
+            'kor_names': dict(KOR_NAME_MAP),
+            'databases': {name: dict(db) for name, db in section_map.items()},
+        })
+    # 컴파일 결과는 코드에서 다시 만들 수 있으므로 스냅샷 저장 뒤에 만들어 스냅샷에 넣지 않습니다.
+    for target_db in section_map.values():
+        compile_card_effects(target_db.values())
+
 def resolve_all_card_references():
     """로드된 모든 카드 데이터베이스에 대해 상호 카드 참조를 해결합니다.
     이것은 모든 카드의 결합된 뷰를 구축하고 각 최상위 데이터베이스에 대해 resolve_card_references를 호출합니다."""
@@ -512,42 +885,29 @@ def resolve_all_card_references():
     resolve_card_references(TOKEN_CARD_DATABASE, all_cards)
 
 def evaluate_condition(card: Any, condition_str: str) -> bool:
-    """카드가 주어진 condition_str 조건을 만족하는지 검사합니다."""
+    """카드가 주어진 condition_str 조건을 만족하는지 검사합니다. 조건 문자열은 처음 한 번만 해석되어 판정 함수로 캐시됩니다."""
     if not condition_str:
         return True
-    
-    if condition_str.startswith("CARD_TYPE_"):
-        card_type_str = condition_str.replace("CARD_TYPE_", "")
-        try:
-            target_type = CardType[card_type_str]
-            return card.get_type() == target_type
-        except KeyError:
-            return False
-            
-    elif condition_str.startswith("CLASS_TYPE_"):
-        class_type_str = condition_str.replace("CLASS_TYPE_", "")
-        try:
-            target_class = ClassType[class_type_str]
-            return card.card_data.class_type == target_class
-        except KeyError:
-            return False
-            
-    elif condition_str.startswith("NAME_"):
-        name_str = condition_str.replace("NAME_", "")
-        return card.card_data.name == name_str
-
-    elif condition_str.startswith("COST_IS_"):
-        try:
-            cost_val = int(condition_str.replace("COST_IS_", ""))
-            return card.current_cost == cost_val
-        except ValueError:
-            return False
-        
-    return True
+    return compile_condition(condition_str)(card)
 
 def get_card_data_by_id(card_id: str) -> Any:
     """ID를 기반으로 정적 카드 데이터를 조회합니다."""
     for db in [BASIC_CARD_DATABASE, LEGENDS_RISE_CARD_DATABASE, TOKEN_CARD_DATABASE]:
         if card_id in db:
             return db[card_id]
-    return None
+    # 지연 적재 중이면 아직 만들지 않은 카드에서 찾습니다.
+    return _find_pending_card(card_id)
+
+def find_card_data_by_name(name: str) -> Any:
+    """카드명으로 정적 카드 데이터를 조회합니다.
+    영문명과 한글명의 정확한 일치를 먼저 찾고 없으면 정규화 별칭으로 찾습니다. 없으면 None을 반환합니다."""
+    databases = [BASIC_CARD_DATABASE, LEGENDS_RISE_CARD_DATABASE, TOKEN_CARD_DATABASE]
+    for db in databases:
+        card_data_obj = db.get_by_name(name) or db.get_by_name_ko(name)
+        if card_data_obj is not None:
+            return card_data_obj
+    for db in databases:
+        card_data_obj = db.get_by_alias(name)
+        if card_data_obj is not None:
+            return card_data_obj
+    return _find_pending_card(name)
@@ -0,0 +1,131 @@
+# 역할 정의. Effect와 Process 그래프를 효과 해결에 필요한 필드만 담은 고정 배치 레코드로 컴파일합니다.
+
+from typing import Any, Iterable, Optional, Tuple
+from src.common.enums import TargetType
+from src.common.condition import Predicate, compile_condition
+
+_COMPILED_ATTR = '_compiled'  # 컴파일 결과를 보관하는 효과 객체의 인스턴스 속성 이름입니다.
+
+
+class CompiledProcess:
+    """프로세스 하나에서 효과 해결 루프가 읽는 필드를 미리 해석해 둔 레코드입니다.
+    parent_effect로 위임되는 속성과 효과 단위 target 대체까지 컴파일 시점에 결정하므로 실행 중에는 필드만 읽습니다.
+    condition_predicate는 문자열 조건을 컴파일한 판정 함수이며 검사할 조건이 없으면 None입니다."""
+    __slots__ = ('process_type', 'condition', 'condition_predicate', 'target', 'is_split', 'has_post_action', 'post_action_type', 'raw_action_text')
+
+    def __init__(self, process: Any, effect_target: Any):
+        """CompiledProcess 클래스의 생성자입니다. effect_target은 프로세스에 target이 없을 때 대신 쓸 효과 단위 target입니다."""
+        self.process_type = getattr(process, "process", None)
+        self.condition = getattr(process, "condition", None)
+        self.condition_predicate = _compile_condition(self.condition)
+        target = process.get('target') if hasattr(process, "get") else None
+        self.target = _resolve_target(effect_target if target is None else target)
+        self.is_split = bool(process.get('is_split')) if hasattr(process, "get") else False
+        post_action = getattr(process, "post_action", None)
+        self.has_post_action = bool(post_action)
+        if post_action:
+            self.post_action_type = post_action.process if hasattr(post_action, "process") else post_action.get("process")
+        else:
+            self.post_action_type = None
+        self.raw_action_text = getattr(process, "raw_action_text", None)
+
+
+class CompiledEffect:
+    """효과 하나의 타입, 효과 단위 조건, 프로세스별 레코드를 담은 고정 배치 레코드입니다.
+    has_variables는 변수 X, Y, Z 해석으로 값이 바뀔 수 있는 속성이 그래프 어딘가에 있는지를 나타냅니다."""
+    __slots__ = ('type', 'condition', 'condition_predicate', 'processes', 'has_variables')
+
+    def __init__(self, effect: Any):
+        """CompiledEffect 클래스의 생성자입니다."""
+        attributes = getattr(effect, "attributes", None)
+        if isinstance(attributes, dict):
+            # 위임된 프로세스 조건은 제외하고 attributes에 직접 명시된 조건만 효과 전체 조건으로 봅니다.
+            self.condition = attributes.get("condition")
+        else:
+            self.condition = effect.get("condition")
+        self.condition_predicate = _compile_condition(self.condition)
+        self.type = getattr(effect, "type", None)
+        processes = getattr(effect, "processes", None)
+        if processes is None:
+            self.processes: Optional[Tuple[CompiledProcess, ...]] = None
+        else:
+            effect_target = effect.get('target')
+            self.processes = tuple(CompiledProcess(process, effect_target) for process in processes)
+        self.has_variables = _has_variables(effect, set())
+
+
+def _resolve_target(target: Any) -> Any:
+    """문자열 target을 TargetType으로 미리 바꿉니다. 알 수 없는 문자열과 None은 그대로 두어 실행 시 처리를 따릅니다."""
+    if isinstance(target, str):
+        return TargetType.__members__.get(target, target)
+    return target
+
+
+def _compile_condition(condition: Any) -> Optional[Predicate]:
+    """문자열 조건을 판정 함수로 컴파일합니다. 검사할 조건이 없으면 None을 반환합니다."""
+    if condition and isinstance(condition, str):
+        return compile_condition(condition)
+    return None
+
+
+def _is_variable_value(value: Any) -> bool:
+    """변수 해석이 값을 바꿀 수 있는지 판정합니다. 변수 대상, X/Y/Z 문자열, 정수로 바뀌는 문자열이 해당하며 리스트는 항목을 재귀적으로 봅니다."""
+    if isinstance(value, list):
+        return any(_is_variable_value(item) for item in value)
+    if value == TargetType.VARIABLE:
+        return True
+    if isinstance(value, str):
+        if value.replace('+', '').replace('-', '').strip() in ('X', 'Y', 'Z'):
+            return True
+        try:
+            int(value)
+        except ValueError:
+            return False
+        return True
+    return False
+
+
+def _has_variables(node: Any, visited: set) -> bool:
+    """효과 그래프 안에 변수 해석 대상 값이 하나라도 있는지 재귀적으로 확인합니다."""
+    if id(node) in visited:
+        return False
+    visited.add(id(node))
+    attributes = getattr(node, "attributes", None)
+    if not isinstance(attributes, dict):
+        return False
+    for process in getattr(node, "processes", None) or ():
+        if _has_variables(process, visited):
+            return True
+    for key, value in attributes.items():
+        if key == "processes":
+            continue
+        values = value if isinstance(value, list) else (value,)
+        for item in values:
+            if hasattr(item, "attributes"):
+                if _has_variables(item, visited):
+                    return True
+            elif _is_variable_value(item):
+                return True
+    return False
+
+
+def compile_effect(effect: Any) -> CompiledEffect:
+    """효과를 새로 컴파일하여 반환합니다. 결과를 효과 객체에 저장하지 않습니다."""
+    return CompiledEffect(effect)
+
+
+def get_compiled_effect(effect: Any) -> CompiledEffect:
+    """효과의 컴파일 결과를 반환합니다. 아직 없으면 컴파일하여 효과 객체에 저장합니다.
+    복제된 효과는 같은 구조이므로 원본의 컴파일 결과를 그대로 공유합니다."""
+    compiled = effect.__dict__.get(_COMPILED_ATTR)
+    if compiled is None:
+        compiled = CompiledEffect(effect)
+        effect.__dict__[_COMPILED_ATTR] = compiled
+    return compiled
+
+
+def compile_card_effects(card_data_list: Iterable[Any]):
+    """카드 데이터들의 최상위 효과를 미리 컴파일합니다. 선택지 등 하위 효과는 처음 해결될 때 컴파일합니다."""
+    for card_data_obj in card_data_list:
+        for effect in card_data_obj.effects:
+            get_compiled_effect(effect)
@@ -0,0 +1,58 @@
+# 역할 정의. CARD_TYPE_, CLASS_TYPE_, NAME_, COST_IS_ 형태의 조건 문자열을 카드 하나를 받는 판정 함수로 컴파일하고 캐시합니다.
+
+from typing import Any, Callable, Dict
+from src.common.enums import CardType, ClassType
+
+Predicate = Callable[[Any], bool]  # 카드를 받아 조건 만족 여부를 반환하는 판정 함수입니다.
+
+_PREDICATE_CACHE: Dict[str, Predicate] = {}  # 조건 문자열별 컴파일된 판정 함수 캐시입니다.
+
+
+def _always_true(card: Any) -> bool:
+    """조건이 없거나 알 수 없는 조건일 때 쓰는 판정 함수입니다."""
+    return True
+
+
+def _always_false(card: Any) -> bool:
+    """조건 문자열의 값을 해석할 수 없을 때 쓰는 판정 함수입니다."""
+    return False
+
+
+def _build_predicate(condition_str: str) -> Predicate:
+    """조건 문자열을 한 번 해석하여 판정 함수를 만듭니다. 판정 기준은 기존 evaluate_condition과 같습니다."""
+    if not condition_str:
+        return _always_true
+
+    if condition_str.startswith("CARD_TYPE_"):
+        target_type = CardType.__members__.get(condition_str.replace("CARD_TYPE_", ""))
+        if target_type is None:
+            return _always_false
+        return lambda card: card.get_type() == target_type
+
+    if condition_str.startswith("CLASS_TYPE_"):
+        target_class = ClassType.__members__.get(condition_str.replace("CLASS_TYPE_", ""))
+        if target_class is None:
+            return _always_false
+        return lambda card: card.card_data.class_type == target_class
+
+    if condition_str.startswith("NAME_"):
+        name_str = condition_str.replace("NAME_", "")
+        return lambda card: card.card_data.name == name_str
+
+    if condition_str.startswith("COST_IS_"):
+        try:
+            cost_val = int(condition_str.replace("COST_IS_", ""))
+        except ValueError:
+            return _always_false
+        return lambda card: card.current_cost == cost_val
+
+    return _always_true
+
+
+def compile_condition(condition_str: str) -> Predicate:
+    """조건 문자열의 판정 함수를 반환합니다. 같은 문자열은 처음 한 번만 해석하고 이후에는 캐시를 돌려줍니다."""
+    predicate = _PREDICATE_CACHE.get(condition_str)
+    if predicate is None:
+        predicate = _build_predicate(condition_str)
+        _PREDICATE_CACHE[condition_str] = predicate
+    return predicate
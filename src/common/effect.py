@@ -38,6 +38,44 @@ def wrap_dict(val: Any) -> Any:
     return val
 
 
+def _clone_value(val: Any, memo: Dict[int, Any]) -> Any:
+    """효과 그래프 안의 값을 복제합니다. Effect, Process, 리스트, 딕셔너리만 새로 만들고 CardData 등 나머지 참조는 공유합니다."""
+    if isinstance(val, (Effect, Process)):
+        return val.clone(memo)
+    if isinstance(val, (list, dict)):
+        if id(val) in memo:
+            return memo[id(val)]
+        if isinstance(val, list):
+            cloned = []
+            memo[id(val)] = cloned
+            cloned.extend(_clone_value(item, memo) for item in val)
+        else:
+            cloned = {}
+            memo[id(val)] = cloned
+            cloned.update((k, _clone_value(v, memo)) for k, v in val.items())
+        return cloned
+    return val
+
+
+def _clone_node(node: Any, memo: Optional[Dict[int, Any]]) -> Any:
+    """Effect 또는 Process 객체 하나를 생성자 없이 복제하고 속성 값들을 재귀적으로 복제합니다.
+    __dict__와 attributes가 같은 객체를 가리키면 복제본에서도 같은 객체를 가리키도록 memo로 공유 관계를 유지합니다."""
+    memo = {} if memo is None else memo
+    if id(node) in memo:
+        return memo[id(node)]
+    cloned = node.__class__.__new__(node.__class__)
+    memo[id(node)] = cloned
+    state = {}
+    for key, value in node.__dict__.items():
+        if key == 'parent_effect':
+            # 부모가 함께 복제되는 중이면 복제본을, 아니면 기존 부모를 가리킵니다.
+            state[key] = memo.get(id(value), value)
+        else:
+            state[key] = _clone_value(value, memo)
+    cloned.__dict__.update(state)
+    return cloned
+
+
 class Process:
     """Process 클래스입니다."""
     def __init__(self, **kwargs):
@@ -76,6 +114,10 @@ class Process:
         """키를 사용하여 프로세스의 속성 값을 가져옵니다."""
         return getattr(self, key, default)
 
+    def clone(self, memo: Optional[Dict[int, Any]] = None) -> 'Process':
+        """프로세스와 하위 효과 그래프를 복제합니다. 참조된 CardData는 공유합니다."""
+        return _clone_node(self, memo)
+
     def update(self, **kwargs):
         """프로세스의 속성을 업데이트합니다."""
         self.attributes.update(kwargs)
@@ -216,4 +258,9 @@ class Effect:
 
     def get(self, key: str, default: Any = None) -> Any:
         """키를 사용하여 효과의 속성 값을 가져옵니다."""
-        return getattr(self, key, default)
\ No newline at end of file
+        return getattr(self, key, default)
+
+    def clone(self, memo: Optional[Dict[int, Any]] = None) -> 'Effect':
+        """효과와 하위 프로세스 그래프를 복제합니다. 참조된 CardData는 공유하므로 deepcopy보다 훨씬 가볍습니다.
+        복제본의 프로세스는 복제된 효과를 부모로 가리킵니다."""
+        return _clone_node(self, memo)
\ No newline at end of file
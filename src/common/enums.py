@@ -39,6 +39,16 @@ class EventType(Enum):
     CARD_MOVED_TO_GRAVEYARD = "카드_묘지로_이동됨"
 
 
+class ActionType(Enum):
+    """플레이어가 자기 턴에 선택할 수 있는 행동의 종류를 정의합니다."""
+    PLAY_CARD = "카드_플레이"
+    ATTACK = "공격"
+    EVOLVE = "진화"
+    SUPER_EVOLVE = "초진화"
+    ENGAGE = "활성화"
+    END_TURN = "턴_종료"
+
+
 class ClassType(Enum):
     """클래스(직업)를 정의합니다."""
     NEUTRAL = "Neutral"
@@ -0,0 +1,5 @@
+# 역할 정의. MCTS 에이전트와 NumPy 국면 인코더가 함께 쓰는 휴리스틱 국면 평가 상수를 정의합니다.
+
+EVALUATION_SCALE = 10.0  # 휴리스틱 점수를 승률 추정치로 바꿀 때 쓰는 로지스틱 함수의 폭입니다.
+BOARD_WEIGHT = 0.5  # 휴리스틱 점수에서 양쪽 필드 추종자의 공격력과 체력 합계 차에 곱하는 가중치입니다.
+HAND_WEIGHT = 0.5  # 휴리스틱 점수에서 양쪽 손패 수 차에 곱하는 가중치입니다.
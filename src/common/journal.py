@@ -0,0 +1,165 @@
+# 역할 정의. 게임 상태 변경을 역연산으로 기록하여 지정한 시점까지 되돌리는 변경 저널을 정의합니다.
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, MutableSequence, Set, Tuple
+
+_MISSING = object()  # 기록 시점에 속성이나 키가 없었음을 나타내는 표식입니다.
+
+
+def _restore_attr(obj: Any, name: str, old: Any):
+    """속성을 기록 시점의 값으로 되돌립니다. 속성이 없었으면 제거합니다."""
+    if old is _MISSING:
+        obj.__dict__.pop(name, None)
+    else:
+        obj.__dict__[name] = old
+
+
+def _restore_item(mapping: Dict[Any, Any], key: Any, old: Any):
+    """딕셔너리 항목을 기록 시점의 값으로 되돌립니다. 항목이 없었으면 제거합니다."""
+    if old is _MISSING:
+        mapping.pop(key, None)
+    else:
+        mapping[key] = old
+
+
+def _restore_sequence(sequence: MutableSequence[Any], items: List[Any]):
+    """리스트나 덱의 내용을 기록 시점의 내용으로 되돌립니다."""
+    sequence.clear()
+    sequence.extend(items)
+
+
+class Journal:
+    """상태 변경마다 역연산을 쌓아 두었다가 역순으로 실행하여 되돌리는 저널입니다.
+    되돌리는 비용은 기록 이후 변경된 양에 비례하며 전체 상태 크기와는 무관합니다.
+    기록은 start 이후에만 하며 비활성 상태의 변경 지점은 active 검사 한 번만 합니다."""
+
+    def __init__(self):
+        """Journal 클래스의 생성자입니다."""
+        self.active = False
+        self._entries: List[Tuple[Callable[..., Any], Tuple[Any, ...]]] = []
+
+    def start(self):
+        """기록을 시작합니다."""
+        self.active = True
+
+    def stop(self):
+        """기록을 멈추고 쌓인 역연산을 모두 버립니다. 이전에 받은 시점 표식은 더 이상 쓸 수 없습니다."""
+        self.active = False
+        self._entries.clear()
+
+    def clear(self):
+        """기록 상태는 유지한 채 쌓인 역연산을 모두 버립니다. 이전에 받은 시점 표식은 더 이상 쓸 수 없습니다."""
+        self._entries.clear()
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """블록 안의 변경은 기록하지 않습니다."""
+        was_active = self.active
+        self.active = False
+        try:
+            yield
+        finally:
+            self.active = was_active
+
+    def mark(self) -> int:
+        """현재 시점의 표식을 반환합니다. 기록 중이 아니면 기록을 시작합니다."""
+        self.active = True
+        return len(self._entries)
+
+    def __len__(self) -> int:
+        """쌓여 있는 역연산의 수를 반환합니다."""
+        return len(self._entries)
+
+    def record(self, undo: Callable[..., Any], *args: Any):
+        """되돌릴 때 undo(*args)를 호출하도록 역연산을 기록합니다."""
+        self._entries.append((undo, args))
+
+    def record_attr(self, obj: Any, name: str):
+        """속성을 바꾸기 직전에 호출하여 현재 값을 기록합니다.
+        인스턴스 딕셔너리에 없는 프로퍼티는 세터가 바꾸는 실제 속성이 따로 기록되므로 건너뜁니다."""
+        old = obj.__dict__.get(name, _MISSING)
+        if old is _MISSING and isinstance(getattr(type(obj), name, None), property):
+            return
+        self._entries.append((_restore_attr, (obj, name, old)))
+
+    def record_item(self, mapping: Dict[Any, Any], key: Any):
+        """딕셔너리 항목을 바꾸거나 지우기 직전에 호출하여 현재 값을 기록합니다."""
+        self._entries.append((_restore_item, (mapping, key, mapping.get(key, _MISSING))))
+
+    def record_sequence(self, sequence: MutableSequence[Any]):
+        """리스트나 덱을 통째로 바꾸는 변경 직전에 호출하여 현재 내용을 복사해 둡니다."""
+        self._entries.append((_restore_sequence, (sequence, list(sequence))))
+
+    def note_attr(self, obj: Any, name: str):
+        """기록 중이면 속성을 바꾸기 직전의 값을 기록합니다. 저널을 직접 참조하지 않는 객체의 속성 변경에 씁니다."""
+        if self.active:
+            self.record_attr(obj, name)
+
+    def append(self, sequence: MutableSequence[Any], item: Any):
+        """리스트나 덱의 끝에 항목을 추가하고 기록 중이면 역연산을 기록합니다."""
+        sequence.append(item)
+        if self.active:
+            self._entries.append((sequence.pop, ()))
+
+    def remove(self, sequence: MutableSequence[Any], item: Any):
+        """리스트에서 항목을 제거하고 기록 중이면 원래 위치에 다시 넣는 역연산을 기록합니다."""
+        index = sequence.index(item)
+        del sequence[index]
+        if self.active:
+            self._entries.append((sequence.insert, (index, item)))
+
+    def replace(self, sequence: MutableSequence[Any], index: int, item: Any):
+        """리스트의 지정 위치 항목을 바꾸고 기록 중이면 역연산을 기록합니다."""
+        if self.active:
+            self._entries.append((sequence.__setitem__, (index, sequence[index])))
+        sequence[index] = item
+
+    def clear_sequence(self, sequence: MutableSequence[Any]):
+        """리스트나 덱을 비우고 기록 중이면 원래 내용을 복사해 둡니다."""
+        if self.active and sequence:
+            self.record_sequence(sequence)
+        sequence.clear()
+
+    def set_item(self, mapping: Dict[Any, Any], key: Any, value: Any):
+        """딕셔너리 항목을 설정하고 기록 중이면 이전 값을 기록합니다."""
+        if self.active:
+            self.record_item(mapping, key)
+        mapping[key] = value
+
+    def pop_item(self, mapping: Dict[Any, Any], key: Any, default: Any = None) -> Any:
+        """딕셔너리 항목을 제거하여 반환하고 기록 중이면 이전 값을 기록합니다."""
+        if self.active and key in mapping:
+            self.record_item(mapping, key)
+        return mapping.pop(key, default)
+
+    def set_add(self, items: Set[Any], item: Any):
+        """집합에 항목을 추가하고 기록 중이면 새로 추가된 경우에만 역연산을 기록합니다."""
+        if item not in items:
+            items.add(item)
+            if self.active:
+                self._entries.append((items.discard, (item,)))
+
+    def set_discard(self, items: Set[Any], item: Any):
+        """집합에서 항목을 제거하고 기록 중이면 실제로 제거된 경우에만 역연산을 기록합니다."""
+        if item in items:
+            items.discard(item)
+            if self.active:
+                self._entries.append((items.add, (item,)))
+
+    def undo_to(self, mark: int):
+        """mark 시점 이후에 기록된 역연산을 역순으로 실행하여 상태를 되돌립니다.
+        되돌리는 동안에는 기록하지 않으며 끝나면 원래 기록 상태로 돌아갑니다."""
+        if mark < 0 or mark > len(self._entries):
+            raise ValueError(f"invalid journal mark {mark}.")
+        was_active = self.active
+        self.active = False
+        try:
+            entries = self._entries
+            while len(entries) > mark:
+                undo, args = entries.pop()
+                undo(*args)
+        finally:
+            self.active = was_active
+
+
+DETACHED_JOURNAL = Journal()  # 게임에 연결되기 전의 객체가 쓰는 기본 저널입니다. 기록을 시작하지 않습니다.
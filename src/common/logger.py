@@ -0,0 +1,169 @@
+# 역할 정의. 엔진의 서브시스템별 레벨 로거와 출력 설정을 제공하며 비활성 레벨의 메시지는 포맷팅 자체를 생략하는 모듈입니다.
+
+import contextlib
+import logging
+import sys
+from typing import Any, Callable, Dict, Optional, Union
+
+ROOT_LOGGER_NAME = "svsim"  # 모든 서브시스템 로거의 상위 로거 이름입니다.
+DEFAULT_LEVEL = logging.INFO  # 별도 설정이 없을 때 적용하는 기본 로그 레벨입니다.
+OFF = logging.CRITICAL + 10  # 모든 로그 출력을 끄기 위한 레벨입니다.
+
+# 기존 콘솔 로그 형식과 호환되도록 레벨별 접두사를 유지합니다.
+LEVEL_PREFIXES = {
+    logging.DEBUG: "[DEBUG]",
+    logging.INFO: "[LOG]",
+    logging.WARNING: "[WARNING]",
+    logging.ERROR: "[ERROR]",
+    logging.CRITICAL: "[ERROR]",
+}
+
+# 서브시스템 이름 목록입니다. configure_logging의 subsystem_levels 키로 사용합니다.
+SUBSYSTEMS = (
+    "engine.game",
+    "engine.state",
+    "engine.event",
+    "engine.rule",
+    "engine.effect",
+    "engine.ai",
+    "model.card",
+    "model.player",
+    "model.zone",
+    "model.crest",
+    "data",
+)
+
+Message = Union[str, Callable[[], str]]
+
+
+class _PrefixFormatter(logging.Formatter):
+    """레코드 레벨에 맞는 접두사를 붙여 한 줄 로그를 만드는 포매터입니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """접두사와 메시지를 결합한 문자열을 반환합니다."""
+        prefix = LEVEL_PREFIXES.get(record.levelno, "[LOG]")
+        return f"{prefix} {record.getMessage()}"
+
+
+class _CurrentStdoutHandler(logging.Handler):
+    """출력 시점의 sys.stdout에 기록하는 핸들러입니다. 실행 중 stdout이 교체되어도 그대로 따라갑니다."""
+
+    def emit(self, record: logging.LogRecord):
+        """레코드를 포맷팅하여 현재 표준 출력에 기록합니다."""
+        try:
+            sys.stdout.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+
+class GameLogger:
+    """레벨이 활성화된 경우에만 메시지를 생성하여 기록하는 서브시스템 로거입니다.
+    메시지로 문자열 대신 인자 없는 호출 객체를 넘기면 해당 레벨이 켜져 있을 때만 호출하여 문자열을 만듭니다."""
+
+    __slots__ = ("name", "_logger")
+
+    def __init__(self, name: str):
+        """GameLogger 클래스의 생성자입니다."""
+        self.name = name
+        self._logger = logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+    def is_enabled(self, level: int) -> bool:
+        """지정한 레벨의 로그가 실제로 기록되는지 여부를 반환합니다."""
+        return self._logger.isEnabledFor(level)
+
+    def _emit(self, level: int, msg: Message, args: tuple):
+        """레벨을 먼저 검사하고 활성화된 경우에만 메시지를 만들어 기록합니다."""
+        if not self._logger.isEnabledFor(level):
+            return
+        if callable(msg):
+            msg = msg()
+        self._logger.log(level, msg, *args)
+
+    def debug(self, msg: Message, *args: Any):
+        """DEBUG 레벨 로그를 기록합니다."""
+        self._emit(logging.DEBUG, msg, args)
+
+    def info(self, msg: Message, *args: Any):
+        """INFO 레벨 로그를 기록합니다."""
+        self._emit(logging.INFO, msg, args)
+
+    def warning(self, msg: Message, *args: Any):
+        """WARNING 레벨 로그를 기록합니다."""
+        self._emit(logging.WARNING, msg, args)
+
+    def error(self, msg: Message, *args: Any):
+        """ERROR 레벨 로그를 기록합니다."""
+        self._emit(logging.ERROR, msg, args)
+
+
+_loggers: Dict[str, GameLogger] = {}
+
+
+def get_logger(subsystem: str) -> GameLogger:
+    """서브시스템 이름에 해당하는 GameLogger를 반환합니다. 같은 이름이면 같은 인스턴스를 재사용합니다."""
+    logger = _loggers.get(subsystem)
+    if logger is None:
+        logger = GameLogger(subsystem)
+        _loggers[subsystem] = logger
+    return logger
+
+
+def _to_level(level: Optional[Union[int, str]]) -> int:
+    """문자열이나 None으로 주어진 레벨을 logging 모듈의 정수 레벨로 변환합니다."""
+    if level is None:
+        return OFF
+    if isinstance(level, str):
+        if level.upper() == "OFF":
+            return OFF
+        return logging.getLevelName(level.upper())
+    return level
+
+
+def configure_logging(level: Optional[Union[int, str]] = DEFAULT_LEVEL, subsystem_levels: Optional[Dict[str, Union[int, str, None]]] = None, handler: Optional[logging.Handler] = None):
+    """엔진 로그의 레벨과 출력 대상을 설정합니다.
+
+    매개변수
+    ----------
+    level (int | str | None) - 전체 기본 레벨입니다. None이나 'OFF'이면 모든 출력을 끕니다.
+    subsystem_levels (dict) - 서브시스템 이름별로 덮어쓸 레벨입니다.
+    handler (logging.Handler) - 출력 핸들러입니다. 생략하면 현재 표준 출력에 기록합니다.
+    """
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    for old_handler in list(root.handlers):
+        root.removeHandler(old_handler)
+    if handler is None:
+        handler = _CurrentStdoutHandler()
+    if handler.formatter is None:
+        handler.setFormatter(_PrefixFormatter())
+    root.addHandler(handler)
+    root.propagate = False
+    root.setLevel(_to_level(level))
+
+    for name in SUBSYSTEMS:
+        logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}").setLevel(logging.NOTSET)
+    for name, sub_level in (subsystem_levels or {}).items():
+        logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}").setLevel(_to_level(sub_level))
+
+
+def disable_logging():
+    """헤드리스 시뮬레이션용으로 모든 엔진 로그를 끕니다. 메시지 생성과 표준 출력 기록이 모두 생략됩니다."""
+    configure_logging(OFF)
+
+
+@contextlib.contextmanager
+def suppress_logging():
+    """블록 안에서만 모든 엔진 로그를 끄고 블록이 끝나면 서브시스템별 레벨까지 이전 설정으로 되돌립니다.
+    AI 탐색처럼 실제 진행이 아닌 가상 플레이 구간에서 로그 생성 비용과 출력을 없애는 데 사용합니다."""
+    loggers = [logging.getLogger(ROOT_LOGGER_NAME)] + [logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}") for name in SUBSYSTEMS]
+    previous_levels = [logger.level for logger in loggers]
+    for logger in loggers:
+        logger.setLevel(OFF)
+    try:
+        yield
+    finally:
+        for logger, level in zip(loggers, previous_levels):
+            logger.setLevel(level)
+
+
+# 모듈을 처음 불러올 때 기존 print 출력과 같은 동작이 되도록 기본 설정을 적용합니다.
+configure_logging()
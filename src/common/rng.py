@@ -0,0 +1,25 @@
+# 역할 정의. 마스터 시드에서 용도별 독립 난수 스트림 시드를 파생하는 유틸리티 모듈입니다.
+
+import hashlib
+import random
+from typing import Optional
+
+# 게임 하나가 사용하는 난수 스트림 이름입니다. 스트림을 나누어 한쪽의 소비량이 다른 쪽 결과를 바꾸지 않도록 합니다.
+ENGINE_STREAM = "engine"  # 덱 셔플과 카드 효과의 무작위 처리에 사용합니다.
+DECK_STREAM = "deck"  # 무작위 덱 생성에 사용합니다.
+AGENT_STREAM = "agent"  # 자동 플레이 에이전트의 행동 선택에 사용합니다.
+
+
+def derive_seed(master_seed: int, *labels: object) -> int:
+    """마스터 시드와 라벨 조합으로부터 64비트 하위 시드를 결정적으로 파생합니다.
+    같은 입력이면 프로세스나 플랫폼과 관계없이 항상 같은 값을 반환합니다."""
+    key = ":".join([str(master_seed)] + [str(label) for label in labels])
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def make_rng(master_seed: Optional[int], *labels: object) -> random.Random:
+    """마스터 시드에서 파생한 난수 생성기를 반환합니다. 시드가 None이면 운영체제 엔트로피로 초기화합니다."""
+    if master_seed is None:
+        return random.Random()
+    return random.Random(derive_seed(master_seed, *labels))
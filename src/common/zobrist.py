@@ -0,0 +1,119 @@
+# 역할 정의. 게임 국면의 구성 요소마다 고정된 64비트 키를 배정하고 XOR로 누적하여 국면 해시를 증분 갱신하는 조브리스트 해시를 정의합니다.
+
+import hashlib
+import random
+from array import array
+from enum import Enum
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.common.journal import Journal, DETACHED_JOURNAL
+
+Feature = Tuple[Any, Any, Any]  # (엔티티 ID, 속성 이름, 값)처럼 국면 구성 요소 하나를 나타내는 튜플입니다.
+
+_VALUE_OFFSET = 32  # 작은 정수 값을 키 표의 칸 번호로 바꿀 때 더하는 값입니다. 음수가 된 체력도 표에서 찾습니다.
+_VALUE_SLOTS = 128  # (엔티티, 속성) 하나의 키 표 칸 수입니다.
+_KEY_ROWS: Dict[Tuple[Any, Any], array] = {}  # (엔티티 ID, 속성 이름)별로 미리 뽑아 둔 값별 64비트 키 표입니다.
+_KEY_ROWS_LIMIT = 1 << 13  # 키 표의 최대 수입니다. 넘으면 새 표를 캐시하지 않고 매번 만듭니다.
+_ENUM_SLOTS: Dict[int, int] = {}  # 열거형 멤버의 id별 키 표 칸 번호입니다. 멤버는 정의 순서대로 칸을 차지합니다.
+_KEY_CACHE: Dict[Feature, int] = {}  # 키 표에서 찾을 수 없는 값의 구성 요소별 64비트 키 캐시입니다.
+_KEY_CACHE_LIMIT = 1 << 16  # 키 캐시의 최대 항목 수입니다. 값이 끝없이 바뀌는 진행에서도 메모리가 늘지 않도록 넘으면 더 캐시하지 않습니다.
+
+
+def _digest(obj: Any) -> int:
+    """객체의 repr에서 64비트 정수를 결정적으로 파생합니다."""
+    return int.from_bytes(hashlib.blake2b(repr(obj).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _key_row(row_id: Tuple[Any, Any]) -> array:
+    """(엔티티 ID, 속성 이름)의 값별 키 표를 반환합니다. 없으면 표 ID에서 파생한 시드의 난수 생성기로 뽑습니다."""
+    row = _KEY_ROWS.get(row_id)
+    if row is None:
+        row = array("Q", random.Random(_digest(row_id)).randbytes(8 * _VALUE_SLOTS))
+        if len(_KEY_ROWS) < _KEY_ROWS_LIMIT:
+            _KEY_ROWS[row_id] = row
+    return row
+
+
+def _enum_slot(value: Any) -> Optional[int]:
+    """열거형 멤버의 키 표 칸 번호를 반환합니다. 열거형이 아니거나 멤버가 칸 수보다 많으면 None입니다.
+    한 속성은 정수나 한 열거형 중 한 종류의 값만 가지므로 정수와 열거형 멤버가 같은 칸 번호를 써도 키가 겹치지 않습니다."""
+    slot = None
+    if isinstance(value, Enum):
+        members = list(type(value))
+        if len(members) > _VALUE_SLOTS:
+            return None
+        for index, member in enumerate(members):
+            _ENUM_SLOTS[id(member)] = index
+        slot = _ENUM_SLOTS[id(value)]
+    return slot
+
+
+def zobrist_key(entity_id: Any, name: Any, value: Any) -> int:
+    """구성 요소 (entity_id, name, value) 하나의 64비트 키를 반환합니다. 값이 None이면 0이므로 해시에 영향을 주지 않습니다.
+    -32부터 95까지의 정수와 열거형 값은 (엔티티, 속성)별 키 표에서 찾고 나머지 값은 구성 요소의 repr에서 파생합니다.
+    키 표의 시드도 repr에서 파생하므로 프로세스나 실행이 달라도 같은 국면은 같은 해시를 가집니다."""
+    if value is None:
+        return 0
+    value_type = type(value)
+    if value_type is int or value_type is bool:
+        slot = value + _VALUE_OFFSET
+        if not 0 <= slot < _VALUE_SLOTS:
+            slot = None
+    else:
+        slot = _ENUM_SLOTS.get(id(value))
+        if slot is None:
+            slot = _enum_slot(value)
+    if slot is not None:
+        row = _KEY_ROWS.get((entity_id, name))
+        if row is None:
+            row = _key_row((entity_id, name))
+        return row[slot]
+    feature = (entity_id, name, value)
+    key = _KEY_CACHE.get(feature)
+    if key is None:
+        key = _digest(feature)
+        if len(_KEY_CACHE) < _KEY_CACHE_LIMIT:
+            _KEY_CACHE[feature] = key
+    return key
+
+
+class ZobristHash:
+    """게임 국면의 64비트 조브리스트 해시를 누적합니다.
+    해시는 국면에 있는 구성 요소 키들의 XOR이며 구성 요소가 바뀔 때마다 이전 키와 새 키를 XOR하여 상수 시간에 갱신합니다.
+    toggle과 replace는 저널이 기록 중이면 같은 키를 다시 XOR하는 역연산을 기록하므로 되돌리기 후에도 해시가 국면과 일치합니다."""
+
+    def __init__(self, journal: Journal = DETACHED_JOURNAL):
+        """ZobristHash 클래스의 생성자입니다."""
+        self.value = 0
+        self._journal = journal
+
+    def _xor(self, key: int):
+        """해시에 키를 XOR합니다. 저널의 역연산으로도 사용합니다."""
+        self.value ^= key
+
+    def flip(self, entity_id: Any, name: Any, value: Any):
+        """구성 요소 키를 XOR하되 역연산은 기록하지 않습니다.
+        되돌릴 때 같은 경로를 다시 거치는 컨테이너처럼 스스로 해시를 되돌리는 곳에서 사용합니다."""
+        self.value ^= zobrist_key(entity_id, name, value)
+
+    def toggle(self, entity_id: Any, name: Any, value: Any):
+        """구성 요소를 해시에 넣거나 뺍니다. XOR이므로 같은 구성 요소를 두 번 토글하면 원래 해시가 됩니다."""
+        key = zobrist_key(entity_id, name, value)
+        self.value ^= key
+        if self._journal.active:
+            self._journal.record(self._xor, key)
+
+    def replace(self, entity_id: str, name: str, old: Any, new: Any):
+        """엔티티 속성의 값이 old에서 new로 바뀐 것을 해시에 반영합니다."""
+        key = zobrist_key(entity_id, name, old) ^ zobrist_key(entity_id, name, new)
+        if key:
+            self.value ^= key
+            if self._journal.active:
+                self._journal.record(self._xor, key)
+
+    def add_attrs(self, entity_id: str, obj: Any, names: Iterable[str]):
+        """엔티티가 국면에 처음 들어올 때 해시 대상 속성들의 현재 값을 해시에 넣습니다.
+        None인 속성은 키가 0이므로 해시에 영향을 주지 않습니다."""
+        attrs = obj.__dict__
+        for name in names:
+            self.replace(entity_id, name, None, attrs.get(name))
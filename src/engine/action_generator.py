@@ -0,0 +1,162 @@
+# 역할 정의. 현재 국면에서 플레이어가 선택할 수 있는 모든 합법 행동을 간결한 튜플로 생성하는 클래스입니다.
+
+from typing import List, NamedTuple, Optional, Tuple, Any
+from src.common.effect import Effect
+from src.common.enums import CardType, EffectType, ActionType
+from src.common.action_cache import PLAY_SEGMENT, FIELD_SEGMENT
+from src.engine.game_state_manager import GameStateManager
+from src.engine.rule_checks import play_block, engage_block, attack_block, target_block
+from src.models.card import Card
+from src.models.player import Player
+
+Action = Tuple[Any, ...]  # (ActionType, 인자...) 형태의 행동 튜플입니다.
+
+END_TURN_ACTION: Action = (ActionType.END_TURN,)  # 언제나 선택 가능한 턴 종료 행동입니다.
+
+
+class CardActionFacts(NamedTuple):
+    """카드 자신의 상태만으로 정해지는 행동 판정 결과입니다.
+    카드의 action_facts에 캐시되며 Card.ACTION_ATTRS에 속한 속성이 바뀌면 카드의 속성 훅이 무효화합니다."""
+    card_type: CardType
+    cost: int
+    enhance_costs: Tuple[int, ...]  # 강화 효과의 코스트 목록입니다.
+    can_attack_follower: bool
+    can_attack_leader: bool
+    is_evolved: bool
+    is_engaged: bool
+    engage_effect: Optional[Effect]  # 첫 활성화 효과이며 없으면 None입니다.
+    targetable: bool  # 상대 필드에 수호 추종자가 없을 때 공격 대상이 될 수 있는지 여부입니다.
+    targetable_under_ward: bool  # 상대 필드에 수호 추종자가 있을 때 공격 대상이 될 수 있는지 여부입니다.
+
+
+def card_action_facts(card: Card) -> CardActionFacts:
+    """카드의 행동 판정 결과를 반환합니다. 캐시가 없으면 rule_checks의 판정 함수로 계산하여 카드에 저장합니다."""
+    facts = card.action_facts
+    if facts is None:
+        enhance_costs = tuple(effect.enhance_cost for effect in card.effects if effect.type == EffectType.ENHANCE) if card.has_keyword(EffectType.ENHANCE) else ()
+        engage_effect = next((effect for effect in card.effects if effect.type == EffectType.ENGAGE), None) if card.has_keyword(EffectType.ENGAGE) else None
+        facts = CardActionFacts(
+            card_type=card.get_type(),
+            cost=card.current_cost,
+            enhance_costs=enhance_costs,
+            can_attack_follower=attack_block(card, CardType.FOLLOWER) is None,
+            can_attack_leader=attack_block(card, CardType.LEADER) is None,
+            is_evolved=card.is_evolved,
+            is_engaged=card.is_engaged,
+            engage_effect=engage_effect,
+            targetable=target_block(card, False) is None,
+            targetable_under_ward=target_block(card, True) is None,
+        )
+        card.action_facts = facts
+    return facts
+
+
+class ActionGenerator:
+    """플레이어의 합법 행동 목록을 생성합니다.
+    판정 규칙은 RuleEngine과 같은 rule_checks 함수를 사용합니다. 행동 목록은 카드 플레이 구간과 필드 행동 구간으로 나누어
+    게임 상태 관리자의 ActionCache에 보관하고, 영역, 카드, 자원 변경 알림으로 무효화된 구간만 다시 계산합니다.
+    다시 계산할 때도 카드 자신의 상태로 정해지는 판정은 카드별 CardActionFacts 캐시를 재사용하여 상태가 바뀐 카드만 다시 판정합니다.
+
+    행동 튜플 형식은 다음과 같습니다.
+    (ActionType.PLAY_CARD, card_id, enhanced_cost, use_extra_pp)
+    (ActionType.ATTACK, attacker_id, target_id)
+    (ActionType.EVOLVE, card_id)
+    (ActionType.SUPER_EVOLVE, card_id)
+    (ActionType.ENGAGE, card_id)
+    (ActionType.END_TURN,)
+    """
+    def __init__(self, game_state_manager: GameStateManager):
+        """ActionGenerator 클래스의 생성자입니다."""
+        self.game_state_manager = game_state_manager
+
+    def legal_actions(self, player_id: str) -> List[Action]:
+        """플레이어가 지금 수행할 수 있는 모든 행동 튜플을 새 목록으로 반환합니다.
+        순서는 엑스트라 PP 미사용 카드 플레이, 엑스트라 PP 사용 카드 플레이, 필드 카드별 공격, 진화, 초진화, 활성화, 턴 종료 순입니다."""
+        gsm = self.game_state_manager
+        cache = gsm.action_cache
+        player = gsm.players[player_id]
+        play_actions = cache.get(player_id, PLAY_SEGMENT)
+        if play_actions is None:
+            play_actions = []
+            self._collect_play_actions(player, play_actions)
+            cache.store(player_id, PLAY_SEGMENT, play_actions)
+        field_actions = cache.get(player_id, FIELD_SEGMENT)
+        if field_actions is None:
+            field_actions = []
+            self._collect_field_actions(player, gsm.players[gsm.opponent_id[player_id]], field_actions)
+            cache.store(player_id, FIELD_SEGMENT, field_actions)
+        actions = play_actions + field_actions
+        actions.append(END_TURN_ACTION)
+        return actions
+
+    def _collect_play_actions(self, player: Player, actions: List[Action]):
+        """패의 카드를 내는 행동을 수집합니다."""
+        hand_cards = player.hand.get_cards()
+        if not hand_cards:
+            return
+        current_pp = player.current_pp
+        field_size = player.field.size()
+        facts = [(card.card_id, card_action_facts(card)) for card in hand_cards]
+
+        use_extra_pp_options = (False, True) if player.extra_pp > 0 else (False,)
+        for use_extra_pp in use_extra_pp_options:
+            available_pp = current_pp + (1 if use_extra_pp else 0)
+            for card_id, card_facts in facts:
+                if play_block(card_facts.cost, card_facts.card_type, available_pp, field_size) is not None:
+                    continue
+                enhanced_cost = max((c for c in card_facts.enhance_costs if c <= available_pp), default=0)
+                actions.append((ActionType.PLAY_CARD, card_id, enhanced_cost, use_extra_pp))
+
+    def _collect_field_actions(self, player: Player, opponent: Player, actions: List[Action]):
+        """필드 카드의 공격, 진화, 초진화, 활성화 행동을 수집합니다.
+        상대 추종자와 리더가 공격 대상이 될 수 있는지는 공격자와 무관하므로 한 번만 판정합니다."""
+        field_cards = player.field.get_cards()
+        if not field_cards:
+            return
+        current_pp = player.current_pp
+        can_evolve = player.current_ep > 0 and not player.spent_ep_in_turn
+        can_super_evolve = player.current_sep > 0 and not player.spent_ep_in_turn
+        follower_targets, leader_targetable = self._get_attack_targets(opponent)
+
+        for card in field_cards:
+            card_id = card.card_id
+            facts = card_action_facts(card)
+            is_follower = facts.card_type == CardType.FOLLOWER
+            if is_follower and facts.can_attack_follower:
+                for target_id in follower_targets:
+                    actions.append((ActionType.ATTACK, card_id, target_id))
+                if leader_targetable and facts.can_attack_leader:
+                    actions.append((ActionType.ATTACK, card_id, opponent.player_id))
+            if is_follower and not facts.is_evolved:
+                if can_evolve:
+                    actions.append((ActionType.EVOLVE, card_id))
+                if can_super_evolve:
+                    actions.append((ActionType.SUPER_EVOLVE, card_id))
+            if facts.engage_effect is not None and engage_block(facts.engage_effect, facts.is_engaged, current_pp) is None:
+                actions.append((ActionType.ENGAGE, card_id))
+
+    @staticmethod
+    def _get_attack_targets(opponent: Player) -> Tuple[List[str], bool]:
+        """공격 대상이 될 수 있는 상대 필드 추종자 ID 목록과 상대 리더의 공격 대상 가능 여부를 반환합니다.
+        상대 필드에 수호 추종자가 있으면 리더는 대상이 될 수 없습니다."""
+        has_ward = opponent.field.has_card_with_keyword(EffectType.WARD)
+        follower_targets = []
+        for target in opponent.field.get_cards():
+            facts = card_action_facts(target)
+            if facts.card_type != CardType.FOLLOWER:
+                continue
+            if facts.targetable_under_ward if has_ward else facts.targetable:
+                follower_targets.append(target.card_id)
+        return follower_targets, not has_ward
+
+
+def action_to_dict(action: Action) -> dict:
+    """행동 튜플을 퍼징 보고서 등에서 쓰는 딕셔너리 형태로 변환합니다."""
+    action_type = action[0]
+    if action_type == ActionType.PLAY_CARD:
+        return {"type": action_type.name, "card_id": action[1], "enhanced_cost": action[2], "use_extra_pp": action[3]}
+    if action_type == ActionType.ATTACK:
+        return {"type": action_type.name, "attacker_id": action[1], "target_id": action[2]}
+    if action_type == ActionType.END_TURN:
+        return {"type": action_type.name}
+    return {"type": action_type.name, "card_id": action[1]}
@@ -0,0 +1,100 @@
+# 역할 정의. 게임 진행 중 플레이어의 선택을 공급하는 의사결정 제공자 인터페이스와 헤드리스용 기본 구현을 정의하는 모듈입니다.
+
+import random
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from src.common.enums import ActionType
+
+if TYPE_CHECKING:
+    from src.engine.game_state_manager import GameStateManager
+    from src.models.card import Card
+
+MAX_ACTIONS_PER_TURN = 30  # 에이전트가 한 턴에 할 수 있는 최대 행동 수입니다. 넘으면 턴을 강제로 종료합니다.
+
+
+class DecisionProvider:
+    """Game이 플레이어의 선택을 요청할 때 사용하는 인터페이스입니다.
+    GUI, 자동 플레이 에이전트, 테스트용 대역이 모두 이 인터페이스를 구현하여 Game에 주입됩니다."""
+
+    game_state_manager: Optional['GameStateManager'] = None
+
+    def attach(self, game_state_manager: 'GameStateManager'):
+        """제공자가 참조할 게임 상태 관리자를 연결합니다."""
+        self.game_state_manager = game_state_manager
+
+    def update(self):
+        """게임 상태가 바뀌었음을 알립니다. 화면이 없는 제공자는 아무 동작도 하지 않습니다."""
+        pass
+
+    def get_user_choice(self, prompt: str, choices: Dict[str, Any]) -> Any:
+        """선택지 딕셔너리에서 하나를 골라 그 값을 반환합니다."""
+        raise NotImplementedError
+
+    def get_mulligan_choices(self, player_id: str, hand_cards: List['Card']) -> List[str]:
+        """멀리건으로 교체할 손패 카드 ID 목록을 반환합니다."""
+        raise NotImplementedError
+
+    def get_discard_choices(self, player_id: str, hand_cards: List['Card'], count: int) -> List[str]:
+        """버릴 손패 카드 ID 목록을 최대 count장까지 반환합니다."""
+        raise NotImplementedError
+
+
+class RandomDecisionProvider(DecisionProvider):
+    """모든 선택을 무작위로 결정하는 헤드리스용 의사결정 제공자입니다."""
+
+    def __init__(self, rng: random.Random = None):
+        """RandomDecisionProvider 클래스의 생성자입니다. rng를 주면 선택이 해당 난수 스트림으로 재현됩니다."""
+        self.rng = rng if rng is not None else random.Random()
+
+    def get_user_choice(self, prompt: str, choices: Dict[str, Any]) -> Any:
+        """제시된 무작위 효과나 행동 선택지 중 하나를 무작위로 결정하여 반환합니다."""
+        if not choices:
+            return None
+        selected_key = self.rng.choice(list(choices.keys()))
+        return choices[selected_key]
+
+    def get_mulligan_choices(self, player_id: str, hand_cards: List['Card']) -> List[str]:
+        """멀리건 단계에서 교체할 손패 카드를 0장부터 최대 전체 손패 수 범위 내에서 무작위로 선택합니다."""
+        if not hand_cards:
+            return []
+        num_to_replace = self.rng.randint(0, len(hand_cards))
+        selected_cards = self.rng.sample(hand_cards, num_to_replace)
+        return [c.card_id for c in selected_cards]
+
+    def get_discard_choices(self, player_id: str, hand_cards: List['Card'], count: int) -> List[str]:
+        """버려야 할 손패 카드를 요구 수량에 맞춰 무작위로 선택하여 반환합니다."""
+        card_ids = [c.card_id for c in hand_cards]
+        num_to_discard = min(count, len(card_ids))
+        return self.rng.sample(card_ids, num_to_discard)
+
+
+class RandomAgent(RandomDecisionProvider):
+    """legal_actions 중에서 행동을 무작위로 골라 한 턴을 진행하는 에이전트입니다. 하위 선택도 무작위로 결정합니다.
+    choose_action만 바꾸면 다른 행동 선택 방식의 에이전트가 되며 배치 시뮬레이션은 모든 에이전트를 play_turn으로 진행합니다."""
+
+    def choose_action(self, game: Any, player_id: str) -> Tuple[Any, ...]:
+        """현재 국면에서 player_id가 할 행동 튜플 하나를 무작위로 고릅니다."""
+        return self.rng.choice(game.legal_actions(player_id))
+
+    def play_turn(self, game: Any, player_id: str):
+        """player_id의 턴을 끝까지 진행합니다. 턴 동안 에이전트를 게임의 의사결정 제공자로 두어 하위 선택도 에이전트가 결정합니다."""
+        original_provider = game.gui
+        game.gui = self
+        self.attach(game.game_state_manager)
+        try:
+            for _ in range(MAX_ACTIONS_PER_TURN):
+                if game.is_game_over():
+                    return
+                game.process_player_choice()
+                action = self.choose_action(game, player_id)
+                game.apply_action(player_id, action)
+                if action[0] == ActionType.END_TURN:
+                    return
+            if not game.is_game_over():
+                game.end_turn(player_id)
+        finally:
+            game.gui = original_provider
+            original_provider.update()
+
+    def close(self):
+        """에이전트가 잡고 있는 자원을 정리합니다. 무작위 에이전트는 정리할 자원이 없습니다."""
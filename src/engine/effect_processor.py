@@ -1,10 +1,10 @@
 # 역할 정의. 카드 효과를 해석하고 처리하는 클래스입니다.
 
 import random
-import logging
+import re
 
 import src.common.card_data as card_data
-from typing import Any, List, Union
+from typing import Any, List, Tuple, Union
 
 def to_target_type(val):
     """문자열 혹은 enum을 TargetType enum으로 변환합니다."""
@@ -22,16 +22,23 @@ from src.models.card import Card
 from src.engine.game_state_manager import GameStateManager
 from src.models.player import Player
 from src.common.effect import Effect, Process
+from src.common.compiled_effect import compile_effect, get_compiled_effect
+from src.common.condition import compile_condition
 from src.common.event import Event, DestroyedOnFieldEvent, FollowerSuperEvolvedEvent
+from src.common.logger import get_logger
+
+_log = get_logger("engine.effect")
+_ARTICLE_PATTERN = re.compile(r'^(?:an?|the)\s+', re.IGNORECASE)  # 카드명 앞의 영어 관사를 제거합니다.
 
 
 class EffectProcessor:
     """카드 효과를 해석하고 실행합니다."""
-    def __init__(self, event_manager: 'EventManager'):
-        """EffectProcessor 클래스의 생성자입니다."""
+    def __init__(self, event_manager: 'EventManager', rng: random.Random = None):
+        """EffectProcessor 클래스의 생성자입니다. rng는 게임 단위 난수 생성기이며 생략하면 새로 만듭니다."""
         self.event_manager = event_manager
-        # 통합 로깅을 위한 로거를 초기화합니다.
-        self.logger = logging.getLogger(__name__)
+        self.rng = rng if rng is not None else random.Random()
+        # 해결 중인 효과와 시전자 ID의 스택입니다. 공유 효과를 복제해 caster_id를 기록하는 대신 핸들러가 이 실행 문맥에서 시전자를 찾습니다.
+        self._resolving: List[Tuple[Any, str]] = []
 
         self.target_handlers = {
             TargetType.SELF: self._get_target_self,
@@ -193,6 +200,15 @@ class EffectProcessor:
                 resolved = self._resolve_val(val, x_val)
                 effect.update(**{key: resolved})
 
+    def _get_caster_id(self, effect_data: Any, default: Any = None) -> Any:
+        """핸들러에 전달된 효과나 프로세스의 시전자 ID를 해결 중인 효과 스택에서 찾습니다.
+        해결 중인 효과 자신이거나 그 직속 프로세스인 경우에만 시전자를 돌려주고 그 외에는 default를 반환합니다."""
+        parent_effect = getattr(effect_data, '__dict__', {}).get('parent_effect')
+        for effect, resolving_caster_id in reversed(self._resolving):
+            if effect_data is effect or (parent_effect is not None and parent_effect is effect):
+                return resolving_caster_id
+        return default
+
     def _get_variable_value(self, caster_card, game_state_manager):
         """카드 정보 및 텍스트를 기반으로 동적 변수 X의 값을 계산합니다."""
         definition = None
@@ -204,15 +220,12 @@ class EffectProcessor:
                         break
                 if definition:
                     break
-            if not definition and caster_card.card_data.raw_effects_text:
-                import re
-                match = re.search(r"X is (.*?)(?:\.|$)", caster_card.card_data.raw_effects_text, re.IGNORECASE)
-                if match:
-                    definition = match.group(1).strip()
+            if not definition:
+                definition = caster_card.card_data.variable_definition
 
         if not definition:
             # instead 대체 카드의 경우, X의 정의가 명시되지 않았을 때 앞선 Fanfare/Spell 효과의 수치값을 fallback으로 제공합니다.
-            if isinstance(caster_card, Card) and caster_card.card_data.raw_effects_text and "instead" in caster_card.card_data.raw_effects_text.lower():
+            if isinstance(caster_card, Card) and caster_card.card_data.has_instead:
                 for e in caster_card.effects:
                     if e.type in [EffectType.FANFARE, EffectType.SPELL]:
                         for p in e.processes:
@@ -230,15 +243,15 @@ class EffectProcessor:
                 faith_val = getattr(player, "faith", 0)
                 if faith_val == 0:
                     faith_val = 5
-                v1 = random.randint(0, faith_val)
-                v2 = random.randint(0, faith_val - v1)
+                v1 = self.rng.randint(0, faith_val)
+                v2 = self.rng.randint(0, faith_val - v1)
                 v3 = faith_val - v1 - v2
                 vals = [v1, v2, v3]
-                random.shuffle(vals)
+                self.rng.shuffle(vals)
                 caster_card.x_val = vals[0]
                 caster_card.y_val = vals[1]
                 caster_card.z_val = vals[2]
-                print(f"[LOG] Depths of the Eld Crystals 변수 할당 - X {caster_card.x_val}, Y {caster_card.y_val}, Z {caster_card.z_val}")
+                _log.info(lambda: f"Depths of the Eld Crystals 변수 할당 - X {caster_card.x_val}, Y {caster_card.y_val}, Z {caster_card.z_val}")
             return {'X': caster_card.x_val, 'Y': caster_card.y_val, 'Z': caster_card.z_val}
         elif def_lower == "destroyed_shikigami_stats":
             game = game_state_manager.game
@@ -252,7 +265,7 @@ class EffectProcessor:
             total_def = sum(c.card_data.get("defense", 0) for c in shikigami_followers)
             caster_card.x_val = total_atk
             caster_card.y_val = total_def
-            print(f"[LOG] Noble Shikigami 변수 할당 - X {total_atk}, Y {total_def}")
+            _log.info(lambda: f"Noble Shikigami 변수 할당 - X {total_atk}, Y {total_def}")
             return {'X': total_atk, 'Y': total_def}
         elif "combo" in def_lower:
             return player.combo_count
@@ -273,35 +286,29 @@ class EffectProcessor:
 
         return 0
 
-    def _log_info(self, msg: str) -> None:
-        self.logger.info(msg)
-
-    def _log_error(self, msg: str) -> None:
-        self.logger.error(msg)
-
     def _invoke_target_handler(self, target_type: TargetType, caster_card: Card, gsm: 'GameStateManager') -> List[Any]:
         try:
             target_type = to_target_type(target_type)
         except ValueError as e:
-            self._log_error(str(e))
+            _log.error(lambda e=e: str(e))
             return []
         handler = self.target_handlers.get(target_type)
-        print(f"[DEBUG INVOKE] target_type={target_type}, handler={handler.__name__ if handler else 'None'}")
+        _log.debug(lambda: f"invoke - target_type={target_type}, handler={handler.__name__ if handler else 'None'}")
         if not handler:
-            self._log_error(f"Target type {target_type} has no handler.")
+            _log.error(lambda: f"Target type {target_type} has no handler.")
             return []
         targets = handler(caster_card, gsm)
-        self._log_info(f"Target type {target_type.value} resolved to {[t.get_display_name() for t in targets]}")
+        _log.info(lambda: f"Target type {target_type.value} resolved to {[t.get_display_name() for t in targets]}")
         return targets
 
     def _can_target_with_ability(self, target_card_id: str, game_state_manager: 'GameStateManager') -> bool:
         """능력의 대상으로 추종자를 선택할 수 있는지 확인합니다. 오라나 잠복 상태를 고려합니다."""
         target_card = game_state_manager.get_entity_by_id(target_card_id)
         if target_card.has_keyword(EffectType.AURA):
-            self._log_info(f"[LOG] {target_card.get_display_name()} (ID: {target_card_id})는 '오라'로 능력의 대상이 될 수 없습니다.")
+            _log.info(lambda: f"{target_card.get_display_name()} (ID: {target_card_id})는 '오라'로 능력의 대상이 될 수 없습니다.")
             return False
         if target_card.has_keyword(EffectType.AMBUSH):
-            self._log_info(f"[LOG] {target_card.get_display_name()} (ID: {target_card_id})는 '잠복'으로 능력의 대상이 될 수 없습니다.")
+            _log.info(lambda: f"{target_card.get_display_name()} (ID: {target_card_id})는 '잠복'으로 능력의 대상이 될 수 없습니다.")
             return False
         return True
 
@@ -429,10 +436,10 @@ class EffectProcessor:
 
     def _get_target_own_hand_choice(self, caster_card: Card, game_state_manager: 'GameStateManager') -> List[Any]:
         """대상 - 자신의 패에서 카드 선택"""
-        print(f"[DEBUG HAND CHOICE] entering choice, caster={caster_card.get_display_name()}")
+        _log.debug(lambda: f"hand choice - entering choice, caster={caster_card.get_display_name()}")
         owner_id = self._get_owner_id(caster_card)
         hand_cards = game_state_manager.get_cards_in_zone(owner_id, Zone.HAND)
-        print(f"[DEBUG HAND CHOICE] hand_cards={[c.card_id for c in hand_cards]}")
+        _log.debug(lambda: f"hand choice - hand_cards={[c.card_id for c in hand_cards]}")
         if not hand_cards:
             return []
 
@@ -504,7 +511,7 @@ class EffectProcessor:
         selectable_cards = [c for c in hand_cards if c.card_id != caster_card.card_id]
         if not selectable_cards:
             return []
-        selected_card = random.choice(selectable_cards)
+        selected_card = self.rng.choice(selectable_cards)
         return [selected_card]
 
     def _get_target_opponent_follower_random(self, caster_card: Card, game_state_manager: 'GameStateManager') -> List[Any]:
@@ -516,7 +523,7 @@ class EffectProcessor:
         if not opponent_followers:
             return []
 
-        random.shuffle(opponent_followers)
+        self.rng.shuffle(opponent_followers)
         count = 1
         if hasattr(self, 'current_effect') and self.current_effect:
             count = getattr(self.current_effect, 'target_count', 1)
@@ -537,7 +544,7 @@ class EffectProcessor:
         if not max_attack_followers: return []
 
         # 가장 공격력이 높은 추종자 중 랜덤 선택은 유지합니다.
-        random.shuffle(max_attack_followers)
+        self.rng.shuffle(max_attack_followers)
         selected_card = max_attack_followers.pop()
 
         return [selected_card]
@@ -570,8 +577,7 @@ class EffectProcessor:
         candidates = [c for c in ally_cards if c.get_type() == CardType.FOLLOWER and c.card_id != caster_card.card_id]
         if not candidates:
             return []
-        import random
-        return [random.choice(candidates)]
+        return [self.rng.choice(candidates)]
 
     def _get_target_all_opponents(self, caster_card: Card, game_state_manager: 'GameStateManager') -> List[Any]:
         """대상 - 상대 전체"""
@@ -608,7 +614,7 @@ class EffectProcessor:
         self.current_effect = effect_data
         caster_card = game_state_manager.get_entity_by_id(caster_id)
         if not caster_card:
-            self._log_error(f"list_target - caster card with id {caster_id} not found.")
+            _log.error(lambda: f"list_target - caster card with id {caster_id} not found.")
             return []
         # 통합 핸들러 호출을 사용합니다(내부에서 문자열에서 enum으로의 변환이 처리됩니다).
         return self._invoke_target_handler(target_type, caster_card, game_state_manager)
@@ -621,7 +627,7 @@ class EffectProcessor:
         target.current_attack += attack
         target.current_defense += defense
         target.max_defense += defense
-        self._log_info(f"[LOG] 처리 내용: 스텟 버프, 타겟: {target.get_display_name()}, 증가량: {value}")
+        _log.info(lambda: f"처리 내용: 스텟 버프, 타겟: {target.get_display_name()}, 증가량: {value}")
 
     def _process_draw(self, effect_data: Effect, target: Player, game_state_manager: 'GameStateManager'):
         """처리 - 카드 드로우"""
@@ -630,7 +636,8 @@ class EffectProcessor:
         target_id = target.player_id
         condition_val = effect_data.get('condition')
         if condition_val and isinstance(condition_val, str):
-            condition = lambda x: card_data.evaluate_condition(x, condition_val)
+            # 덱의 카드마다 조건 문자열을 다시 해석하지 않도록 컴파일된 판정 함수를 그대로 필터로 씁니다.
+            condition = compile_condition(condition_val)
         else:
             condition = (lambda x: True)
         deck = game_state_manager.get_cards_in_zone(target_id, Zone.DECK, condition)
@@ -643,9 +650,9 @@ class EffectProcessor:
         for _ in range(count):
             if not deck:
                 if effect_data.get('condition'):
-                    self._log_info(f"[LOG] : {target_id} 덱에서 조건에 맞는 카드가 검색되지 않았습니다.")
+                    _log.info(lambda: f"{target_id} 덱에서 조건에 맞는 카드가 검색되지 않았습니다.")
                     return
-                self._log_info(f"[LOG] : {target_id} 덱 아웃!")
+                _log.info(lambda: f"{target_id} 덱 아웃!")
                 return
             drawn_card = deck.pop(0)
             game_state_manager.move_card(drawn_card.card_id, Zone.DECK, Zone.HAND)
@@ -656,15 +663,15 @@ class EffectProcessor:
                 if handler:
                     handler(post_action, drawn_card, game_state_manager)
                 else:
-                    self._log_error(f"[ERROR] 처리 타입 {post_action['process'].value}에 대한 핸들러가 정의되지 않았습니다.")
+                    _log.error(lambda: f"처리 타입 {post_action['process'].value}에 대한 핸들러가 정의되지 않았습니다.")
 
-        print(f"[LOG] 처리 내용: 카드 드로우, 타겟: {target_id}, 드로우 장수: {count}")
+        _log.info(lambda: f"처리 내용: 카드 드로우, 타겟: {target_id}, 드로우 장수: {count}")
 
     def _process_heal(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 체력 회복"""
         value = effect_data.value
         target.heal_damage(value)
-        print(f"[LOG] 처리 내용: 체력 회복, 타겟: {target.get_display_name()}, 회복량: {value}")
+        _log.info(lambda: f"처리 내용: 체력 회복, 타겟: {target.get_display_name()}, 회복량: {value}")
 
     def _process_add_card_to_hand(self, effect_data: Effect, target: Player, game_state_manager: 'GameStateManager'):
         """처리 - 패에 카드 추가"""
@@ -679,7 +686,7 @@ class EffectProcessor:
                 opponent_deck = game_state_manager.get_cards_in_zone(opponent_id, Zone.DECK)
                 count = min(5, len(opponent_deck))
                 if count > 0:
-                    chosen_cards = random.sample(opponent_deck, count)
+                    chosen_cards = self.rng.sample(opponent_deck, count)
                     value = [c.card_data for c in chosen_cards]
                 else:
                     return
@@ -690,7 +697,7 @@ class EffectProcessor:
                 game_state_manager.add_card(card, Zone.HAND, target_id)
             else:
                 game_state_manager.add_card(card, Zone.GRAVEYARD, target_id)
-            print(f"[LOG] 처리 내용: 패에 카드 추가, 타겟: {target_id}, 추가 카드: {card.get_display_name()}")
+            _log.info(lambda: f"처리 내용: 패에 카드 추가, 타겟: {target_id}, 추가 카드: {card.get_display_name()}")
             
             # 후속 조치 효과가 정의되어 있다면 실행합니다.
             post_action = getattr(effect_data, "post_action", None)
@@ -708,7 +715,7 @@ class EffectProcessor:
                     game_state_manager.add_card(card, Zone.HAND, target_id)
                 else:
                     game_state_manager.add_card(card, Zone.GRAVEYARD, target_id)
-                print(f"[LOG] 처리 내용: 패에 카드 추가, 타겟: {target_id}, 추가 카드: {card.get_display_name()}")
+                _log.info(lambda: f"처리 내용: 패에 카드 추가, 타겟: {target_id}, 추가 카드: {card.get_display_name()}")
                 
                 # 후속 조치 효과가 정의되어 있다면 실행합니다.
                 post_action = getattr(effect_data, "post_action", None)
@@ -727,7 +734,7 @@ class EffectProcessor:
             card = game_state_manager.create_card_instance(value, target_id)
             if len(game_state_manager.get_cards_in_zone(target_id, Zone.FIELD)) < 5:
                 game_state_manager.add_card(card, Zone.FIELD, target_id)
-            print(f"[LOG] 처리 내용: 필드에 카드 소환, 타겟: {target_id}, 소환 카드: {card.get_display_name()}")
+            _log.info(lambda: f"처리 내용: 필드에 카드 소환, 타겟: {target_id}, 소환 카드: {card.get_display_name()}")
 
             # 후속 조치 효과가 정의되어 있다면 실행합니다.
             post_action = getattr(effect_data, "post_action", None)
@@ -743,7 +750,7 @@ class EffectProcessor:
                 card = game_state_manager.create_card_instance(data, target_id)
                 if len(game_state_manager.get_cards_in_zone(target_id, Zone.FIELD)) < 5:
                     game_state_manager.add_card(card, Zone.FIELD, target_id)
-                print(f"[LOG] 처리 내용: 필드에 카드 소환, 타겟: {target_id}, 소환 카드: {card.get_display_name()}")
+                _log.info(lambda: f"처리 내용: 필드에 카드 소환, 타겟: {target_id}, 소환 카드: {card.get_display_name()}")
 
                 # 후속 조치 효과가 정의되어 있다면 실행합니다.
                 post_action = getattr(effect_data, "post_action", None)
@@ -754,7 +761,7 @@ class EffectProcessor:
 
     def _process_summon_copy(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 복사본 소환"""
-        caster_id = getattr(effect_data, "caster_id", "")
+        caster_id = self._get_caster_id(effect_data, "")
         caster_card = game_state_manager.get_entity_by_id(caster_id)
 
         owner_id = ""
@@ -775,7 +782,7 @@ class EffectProcessor:
             if hasattr(effect_data, "value") and isinstance(effect_data.value, card_data.CardData):
                 original_card_data = effect_data.value
             else:
-                print("[WARNING] summon_copy - 원본 카드를 찾을 수 없습니다.")
+                _log.warning("summon_copy - 원본 카드를 찾을 수 없습니다.")
                 return
 
         if not owner_id:
@@ -785,7 +792,7 @@ class EffectProcessor:
         if len(game_state_manager.get_cards_in_zone(owner_id, Zone.FIELD)) < 5:
             game_state_manager.add_card(card, Zone.FIELD, owner_id)
 
-        print(f"[LOG] 처리 내용: 복사본 소환, 타겟: {owner_id}, 소환 카드: {card.get_display_name()}")
+        _log.info(lambda: f"처리 내용: 복사본 소환, 타겟: {owner_id}, 소환 카드: {card.get_display_name()}")
 
         # 후속 조치 효과가 정의되어 있다면 실행합니다.
         post_action = getattr(effect_data, "post_action", None)
@@ -801,12 +808,12 @@ class EffectProcessor:
         val = self._safe_int(value, 0)
 
         if target.has_keyword(EffectType.BARRIER):
-            print(f"[LOG] {target.get_display_name()} 배리어로 데미지 0 받음.")
+            _log.info(lambda: f"{target.get_display_name()} 배리어로 데미지 0 받음.")
             val = 0
             target.effects = [effect for effect in target.effects if effect.type != EffectType.BARRIER]
 
         elif self._is_protected_by_super_evolution(target, game_state_manager):
-            print(f"[LOG] {target.get_display_name()} 초진화 효과로 데미지 0 받음.")
+            _log.info(lambda: f"{target.get_display_name()} 초진화 효과로 데미지 0 받음.")
             val = 0
 
         if target.take_damage(val):
@@ -817,7 +824,7 @@ class EffectProcessor:
                 target_id = target.card_id
                 game_state_manager.move_card(target_id, Zone.FIELD, Zone.GRAVEYARD)
                 self.event_manager.publish(DestroyedOnFieldEvent(target_id))
-        print(f"[LOG] 처리 내용: 피해 입히기, 타겟: {target.get_display_name()}, 피해량: {value}")
+        _log.info(lambda: f"처리 내용: 피해 입히기, 타겟: {target.get_display_name()}, 피해량: {value}")
 
     def _resolve_split_damage(self, effect_data: Effect, target_list: List[Any], game_state_manager: 'GameStateManager'):
         import copy
@@ -857,12 +864,12 @@ class EffectProcessor:
         if not hasattr(target, "card_id"):
             return
         if self._is_protected_by_super_evolution(target, game_state_manager):
-            print(f"[LOG] 처리 내용: 파괴, 타겟: {target.get_display_name()}")
-            print(f"[LOG] {target.get_display_name()} 초진화 효과로 파괴되지 않음.")
+            _log.info(lambda: f"처리 내용: 파괴, 타겟: {target.get_display_name()}")
+            _log.info(lambda: f"{target.get_display_name()} 초진화 효과로 파괴되지 않음.")
             return
         game_state_manager.move_card(target.card_id, Zone.FIELD, Zone.GRAVEYARD)
         self.event_manager.publish(DestroyedOnFieldEvent(target.card_id))
-        print(f"[LOG] 처리 내용: 파괴, 타겟: {target.get_display_name()}")
+        _log.info(lambda: f"처리 내용: 파괴, 타겟: {target.get_display_name()}")
 
     def _process_banish(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 소멸"""
@@ -870,7 +877,7 @@ class EffectProcessor:
             return
         current_zone = getattr(target, "current_zone", Zone.FIELD)
         game_state_manager.move_card(target.card_id, current_zone, Zone.BANISHED)
-        print(f"[LOG] 처리 내용 소멸, 타겟 {target.get_display_name()}.")
+        _log.info(lambda: f"처리 내용 소멸, 타겟 {target.get_display_name()}.")
 
     def _process_select(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 선택. 선택된 아군 카드를 파괴 처리하거나 후속 조치를 실행합니다."""
@@ -888,13 +895,15 @@ class EffectProcessor:
                     tgt_val = post_action.target if hasattr(post_action, "target") else post_action.get("target")
                     # post_action이 TargetType.SELF 를 지목하면 시전자 카드를 대상으로 후속 조치를 취합니다.
                     if tgt_val == TargetType.SELF:
-                        caster_id = getattr(effect_data, "caster_id", None)
+                        caster_id = self._get_caster_id(effect_data)
                         caster_card = game_state_manager.get_entity_by_id(caster_id) if caster_id else None
                         handler(post_action, caster_card or target, game_state_manager)
                     # 그 외 TRANSFORM, ADD_EFFECT 등의 카드 자체를 변형시키는 경우 target(선택된 카드)을 직접 전달합니다.
                     elif proc_val in (ProcessType.TRANSFORM, ProcessType.ADD_EFFECT):
                         handler(post_action, target, game_state_manager)
                     else:
+                        # post_action은 카드 데이터의 효과와 공유되므로 복제본에 선택된 카드를 기록합니다.
+                        post_action = post_action.clone()
                         post_action.value = target.card_data
                         owner = game_state_manager.players[target.owner_id]
                         handler(post_action, owner, game_state_manager)
@@ -905,31 +914,31 @@ class EffectProcessor:
 
         # 선택된 타겟 카드를 필드에서 묘지로 파괴 이동합니다.
         if self._is_protected_by_super_evolution(target, game_state_manager):
-            print(f"[LOG] 처리 내용: 선택 파괴 실패, 타겟 {target.get_display_name()}")
-            print(f"[LOG] {target.get_display_name()} 초진화 효과로 파괴되지 않음.")
+            _log.info(lambda: f"처리 내용: 선택 파괴 실패, 타겟 {target.get_display_name()}")
+            _log.info(lambda: f"{target.get_display_name()} 초진화 효과로 파괴되지 않음.")
             return
         game_state_manager.move_card(target.card_id, Zone.FIELD, Zone.GRAVEYARD)
         self.event_manager.publish(DestroyedOnFieldEvent(target.card_id))
-        print(f"[LOG] 처리 내용: 선택 파괴, 타겟 {target.get_display_name()}")
+        _log.info(lambda: f"처리 내용: 선택 파괴, 타겟 {target.get_display_name()}")
 
     def _process_recover_pp(self, effect_data: Effect, target: Player, game_state_manager: 'GameStateManager'):
         """처리 - PP 회복"""
         value = effect_data.value
         target.gain_pp(value)
-        print(f"[LOG] 처리 내용: PP 회복, 타겟: {target.player_id}, 회복량: {value}")
+        _log.info(lambda: f"처리 내용: PP 회복, 타겟: {target.player_id}, 회복량: {value}")
 
     def _process_super_evolve(self, effect_data: Effect, target: Card, game_state_manager: 'GameStateManager'):
         """처리 - 초진화"""
         game_state_manager.super_evolve_card(target.card_id)
         self.event_manager.publish(FollowerSuperEvolvedEvent(target.card_id, spend_sep="False"))
-        print(f"[LOG] 처리 내용: 초진화, 타겟: {target.get_display_name()}")
+        _log.info(lambda: f"처리 내용: 초진화, 타겟: {target.get_display_name()}")
 
     def _process_evolve(self, effect_data: Effect, target: Card, game_state_manager: 'GameStateManager'):
         """처리 - 지정 카드를 진화시킵니다."""
         game_state_manager.evolve_card(target.card_id)
         from src.common.event import FollowerEvolvedEvent
         self.event_manager.publish(FollowerEvolvedEvent(target.card_id, spend_ep=False))
-        print(f"[LOG] 처리 내용: 카드 진화, 타겟 {target.get_display_name()}")
+        _log.info(lambda: f"처리 내용: 카드 진화, 타겟 {target.get_display_name()}")
 
     def _process_replace_deck(self, effect_data: Effect, target: Player, game_state_manager: 'GameStateManager'):
         """처리 - 덱 교체"""
@@ -939,56 +948,56 @@ class EffectProcessor:
         for card_data_item in value:
             card_data_to_add = game_state_manager.create_card_instance(card_data_item, target_id)
             replaced_deck_list.append(card_data_to_add)
-        random.shuffle(replaced_deck_list)
-        replaced_deck = Deck(replaced_deck_list)
-        target.deck = replaced_deck
-        print(f"[LOG] 처리 내용: 덱 교체, 타겟: {target.player_id}, 덱 사이즈: {len(replaced_deck)}")
+        self.rng.shuffle(replaced_deck_list)
+        replaced_deck = Deck(replaced_deck_list, rng=self.rng)
+        target.replace_deck(replaced_deck)
+        _log.info(lambda: f"처리 내용: 덱 교체, 타겟: {target.player_id}, 덱 사이즈: {len(replaced_deck)}")
 
     def _process_set_max_health(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 최대 체력 설정"""
         value = effect_data.value
         target.max_defense = value
-        print(f"[LOG] 처리 내용: 최대 체력 설정, 타겟: {target.get_display_name()}, 설정값: {value}")
+        _log.info(lambda: f"처리 내용: 최대 체력 설정, 타겟: {target.get_display_name()}, 설정값: {value}")
 
     def _process_add_keyword(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 키워드 부여"""
         value = effect_data.value
         if value is None:
-            print(f"[LOG] 처리 내용: 키워드 부여 실패. 키워드가 존재하지 않습니다.")
+            _log.info("처리 내용: 키워드 부여 실패. 키워드가 존재하지 않습니다.")
             return
 
         if isinstance(value, list):
             for v in value:
                 if isinstance(v, Effect):
-                    target.effects.append(v)
-                    print(f"[LOG] 처리 내용: 키워드 부여, 타겟: {target.get_display_name() if hasattr(target, 'get_display_name') else target}, 키워드: {v.type.value if hasattr(v, 'type') and hasattr(v.type, 'value') else v}")
+                    target.add_effect(v)
+                    _log.info(lambda: f"처리 내용: 키워드 부여, 타겟: {target.get_display_name() if hasattr(target, 'get_display_name') else target}, 키워드: {v.type.value if hasattr(v, 'type') and hasattr(v.type, 'value') else v}")
                 elif isinstance(v, EffectType):
                     new_eff = Effect(type=v)
-                    target.effects.append(new_eff)
-                    print(f"[LOG] 처리 내용: 키워드 부여, 타겟: {target.get_display_name() if hasattr(target, 'get_display_name') else target}, 키워드: {v.value}")
+                    target.add_effect(new_eff)
+                    _log.info(lambda: f"처리 내용: 키워드 부여, 타겟: {target.get_display_name() if hasattr(target, 'get_display_name') else target}, 키워드: {v.value}")
                 elif isinstance(v, str):
                     try:
                         eff_type = EffectType[v.upper()]
                         new_eff = Effect(type=eff_type)
-                        target.effects.append(new_eff)
-                        print(f"[LOG] 처리 내용: 키워드 부여, 타겟: {target.get_display_name() if hasattr(target, 'get_display_name') else target}, 키워드: {eff_type.value}")
+                        target.add_effect(new_eff)
+                        _log.info(lambda: f"처리 내용: 키워드 부여, 타겟: {target.get_display_name() if hasattr(target, 'get_display_name') else target}, 키워드: {eff_type.value}")
                     except KeyError:
-                        print(f"[LOG] 처리 내용: 키워드 부여 경고. 알 수 없는 키워드 문자열 {v}")
+                        _log.info(lambda: f"처리 내용: 키워드 부여 경고. 알 수 없는 키워드 문자열 {v}")
         elif isinstance(value, Effect):
-            target.effects.append(value)
-            print(f"[LOG] 처리 내용: 키워드 부여, 타겟: {target.get_display_name() if hasattr(target, 'get_display_name') else target}, 키워드: {value.type.value if hasattr(value, 'type') and hasattr(value.type, 'value') else value}")
+            target.add_effect(value)
+            _log.info(lambda: f"처리 내용: 키워드 부여, 타겟: {target.get_display_name() if hasattr(target, 'get_display_name') else target}, 키워드: {value.type.value if hasattr(value, 'type') and hasattr(value.type, 'value') else value}")
         elif isinstance(value, EffectType):
             new_eff = Effect(type=value)
-            target.effects.append(new_eff)
-            print(f"[LOG] 처리 내용: 키워드 부여, 타겟: {target.get_display_name() if hasattr(target, 'get_display_name') else target}, 키워드: {value.value}")
+            target.add_effect(new_eff)
+            _log.info(lambda: f"처리 내용: 키워드 부여, 타겟: {target.get_display_name() if hasattr(target, 'get_display_name') else target}, 키워드: {value.value}")
         elif isinstance(value, str):
             try:
                 eff_type = EffectType[value.upper()]
                 new_eff = Effect(type=eff_type)
-                target.effects.append(new_eff)
-                print(f"[LOG] 처리 내용: 키워드 부여, 타겟: {target.get_display_name() if hasattr(target, 'get_display_name') else target}, 키워드: {eff_type.value}")
+                target.add_effect(new_eff)
+                _log.info(lambda: f"처리 내용: 키워드 부여, 타겟: {target.get_display_name() if hasattr(target, 'get_display_name') else target}, 키워드: {eff_type.value}")
             except KeyError:
-                print(f"[LOG] 처리 내용: 키워드 부여 경고. 알 수 없는 키워드 문자열 {value}")
+                _log.info(lambda: f"처리 내용: 키워드 부여 경고. 알 수 없는 키워드 문자열 {value}")
 
     def _process_remove_keyword(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 키워드 제거"""
@@ -999,19 +1008,19 @@ class EffectProcessor:
         else:
             target.effects = [effect for effect in target.effects if not effect.type == value]
             val_str = value.value
-        print(f"[LOG] 처리 내용 키워드 제거 타겟 {target.get_display_name()} 키워드 {val_str}.")
+        _log.info(lambda: f"처리 내용 키워드 제거 타겟 {target.get_display_name()} 키워드 {val_str}.")
 
 
     def _process_return_to_deck(self, effect_data: Effect, target: Card, game_state_manager: 'GameStateManager'):
         """처리 - 덱으로 되돌리기"""
         game_state_manager.move_card(target.card_id, Zone.HAND, Zone.DECK)
-        print(f"[LOG] 처리 내용: 덱으로 되돌리기, 타겟: {target.get_display_name()}")
+        _log.info(lambda: f"처리 내용: 덱으로 되돌리기, 타겟: {target.get_display_name()}")
 
     def _process_return_to_hand(self, effect_data: Effect, target: Card, game_state_manager: 'GameStateManager'):
         """처리 - 패로 되돌리기"""
         game_state_manager.move_card(target.card_id, Zone.FIELD, Zone.HAND)
         target.current_cost = target.card_data['cost']
-        print(f"[LOG] 처리 내용: 패로 되돌리기, 타겟: {target.get_display_name()}")
+        _log.info(lambda: f"처리 내용: 패로 되돌리기, 타겟: {target.get_display_name()}")
 
     def _process_trigger_effect(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 다른 효과 발동"""
@@ -1027,15 +1036,15 @@ class EffectProcessor:
                 target.activated_abilities = set()
             unactivated = [(idx, eff) for idx, eff in spell_effects if idx not in target.activated_abilities]
             if unactivated:
-                selected_idx, selected_eff = random.choice(unactivated)
-                target.activated_abilities.add(selected_idx)
+                selected_idx, selected_eff = self.rng.choice(unactivated)
+                game_state_manager.journal.set_add(target.activated_abilities, selected_idx)
                 self.resolve_effect(selected_eff, target.card_id, game_state_manager, None)
-                print(f"[LOG] Slaus 효과 발동 - 인덱스 {selected_idx} 효과 실행.")
+                _log.info(lambda: f"Slaus 효과 발동 - 인덱스 {selected_idx} 효과 실행.")
         else:
             for effect in target.effects:
                 if effect.type == value:
                     self.resolve_effect(effect, target.card_id, game_state_manager, None)
-            print(f"[LOG] 처리 내용: 다른 효과 발동, 타겟: {target.get_display_name()}, 발동 효과: {value.value}")
+            _log.info(lambda: f"처리 내용: 다른 효과 발동, 타겟: {target.get_display_name()}, 발동 효과: {value.value}")
 
     def _process_gain_crest(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """문장 획득 효과를 처리하고 전역 리스너를 바인딩합니다."""
@@ -1050,9 +1059,9 @@ class EffectProcessor:
             from src.models.crest import create_crest
             game = game_state_manager.game
             crest_obj = create_crest(crest_name, player.player_id)
-            player.crests.append(crest_obj)
+            game_state_manager.journal.append(player.crests, crest_obj)
             crest_obj.register_listeners(game)
-            print(f"[LOG] 처리 내용: 문장 획득, 타겟: {player.player_id}, 문장명: {crest_name}")
+            _log.info(lambda: f"처리 내용: 문장 획득, 타겟: {player.player_id}, 문장명: {crest_name}")
 
     def _process_fuse(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """융합 효과를 처리합니다."""
@@ -1068,7 +1077,7 @@ class EffectProcessor:
         fuse_condition = getattr(target.card_data, "fuse_condition", None)
         fusible_cards = [c for c in hand if c.card_id != target.card_id and validate_fuse_material(c, fuse_condition)]
         if not fusible_cards:
-            print(f"[LOG] {player_id}의 패에 융합할 수 있는 카드가 존재하지 않습니다.")
+            _log.info(lambda: f"{player_id}의 패에 융합할 수 있는 카드가 존재하지 않습니다.")
             return
 
         material_ids = game.gui.get_fuse_choices(player_id, target, fusible_cards)
@@ -1083,11 +1092,10 @@ class EffectProcessor:
         elif isinstance(target, Player):
             count = effect_data.value if isinstance(effect_data.value, int) else 1
             player_id = target.player_id
-            import random
             for _ in range(count):
                 hand_ids = game_state_manager.get_card_ids_in_zone(player_id, Zone.HAND)
                 if hand_ids:
-                    chosen_id = random.choice(hand_ids)
+                    chosen_id = self.rng.choice(hand_ids)
                     game.discard_card(player_id, chosen_id)
                 else:
                     break
@@ -1097,53 +1105,45 @@ class EffectProcessor:
         """효과를 해결하고 게임 상태에 적용합니다."""
         caster_card = game_state_manager.get_entity_by_id(caster_id)
         if not caster_card:
-            print(f"[ERROR] resolve_effect - caster card with id {caster_id} not found.")
+            _log.error(lambda: f"resolve_effect - caster card with id {caster_id} not found.")
             return
 
+        # 실행 중에는 속성 위임 조회 대신 로드 시점에 컴파일한 고정 배치 레코드의 필드만 읽습니다.
+        compiled = get_compiled_effect(effect_data)
+
         # 설정된 조건이 있는 경우 시전자 카드가 이를 만족하는지 확인합니다.
         # attributes에 직접 명시된 조건만 이펙트 전체 조건으로 판단하며 위임된 프로세스 조건은 제외합니다.
-        if hasattr(effect_data, "attributes") and isinstance(effect_data.attributes, dict):
-            condition_str = effect_data.attributes.get("condition")
-        else:
-            condition_str = effect_data.get("condition")
-        if condition_str and isinstance(condition_str, str):
-            from src.common import card_data as cd
-            if not cd.evaluate_condition(caster_card, condition_str):
-                print(f"[LOG] {caster_card.get_display_name()}의 조건 {condition_str} 미충족으로 효과 발동 실패.")
+        condition_str = compiled.condition
+        if compiled.condition_predicate is not None:
+            if not compiled.condition_predicate(caster_card):
+                _log.info(lambda: f"{caster_card.get_display_name()}의 조건 {condition_str} 미충족으로 효과 발동 실패.")
                 return
 
-        from copy import copy
-        effect_data = copy(effect_data)
-        effect_data.attributes = copy(effect_data.attributes)
-
-        # 하위 프로세스들의 부모 참조를 복사본으로 재바인딩합니다.
-        if hasattr(effect_data, "processes"):
-            for p in effect_data.processes:
-                if isinstance(p, Process):
-                    p.parent_effect = effect_data
+        # 카드들이 CardData의 효과 객체를 공유하므로 변수 X를 해석해야 하는 효과만 복제하여 해석 결과를 복제본에 기록합니다.
+        # 변수가 없는 효과는 복제 없이 원본을 그대로 읽고 시전자 ID는 실행 문맥 스택으로 전달합니다.
+        is_private = False
+        if compiled.has_variables:
+            x_val = self._get_variable_value(caster_card, game_state_manager)
+            if x_val is not None:
+                effect_data = effect_data.clone()
+                is_private = True
+                self._resolve_effect_variables(effect_data, x_val)
+                # 변수 해석으로 target 등이 바뀌었을 수 있으므로 해석된 복제본을 다시 컴파일합니다.
+                compiled = compile_effect(effect_data)
 
-        effect_data.update(caster_id=caster_id)
-
-        # 변수 X의 값을 동적으로 해석하여 적용합니다.
-        x_val = self._get_variable_value(caster_card, game_state_manager)
-        self._resolve_effect_variables(effect_data, x_val)
-
-        effect_type = getattr(effect_data, "type", None)
+        effect_type = compiled.type
 
         # 대체(instead) 효과 체크 로직입니다.
         if isinstance(caster_card, Card) and effect_type in [EffectType.FANFARE, EffectType.SPELL]:
-            raw_text = caster_card.card_data.get("raw_effects_text", "").lower()
-            if "instead" in raw_text:
+            if caster_card.card_data.has_instead:
                 # 콤보 대체 조건 검사
                 has_combo = any(e.type == EffectType.COMBO for e in caster_card.effects)
                 if has_combo:
-                    import re
-                    match = re.search(r"Combo\s*\((\d+)\)", caster_card.card_data.raw_effects_text, re.IGNORECASE)
-                    req_combo = int(match.group(1)) if match else 3
+                    req_combo = caster_card.card_data.combo_requirement
                     player = game_state_manager.players[self._get_owner_id(caster_card)]
-                    print(f"[DEBUG INSTEAD] card={caster_card.card_data.name}, req={req_combo}, combo={player.combo_count}")
+                    _log.debug(lambda: f"instead - card={caster_card.card_data.name}, req={req_combo}, combo={player.combo_count}")
                     if player.combo_count >= req_combo:
-                        print(f"[LOG] 콤보 조건 만족으로 인해 {effect_type.value if effect_type else 'None'} 효과 발동을 건너뛰고 콤보 효과로 대체합니다.")
+                        _log.info(lambda: f"콤보 조건 만족으로 인해 {effect_type.value if effect_type else 'None'} 효과 발동을 건너뛰고 콤보 효과로 대체합니다.")
                         return
 
                 # 오의 대체 조건 검사
@@ -1151,7 +1151,7 @@ class EffectProcessor:
                 if has_sa:
                     sa_effects = [e for e in caster_card.effects if e.type == EffectType.SKYBOUND_ART]
                     if any(game_state_manager.turn_number + getattr(e, "skybound_art_evo_charge", 0) >= 10 for e in sa_effects):
-                        print(f"[LOG] 오의 조건 만족으로 인해 {effect_type.value if effect_type else 'None'} 효과 발동을 건너뛰고 오의 효과로 대체합니다")
+                        _log.info(lambda: f"오의 조건 만족으로 인해 {effect_type.value if effect_type else 'None'} 효과 발동을 건너뛰고 오의 효과로 대체합니다")
                         return
 
                 # 해방오의 대체 조건 검사
@@ -1159,19 +1159,17 @@ class EffectProcessor:
                 if has_ssa:
                     ssa_effects = [e for e in caster_card.effects if e.type == EffectType.SUPER_SKYBOUND_ART]
                     if any(game_state_manager.turn_number + getattr(e, "skybound_art_evo_charge", 0) >= 15 for e in ssa_effects):
-                        print(f"[LOG] 해방오의 조건 만족으로 인해 {effect_type.value if effect_type else 'None'} 효과 발동을 건너뛰고 해방오의 효과로 대체합니다")
+                        _log.info(lambda: f"해방오의 조건 만족으로 인해 {effect_type.value if effect_type else 'None'} 효과 발동을 건너뛰고 해방오의 효과로 대체합니다")
                         return
 
         if effect_type == EffectType.COMBO:
             if isinstance(caster_card, Card):
-                import re
-                match = re.search(r"Combo\s*\((\d+)\)", caster_card.card_data.raw_effects_text, re.IGNORECASE)
-                req_combo = int(match.group(1)) if match else 3
+                req_combo = caster_card.card_data.combo_requirement
             else:
-                req_combo = 3
+                req_combo = card_data.DEFAULT_COMBO_REQUIREMENT
             player = game_state_manager.players[self._get_owner_id(caster_card)]
             if player.combo_count < req_combo:
-                print(f"[LOG] 콤보 카운트({player.combo_count})가 조건({req_combo})에 미달하여 효과 발동 실패.")
+                _log.info(lambda: f"콤보 카운트({player.combo_count})가 조건({req_combo})에 미달하여 효과 발동 실패.")
                 return
             # value가 'X'인 경우, 다른 FANFARE나 SPELL 효과의 value 값을 복제하여 사용합니다.
             if effect_data.value == 'X':
@@ -1182,54 +1180,56 @@ class EffectProcessor:
                             base_val = e.value
                             break
                 if base_val is not None:
+                    if not is_private:
+                        effect_data = effect_data.clone()
+                        is_private = True
                     effect_data.value = base_val
-                    print(f"[LOG] 콤보 효과의 수치 'X'를 기본 효과의 값인 {base_val}로 설정합니다.")
-            print(f"[LOG] 콤보 {req_combo} 효과 발동.")
+                    _log.info(lambda: f"콤보 효과의 수치 'X'를 기본 효과의 값인 {base_val}로 설정합니다.")
+            _log.info(lambda: f"콤보 {req_combo} 효과 발동.")
 
         elif effect_type == EffectType.SKYBOUND_ART:
             evo_charge = getattr(effect_data, "skybound_art_evo_charge", 0)
             total_charge = game_state_manager.turn_number + evo_charge
             if total_charge < 10:
-                print(f"[LOG] 오의 게이지({total_charge}/10) 부족으로 효과 발동 실패.")
+                _log.info(lambda: f"오의 게이지({total_charge}/10) 부족으로 효과 발동 실패.")
                 return
-            print(f"[LOG] 오의 효과 발동.")
+            _log.info("오의 효과 발동.")
 
         elif effect_type == EffectType.SUPER_SKYBOUND_ART:
             evo_charge = getattr(effect_data, "skybound_art_evo_charge", 0)
             total_charge = game_state_manager.turn_number + evo_charge
             if total_charge < 15:
-                print(f"[LOG] 해방오의 게이지({total_charge}/15) 부족으로 효과 발동 실패.")
+                _log.info(lambda: f"해방오의 게이지({total_charge}/15) 부족으로 효과 발동 실패.")
                 return
-            print(f"[LOG] 해방오의 효과 발동.")
+            _log.info("해방오의 효과 발동.")
 
         elif effect_type == EffectType.OVERFLOW:
             player = game_state_manager.players[self._get_owner_id(caster_card)]
             if not player.is_overflow:
-                print(f"[LOG] 각성 조건 미충족으로 효과 발동 실패.")
+                _log.info("각성 조건 미충족으로 효과 발동 실패.")
                 return
-            print(f"[LOG] 각성 효과 발동.")
+            _log.info("각성 효과 발동.")
 
         elif effect_type == EffectType.RALLY:
             if isinstance(caster_card, Card):
-                import re
-                match = re.search(r"Rally\s*\((\d+)\)", caster_card.card_data.raw_effects_text, re.IGNORECASE)
-                req_rally = int(match.group(1)) if match else 10
+                req_rally = caster_card.card_data.rally_requirement
             else:
-                req_rally = 10
+                req_rally = card_data.DEFAULT_RALLY_REQUIREMENT
             player = game_state_manager.players[self._get_owner_id(caster_card)]
             if player.rally_count < req_rally:
-                print(f"[LOG] 연계 수치({player.rally_count})가 조건({req_rally})에 미달하여 효과 발동 실패.")
+                _log.info(lambda: f"연계 수치({player.rally_count})가 조건({req_rally})에 미달하여 효과 발동 실패.")
                 return
-            print(f"[LOG] 연계 {req_rally} 효과 발동.")
+            _log.info(lambda: f"연계 {req_rally} 효과 발동.")
 
         if effect_type == EffectType.NECROMANCY:
             player = game_state_manager.players[self._get_owner_id(caster_card)]
             req_shadows = int(effect_data.value) if effect_data.value is not None else 0
             if player.graveyard.shadows_count >= req_shadows:
+                game_state_manager.journal.note_attr(player.graveyard, 'shadows_count')
                 player.graveyard.shadows_count -= req_shadows
-                print(f"[LOG] 사령술 {req_shadows} 발동. 남은 그림자 수 {player.graveyard.shadows_count}.")
+                _log.info(lambda: f"사령술 {req_shadows} 발동. 남은 그림자 수 {player.graveyard.shadows_count}.")
             else:
-                print(f"[LOG] 그림자 수 부족으로 사령술 {req_shadows} 발동 실패. 현재 그림자 수 {player.graveyard.shadows_count}.")
+                _log.info(lambda: f"그림자 수 부족으로 사령술 {req_shadows} 발동 실패. 현재 그림자 수 {player.graveyard.shadows_count}.")
                 return
 
         if effect_type == EffectType.EARTH_RITE:
@@ -1241,45 +1241,51 @@ class EffectProcessor:
                 game_state_manager.move_card(target_sigil.card_id, Zone.FIELD, Zone.GRAVEYARD)
                 from src.common.event import DestroyedOnFieldEvent
                 self.event_manager.publish(DestroyedOnFieldEvent(target_sigil.card_id))
-                print(f"[LOG] 흙의 비술 발동. {target_sigil.get_display_name()} 소모(파괴).")
+                _log.info(lambda: f"흙의 비술 발동. {target_sigil.get_display_name()} 소모(파괴).")
             else:
-                print(f"[LOG] 필드에 비술 마법진(Earth Sigil)이 존재하지 않아 흙의 비술 발동 실패.")
+                _log.info("필드에 비술 마법진(Earth Sigil)이 존재하지 않아 흙의 비술 발동 실패.")
                 return
 
+        self._resolving.append((effect_data, caster_id))
+        try:
+            self._resolve_processes(effect_data, compiled, caster_card, caster_id, game_state_manager, target_id, is_private)
+        finally:
+            self._resolving.pop()
+
+    def _resolve_processes(self, effect_data: Effect, compiled: Any, caster_card: Any, caster_id: str,
+                           game_state_manager: 'GameStateManager', target_id: str, is_private: bool):
+        """효과의 프로세스들을 순서대로 처리합니다. is_private는 effect_data가 이번 해결을 위해 복제된 전용 객체인지 여부입니다."""
+        effect_type = compiled.type
         # Effect 내의 processes 리스트를 순서대로 순회하며 각 프로세스 단계를 처리합니다.
-        for process in effect_data.processes:
+        for process, compiled_process in zip(effect_data.processes, compiled.processes):
             # 개별 프로세스 레벨의 조건을 검사합니다.
-            proc_condition = getattr(process, "condition", None)
+            proc_condition = compiled_process.condition
             if caster_card and hasattr(caster_card, "current_cost"):
-                print(f"[DEBUG DISCARD] process_type={getattr(process, 'process', None)}, condition={proc_condition}, card_cost={caster_card.current_cost}")
-            if proc_condition and isinstance(proc_condition, str):
-                from src.common import card_data as cd
-                if not cd.evaluate_condition(caster_card, proc_condition):
-                    print(f"[LOG] 프로세스 조건 {proc_condition} 미충족으로 프로세스 스킵.")
+                _log.debug(lambda: f"discard - process_type={compiled_process.process_type}, condition={proc_condition}, card_cost={caster_card.current_cost}")
+            if compiled_process.condition_predicate is not None:
+                if not compiled_process.condition_predicate(caster_card):
+                    _log.info(lambda: f"프로세스 조건 {proc_condition} 미충족으로 프로세스 스킵.")
                     continue
 
-            process_type = getattr(process, "process", None)
+            process_type = compiled_process.process_type
 
             # process가 없거나 변수 정의인 경우, post_action이 있는 경우에만 처리합니다.
             if not process_type or process_type == ProcessType.DEFINE_VARIABLE:
-                post_action = getattr(process, "post_action", None)
-                if post_action:
-                    proc_val = post_action.process if hasattr(post_action, "process") else post_action.get("process")
-                    handler = self.process_handlers.get(proc_val)
+                if compiled_process.has_post_action:
+                    handler = self.process_handlers.get(compiled_process.post_action_type)
                     if handler:
                         target = game_state_manager.get_entity_by_id(target_id) if target_id else caster_card
                         if target:
-                            handler(post_action, target, game_state_manager)
+                            handler(process.post_action, target, game_state_manager)
                 else:
                     # post_action이 없고 raw_action_text가 카드 이름이라면 소환 효과로 대체 처리합니다.
-                    raw_text = getattr(process, "raw_action_text", None)
+                    raw_text = compiled_process.raw_action_text
                     if raw_text and isinstance(raw_text, str):
                         from src.common import card_data as cd
                         clean_name = raw_text.strip()
                         resolved_card = cd.get_card_data_by_id(clean_name)
                         if not resolved_card:
-                            import re
-                            clean_name = re.sub(r'^(?:an?|the)\s+', '', clean_name, flags=re.IGNORECASE).strip()
+                            clean_name = _ARTICLE_PATTERN.sub('', clean_name).strip()
                             resolved_card = cd.get_card_data_by_id(clean_name)
                         if resolved_card:
                             player_id = self._get_owner_id(caster_card)
@@ -1290,19 +1296,22 @@ class EffectProcessor:
 
             # ProcessType.CHOOSE (선택 모드) 인 경우 pending_choice 에 전체 이펙트 등록 후 사용자 선택을 대기합니다.
             if process_type == ProcessType.CHOOSE:
+                # 대기 중인 선택은 해결이 끝난 뒤에도 남으므로 전용 복제본에 시전자 ID를 기록해 둡니다.
+                if not is_private:
+                    effect_data = effect_data.clone()
                 effect_data.update(caster_id=caster_id)
                 game_state_manager.is_awaiting_choice = True
                 game_state_manager.pending_choice = effect_data
                 game_state_manager.player_awaiting_choice = self._get_owner_id(caster_card)
-                print(f"[LOG] {self._get_owner_id(caster_card)}의 선택 대기. 선택지: {effect_data.get('choices')}")
+                _log.info(lambda: f"{self._get_owner_id(caster_card)}의 선택 대기. 선택지: {effect_data.get('choices')}")
                 return
 
             handler = self.process_handlers.get(process_type)
             if not handler:
-                print(f"[ERROR] 처리 타입 {process_type.value}에 대한 핸들러가 정의되지 않았습니다.")
+                _log.error(lambda: f"처리 타입 {process_type.value}에 대한 핸들러가 정의되지 않았습니다.")
                 continue
 
-            print(f"[LOG] {caster_card.get_display_name()} (ID: {caster_id})의 키워드 {effect_type.value if effect_type else 'None'} 중 프로세스 {process_type.name} 처리 시작")
+            _log.info(lambda: f"{caster_card.get_display_name()} (ID: {caster_id})의 키워드 {effect_type.value if effect_type else 'None'} 중 프로세스 {process_type.name} 처리 시작")
 
             if target_id:
                 target = game_state_manager.get_entity_by_id(target_id)
@@ -1310,14 +1319,10 @@ class EffectProcessor:
                     handler(process, target, game_state_manager)
                 continue
 
-            target_type = process.get('target')
-            # 개별 프로세스에 target 이 지정되지 않은 경우, Effect 레벨의 target을 대체 사용합니다.
-            if target_type is None:
-                target_type = effect_data.get('target')
-
-            target_list = self.list_target(target_type, caster_id, game_state_manager, process)
+            # 개별 프로세스에 target 이 지정되지 않은 경우의 Effect 레벨 target 대체는 컴파일 시점에 반영되어 있습니다.
+            target_list = self.list_target(compiled_process.target, caster_id, game_state_manager, process)
 
-            if process_type == ProcessType.DEAL_DAMAGE and process.get('is_split'):
+            if process_type == ProcessType.DEAL_DAMAGE and compiled_process.is_split:
                 self._resolve_split_damage(process, target_list, game_state_manager)
             else:
                 for target in target_list:
@@ -1334,7 +1339,7 @@ class EffectProcessor:
             else:
                 val = self._safe_int(value, 0)
                 target.current_cost = max(0, target.current_cost - val)
-            print(f"[LOG] 처리 내용 코스트 감소, 타겟 {target.get_display_name()}, 현재 코스트 {target.current_cost}.")
+            _log.info(lambda: f"처리 내용 코스트 감소, 타겟 {target.get_display_name()}, 현재 코스트 {target.current_cost}.")
 
     def _process_increase_cost(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 코스트 증가"""
@@ -1342,7 +1347,7 @@ class EffectProcessor:
         if hasattr(target, "current_cost"):
             val = self._safe_int(value, 0)
             target.current_cost = target.current_cost + val
-            print(f"[LOG] 처리 내용 코스트 증가, 타겟 {target.get_display_name()}, 현재 코스트 {target.current_cost}.")
+            _log.info(lambda: f"처리 내용 코스트 증가, 타겟 {target.get_display_name()}, 현재 코스트 {target.current_cost}.")
 
     def _process_set_cost(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 코스트 설정"""
@@ -1350,7 +1355,7 @@ class EffectProcessor:
         if hasattr(target, "current_cost"):
             val = self._safe_int(value, 0)
             target.current_cost = val
-            print(f"[LOG] 처리 내용 코스트 설정, 타겟 {target.get_display_name()}, 현재 코스트 {target.current_cost}.")
+            _log.info(lambda: f"처리 내용 코스트 설정, 타겟 {target.get_display_name()}, 현재 코스트 {target.current_cost}.")
 
     def _process_set_attack(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 공격력 설정"""
@@ -1358,7 +1363,7 @@ class EffectProcessor:
         if hasattr(target, "current_attack"):
             val = self._safe_int(value, 0)
             target.current_attack = val
-            print(f"[LOG] 처리 내용 공격력 설정, 타겟 {target.get_display_name()}, 현재 공격력 {target.current_attack}.")
+            _log.info(lambda: f"처리 내용 공격력 설정, 타겟 {target.get_display_name()}, 현재 공격력 {target.current_attack}.")
 
     def _process_advance_crest(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 문장 카운트 변경"""
@@ -1372,15 +1377,17 @@ class EffectProcessor:
             amount = self._safe_int(value[1], 0)
             for crest in player.crests:
                 if crest.name == crest_name:
+                    game_state_manager.journal.note_attr(crest, 'count')
                     crest.count += amount
-                    print(f"[LOG] {crest.name} 문장 카운트 {amount}만큼 변경. 현재 카운트 {crest.count}.")
+                    _log.info(lambda: f"{crest.name} 문장 카운트 {amount}만큼 변경. 현재 카운트 {crest.count}.")
         else:
             amount = self._safe_int(value, 0)
             if value2 == "-0" or (isinstance(value2, str) and value2.startswith("-")):
                 amount = -amount
             for crest in player.crests:
+                game_state_manager.journal.note_attr(crest, 'count')
                 crest.count += amount
-                print(f"[LOG] {crest.name} 문장 카운트 {amount}만큼 변경. 현재 카운트 {crest.count}.")
+                _log.info(lambda: f"{crest.name} 문장 카운트 {amount}만큼 변경. 현재 카운트 {crest.count}.")
 
     def _process_destroy_crest(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 문장 파괴"""
@@ -1390,8 +1397,8 @@ class EffectProcessor:
         crests_to_remove = [c for c in player.crests if c.name == crest_name]
         for crest in crests_to_remove:
             crest.unregister_listeners(game_state_manager.game)
-            player.crests.remove(crest)
-            print(f"[LOG] 처리 내용 문장 파괴, 타겟 {player.player_id}, 문장명 {crest_name}.")
+            game_state_manager.journal.remove(player.crests, crest)
+            _log.info(lambda: f"처리 내용 문장 파괴, 타겟 {player.player_id}, 문장명 {crest_name}.")
 
     def _process_recover_ep(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - EP 회복"""
@@ -1399,7 +1406,7 @@ class EffectProcessor:
 
         value = self._safe_int(effect_data.value, 1)
         player.gain_ep(value)
-        print(f"[LOG] 처리 내용 EP 회복, 타겟 {player.player_id}, 회복량 {value}.")
+        _log.info(lambda: f"처리 내용 EP 회복, 타겟 {player.player_id}, 회복량 {value}.")
 
     def _process_heal_linked(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 연계 회복"""
@@ -1408,15 +1415,16 @@ class EffectProcessor:
             target.heal_damage(heal_amount)
             leader = game_state_manager.players[target.owner_id]
             leader.heal_damage(heal_amount)
-            print(f"[LOG] 처리 내용 연계 회복, 타겟 {target.get_display_name()}, 회복량 {heal_amount}.")
+            _log.info(lambda: f"처리 내용 연계 회복, 타겟 {target.get_display_name()}, 회복량 {heal_amount}.")
 
     def _process_gain_shadow(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 묘지 그림자 증가"""
         player = self._get_player_entity(target, game_state_manager)
 
         val = self._safe_int(effect_data.value, 0)
+        game_state_manager.journal.note_attr(player.graveyard, 'shadows_count')
         player.graveyard.shadows_count += val
-        print(f"[LOG] 처리 내용 묘지 그림자 증가, 타겟 {player.player_id}, 증가량 {val}.")
+        _log.info(lambda: f"처리 내용 묘지 그림자 증가, 타겟 {player.player_id}, 증가량 {val}.")
 
     def _process_reanimate(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 사령 재생"""
@@ -1427,17 +1435,16 @@ class EffectProcessor:
         graveyard_cards = player.graveyard.get_cards()
         candidates = [c for c in graveyard_cards if c.get_type() == CardType.FOLLOWER and c.current_cost <= max_cost]
         if not candidates:
-            print(f"[LOG] 사령 재생 {max_cost} 실패. 조건에 부합하는 추종자가 묘지에 없습니다.")
+            _log.info(lambda: f"사령 재생 {max_cost} 실패. 조건에 부합하는 추종자가 묘지에 없습니다.")
             return
 
         max_found_cost = max(c.current_cost for c in candidates)
         best_candidates = [c for c in candidates if c.current_cost == max_found_cost]
-        import random
-        selected_card = random.choice(best_candidates)
+        selected_card = self.rng.choice(best_candidates)
 
-        player.graveyard._cards.remove(selected_card)
+        player.graveyard.remove_card(selected_card.card_id)
         game_state_manager.add_card(selected_card, Zone.FIELD, player.player_id)
-        print(f"[LOG] 사령 재생 {max_cost} 발동, 소환된 추종자 {selected_card.get_display_name()}.")
+        _log.info(lambda: f"사령 재생 {max_cost} 발동, 소환된 추종자 {selected_card.get_display_name()}.")
 
     def _process_gain_earth_sigil(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 비술 마법진 획득"""
@@ -1454,7 +1461,7 @@ class EffectProcessor:
         card = game_state_manager.create_card_instance(sigil_data, player.player_id)
         if len(game_state_manager.get_cards_in_zone(player.player_id, Zone.FIELD)) < 5:
             game_state_manager.add_card(card, Zone.FIELD, player.player_id)
-            print(f"[LOG] 비술 마법진 획득 발동, 필드에 Earth Sigil 소환.")
+            _log.info("비술 마법진 획득 발동, 필드에 Earth Sigil 소환.")
 
     def _process_transform(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 변신"""
@@ -1477,19 +1484,19 @@ class EffectProcessor:
                 opponent_id = "player2" if owner_id == "player1" else "player1"
                 opponent_deck = game_state_manager.get_cards_in_zone(opponent_id, Zone.DECK)
                 if opponent_deck:
-                    chosen_card = random.choice(opponent_deck)
+                    chosen_card = self.rng.choice(opponent_deck)
                     new_card_data = chosen_card.card_data
                 else:
-                    print("[WARNING] Opponent deck is empty. Cannot transform.")
+                    _log.warning("Opponent deck is empty. Cannot transform.")
                     return
             elif new_card_data == TargetType.OWN_DECK_RANDOM_FOLLOWER:
                 own_deck = game_state_manager.get_cards_in_zone(owner_id, Zone.DECK)
                 followers = [c for c in own_deck if c.get_type() == CardType.FOLLOWER]
                 if followers:
-                    chosen_card = random.choice(followers)
+                    chosen_card = self.rng.choice(followers)
                     new_card_data = chosen_card.card_data
                 else:
-                    print("[WARNING] Own deck has no followers. Cannot transform.")
+                    _log.warning("Own deck has no followers. Cannot transform.")
                     return
 
         new_card = game_state_manager.create_card_instance(new_card_data, owner_id)
@@ -1497,15 +1504,10 @@ class EffectProcessor:
 
         game_state_manager.game._unregister_card_listeners(target)
 
-        field_cards = player.field._cards
-        if target in field_cards:
-            idx = field_cards.index(target)
-            field_cards[idx] = new_card
-        else:
-            field_cards.append(new_card)
+        player.field.replace_card(target, new_card)
 
         game_state_manager.game._register_card_listeners(new_card)
-        print(f"[LOG] 변신 완료, {target.get_display_name()}이(가) {new_card.get_display_name()}으로 변신하였습니다.")
+        _log.info(lambda: f"변신 완료, {target.get_display_name()}이(가) {new_card.get_display_name()}으로 변신하였습니다.")
 
     def _process_conditional_effect(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """처리 - 조건부 효과"""
@@ -1518,9 +1520,9 @@ class EffectProcessor:
         try:
             condition_met = condition_fn(game_state_manager)
         except Exception as e:
-            print(f"[ERROR] 조건부 효과 조건식 검사 중 오류 발생 {str(e)}.")
+            _log.error(lambda e=e: f"조건부 효과 조건식 검사 중 오류 발생 {str(e)}.")
 
-        caster_id = getattr(effect_data, "caster_id", None)
+        caster_id = self._get_caster_id(effect_data)
 
         if condition_met:
             if_true_effect = val.get("if_true")
@@ -1536,7 +1538,7 @@ class EffectProcessor:
         """처리 - 손패 주문 증폭"""
         player = self._get_player_entity(target, game_state_manager)
 
-        caster_id = getattr(effect_data, "caster_id", None)
+        caster_id = self._get_caster_id(effect_data)
         times = 1
         if caster_id and game_state_manager.get_card_name(caster_id) == "William, Mysterian Student":
             times = 2
@@ -1548,7 +1550,7 @@ class EffectProcessor:
             cards_with_sb = [c for c in hand_cards if c.has_keyword(EffectType.SPELLBOOST)]
             for card in cards_with_sb:
                 card.spellboost_stacks += 1
-                print(f"[LOG] 패의 {card.get_display_name()} 주문 증폭 스택 증가. 현재 스택 {card.spellboost_stacks}.")
+                _log.info(lambda: f"패의 {card.get_display_name()} 주문 증폭 스택 증가. 현재 스택 {card.spellboost_stacks}.")
                 for effect in card.effects:
                     if effect.type == EffectType.SPELLBOOST:
                         self.resolve_effect(effect, card.card_id, game_state_manager, None)
@@ -1564,8 +1566,9 @@ class EffectProcessor:
             for effect in card.effects:
                 if effect.type in [EffectType.SKYBOUND_ART, EffectType.SUPER_SKYBOUND_ART]:
                     if hasattr(effect, "skybound_art_evo_charge"):
+                        game_state_manager.journal.note_attr(effect, 'skybound_art_evo_charge')
                         effect.skybound_art_evo_charge += amount
-                        print(f"[LOG] {card.get_display_name()} 의 오의 진화 충전량 {amount} 증가 현재 충전량 {effect.skybound_art_evo_charge}")
+                        _log.info(lambda: f"{card.get_display_name()} 의 오의 진화 충전량 {amount} 증가 현재 충전량 {effect.skybound_art_evo_charge}")
 
     def _get_target_all_leaders_max_defense(self, caster_card: Card, game_state_manager: 'GameStateManager') -> List[Any]:
         """체력이 가장 높은 리더들을 반환합니다."""
@@ -1590,7 +1593,7 @@ class EffectProcessor:
         candidates = [c for c in ally_cards if c.get_type() == CardType.FOLLOWER and c.card_id != caster_card.card_id and not c.is_evolved]
         if not candidates:
             return []
-        return [random.choice(candidates)]
+        return [self.rng.choice(candidates)]
 
     def _get_target_ally_follower_random_super_evolved(self, caster_card: Card, game_state_manager: 'GameStateManager') -> List[Any]:
         """아군 초진화 추종자 중 임의의 대상을 반환합니다."""
@@ -1599,7 +1602,7 @@ class EffectProcessor:
         candidates = [c for c in ally_cards if c.get_type() == CardType.FOLLOWER and c.is_super_evolved]
         if not candidates:
             return []
-        return [random.choice(candidates)]
+        return [self.rng.choice(candidates)]
 
     def _get_target_summoned_followers(self, caster_card: Card, game_state_manager: 'GameStateManager') -> List[Any]:
         """방금 소환된 아군 추종자들을 반환합니다."""
@@ -1613,7 +1616,7 @@ class EffectProcessor:
         val = self._safe_int(effect_data.value, 1)
 
         player.max_pp = min(player.max_pp + val, player.MAX_PP)
-        print(f"[LOG] 처리 내용 최대 PP 증가, 타겟 {player.player_id}, 증가량 {val}.")
+        _log.info(lambda: f"처리 내용 최대 PP 증가, 타겟 {player.player_id}, 증가량 {val}.")
 
     def _process_advance_countdown(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """마법진의 카운트다운을 진행시키는 처리를 담당합니다."""
@@ -1623,7 +1626,7 @@ class EffectProcessor:
         val = self._safe_int(effect_data.value, 1)
 
         target.countdown_value = max(0, target.countdown_value - val)
-        print(f"[LOG] 처리 내용 카운트다운 진행, 타겟 {target.get_display_name()}, 진행 값 {val}, 남은 카운트다운 {target.countdown_value}.")
+        _log.info(lambda: f"처리 내용 카운트다운 진행, 타겟 {target.get_display_name()}, 진행 값 {val}, 남은 카운트다운 {target.countdown_value}.")
 
         if target.countdown_value == 0:
             game_state_manager.move_card(target.card_id, Zone.FIELD, Zone.GRAVEYARD)
@@ -1636,7 +1639,7 @@ class EffectProcessor:
         val = self._safe_int(effect_data.value, 1)
 
         player.combo_count += val
-        print(f"[LOG] 처리 내용 콤보 카운트 증가, 타겟 {player.player_id}, 증가량 {val}, 현재 콤보 {player.combo_count}.")
+        _log.info(lambda: f"처리 내용 콤보 카운트 증가, 타겟 {player.player_id}, 증가량 {val}, 현재 콤보 {player.combo_count}.")
 
     def _process_multi_attack(self, effect_data: Effect, target: Any, game_state_manager: 'GameStateManager'):
         """추종자에게 다중 공격 가능 횟수를 설정하는 처리를 담당합니다."""
@@ -1646,4 +1649,4 @@ class EffectProcessor:
         val = self._safe_int(effect_data.value, 2)
 
         target.max_attack_count = val
-        print(f"[LOG] 처리 내용 다중 공격 부여, 타겟 {target.get_display_name()}, 최대 공격 횟수 {val}.")
\ No newline at end of file
+        _log.info(lambda: f"처리 내용 다중 공격 부여, 타겟 {target.get_display_name()}, 최대 공격 횟수 {val}.")
\ No newline at end of file
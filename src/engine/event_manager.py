@@ -1,44 +1,122 @@
 # 역할 정의. 이벤트 디스패치 및 구독을 관리하는 클래스입니다.
 
-from typing import Dict, List
-from collections import defaultdict
+import heapq
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Tuple
 from src.common.enums import EventType
 from src.common.event import Event
 from src.common.listener import Listener
+from src.common.journal import Journal, DETACHED_JOURNAL
+from src.common.logger import get_logger
+
+_log = get_logger("engine.event")
 
 
 class EventManager:
-    """이벤트 디스패치 및 구독을 관리합니다."""
-    def __init__(self):
-        self.listeners: Dict[EventType, List[Listener]] = defaultdict(list)
-        self.event_queue: List[Event] = []
+    """이벤트 디스패치 및 구독을 관리합니다.
+    리스너는 이벤트 타입별로 리스너 ID를 키로 하는 삽입 순서 딕셔너리에 보관하여 상수 시간에 제거합니다.
+    카드 전용 리스너는 card_id 보조 인덱스로 따로 보관하여 해당 카드의 이벤트에서만 바로 찾습니다.
+    저널을 주면 구독, 구독 해제, 이벤트 큐 변경을 역연산으로 기록합니다."""
+    def __init__(self, journal: Journal = None):
+        self.journal = journal if journal is not None else DETACHED_JOURNAL
+        self.listeners: Dict[EventType, Dict[str, Listener]] = defaultdict(dict)
+        self.event_queue: Deque[Event] = deque()
+        # 디스패치 순서를 등록 순서와 같게 유지하기 위해 각 리스너에 등록 순번을 함께 저장합니다.
+        self._unscoped_listeners: Dict[EventType, Dict[str, Tuple[int, Listener]]] = defaultdict(dict)
+        self._card_listeners: Dict[EventType, Dict[str, Dict[str, Tuple[int, Listener]]]] = defaultdict(dict)
+        self._next_sequence = 0
+
+    def clear(self):
+        """등록된 모든 리스너와 대기 중인 이벤트를 제거합니다. 상태 복원 후 리스너를 다시 구성할 때 사용합니다."""
+        self.listeners.clear()
+        self.event_queue.clear()
+        self._unscoped_listeners.clear()
+        self._card_listeners.clear()
+        self._next_sequence = 0
 
     def subscribe(self, listener: Listener):
-        """이벤트 리스너를 등록합니다."""
-        self.listeners[listener.event_type].append(listener)
-        print(f"[LOG] 리스너 ID '{listener.id}'가 {listener.event_type.value} 이벤트에 등록됨.")
+        """이벤트 리스너를 등록합니다. 같은 이벤트에 같은 ID로 다시 등록하면 기존 리스너를 대체하여 가장 뒤로 보냅니다."""
+        if listener.id in self.listeners[listener.event_type]:
+            self._remove_listener(listener.event_type, listener.id)
+        entry = (self._next_sequence, listener)
+        if self.journal.active:
+            self.journal.record_attr(self, '_next_sequence')
+            self.journal.record(self._remove_listener, listener.event_type, listener.id)
+        self._next_sequence += 1
+        self._insert_entry(entry)
+        _log.info(lambda: f"리스너 ID '{listener.id}'가 {listener.event_type.value} 이벤트에 등록됨.")
+
+    def _remove_listener(self, event_type: EventType, listener_id: str) -> bool:
+        """리스너를 기본 저장소와 보조 인덱스에서 모두 제거합니다. 제거했으면 True를 반환합니다."""
+        listener = self.listeners[event_type].pop(listener_id, None)
+        if listener is None:
+            return False
+        if self.journal.active:
+            self.journal.record(self._insert_entry, self._find_entry(listener))
+        if listener.card_id:
+            card_bucket = self._card_listeners[event_type].get(listener.card_id)
+            if card_bucket is not None:
+                card_bucket.pop(listener_id, None)
+                if not card_bucket:
+                    del self._card_listeners[event_type][listener.card_id]
+        else:
+            self._unscoped_listeners[event_type].pop(listener_id, None)
+        return True
+
+    def _find_entry(self, listener: Listener) -> Tuple[int, Listener]:
+        """보조 인덱스에서 리스너의 (등록 순번, 리스너) 항목을 찾습니다."""
+        if listener.card_id:
+            return self._card_listeners[listener.event_type][listener.card_id][listener.id]
+        return self._unscoped_listeners[listener.event_type][listener.id]
+
+    def _insert_entry(self, entry: Tuple[int, Listener]):
+        """(등록 순번, 리스너) 항목을 기본 저장소와 보조 인덱스에 넣습니다.
+        되돌리기로 예전 순번의 항목이 다시 들어오면 보조 인덱스를 순번 순서로 다시 정렬합니다."""
+        sequence, listener = entry
+        self.listeners[listener.event_type][listener.id] = listener
+        if listener.card_id:
+            bucket = self._card_listeners[listener.event_type].setdefault(listener.card_id, {})
+        else:
+            bucket = self._unscoped_listeners[listener.event_type]
+        last = next(reversed(bucket.values()), None)
+        bucket[listener.id] = entry
+        if last is not None and last[0] > sequence:
+            ordered = sorted(bucket.items(), key=lambda item: item[1][0])
+            bucket.clear()
+            bucket.update(ordered)
 
     def unsubscribe(self, event_type: EventType, listener_id: str):
         """특정 ID를 가진 이벤트 리스너를 제거합니다."""
-        initial_len = len(self.listeners[event_type])
-        self.listeners[event_type] = [l for l in self.listeners[event_type] if l.id != listener_id]
-        if len(self.listeners[event_type]) < initial_len:
-            print(f"[LOG] 리스너 ID '{listener_id}'가 {event_type.value} 이벤트에서 제거됨.")
+        if self._remove_listener(event_type, listener_id):
+            _log.info(lambda: f"리스너 ID '{listener_id}'가 {event_type.value} 이벤트에서 제거됨.")
 
     def publish(self, event: Event):
         """이벤트를 게시(큐에 추가)합니다."""
-        self.event_queue.append(event)
-        print(f"[LOG] 이벤트 {event.event_type.value}가 큐에 추가됨. 데이터: {event}")
+        self.journal.append(self.event_queue, event)
+        _log.info(lambda: f"이벤트 {event.event_type.value}가 큐에 추가됨. 데이터: {event}")
+
+    def _collect_listeners(self, event: Event) -> List[Listener]:
+        """이벤트를 받을 후보 리스너 목록을 등록 순서대로 반환합니다.
+        카드 전용 리스너는 이벤트의 card_id와 일치하는 것만 보조 인덱스에서 가져옵니다."""
+        unscoped = list(self._unscoped_listeners[event.event_type].values())
+        card_id = getattr(event, 'card_id', None)
+        card_bucket = self._card_listeners[event.event_type].get(card_id) if card_id else None
+        if not card_bucket:
+            return [listener for _, listener in unscoped]
+        scoped = list(card_bucket.values())
+        if not unscoped:
+            return [listener for _, listener in scoped]
+        return [listener for _, listener in heapq.merge(unscoped, scoped, key=lambda entry: entry[0])]
 
     def process_events(self):
         """큐에 있는 모든 이벤트를 처리합니다."""
         while self.event_queue:
-            event = self.event_queue.pop(0)
-            print(f"[LOG] {event.event_type.value} 이벤트 처리 시작. 데이터: {event}")
-            # 리스너 목록을 복사하여 순회 중에 리스너가 변경되어도 안전하도록 합니다.
-            for listener in list(self.listeners[event.event_type]):
-                if listener.card_id and event.card_id != listener.card_id:
-                    continue
+            event = self.event_queue.popleft()
+            if self.journal.active:
+                self.journal.record(self.event_queue.appendleft, event)
+            _log.info(lambda: f"{event.event_type.value} 이벤트 처리 시작. 데이터: {event}")
+            # 후보 목록을 미리 만들어 순회 중에 리스너가 변경되어도 안전하도록 합니다.
+            for listener in self._collect_listeners(event):
                 if listener.player_id and event.player_id != listener.player_id:
                     continue
                 if listener.condition(event):
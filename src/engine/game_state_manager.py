@@ -1,19 +1,91 @@
 # 역할 정의. 게임의 전반적인 상태를 추적하고 조작하는 클래스입니다.
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from src.common.enums import GamePhase, CardType, Zone, EffectType, TargetType
-from src.models.card import Card
-from src.models.player import Player
+from src.models.card import Card, HASHED_ATTRS as CARD_HASHED_ATTRS
+from src.models.player import Player, HASHED_ATTRS as PLAYER_HASHED_ATTRS
 from src.common.effect import Effect
+from src.common.journal import Journal, DETACHED_JOURNAL
+from src.common.zobrist import ZobristHash, zobrist_key
+from src.common.action_cache import ActionCache
 from src.common.event import FollowerEnterFieldEvent, LeaveFieldEvent
+from src.common.logger import get_logger
+
+_log = get_logger("engine.state")
+
+HASHED_ATTRS = frozenset(('turn_number', 'current_turn_player_id', 'game_phase'))  # 국면 해시에 값을 반영하는 턴 진행 속성입니다.
+
+
+class EntityIndex(dict):
+    """카드 ID를 (카드, 소유자 ID, 영역)으로 매핑하는 엔티티 색인입니다.
+    항목이 바뀔 때마다 카드 위치를 국면 해시에 반영하고 행동 캐시에 영역 변경을 알리며
+    저널의 역연산도 같은 메서드를 거치므로 되돌린 뒤에도 해시가 색인과 일치합니다.
+    영역 안의 카드 순서는 해시에 넣지 않습니다."""
+
+    def __init__(self, zobrist: ZobristHash, action_cache: ActionCache):
+        """EntityIndex 클래스의 생성자입니다."""
+        super().__init__()
+        self._zobrist = zobrist
+        self._action_cache = action_cache
+
+    def __setitem__(self, card_id: str, entry: Tuple[Card, str, Zone]):
+        """항목을 설정하고 이전 위치와 새 위치를 해시와 행동 캐시에 반영합니다."""
+        old_entry = self.get(card_id)
+        if old_entry is not None:
+            self._zobrist.flip(card_id, ('zone', old_entry[1]), old_entry[2])
+            self._action_cache.on_zone_changed(old_entry[1], old_entry[2])
+        super().__setitem__(card_id, entry)
+        self._zobrist.flip(card_id, ('zone', entry[1]), entry[2])
+        self._action_cache.on_zone_changed(entry[1], entry[2])
+
+    def pop(self, card_id: str, *default: Any) -> Any:
+        """항목을 제거하고 위치를 해시에서 빼며 행동 캐시에 알립니다."""
+        entry = self.get(card_id)
+        if entry is not None:
+            self._zobrist.flip(card_id, ('zone', entry[1]), entry[2])
+            self._action_cache.on_zone_changed(entry[1], entry[2])
+        return super().pop(card_id, *default)
+
+    def clear(self):
+        """모든 항목을 제거하고 위치를 해시에서 빼며 행동 캐시를 비웁니다."""
+        for card_id, entry in self.items():
+            self._zobrist.flip(card_id, ('zone', entry[1]), entry[2])
+        self._action_cache.clear()
+        super().clear()
+
+    def update(self, entries: Dict[str, Tuple[Card, str, Zone]]):
+        """항목들을 설정하고 위치를 해시에 반영합니다."""
+        for card_id, entry in entries.items():
+            self[card_id] = entry
+
+    def restore(self, entries: Dict[str, Tuple[Card, str, Zone]]):
+        """스냅샷의 항목들로 내용을 통째로 바꿉니다. 해시와 행동 캐시는 갱신하지 않으므로 호출한 쪽이 맞춥니다."""
+        dict.clear(self)
+        dict.update(self, entries)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """직렬화한 색인을 되살릴 때 항목 설정이 해시를 다시 뒤집지 않도록 restore로 내용을 채웁니다."""
+        return _rebuild_entity_index, (self._zobrist, self._action_cache, dict(self))
+
+
+def _rebuild_entity_index(zobrist: ZobristHash, action_cache: ActionCache, entries: Dict[str, Tuple[Card, str, Zone]]) -> EntityIndex:
+    """직렬화한 엔티티 색인을 해시 갱신 없이 되살립니다."""
+    index = EntityIndex(zobrist, action_cache)
+    index.restore(entries)
+    return index
 
 
 class GameStateManager:
     """게임 보드 상태를 관리하는 객체입니다."""
+    journal: Journal = DETACHED_JOURNAL
+    zobrist: ZobristHash = None
+    action_cache: ActionCache = None
 
     def __init__(self):
         """GameStateManager 클래스의 생성자입니다."""
+        self.journal = Journal()  # 되돌리기를 위한 게임 상태 변경 저널입니다. 이 관리자가 만든 카드와 등록된 플레이어가 공유합니다.
+        self.zobrist = ZobristHash(self.journal)  # 국면 해시 누적기입니다. 이 관리자가 만든 카드, 등록된 플레이어, 엔티티 색인이 공유합니다.
         self.players: Dict[str, Player] = {}
         self.opponent_id: Dict[str, str] = {}
         self.current_turn_player_id: Optional[str] = None
@@ -26,6 +98,87 @@ class GameStateManager:
         self.is_awaiting_choice: bool = False
         self.pending_choice: Optional[Effect] = None
         self.player_awaiting_choice: Optional[str] = None
+        self.action_cache = ActionCache(self.journal)  # 합법 행동 구간 캐시입니다. 이 관리자가 만든 카드, 등록된 플레이어, 엔티티 색인이 변경을 알립니다.
+        self._entity_index: Dict[str, Tuple[Card, str, Zone]] = EntityIndex(self.zobrist, self.action_cache)  # 카드 ID를 (카드, 소유자 ID, 영역)으로 매핑하는 색인입니다.
+        self.action_cache.bind_entity_index(self._entity_index)
+
+    @property
+    def state_hash(self) -> int:
+        """현재 국면의 64비트 조브리스트 해시를 반환합니다.
+        카드 위치, 카드와 플레이어의 스탯과 자원, 카드 키워드, 턴 진행 정보가 바뀔 때마다 증분 갱신되므로 조회는 상수 시간입니다.
+        영역 안의 카드 순서, 문장, 대기 중인 선택, 난수 상태는 해시에 넣지 않습니다."""
+        return self.zobrist.value
+
+    def recompute_state_hash(self) -> int:
+        """현재 국면의 조브리스트 해시를 처음부터 다시 계산하여 반환합니다.
+        증분 갱신한 state_hash와 비교하여 해시 갱신 누락을 찾는 디버그용이며 국면 크기에 비례하는 시간이 걸립니다."""
+        value = 0
+        for name in HASHED_ATTRS:
+            value ^= zobrist_key('game', name, self.__dict__.get(name))
+        for player_id, player in self.players.items():
+            for name in PLAYER_HASHED_ATTRS:
+                value ^= zobrist_key(player_id, name, player.__dict__.get(name))
+        for card in self.cards:
+            for name in CARD_HASHED_ATTRS:
+                value ^= zobrist_key(card.card_id, name, card.__dict__.get(name))
+            for keyword in card._keyword_counts:
+                value ^= zobrist_key(card.card_id, 'keyword', keyword)
+        for card_id, (_, owner_id, zone) in self._entity_index.items():
+            value ^= zobrist_key(card_id, ('zone', owner_id), zone)
+        return value
+
+    def add_player(self, player: Player):
+        """플레이어를 등록하고 플레이어의 모든 영역을 엔티티 색인에 연결합니다."""
+        self.players[player.player_id] = player
+        player.bind_journal(self.journal)
+        player.bind_state_hash(self.zobrist)
+        player.bind_action_cache(self.action_cache)
+        player.bind_entity_index(self._entity_index)
+
+    def __setattr__(self, name: str, value: Any):
+        """속성을 바꿉니다. 게임 저널이 기록 중이면 이전 값을 먼저 기록합니다."""
+        journal = self.journal
+        if journal.active:
+            journal.record_attr(self, name)
+        if name in HASHED_ATTRS and self.zobrist is not None:
+            self.zobrist.replace('game', name, self.__dict__.get(name), value)
+        object.__setattr__(self, name, value)
+
+    def snapshot_state(self) -> Dict[str, Any]:
+        """보드 상태 전체를 복원 가능한 형태로 반환합니다.
+        생성된 모든 카드 인스턴스의 가변 상태와 플레이어별 영역, 턴 진행 정보, 대기 중인 선택을 기록합니다."""
+        return {
+            'turn_number': self.turn_number,
+            'current_turn_player_id': self.current_turn_player_id,
+            'game_phase': self.game_phase,
+            'next_card_instance_id': self._next_card_instance_id,
+            'cards': tuple((card, card.snapshot_state()) for card in self.cards),
+            'players': tuple((player, player.snapshot_state()) for player in self.players.values()),
+            'entity_index': self._entity_index.copy(),
+            'recently_summoned_cards': tuple(self.recently_summoned_cards),
+            'pending_choice': (self.is_awaiting_choice, self.pending_choice, self.player_awaiting_choice),
+            'state_hash': self.zobrist.value,
+        }
+
+    def restore_state(self, state: Dict[str, Any]):
+        """snapshot_state로 기록한 보드 상태로 되돌립니다. 스냅샷 이후에 생성된 카드 인스턴스는 버립니다."""
+        self.turn_number = state['turn_number']
+        self.current_turn_player_id = state['current_turn_player_id']
+        self.game_phase = state['game_phase']
+        self._next_card_instance_id = state['next_card_instance_id']
+        self.cards = []
+        for card, card_state in state['cards']:
+            card.restore_state(card_state)
+            self.cards.append(card)
+        for player, player_state in state['players']:
+            player.restore_state(player_state)
+        # 영역들이 같은 딕셔너리를 참조하므로 객체를 바꾸지 않고 비운 뒤 다시 채웁니다.
+        self._entity_index.restore(state['entity_index'])
+        self.recently_summoned_cards = list(state['recently_summoned_cards'])
+        self.is_awaiting_choice, self.pending_choice, self.player_awaiting_choice = state['pending_choice']
+        # 카드와 플레이어 속성은 해시와 행동 캐시 알림을 거치지 않고 복원되므로 기록해 둔 해시 값으로 맞추고 행동 캐시는 비웁니다.
+        self.zobrist.value = state['state_hash']
+        self.action_cache.clear()
 
     def create_card_instance(self, card_data_obj, owner_id):
         """새로운 카드 인스턴스를 생성하고 게임에 추가합니다."""
@@ -35,39 +188,19 @@ class GameStateManager:
             # 1. card_id 로 먼저 조회해 봅니다.
             resolved = cd.get_card_data_by_id(card_data_obj)
             if not resolved:
-                # 2. card_id 가 아니면 카드 영문명 또는 한글명으로 조회해 봅니다.
-                # 오염된 접두사나 영어 관사 및 수량사를 반복적으로 제거하여 순수 카드명을 추출합니다.
-                clean_name = card_data_obj.strip()
-                prefixes = [
-                    "exact copies of ", "an exact copy of ", "copies of ",
-                    "copy of ", "and give them ", "and give it ",
-                    "a ", "an ", "the ", "d ", "and "
-                ]
-                changed = True
-                while changed:
-                    changed = False
-                    clean_name_lower = clean_name.lower()
-                    for prefix in prefixes:
-                        if clean_name_lower.startswith(prefix):
-                            clean_name = clean_name[len(prefix):].strip()
-                            changed = True
-                            break
-
-                for db in [cd.BASIC_CARD_DATABASE, cd.LEGENDS_RISE_CARD_DATABASE, cd.TOKEN_CARD_DATABASE]:
-                    for c_data in db.values():
-                        if c_data.name == clean_name or c_data.name_ko == clean_name:
-                            resolved = c_data
-                            break
-                    if resolved:
-                        break
+                # 2. card_id 가 아니면 오염된 접두사를 제거한 뒤 카드명 보조 인덱스로 조회해 봅니다.
+                resolved = cd.find_card_data_by_name(cd.strip_card_name_prefixes(card_data_obj))
             if resolved:
                 card_data_obj = resolved
             else:
-                print(f"[ERROR] create_card_instance - '{card_data_obj}'에 해당하는 카드 데이터를 찾을 수 없습니다.")
+                _log.error(lambda: f"create_card_instance - '{card_data_obj}'에 해당하는 카드 데이터를 찾을 수 없습니다.")
 
         new_card_id = str(self._next_card_instance_id)
         card = Card(card_data_obj, owner_id, new_card_id)
-        self.cards.append(card)
+        card._journal = self.journal
+        card._action_cache = self.action_cache
+        card.bind_state_hash(self.zobrist)
+        self.journal.append(self.cards, card)
         self._next_card_instance_id += 1
         return card
 
@@ -87,7 +220,7 @@ class GameStateManager:
             return
         card = self.get_entity_by_id(card_id, from_zone)
         if not card:
-            print(f"[ERROR] move_card - card with id {card_id} from zone {from_zone} not found.")
+            _log.error(lambda: f"move_card - card with id {card_id} from zone {from_zone} not found.")
             return
 
         player = self.players[card.owner_id]
@@ -104,9 +237,9 @@ class GameStateManager:
         if not player.zone_dict[to_zone].add_card(card):
             if to_zone == Zone.HAND:
                 player.graveyard.add_card(card)
-                print(f"[LOG] {card.get_display_name()} (ID: {card_id}) 손패 소지 제한 매수 초과로 묘지로 이동.")
+                _log.info(lambda: f"{card.get_display_name()} (ID: {card_id}) 손패 소지 제한 매수 초과로 묘지로 이동.")
             elif to_zone == Zone.FIELD:
-                print(f"[LOG] {card.get_display_name()} (ID: {card_id}) 필드 소환 제한 매수 초과로 소멸.")
+                _log.info(lambda: f"{card.get_display_name()} (ID: {card_id}) 필드 소환 제한 매수 초과로 소멸.")
         else:
             card.current_zone = to_zone
             # 필드에 들어올 때 리스너를 등록합니다.
@@ -115,9 +248,9 @@ class GameStateManager:
                 if card.get_type() == CardType.FOLLOWER:
                     self.game.event_manager.publish(FollowerEnterFieldEvent(card_id=card.card_id, player_id=card.owner_id))
                     player.rally_count += 1
-                    self.recently_summoned_cards.append(card)
+                    self.journal.append(self.recently_summoned_cards, card)
             
-            print(f"[LOG] 카드 {card.get_display_name()} (ID: {card_id})이(가) {from_zone.value}에서 {to_zone.value}로 이동됨.")
+            _log.info(lambda: f"카드 {card.get_display_name()} (ID: {card_id})이(가) {from_zone.value}에서 {to_zone.value}로 이동됨.")
 
     def add_card(self, card: Card, to_zone: Zone, player_id: str):
         """카드를 지정 영역에 추가합니다."""
@@ -125,9 +258,9 @@ class GameStateManager:
         if not player.zone_dict[to_zone].add_card(card):
             if to_zone == Zone.HAND:
                 player.graveyard.add_card(card)
-                print(f"[LOG] {card.get_display_name()} (ID: {card.card_id}) 손패 소지 제한 매수 초과로 묘지로 보내짐.")
+                _log.info(lambda: f"{card.get_display_name()} (ID: {card.card_id}) 손패 소지 제한 매수 초과로 묘지로 보내짐.")
             elif to_zone == Zone.FIELD:
-                print(f"[LOG] {card.get_display_name()} (ID: {card.card_id}) 필드 소환 제한 매수 초과로 소멸.")
+                _log.info(lambda: f"{card.get_display_name()} (ID: {card.card_id}) 필드 소환 제한 매수 초과로 소멸.")
         else:
             card.current_zone = to_zone
             # 필드에 들어올 때 리스너를 등록합니다.
@@ -137,9 +270,9 @@ class GameStateManager:
                 if card.get_type() == CardType.FOLLOWER:
                     self.game.event_manager.publish(FollowerEnterFieldEvent(card_id=card.card_id, player_id=card.owner_id))
                     player.rally_count += 1
-                    self.recently_summoned_cards.append(card)
+                    self.journal.append(self.recently_summoned_cards, card)
 
-            print(f"[LOG] 카드 {card.get_display_name()} (ID: {card.card_id})이(가) {to_zone.value}로 추가됨.")
+            _log.info(lambda: f"카드 {card.get_display_name()} (ID: {card.card_id})이(가) {to_zone.value}로 추가됨.")
 
     def shuffle_deck(self, player_id: str):
         """지정 플레이어의 덱을 셔플합니다."""
@@ -152,7 +285,7 @@ class GameStateManager:
         self.turn_number += 1
         self.current_turn_player_id = player_id
         player = self.players[player_id]
-        print(f"[LOG] {player_id}의 {self.turn_number}턴 시작 (시작 단계)")
+        _log.info(lambda: f"{player_id}의 {self.turn_number}턴 시작 (시작 단계)")
 
         # 최대 PP를 증가시키고 회복시킵니다.
         if player.max_pp < player.MAX_PP:
@@ -186,15 +319,15 @@ class GameStateManager:
         player.combo_count += 1
         card = self.get_entity_by_id(card_id, Zone.HAND)
         if not card:
-            print(f"[ERROR] play_card - card with id {card_id} not found.")
+            _log.error(lambda: f"play_card - card with id {card_id} not found.")
             return
 
         if enhanced_cost:
             player.spend_pp(enhanced_cost)
-            print(f"[LOG] {player_id}가 {card.get_display_name()} (ID: {card_id})을(를) PP {enhanced_cost} 소모하여 플레이함. 남은 PP: {player.current_pp}")
+            _log.info(lambda: f"{player_id}가 {card.get_display_name()} (ID: {card_id})을(를) PP {enhanced_cost} 소모하여 플레이함. 남은 PP: {player.current_pp}")
         else:
             player.spend_pp(card.current_cost)
-            print(f"[LOG] {player_id}가 {card.get_display_name()} (ID: {card_id})을(를) PP {card.current_cost} 소모하여 플레이함. 남은 PP: {player.current_pp}")
+            _log.info(lambda: f"{player_id}가 {card.get_display_name()} (ID: {card_id})을(를) PP {card.current_cost} 소모하여 플레이함. 남은 PP: {player.current_pp}")
 
         # 카드 타입에 따른 처리를 수행합니다.
         if card.get_type() in [CardType.FOLLOWER, CardType.AMULET]:
@@ -213,38 +346,49 @@ class GameStateManager:
         if entity_id in self.players:
             return self.players[entity_id]
 
-        for player in self.players.values():
-            if zone:
-                for card in player.zone_dict[zone].get_cards():
-                    if card.card_id == entity_id:
-                        return card
+        entry = self._entity_index.get(entity_id)
+        if entry is not None:
+            return entry[0]
 
-            for zone_obj in player.zone_dict.values():
+        # 색인에 없는 ID는 영역을 직접 탐색하고 발견되면 색인을 복구합니다.
+        for player in self.players.values():
+            for zone_key, zone_obj in player.zone_dict.items():
                 for card in zone_obj.get_cards():
                     if card.card_id == entity_id:
+                        self._entity_index[entity_id] = (card, player.player_id, zone_key)
                         return card
-        print(f"[ERROR] get_entity_by_id - ID {entity_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"get_entity_by_id - ID {entity_id}를 찾을 수 없습니다.")
+
+    def get_entity_location(self, card_id: str) -> Optional[Tuple[str, Zone]]:
+        """카드 ID로 소유자 ID와 현재 영역을 조회합니다. 게임에 없는 카드이면 None을 반환합니다."""
+        entry = self._entity_index.get(card_id)
+        if entry is None:
+            return None
+        return entry[1], entry[2]
 
     def get_card_name(self, entity_id: str) -> str:
         """Player나 Card의 ID로 이름을 조회합니다."""
         entity = self.get_entity_by_id(entity_id)
         if entity:
             return entity.get_display_name()
-        print(f"[ERROR] get_card_name - ID {entity_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"get_card_name - ID {entity_id}를 찾을 수 없습니다.")
 
     def get_type(self, entity_id: str) -> str:
         """Player나 Card의 ID로 타입을 조회합니다."""
         entity = self.get_entity_by_id(entity_id)
         if entity:
             return entity.get_type()
-        print(f"[ERROR] get_type - ID {entity_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"get_type - ID {entity_id}를 찾을 수 없습니다.")
 
     def get_card_effects(self, entity_id: str, effect_type: EffectType) -> List[Effect]:
         """Player나 Card의 ID로 키워드 효과들을 조회합니다."""
         entity = self.get_entity_by_id(entity_id)
         if entity:
+            # 키워드 개수로 보유 여부를 먼저 확인하여 대부분의 경우 효과 목록 순회를 생략합니다.
+            if not entity.has_keyword(effect_type):
+                return []
             return [effect for effect in entity.effects if effect.type == effect_type]
-        print(f"[ERROR] get_card_effects - ID {entity_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"get_card_effects - ID {entity_id}를 찾을 수 없습니다.")
         return []
 
     def get_owner(self, card_id: str):
@@ -252,7 +396,7 @@ class GameStateManager:
         entity = self.get_entity_by_id(card_id)
         if entity:
             return entity.owner_id
-        print(f"[ERROR] get_owner - ID {card_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"get_owner - ID {card_id}를 찾을 수 없습니다.")
 
 
     def evolve_card(self, card_id: str):
@@ -277,8 +421,12 @@ class GameStateManager:
             card.max_defense += 3
 
     def get_cards_with_keyword(self, player_id: str, zone: Zone, keyword: EffectType):
-        """지정 플레이어의 특정 필드에서 해당 키워드를 가진 카드 리스트를 반환합니다."""
-        return [card.card_id for card in self.players[player_id].zone_dict[zone].get_cards() if card.has_keyword(keyword)]
+        """지정 플레이어의 특정 영역에서 해당 키워드를 가진 카드 ID 리스트를 영역 내 순서대로 반환합니다."""
+        return self.players[player_id].zone_dict[zone].get_card_ids_with_keyword(keyword)
+
+    def zone_has_keyword(self, player_id: str, zone: Zone, keyword: EffectType) -> bool:
+        """지정 플레이어의 특정 영역에 해당 키워드를 가진 카드가 있는지 상수 시간에 판단합니다."""
+        return self.players[player_id].zone_dict[zone].has_card_with_keyword(keyword)
 
     def countdown(self, card_id: str):
         """지정 카드의 카운트다운을 처리합니다. 카운트다운 수치가 존재할 때만 처리합니다."""
@@ -289,7 +437,7 @@ class GameStateManager:
                 if entity.countdown_value == 0:
                     return True
             return False
-        print(f"[ERROR] countdown - 카드 ID {card_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"countdown - 카드 ID {card_id}를 찾을 수 없습니다.")
         return False
 
     def get_card_info_hand(self, card_id: str):
@@ -298,7 +446,7 @@ class GameStateManager:
         entity = self.get_entity_by_id(card_id, Zone.HAND)
         if entity:
             return entity.get_display_name(), entity.get_type(), entity.current_cost
-        print(f"[ERROR] get_card_info_hand - 카드 ID {card_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"get_card_info_hand - 카드 ID {card_id}를 찾을 수 없습니다.")
         return None, None, None
 
 
@@ -308,7 +456,7 @@ class GameStateManager:
         entity = self.get_entity_by_id(card_id, Zone.FIELD)
         if entity:
             return entity.get_display_name(), entity.get_type(), entity.current_attack, entity.current_defense, entity.countdown_value, [effect.type for effect in entity.effects]
-        print(f"[ERROR] get_card_info_field - 카드 ID {card_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"get_card_info_field - 카드 ID {card_id}를 찾을 수 없습니다.")
         return None, None, None, None, None, None
 
     def get_pp_info(self, player_id: str):
@@ -316,7 +464,7 @@ class GameStateManager:
         player = self.players[player_id]
         if player:
             return player.current_pp, player.max_pp
-        print(f"[ERROR] get_pp_info - 플레이어 ID {player_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"get_pp_info - 플레이어 ID {player_id}를 찾을 수 없습니다.")
         return None, None
 
     def get_card_attack_info_field(self, card_id: str):
@@ -325,7 +473,7 @@ class GameStateManager:
         card = self.get_entity_by_id(card_id, Zone.FIELD)
         if card:
             return card.get_display_name(), card.get_type(), card.can_attack(TargetType.OPPONENT_LEADER), card.can_attack(TargetType.OPPONENT_FOLLOWER_CHOICE), card.current_attack, card.current_defense, card.is_evolved, card.is_super_evolved
-        print(f"[ERROR] get_card_attack_info_field - 카드 ID {card_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"get_card_attack_info_field - 카드 ID {card_id}를 찾을 수 없습니다.")
         return None, None, None, None, None, None, None, None
 
     def can_evolve(self, player_id: str) -> bool:
@@ -333,7 +481,7 @@ class GameStateManager:
         player = self.players[player_id]
         if player:
             return self.players[player_id].current_ep > 0 and not self.players[player_id].spent_ep_in_turn
-        print(f"[ERROR] can_evolve - 플레이어 ID {player_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"can_evolve - 플레이어 ID {player_id}를 찾을 수 없습니다.")
         return False
 
     def can_super_evolve(self, player_id: str) -> bool:
@@ -341,7 +489,7 @@ class GameStateManager:
         player = self.players[player_id]
         if player:
             return self.players[player_id].current_sep > 0 and not self.players[player_id].spent_ep_in_turn
-        print(f"[ERROR] can_super_evolve - 플레이어 ID {player_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"can_super_evolve - 플레이어 ID {player_id}를 찾을 수 없습니다.")
         return False
 
     def has_keyword(self, card_id: str, effect_type: EffectType):
@@ -350,7 +498,7 @@ class GameStateManager:
         card = self.get_entity_by_id(card_id)
         if card:
             return card.has_keyword(effect_type)
-        print(f"[ERROR] has_keyword - 카드 ID {card_id}를 찾을 수 없습니다.")
+        _log.error(lambda: f"has_keyword - 카드 ID {card_id}를 찾을 수 없습니다.")
         return False
 
     def evolve_card_with_ep(self, card_id: str, player_id:str):
@@ -364,9 +512,9 @@ class GameStateManager:
                 player.spent_ep_in_turn = True
                 self.evolve_card(card_id)
             else:
-                print(f"[LOG] 규칙상 처리 불가능한 진화 요청 (카드 ID: {card_id}, 플레이어 ID: {player_id})")
+                _log.info(lambda: f"규칙상 처리 불가능한 진화 요청 (카드 ID: {card_id}, 플레이어 ID: {player_id})")
         else:
-            print(f"[ERROR] evolve_card_with_ep - 카드 ID {card_id}를 찾을 수 없습니다.")
+            _log.error(lambda: f"evolve_card_with_ep - 카드 ID {card_id}를 찾을 수 없습니다.")
 
     def turn_off_super_evolve(self, player_id: str):
         """턴 종료 시점에 초진화턴 면역 버프를 무력화합니다."""
@@ -375,7 +523,7 @@ class GameStateManager:
             for card in self.players[player_id].field.get_cards():
                 card.is_super_evolved_turn = False
         else:
-            print(f"[ERROR] turn_off_super_evolve - 플레이어 ID {player_id}를 찾을 수 없습니다.")
+            _log.error(lambda: f"turn_off_super_evolve - 플레이어 ID {player_id}를 찾을 수 없습니다.")
 
     def super_evolve_card_with_sep(self, card_id: str, player_id: str):
         """SEP를 사용하여 지정된 카드를 초진화시킵니다."""
@@ -387,9 +535,9 @@ class GameStateManager:
                 player.spent_ep_in_turn = True
                 self.super_evolve_card(card_id)
             else:
-                print(f"[LOG] 규칙상 처리 불가능한 초진화 요청 (카드 ID: {card_id}, 플레이어 ID: {player_id})")
+                _log.info(lambda: f"규칙상 처리 불가능한 초진화 요청 (카드 ID: {card_id}, 플레이어 ID: {player_id})")
         else:
-            print(f"[ERROR] super_evolve_card_with_sep - 카드 ID {card_id}를 찾을 수 없습니다.")
+            _log.error(lambda: f"super_evolve_card_with_sep - 카드 ID {card_id}를 찾을 수 없습니다.")
 
     def get_player_defense(self, player_id: str) -> int:
         """지정된 플레이어의 현재 체력을 반환합니다."""
@@ -1,17 +1,21 @@
 # 역할 정의. 게임의 전체 흐름과 진행 로직을 통합하는 클래스입니다.
 
 from functools import partial
-from typing import Dict, Any
+from typing import Dict, Any, List
 from collections import defaultdict
 
 from src.models.card import Card
-from src.common.enums import GamePhase, EventType, Zone, EffectType, CardType, ClassType, TribeType
+from src.common.enums import GamePhase, EventType, Zone, EffectType, CardType, ClassType, TribeType, ActionType
 from src.engine.event_manager import EventManager
 from src.engine.game_state_manager import GameStateManager
 from src.models.player import Player
 from src.engine.effect_processor import EffectProcessor
 import src.common.card_data as card_data
 from src.engine.rule_engine import RuleEngine
+from src.engine.action_generator import ActionGenerator, Action
+from src.engine.decision_provider import DecisionProvider, RandomDecisionProvider
+from src.common.rng import make_rng, ENGINE_STREAM, AGENT_STREAM
+from src.engine.snapshot import GameSnapshot, get_rng_state
 
 def validate_fuse_material(material_card: Card, fuse_condition: str) -> bool:
     """융합 재료 카드가 융합 조건을 충족하는지 검사합니다."""
@@ -42,7 +46,6 @@ def validate_fuse_material(material_card: Card, fuse_condition: str) -> bool:
         return name in ["Ominous Artifact 1", "Ominous Artifact 3"]
         
     return False
-from ui.gui import GameGUI
 from src.common.effect import Effect
 from src.common.listener import Listener
 from src.common.event import (
@@ -62,26 +65,49 @@ from src.common.event import (
     LeaveFieldEvent,
     CardDiscardedEvent
 )
+from src.common.logger import get_logger
+
+_log = get_logger("engine.game")
 
 
 class Game:
     """게임 전체 흐름을 관리하는 클래스입니다.
     주요 역할 - 플레이어의 요청 처리, 게임 보드의 이벤트에 따른 효과 처리, 효과 처리로 인한 변화를 게임 보드에 적용합니다."""
 
-    def __init__(self, player1_id: str, player2_id: str, p1_deck_data: List[Any] = None, p2_deck_data: List[Any] = None):
-        """Game 클래스의 생성자입니다. 플레이어별 외부 주입 덱이 있으면 이를 기반으로 구성합니다."""
+    def __init__(self, player1_id: str, player2_id: str, p1_deck_data: List[Any] = None, p2_deck_data: List[Any] = None,
+                 decision_provider: DecisionProvider = None, headless: bool = False, seed: int = None):
+        """Game 클래스의 생성자입니다. 플레이어별 외부 주입 덱이 있으면 이를 기반으로 구성합니다.
+
+        매개변수
+        ----------
+        decision_provider (DecisionProvider) - 플레이어 선택을 공급할 제공자입니다. 생략하면 headless 여부에 따라 결정됩니다.
+        headless (bool) - 참이면 tkinter를 불러오지 않으며 제공자가 없을 때 무작위 제공자를 사용합니다.
+        seed (int) - 게임 마스터 시드입니다. 같은 시드와 같은 선택이면 게임이 그대로 재현됩니다. 생략하면 무작위로 초기화합니다.
+        """
+        self.seed = seed
+        self.rng = make_rng(seed, ENGINE_STREAM)  # 셔플과 카드 효과의 무작위 처리가 공유하는 게임 단위 난수 생성기입니다.
         self.game_state_manager = GameStateManager()
         self.game_state_manager.game = self  # Game 인스턴스를 전달합니다.
-        self.event_manager = EventManager()
+        self.event_manager = EventManager(journal=self.game_state_manager.journal)
         self.listener_ref_counts = defaultdict(int)
-        self.effect_processor = EffectProcessor(self.event_manager)
+        self.effect_processor = EffectProcessor(self.event_manager, rng=self.rng)
         self.rule_engine = RuleEngine(self.game_state_manager)
+        self.action_generator = ActionGenerator(self.game_state_manager)
         self.opponent_id = {player1_id: player2_id, player2_id: player1_id}
-        self.gui = GameGUI(self.game_state_manager)
+        self.headless = headless
+        if decision_provider is None:
+            if headless:
+                decision_provider = RandomDecisionProvider(rng=make_rng(seed, AGENT_STREAM))
+            else:
+                # GUI 모드에서만 tkinter 기반 모듈을 불러옵니다.
+                from ui.gui import GameGUI
+                decision_provider = GameGUI(self.game_state_manager)
+        decision_provider.attach(self.game_state_manager)
+        self.gui = decision_provider  # 기존 호출부 호환을 위해 gui 이름으로 보관합니다.
         self.destroyed_this_turn = []
 
-        self.game_state_manager.players[player1_id] = Player(player1_id, self.event_manager)
-        self.game_state_manager.players[player2_id] = Player(player2_id, self.event_manager)
+        self.game_state_manager.add_player(Player(player1_id, self.event_manager, rng=self.rng))
+        self.game_state_manager.add_player(Player(player2_id, self.event_manager, rng=self.rng))
         self.game_state_manager.opponent_id = self.opponent_id
         self.game_state_manager.current_turn_player_id = player1_id  # 선공
         self.game_state_manager.turn_number = 0
@@ -92,6 +118,73 @@ class Game:
         self._start_turn(player1_id)
         self.gui.update()
 
+    @property
+    def decision_provider(self) -> DecisionProvider:
+        """현재 게임에 주입된 의사결정 제공자를 반환합니다."""
+        return self.gui
+
+    def snapshot(self) -> GameSnapshot:
+        """현재 게임 국면을 기록한 스냅샷을 반환합니다.
+        GUI와 리스너 콜백은 복사하지 않으므로 깊은 복사보다 훨씬 가볍고 같은 게임에서 restore로 몇 번이든 되돌릴 수 있습니다."""
+        return GameSnapshot(
+            game_id=id(self),
+            board=self.game_state_manager.snapshot_state(),
+            destroyed_this_turn=tuple(self.destroyed_this_turn),
+            event_queue=tuple(self.event_manager.event_queue),
+            rng_state=self.rng.getstate(),
+            decision_rng_state=get_rng_state(getattr(self.gui, 'rng', None)),
+        )
+
+    def restore(self, snapshot: GameSnapshot):
+        """snapshot으로 기록한 국면으로 게임을 되돌립니다.
+        리스너는 전역 리스너, 문장, 필드 카드의 required_listeners로부터 다시 등록합니다.
+        화면 갱신은 하지 않으므로 GUI 게임에서는 호출한 쪽이 gui.update를 호출합니다."""
+        if snapshot.game_id != id(self):
+            raise ValueError("snapshot was taken from a different Game instance.")
+        journal = self.game_state_manager.journal
+        with journal.paused():
+            self.game_state_manager.restore_state(snapshot.board)
+            self.destroyed_this_turn = list(snapshot.destroyed_this_turn)
+            self.rng.setstate(snapshot.rng_state)
+            if snapshot.decision_rng_state is not None:
+                self.gui.rng.setstate(snapshot.decision_rng_state)
+            self._rebuild_listeners()
+            self.event_manager.event_queue.extend(snapshot.event_queue)
+        # 저널에 남은 역연산은 복원 이전 상태 기준이므로 더 이상 쓸 수 없습니다.
+        journal.clear()
+
+    def mark(self) -> int:
+        """변경 저널의 현재 시점 표식을 반환합니다. 처음 호출하면 이후의 모든 상태 변경을 역연산으로 기록하기 시작합니다.
+        undo_to(mark)는 표식 이후 변경된 양에 비례하는 시간으로 게임을 이 시점으로 되돌리며 난수 상태도 함께 되돌립니다."""
+        journal = self.game_state_manager.journal
+        mark = journal.mark()
+        journal.record(self.rng.setstate, self.rng.getstate())
+        decision_rng_state = get_rng_state(getattr(self.gui, 'rng', None))
+        if decision_rng_state is not None:
+            journal.record(self.gui.rng.setstate, decision_rng_state)
+        return mark
+
+    def undo_to(self, mark: int):
+        """mark로 받은 시점 이후의 모든 상태 변경을 역순으로 되돌립니다.
+        되돌린 뒤에도 기록은 계속되므로 같은 표식이나 더 이른 표식으로 다시 되돌릴 수 있습니다."""
+        self.game_state_manager.journal.undo_to(mark)
+
+    def stop_journal(self):
+        """변경 기록을 멈추고 쌓인 역연산을 버립니다. 탐색을 마친 뒤 일반 진행 속도로 돌아갈 때 사용합니다."""
+        self.game_state_manager.journal.stop()
+
+    def _rebuild_listeners(self):
+        """현재 보드 상태에 맞추어 이벤트 리스너를 처음부터 다시 등록합니다."""
+        self.event_manager.clear()
+        self._setup_global_listeners()
+        for player in self.game_state_manager.players.values():
+            for crest in player.crests:
+                crest.listeners.clear()
+                crest.register_listeners(self)
+        for player in self.game_state_manager.players.values():
+            for card in player.field.get_cards():
+                self._register_card_listeners(card)
+
     def request_user_choice(self, prompt: str, choices: Dict[str, Any]) -> Any:
         """사용자에게 선택을 요청하고 그 결과를 반환합니다."""
         return self.gui.get_user_choice(prompt, choices)
@@ -200,7 +293,7 @@ class Game:
         """카드 효과를 처리하는 콜백 핸들러입니다."""
         card_id = event.card_id
         target_id = getattr(event, 'target_id', None)
-        print(f"[LOG] 핸들러 처리: 이벤트 '{event.event_type.name}' -> 카드 ID '{card_id}'의 이펙트 '{effect_to_resolve.type.name}'")
+        _log.info(lambda: f"핸들러 처리: 이벤트 '{event.event_type.name}' -> 카드 ID '{card_id}'의 이펙트 '{effect_to_resolve.type.name}'")
         self.effect_processor.resolve_effect(effect_to_resolve, card_id, self.game_state_manager, target_id)
         if event.event_type == EventType.LEAVE_FIELD:
             listener_id = f"{card_id}_{effect_to_resolve.type.name}_{id(effect_to_resolve)}"
@@ -214,8 +307,8 @@ class Game:
 
         for effect_trigger_type in effect_trigger_types:
             if self.game_state_manager.has_keyword(card_id, effect_trigger_type):
-                print(
-                    f"[LOG] 초진화 효과 처리: 대상 카드: {self.game_state_manager.get_card_name(card_id)} -> 이펙트 '{effect_trigger_type.name}'")
+                _log.info(
+                    lambda: f"초진화 효과 처리: 대상 카드: {self.game_state_manager.get_card_name(card_id)} -> 이펙트 '{effect_trigger_type.name}'")
                 self.resolve_effects_type(card_id, effect_trigger_type)
 
     def _on_turn_start(self, event: TurnStartEvent):
@@ -224,9 +317,9 @@ class Game:
         cards_with_countdown = self.game_state_manager.get_cards_with_keyword(player_id, Zone.FIELD,
                                                                               EffectType.COUNTDOWN)
         for card_id in cards_with_countdown:
-            print(f"[LOG] {self.game_state_manager.get_card_name(card_id)} (ID: {card_id}) 카운트다운 감소.")
+            _log.info(lambda: f"{self.game_state_manager.get_card_name(card_id)} (ID: {card_id}) 카운트다운 감소.")
             if self.game_state_manager.countdown(card_id):
-                print(f"[LOG] {self.game_state_manager.get_card_name(card_id)} (ID: {card_id}) 카운트다운 0. 필드에서 묘지로 이동.")
+                _log.info(lambda: f"{self.game_state_manager.get_card_name(card_id)} (ID: {card_id}) 카운트다운 0. 필드에서 묘지로 이동.")
                 self.game_state_manager.move_card(card_id, Zone.FIELD, Zone.GRAVEYARD)
                 from src.common.event import DestroyedOnFieldEvent
                 self.event_manager.publish(DestroyedOnFieldEvent(card_id=card_id))
@@ -242,8 +335,8 @@ class Game:
                                                                               EffectType.SPELLBOOST)
         cards_with_spellboost = cards_with_spellboost_field + cards_with_spellboost_hand
         if cards_with_spellboost:
-            print(
-                f"[LOG] {player_id}의 주문 증폭 효과 처리. 대상 카드: {[self.game_state_manager.get_card_name(card_id) for card_id in cards_with_spellboost]}")
+            _log.info(
+                lambda: f"{player_id}의 주문 증폭 효과 처리. 대상 카드: {[self.game_state_manager.get_card_name(card_id) for card_id in cards_with_spellboost]}")
         for card_id in cards_with_spellboost:
             self.resolve_effects_type(card_id, EffectType.SPELLBOOST)
 
@@ -259,10 +352,9 @@ class Game:
         if not card:
             card = next((c for c in self.game_state_manager.cards if c.card_id == event.card_id), None)
 
-        if card and card.card_data.raw_effects_text:
-            text = card.card_data.raw_effects_text.lower()
-            # 텍스트 내에 버리기 지시어가 있는지 확인하고 효과를 실행합니다.
-            if "discarded" in text:
+        if card:
+            # 로드 시점에 효과 원문에서 추출한 버리기 지시어 여부를 확인하고 효과를 실행합니다.
+            if card.card_data.has_discard_trigger:
                 for effect in card.effects:
                     # 버려졌을 때 트리거되는 효과만 선별하여 처리합니다.
                     if effect.type == EffectType.ON_DISCARD:
@@ -277,9 +369,9 @@ class Game:
         cards_with_countdown = self.game_state_manager.get_cards_with_keyword(player_id, Zone.FIELD,
                                                                               EffectType.COUNTDOWN)
         for card_id in cards_with_countdown:
-            print(f"[LOG] {self.game_state_manager.get_card_name(card_id)} (ID: {card_id}) 카운트다운 감소.")
+            _log.info(lambda: f"{self.game_state_manager.get_card_name(card_id)} (ID: {card_id}) 카운트다운 감소.")
             if self.game_state_manager.countdown(card_id):
-                print(f"[LOG] {self.game_state_manager.get_card_name(card_id)} (ID: {card_id}) 카운트다운 0. 필드에서 묘지로 이동.")
+                _log.info(lambda: f"{self.game_state_manager.get_card_name(card_id)} (ID: {card_id}) 카운트다운 0. 필드에서 묘지로 이동.")
                 self.game_state_manager.move_card(card_id, Zone.FIELD, Zone.GRAVEYARD)
                 self.event_manager.publish(DestroyedOnFieldEvent(card_id=card_id))
                 self.process_events()
@@ -311,8 +403,8 @@ class Game:
         if attacker and attacker.has_keyword(EffectType.DRAIN):
             owner = self.game_state_manager.players[attacker.owner_id]
             owner.heal_damage(event.damage)
-            print(
-                f"[LOG] {attacker.get_display_name()} (ID: {attacker_id}) 흡혈 효과 발동. {owner.player_id} {event.damage}만큼 회복.")
+            _log.info(
+                lambda: f"{attacker.get_display_name()} (ID: {attacker_id}) 흡혈 효과 발동. {owner.player_id} {event.damage}만큼 회복.")
 
     def _on_follower_enter_field(self, event: FollowerEnterFieldEvent):
         """필드 소환 효과를 처리합니다."""
@@ -320,8 +412,8 @@ class Game:
         cards_with_enter_field = self.game_state_manager.get_cards_with_keyword(player_id, Zone.FIELD,
                                                                                 EffectType.ON_FOLLOWER_ENTER_FIELD)
         if cards_with_enter_field:
-            print(
-                f"[LOG] {player_id}의 필드 소환 처리. 대상 카드: {[self.game_state_manager.get_card_name(card_id) for card_id in cards_with_enter_field]}")
+            _log.info(
+                lambda: f"{player_id}의 필드 소환 처리. 대상 카드: {[self.game_state_manager.get_card_name(card_id) for card_id in cards_with_enter_field]}")
         for card_id in cards_with_enter_field:
             self.resolve_effects_type(card_id, EffectType.ON_FOLLOWER_ENTER_FIELD, target_id=event.card_id)
 
@@ -330,7 +422,7 @@ class Game:
         card_id = event.card_id
         card = self.game_state_manager.get_entity_by_id(card_id)
         if card:
-            self.destroyed_this_turn.append(card)
+            self.game_state_manager.journal.append(self.destroyed_this_turn, card)
 
     def _initialize_decks(self, player1_id: str, player2_id: str, p1_deck_data: List[Any] = None, p2_deck_data: List[Any] = None):
         """초기 덱을 설정합니다. 최대 40장, 카드별 3장까지 제한됩니다."""
@@ -412,20 +504,20 @@ class Game:
 
     def _initial_draw(self, player1_id: str, player2_id: str):
         """초기 드로우와 멀리건을 진행합니다."""
-        print("[LOG] 초기 드로우 단계 시작")
+        _log.info("초기 드로우 단계 시작")
         for _ in range(4):
             self._draw_card(player1_id)
             self._draw_card(player2_id)
-        print("[LOG] 멀리건 단계 시작")
+        _log.info("멀리건 단계 시작")
         self._perform_mulligan(player1_id)
         self._perform_mulligan(player2_id)
 
     def _perform_mulligan(self, player_id: str):
         """플레이어의 멀리건을 수행합니다."""
-        print(f"[LOG] {player_id} 멀리건 시작")
+        _log.info(lambda: f"{player_id} 멀리건 시작")
         hand = self.game_state_manager.get_card_ids_in_zone(player_id, Zone.HAND)
         if not hand:
-            print(f"[LOG] {player_id} 손에 카드가 없어 멀리건을 진행할 수 없습니다.")
+            _log.info(lambda: f"{player_id} 손에 카드가 없어 멀리건을 진행할 수 없습니다.")
             return
 
         # 1. 현재 패를 보여줍니다.
@@ -435,26 +527,26 @@ class Game:
         cards_to_mulligan_ids = self.gui.get_mulligan_choices(player_id, hand_cards_obj)
 
         # 3. 멀리건할 카드를 식별하여 덱으로 이동시킵니다.
-        print(f"[LOG] 멀리건할 카드 ID: {cards_to_mulligan_ids}")  # DEBUG
+        _log.debug(lambda: f"멀리건할 카드 ID: {cards_to_mulligan_ids}")
         for card_id in cards_to_mulligan_ids:
             self.game_state_manager.move_card(card_id, Zone.HAND, Zone.DECK)
 
         # 4. 덱을 셔플합니다.
-        print(f"[LOG] {player_id} 덱 셔플.")
+        _log.info(lambda: f"{player_id} 덱 셔플.")
         self.game_state_manager.shuffle_deck(player_id)
 
         # 5. 교체한 카드 수만큼 새로 드로우합니다.
         num_to_draw = len(cards_to_mulligan_ids)
         if num_to_draw > 0:
-            print(f"[LOG] {player_id} {num_to_draw}장 카드 새로 드로우.")
+            _log.info(lambda: f"{player_id} {num_to_draw}장 카드 새로 드로우.")
         for _ in range(num_to_draw):
             self._draw_card(player_id)
-        print(
-            f"[LOG] {player_id} 멀리건 종료. 최종 손패: {[self.game_state_manager.get_card_name(card_id) for card_id in self.game_state_manager.get_card_ids_in_zone(player_id, Zone.HAND)]}")
+        _log.info(
+            lambda: f"{player_id} 멀리건 종료. 최종 손패: {[self.game_state_manager.get_card_name(card_id) for card_id in self.game_state_manager.get_card_ids_in_zone(player_id, Zone.HAND)]}")
 
     def _start_turn(self, player_id: str):
         """플레이어의 턴을 시작합니다."""
-        self.destroyed_this_turn.clear()
+        self.game_state_manager.journal.clear_sequence(self.destroyed_this_turn)
         self.game_state_manager.game_phase = GamePhase.START_PHASE
         self.game_state_manager.start_turn(player_id)
 
@@ -474,20 +566,20 @@ class Game:
         """플레이어가 덱에서 카드를 한 장 뽑습니다."""
         deck = self.game_state_manager.get_card_ids_in_zone(player_id, Zone.DECK)
         if not deck:
-            print(f"[LOG] 게임 종료: {player_id} 덱 아웃!")
+            _log.info(lambda: f"게임 종료: {player_id} 덱 아웃!")
             # 게임 종료 로직을 수행합니다. 패배 처리를 포함합니다.
             return
 
         drawn_card_id = deck.pop(0)
         self.game_state_manager.move_card(drawn_card_id, Zone.DECK, Zone.HAND)
-        print(
-            f"[LOG] {player_id}가 {self.game_state_manager.get_card_name(drawn_card_id)} (ID: {drawn_card_id})를 드로우했습니다.")
+        _log.info(
+            lambda: f"{player_id}가 {self.game_state_manager.get_card_name(drawn_card_id)} (ID: {drawn_card_id})를 드로우했습니다.")
 
     def play_card(self, player_id: str, card_id: str, enhanced_cost=0, use_extra_pp=False):
         """카드 플레이 요청을 처리합니다."""
-        self.game_state_manager.recently_summoned_cards.clear()
+        self.game_state_manager.journal.clear_sequence(self.game_state_manager.recently_summoned_cards)
         if not self.rule_engine.validate_play_card(card_id, player_id, use_extra_pp):
-            print(f"[LOG] {self.game_state_manager.get_card_name(card_id)} (ID: {card_id}) 카드 플레이 유효성 검사 실패.")
+            _log.info(lambda: f"{self.game_state_manager.get_card_name(card_id)} (ID: {card_id}) 카드 플레이 유효성 검사 실패.")
             return False
 
         card = self.game_state_manager.get_entity_by_id(card_id, Zone.HAND)
@@ -516,7 +608,7 @@ class Game:
         """패에 있는 특정 카드를 묘지로 버립니다."""
         card = self.game_state_manager.get_entity_by_id(card_id, Zone.HAND)
         if not card:
-            print(f"[ERROR] discard_card - 패에서 카드 ID {card_id}를 찾을 수 없습니다.")
+            _log.error(lambda: f"discard_card - 패에서 카드 ID {card_id}를 찾을 수 없습니다.")
             return
 
         self.game_state_manager.move_card(card_id, Zone.HAND, Zone.GRAVEYARD)
@@ -529,7 +621,7 @@ class Game:
         """플레이어가 패에서 수동으로 선택하여 카드를 버립니다."""
         hand = self.game_state_manager.get_cards_in_zone(player_id, Zone.HAND)
         if not hand:
-            print(f"[LOG] {player_id}의 패에 버릴 카드가 없습니다.")
+            _log.info(lambda: f"{player_id}의 패에 버릴 카드가 없습니다.")
             return
 
         # GUI를 통해 버릴 카드를 선택하게 요청합니다.
@@ -541,13 +633,13 @@ class Game:
         """지정된 베이스 카드에 여러 재료 카드를 융합합니다."""
         base_card = self.game_state_manager.get_entity_by_id(base_card_id, Zone.HAND)
         if not base_card:
-            print(f"[ERROR] fuse_cards - 베이스 카드 ID {base_card_id}를 찾을 수 없습니다.")
+            _log.error(lambda: f"fuse_cards - 베이스 카드 ID {base_card_id}를 찾을 수 없습니다.")
             return False
 
         # 베이스 카드에 융합 조건을 불러옵니다.
         fuse_condition = getattr(base_card.card_data, "fuse_condition", None)
         if not fuse_condition:
-            print(f"[LOG] {base_card.get_display_name()} 카드는 융합 능력이 없습니다.")
+            _log.info(lambda: f"{base_card.get_display_name()} 카드는 융합 능력이 없습니다.")
             return False
 
         # 각 재료 카드의 적합성을 사전에 검증합니다.
@@ -555,11 +647,11 @@ class Game:
         for card_id in material_card_ids:
             material_card = self.game_state_manager.get_entity_by_id(card_id, Zone.HAND)
             if not material_card:
-                print(f"[ERROR] fuse_cards - 재료 카드 ID {card_id}를 패에서 찾을 수 없습니다.")
+                _log.error(lambda: f"fuse_cards - 재료 카드 ID {card_id}를 패에서 찾을 수 없습니다.")
                 return False
 
             if not validate_fuse_material(material_card, fuse_condition):
-                print(f"[LOG] 재료 카드 {material_card.get_display_name()} (ID: {card_id})는 융합 조건 '{fuse_condition}'에 맞지 않습니다.")
+                _log.info(lambda: f"재료 카드 {material_card.get_display_name()} (ID: {card_id})는 융합 조건 '{fuse_condition}'에 맞지 않습니다.")
                 return False
             validated_materials.append(material_card)
 
@@ -572,8 +664,8 @@ class Game:
             # 패에서 재료 카드를 안전하게 추출해 제거합니다.
             player.hand.remove_card(m_card.card_id)
             m_card.current_zone = None
-            base_card.fused_cards.append(m_card.card_id)
-            print(f"[LOG] {m_card.get_display_name()} (ID: {m_card.card_id}) 카드가 {base_card.get_display_name()}에 융합되었습니다.")
+            self.game_state_manager.journal.append(base_card.fused_cards, m_card.card_id)
+            _log.info(lambda: f"{m_card.get_display_name()} (ID: {m_card.card_id}) 카드가 {base_card.get_display_name()}에 융합되었습니다.")
 
         from src.common.event import FuseDeclaredEvent
         self.event_manager.publish(FuseDeclaredEvent(player_id=player_id, card_id=base_card_id, material_card_ids=material_card_ids))
@@ -590,11 +682,11 @@ class Game:
         target = self.game_state_manager.players[self.opponent_id[attacker.owner_id]]
 
         if not self.rule_engine.validate_attack(attacker_id, target.player_id):
-            print(f"[LOG] {self.game_state_manager.get_card_name(attacker_id)} (ID: {attacker_id})의 리더 공격 유효성 검사 실패.")
+            _log.info(lambda: f"{self.game_state_manager.get_card_name(attacker_id)} (ID: {attacker_id})의 리더 공격 유효성 검사 실패.")
             return False
 
-        print(
-            f"[LOG] {self.game_state_manager.get_card_name(attacker_id)} (ID: {attacker_id})이(가) {target.player_id}을(를) 공격!")
+        _log.info(
+            lambda: f"{self.game_state_manager.get_card_name(attacker_id)} (ID: {attacker_id})이(가) {target.player_id}을(를) 공격!")
 
         # 공격 시작 시 효과를 처리합니다.
         self.event_manager.publish(AttackDeclaredEvent(card_id=attacker_id, target_id=target.player_id))
@@ -604,7 +696,7 @@ class Game:
         # 배리어 효과를 처리합니다.
         target_damage_taken = attacker.current_attack
         if target.has_keyword(EffectType.BARRIER):
-            print(f"[LOG] {target.get_display_name()} (ID: {target.player_id}) 배리어로 데미지 0 받음.")
+            _log.info(lambda: f"{target.get_display_name()} (ID: {target.player_id}) 배리어로 데미지 0 받음.")
             target_damage_taken = 0
             target.effects = [effect for effect in target.effects if effect.type != EffectType.BARRIER]
 
@@ -631,12 +723,12 @@ class Game:
             return False
 
         if not self.rule_engine.validate_attack(attacker_id, target_id):
-            print(
-                f"[LOG] {self.game_state_manager.get_card_name(attacker_id)} (ID: {attacker_id})의 {self.game_state_manager.get_card_name(target_id)} (ID: {target_id}) 공격 유효성 검사 실패.")
+            _log.info(
+                lambda: f"{self.game_state_manager.get_card_name(attacker_id)} (ID: {attacker_id})의 {self.game_state_manager.get_card_name(target_id)} (ID: {target_id}) 공격 유효성 검사 실패.")
             return False
 
-        print(
-            f"[LOG] {self.game_state_manager.get_card_name(attacker_id)} (ID: {attacker_id})이(가) {self.game_state_manager.get_card_name(target_id)} (ID: {target_id})을(를) 공격!")
+        _log.info(
+            lambda: f"{self.game_state_manager.get_card_name(attacker_id)} (ID: {attacker_id})이(가) {self.game_state_manager.get_card_name(target_id)} (ID: {target_id})을(를) 공격!")
 
         # 공격 시작 시 효과를 처리합니다.
         self.event_manager.publish(AttackDeclaredEvent(card_id=attacker_id, target_id=target_id))
@@ -653,27 +745,27 @@ class Game:
         target_damage_taken = attacker.current_attack
 
         if attacker.has_keyword(EffectType.BARRIER):
-            print(f"[LOG] {attacker.get_display_name()} (ID: {attacker_id}) 배리어로 데미지 0 받음.")
+            _log.info(lambda: f"{attacker.get_display_name()} (ID: {attacker_id}) 배리어로 데미지 0 받음.")
             attacker_damage_taken = 0
             attacker.effects = [effect for effect in target.effects if effect.type != EffectType.BARRIER]
 
         if target.has_keyword(EffectType.BARRIER):
-            print(f"[LOG] {target.card_data['name']} (ID: {target_id}) 배리어로 데미지 0 받음.")
+            _log.info(lambda: f"{target.card_data['name']} (ID: {target_id}) 배리어로 데미지 0 받음.")
             target_damage_taken = 0
             target.effects = [effect for effect in target.effects if effect.type != EffectType.BARRIER]
 
         target_destroyed = target.take_damage(target_damage_taken)
 
         if attacker.has_keyword(EffectType.BANE):
-            print(
-                f"[LOG] {attacker.get_display_name()} (ID: {attacker_id}) 필살 능력으로 {target.get_display_name()} (ID: {target_id}) 파괴됨.")
+            _log.info(
+                lambda: f"{attacker.get_display_name()} (ID: {attacker_id}) 필살 능력으로 {target.get_display_name()} (ID: {target_id}) 파괴됨.")
             target_destroyed = True
 
         if attacker.is_super_evolved:
-            print(f"[LOG] {attacker.get_display_name()} (ID: {attacker_id}) 초진화 효과로 데미지 0 받음.")
+            _log.info(lambda: f"{attacker.get_display_name()} (ID: {attacker_id}) 초진화 효과로 데미지 0 받음.")
             attacker_damage_taken = 0
             if target_destroyed:
-                print(f"[LOG] {attacker.get_display_name()} (ID: {attacker_id}) 초진화 효과로 상대 리더에게 데미지 1.")
+                _log.info(lambda: f"{attacker.get_display_name()} (ID: {attacker_id}) 초진화 효과로 상대 리더에게 데미지 1.")
                 self.game_state_manager.players[target.owner_id].take_damage(1)
 
         attacker_destroyed = attacker.take_damage(attacker_damage_taken)
@@ -690,8 +782,8 @@ class Game:
 
         # 필살 효과를 처리합니다.
         if target.has_keyword(EffectType.BANE):
-            print(
-                f"[LOG] {target.get_display_name()} (ID: {target_id}) 필살 능력으로 {attacker.get_display_name()} (ID: {attacker_id}) 파괴됨.")
+            _log.info(
+                lambda: f"{target.get_display_name()} (ID: {target_id}) 필살 능력으로 {attacker.get_display_name()} (ID: {attacker_id}) 파괴됨.")
             attacker_destroyed = True
 
         # 파괴된 추종자를 묘지로 이동시키고 유언 효과를 처리합니다.
@@ -709,7 +801,7 @@ class Game:
     def end_turn(self, player_id: str):
         """턴 종료 요청을 처리합니다."""
         self.game_state_manager.game_phase = GamePhase.END_PHASE
-        print(f"[LOG] {player_id}의 턴 종료 (종료 단계)")
+        _log.info(lambda: f"{player_id}의 턴 종료 (종료 단계)")
         player = self.game_state_manager.players[player_id]
         player.combo_count = 0  # 턴 종료 시 콤보 카운트를 0으로 리셋합니다.
 
@@ -724,7 +816,7 @@ class Game:
         # 다음 턴을 진행할 플레이어를 설정합니다.
         opponent_id = self.opponent_id[player_id]
         self.game_state_manager.current_turn_player_id = opponent_id
-        print(f"[LOG] {player_id} 턴 종료. {opponent_id}의 턴으로 전환.")
+        _log.info(lambda: f"{player_id} 턴 종료. {opponent_id}의 턴으로 전환.")
         self._start_turn(opponent_id)
         self.gui.update()
 
@@ -759,8 +851,9 @@ class Game:
             for effect in card.effects:
                 if effect.type in [EffectType.SKYBOUND_ART, EffectType.SUPER_SKYBOUND_ART]:
                     if hasattr(effect, "skybound_art_evo_charge"):
+                        self.game_state_manager.journal.note_attr(effect, 'skybound_art_evo_charge')
                         effect.skybound_art_evo_charge += 1
-                        print(f"[LOG] {card.get_display_name()} 의 오의 진화 충전량 1 증가. 현재 충전량 {effect.skybound_art_evo_charge}.")
+                        _log.info(lambda: f"{card.get_display_name()} 의 오의 진화 충전량 1 증가. 현재 충전량 {effect.skybound_art_evo_charge}.")
 
     def _check_invoke(self, player_id: str):
         """덱에 있는 직접소환 카드 조건을 검사하여 필드로 소환합니다."""
@@ -777,13 +870,13 @@ class Game:
                 try:
                     condition_met = effect.condition(self)
                 except Exception as e:
-                     print(f"[ERROR] 직접소환 조건 검사 중 오류 발생 {str(e)}.")
+                     _log.error(lambda e=e: f"직접소환 조건 검사 중 오류 발생 {str(e)}.")
                      condition_met = False
 
             if condition_met:
                 if len(self.game_state_manager.get_cards_in_zone(player_id, Zone.FIELD)) < 5:
                     self.game_state_manager.move_card(card.card_id, Zone.DECK, Zone.FIELD)
-                    print(f"[LOG] 직접소환 조건 만족, {card.get_display_name()} 카드를 덱에서 필드로 직접 소환합니다.")
+                    _log.info(lambda: f"직접소환 조건 만족, {card.get_display_name()} 카드를 덱에서 필드로 직접 소환합니다.")
                     break
 
     def engage_card(self, card_id: str, player_id: str) -> bool:
@@ -810,6 +903,36 @@ class Game:
         return player_hand_id, [self.rule_engine.validate_play_card(card_id, player_id, use_extra_pp) for card_id in
                                 player_hand_id]
 
+    def legal_actions(self, player_id: str) -> List[Action]:
+        """플레이어가 지금 수행할 수 있는 모든 행동을 (ActionType, 인자...) 튜플 목록으로 반환합니다.
+        검증 로그를 남기지 않으므로 퍼징과 AI 탐색처럼 매 행동마다 후보를 다시 구하는 곳에서 사용합니다."""
+        return self.action_generator.legal_actions(player_id)
+
+    def apply_action(self, player_id: str, action: Action):
+        """legal_actions가 반환한 행동 튜플 하나를 실행합니다. 알 수 없는 행동 타입이면 ValueError를 발생시킵니다."""
+        action_type = action[0]
+        if action_type == ActionType.PLAY_CARD:
+            self.play_card(player_id, action[1], action[2], action[3])
+        elif action_type == ActionType.ATTACK:
+            if self.game_state_manager.get_type(action[2]) == CardType.LEADER:
+                self.attack_leader(action[1])
+            else:
+                self.attack_follower(action[1], action[2])
+        elif action_type == ActionType.EVOLVE:
+            self.evolve_follower(action[1], player_id)
+        elif action_type == ActionType.SUPER_EVOLVE:
+            self.super_evolve_follower(action[1], player_id)
+        elif action_type == ActionType.ENGAGE:
+            self.engage_card(action[1], player_id)
+        elif action_type == ActionType.END_TURN:
+            self.end_turn(player_id)
+        else:
+            raise ValueError(f"Unknown action type {action_type!r}.")
+
+    def is_game_over(self) -> bool:
+        """어느 한쪽 리더의 체력이 0 이하가 되어 승부가 났는지 반환합니다."""
+        return any(player.current_defense <= 0 for player in self.game_state_manager.players.values())
+
     def has_extra_pp(self, player_id: str):
         """플레이어가 엑스트라 PP를 가지고 있는지 확인합니다."""
         return self.game_state_manager.get_entity_by_id(player_id).extra_pp > 0
@@ -0,0 +1,435 @@
+# 역할 정의. 숨은 정보를 결정화한 국면들 위에서 몬테카를로 트리 탐색으로 행동을 고르는 AI 에이전트입니다.
+
+import io
+import math
+import multiprocessing
+import pickle
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import src.common.card_data as card_data
+from src.common.compiled_effect import CompiledEffect
+from src.common.effect import Effect, Process
+from src.common.enums import ActionType, CardType, Zone
+from src.common.evaluation import BOARD_WEIGHT, EVALUATION_SCALE, HAND_WEIGHT
+from src.common.listener import Listener
+from src.common.logger import get_logger, suppress_logging
+from src.engine.action_generator import Action, END_TURN_ACTION
+from src.engine.decision_provider import MAX_ACTIONS_PER_TURN, RandomAgent, RandomDecisionProvider
+
+_log = get_logger("engine.ai")
+
+DEFAULT_ROLLOUT_STEP_LIMIT = 2000  # 탐색 반복 한 번에 허용하는 효과 해결 횟수입니다. 넘으면 효과가 끝없이 연쇄되는 진행으로 보고 중립 보상으로 끝냅니다.
+
+ActionStats = Dict[Action, Tuple[int, float]]  # 루트 행동별 (방문 수, 누적 보상)입니다.
+
+_GUI_PERSISTENT_ID = "gui"  # 국면을 워커에 보낼 때 의사결정 제공자 자리에 넣는 표식입니다.
+# 탐색 풀을 포크할 때의 정적 카드 데이터 객체를 id로 찾는 표입니다.
+# 포크된 워커는 같은 주소의 같은 객체를 물려받으므로 국면을 보낼 때 이 객체들은 id만 보냅니다.
+_worker_static_objects: Dict[int, Any] = {}
+
+
+def _card_databases() -> Tuple[Any, ...]:
+    """정적 카드 데이터가 들어 있는 카드 데이터베이스들을 반환합니다."""
+    return card_data.BASIC_CARD_DATABASE, card_data.LEGENDS_RISE_CARD_DATABASE, card_data.TOKEN_CARD_DATABASE
+
+
+def _static_signature() -> Tuple[int, int]:
+    """카드 데이터베이스의 항목 수와 참조가 해결된 카드 수를 반환합니다. 풀을 만든 뒤 값이 바뀌면 워커의 정적 객체 표가 낡은 것입니다."""
+    entries = resolved = 0
+    for database in _card_databases():
+        entries += len(database)
+        resolved += sum(1 for data in database.values() if getattr(data, "references_resolved", True))
+    return entries, resolved
+
+
+def _collect_static_objects() -> Dict[int, Any]:
+    """카드 데이터와 그 효과 그래프에 속한 객체와 컨테이너를 id로 찾는 표를 만듭니다."""
+    table: Dict[int, Any] = {}
+    stack = [data for database in _card_databases() for data in database.values()]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in table:
+            continue
+        if isinstance(obj, (list, tuple)):
+            table[id(obj)] = obj
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            table[id(obj)] = obj
+            stack.extend(obj.values())
+        elif isinstance(obj, (card_data.CardData, Effect, Process)):
+            table[id(obj)] = obj
+            stack.extend(vars(obj).values())
+    return table
+
+
+def _drop_cached_value() -> None:
+    """직렬화에서 뺀 캐시 자리에 None을 되돌립니다. 컴파일 결과는 처음 해결될 때 다시 만들어집니다."""
+    return None
+
+
+class _PositionPickler(pickle.Pickler):
+    """탐색 워커에 보낼 게임 국면을 직렬화합니다.
+    정적 카드 데이터는 id만 보내고, 의사결정 제공자와 리스너 콜백과 효과 컴파일 결과처럼 직렬화할 수 없거나 다시 만들 수 있는 객체는 뺍니다."""
+
+    def __init__(self, file: io.BytesIO, gui: Any):
+        """_PositionPickler 클래스의 생성자입니다."""
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._gui = gui
+
+    def persistent_id(self, obj: Any) -> Any:
+        """정적 카드 데이터와 의사결정 제공자는 표식으로 대신합니다."""
+        if obj is self._gui and obj is not None:
+            return _GUI_PERSISTENT_ID
+        return id(obj) if id(obj) in _worker_static_objects else None
+
+    def reducer_override(self, obj: Any) -> Any:
+        """리스너와 효과 컴파일 결과는 None으로 보냅니다. 워커가 국면을 복원하면서 다시 만듭니다."""
+        if isinstance(obj, (Listener, CompiledEffect)):
+            return _drop_cached_value, ()
+        return NotImplemented
+
+
+class _PositionUnpickler(pickle.Unpickler):
+    """_PositionPickler로 직렬화한 국면을 워커에서 되살립니다."""
+
+    def persistent_load(self, pid: Any) -> Any:
+        """표식을 워커가 물려받은 정적 객체로 바꿉니다. 의사결정 제공자는 None이 되며 탐색이 따로 주입합니다."""
+        if pid == _GUI_PERSISTENT_ID:
+            return None
+        return _worker_static_objects[pid]
+
+
+def _dump_position(game: Any) -> bytes:
+    """게임 국면을 탐색 워커에 보낼 바이트열로 직렬화합니다."""
+    buffer = io.BytesIO()
+    _PositionPickler(buffer, game.gui).dump(game)
+    return buffer.getvalue()
+
+
+def _load_position(payload: bytes) -> Any:
+    """직렬화한 국면으로 게임을 되살리고 리스너를 다시 등록합니다."""
+    game = _PositionUnpickler(io.BytesIO(payload)).load()
+    # 자기 자신의 스냅샷으로 복원하면 대기 중인 이벤트는 그대로 두고 리스너만 현재 보드에 맞추어 다시 등록됩니다.
+    game.restore(game.snapshot())
+    return game
+
+
+class _SearchBudgetExceeded(BaseException):
+    """탐색 반복이 수마다의 시간 예산이나 효과 해결 횟수 한도를 넘었을 때 발생합니다.
+    엔진의 일반 예외 처리에 잡히지 않고 탐색 반복까지 올라오도록 BaseException을 상속합니다."""
+
+    def __init__(self, deadline_passed: bool):
+        """_SearchBudgetExceeded 클래스의 생성자입니다."""
+        super().__init__(deadline_passed)
+        self.deadline_passed = deadline_passed
+
+
+class _ResolveBudget:
+    """EffectProcessor.resolve_effect를 감싸 효과를 해결할 때마다 반복당 해결 횟수와 수마다의 시간 예산을 검사합니다.
+    효과가 끝없이 연쇄되어 행동 하나가 끝나지 않는 국면에서도 탐색이 예산 안에 멈추도록 합니다."""
+    __slots__ = ("resolve_effect", "deadline", "step_limit", "steps")
+
+    def __init__(self, resolve_effect: Any, deadline: Optional[float], step_limit: int):
+        """_ResolveBudget 클래스의 생성자입니다."""
+        self.resolve_effect = resolve_effect
+        self.deadline = deadline
+        self.step_limit = step_limit
+        self.steps = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """예산이 남아 있으면 원래 resolve_effect를 호출합니다."""
+        self.steps += 1
+        if self.steps > self.step_limit:
+            raise _SearchBudgetExceeded(False)
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise _SearchBudgetExceeded(True)
+        return self.resolve_effect(*args, **kwargs)
+
+
+class _SearchNode:
+    """탐색 트리의 노드입니다. 값은 이 노드로 오는 행동을 고른 플레이어 관점의 누적 보상입니다.
+    결정화마다 가능한 행동이 달라지므로 형제 노드 중 선택 가능했던 횟수를 availability로 따로 셉니다."""
+    __slots__ = ("visits", "value", "availability", "children")
+
+    def __init__(self):
+        """_SearchNode 클래스의 생성자입니다."""
+        self.visits = 0
+        self.value = 0.0
+        self.availability = 0
+        self.children: Dict[Action, '_SearchNode'] = {}
+
+
+def _search_in_pool_worker(task: Tuple[Any, bytes, str, int, Optional[float], Optional[int]]) -> Tuple[ActionStats, int]:
+    """탐색 풀 워커에서 전달받은 국면을 되살려 독립 탐색을 수행합니다."""
+    agent, payload, player_id, seed, deadline, iterations = task
+    return agent._search(_load_position(payload), player_id, seed, deadline, iterations)
+
+
+class MCTSAgent(RandomAgent):
+    """결정화 정보 집합 몬테카를로 트리 탐색으로 턴 행동을 고르는 에이전트입니다.
+
+    반복마다 루트 국면을 복원하고 상대 손패와 덱, 양쪽 덱 순서처럼 탐색하는 플레이어가 볼 수 없는 정보를 무작위로 다시 배치한 뒤
+    트리를 따라 내려가고, 새 노드를 하나 펼친 다음 무작위 플레이아웃을 rollout_turns 턴까지 진행하여 승패 또는 휴리스틱 점수를 역전파합니다.
+    탐색은 반복 횟수 예산이나 수마다의 벽시계 예산 중 먼저 닿는 쪽에서 멈추며, 시간 예산은 효과를 해결할 때마다 검사하므로 진행이 멈춘 플레이아웃도 예산을 넘기지 않습니다.
+    workers가 2 이상이면 fork를 지원하는 플랫폼에서 에이전트 수명 동안 유지하는 프로세스 풀로 루트 병렬 탐색을 하고
+    풀을 만들 수 없는 데몬 프로세스 안에서는 현재 프로세스에서 탐색합니다. 풀을 다 쓰면 close로 정리합니다.
+    턴 진행은 RandomAgent.play_turn을 그대로 쓰며 효과 대상 선택 같은 하위 선택은 무작위로 결정합니다.
+    """
+
+    def __init__(self, time_budget: Optional[float] = 1.0, iterations: Optional[int] = None, exploration: float = 1.4,
+                 rollout_turns: int = 2, workers: int = 1, rng: random.Random = None,
+                 rollout_step_limit: int = DEFAULT_ROLLOUT_STEP_LIMIT):
+        """MCTSAgent 클래스의 생성자입니다.
+
+        매개변수
+        ----------
+        time_budget (float) - 행동 하나를 고르는 데 쓸 최대 초입니다. None이면 시간 제한 없이 iterations만 따릅니다.
+        iterations (int) - 행동 하나당 최대 탐색 반복 횟수입니다. 루트 병렬 탐색에서는 워커들이 나누어 수행합니다.
+        exploration (float) - UCB 탐험 계수입니다.
+        rollout_turns (int) - 플레이아웃에서 진행할 최대 턴 종료 횟수입니다. 그 전에 승부가 나지 않으면 휴리스틱으로 평가합니다.
+        workers (int) - 루트 병렬 탐색 프로세스 수입니다. 1이면 현재 프로세스에서만 탐색합니다.
+        rng (random.Random) - 탐색 시드와 하위 선택에 쓰는 난수 생성기입니다.
+        rollout_step_limit (int) - 탐색 반복 한 번에 허용하는 효과 해결 횟수입니다. 넘은 반복은 중립 보상으로 끝냅니다.
+        """
+        if time_budget is None and iterations is None:
+            raise ValueError("MCTSAgent needs a time_budget or an iterations budget.")
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        super().__init__(rng)
+        self.time_budget = time_budget
+        self.iterations = iterations
+        self.exploration = exploration
+        self.rollout_turns = rollout_turns
+        self.workers = workers
+        self.rollout_step_limit = rollout_step_limit
+        self._pool = None
+        self._pool_signature = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """워커에 보낼 때는 프로세스 풀과 연결된 게임 상태 관리자를 빼고 보냅니다. 워커는 탐색하는 국면에 다시 연결합니다."""
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        state["_pool_signature"] = None
+        state.pop("game_state_manager", None)
+        return state
+
+    def close(self):
+        """루트 병렬 탐색 풀을 종료합니다. 다시 탐색하면 새 풀을 만듭니다."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+            self._pool_signature = None
+
+    def _get_pool(self) -> Any:
+        """루트 병렬 탐색 풀을 반환합니다. 풀을 만든 뒤 카드 데이터가 더 적재되었으면 워커가 새 정적 객체를 물려받도록 다시 만듭니다."""
+        signature = _static_signature()
+        if self._pool is not None and self._pool_signature != signature:
+            self.close()
+        if self._pool is None:
+            _worker_static_objects.clear()
+            _worker_static_objects.update(_collect_static_objects())
+            self._pool = multiprocessing.get_context("fork").Pool(self.workers)
+            self._pool_signature = signature
+        return self._pool
+
+    def choose_action(self, game: Any, player_id: str) -> Action:
+        """현재 국면에서 player_id가 할 행동 튜플 하나를 탐색으로 고릅니다. 게임 상태는 호출 전과 같게 되돌려 둡니다."""
+        legal_actions = game.legal_actions(player_id)
+        if len(legal_actions) == 1:
+            return legal_actions[0]
+
+        deadline = None if self.time_budget is None else time.monotonic() + self.time_budget
+        parallel = (self.workers > 1 and "fork" in multiprocessing.get_all_start_methods()
+                    and not multiprocessing.current_process().daemon)
+        if parallel:
+            stats, iteration_count = self._search_root_parallel(game, player_id, deadline)
+        else:
+            stats, iteration_count = self._search(game, player_id, self.rng.getrandbits(64), deadline, self.iterations)
+
+        # 가장 많이 방문한 행동을 고르고 같으면 평균 보상이 높은 행동을 고릅니다.
+        def score(action: Action) -> Tuple[int, float]:
+            visits, value = stats.get(action, (0, 0.0))
+            return visits, value / visits if visits else 0.0
+
+        best_action = max(legal_actions, key=score)
+        _log.info(lambda: f"{player_id} MCTS {iteration_count}회 탐색 후 행동 {best_action} 선택. 방문 {score(best_action)[0]}회, 평균 보상 {score(best_action)[1]:.3f}.")
+        return best_action
+
+    def _search_root_parallel(self, game: Any, player_id: str, deadline: Optional[float]) -> Tuple[ActionStats, int]:
+        """풀 워커마다 같은 국면을 보내 다른 시드로 독립 트리를 키우고 루트 행동별 통계를 합칩니다.
+        국면을 직렬화할 수 없으면 현재 프로세스에서 탐색합니다."""
+        seeds = [self.rng.getrandbits(64) for _ in range(self.workers)]
+        iterations = None if self.iterations is None else math.ceil(self.iterations / self.workers)
+        pool = self._get_pool()
+        try:
+            payload = _dump_position(game)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            _log.debug(lambda e=e: f"MCTS 국면 직렬화 실패로 단일 프로세스 탐색 {type(e).__name__} {e}")
+            return self._search(game, player_id, seeds[0], deadline, self.iterations)
+        results = pool.map(_search_in_pool_worker,
+                           [(self, payload, player_id, seed, deadline, iterations) for seed in seeds])
+
+        merged: ActionStats = {}
+        total_iterations = 0
+        for stats, iteration_count in results:
+            total_iterations += iteration_count
+            for action, (visits, value) in stats.items():
+                merged_visits, merged_value = merged.get(action, (0, 0.0))
+                merged[action] = (merged_visits + visits, merged_value + value)
+        return merged, total_iterations
+
+    def _search(self, game: Any, player_id: str, seed: int, deadline: Optional[float],
+                iterations: Optional[int]) -> Tuple[ActionStats, int]:
+        """루트 국면에서 예산이 다할 때까지 탐색 반복을 수행하고 루트 행동별 통계와 반복 횟수를 반환합니다.
+        탐색 중에는 로그를 끄고 무작위 하위 선택 제공자를 게임에 주입하며 끝나면 원래 제공자와 루트 국면을 복원합니다."""
+        search_rng = random.Random(seed)
+        original_provider = game.gui
+        root_snapshot = game.snapshot()
+        rollout_provider = RandomDecisionProvider(rng=random.Random(search_rng.getrandbits(64)))
+        rollout_provider.attach(game.game_state_manager)
+        effect_processor = game.effect_processor
+        instance_resolve_effect = effect_processor.__dict__.get("resolve_effect")
+        budget = _ResolveBudget(effect_processor.resolve_effect, deadline, self.rollout_step_limit)
+        root = _SearchNode()
+        iteration_count = 0
+        with suppress_logging():
+            game.gui = rollout_provider
+            effect_processor.resolve_effect = budget
+            try:
+                while iterations is None or iteration_count < iterations:
+                    if deadline is not None and time.monotonic() >= deadline:
+                        break
+                    budget.steps = 0
+                    if not self._run_iteration(game, root_snapshot, root, player_id, search_rng):
+                        break
+                    iteration_count += 1
+            finally:
+                if instance_resolve_effect is None:
+                    del effect_processor.resolve_effect
+                else:
+                    effect_processor.resolve_effect = instance_resolve_effect
+                game.gui = original_provider
+                game.restore(root_snapshot)
+        return {action: (child.visits, child.value) for action, child in root.children.items()}, iteration_count
+
+    def _run_iteration(self, game: Any, root_snapshot: Any, root: _SearchNode, player_id: str, search_rng: random.Random) -> bool:
+        """결정화, 선택, 확장, 플레이아웃, 역전파로 이루어진 탐색 반복 한 번을 수행합니다.
+        진행 중에 수마다의 시간 예산이 다하면 역전파 없이 False를 반환합니다."""
+        game.restore(root_snapshot)
+        game.rng.seed(search_rng.getrandbits(64))
+        game.gui.rng.seed(search_rng.getrandbits(64))
+        gsm = game.game_state_manager
+        path: List[Tuple[_SearchNode, str]] = []
+        try:
+            self._determinize(game, player_id, search_rng)
+            node = root
+            actions_in_turn = 0
+            while not game.is_game_over():
+                game.process_player_choice()
+                actor = gsm.current_turn_player_id
+                legal_actions = game.legal_actions(actor) if actions_in_turn < MAX_ACTIONS_PER_TURN else [END_TURN_ACTION]
+                untried = []
+                for action in legal_actions:
+                    child = node.children.get(action)
+                    if child is None:
+                        untried.append(action)
+                    else:
+                        child.availability += 1
+                if untried:
+                    action = search_rng.choice(untried)
+                    child = _SearchNode()
+                    child.availability = 1
+                    node.children[action] = child
+                else:
+                    action = max(legal_actions, key=lambda a: self._ucb(node.children[a]))
+                    child = node.children[action]
+                game.apply_action(actor, action)
+                path.append((child, actor))
+                actions_in_turn = 0 if action[0] == ActionType.END_TURN else actions_in_turn + 1
+                node = child
+                if untried:
+                    break
+            reward = self._rollout(game, player_id, search_rng, actions_in_turn)
+        except _SearchBudgetExceeded as e:
+            if e.deadline_passed:
+                return False
+            # 효과 해결 횟수 한도를 넘은 가상 진행은 엔진이 멈춘 것으로 보고 중립 보상으로 처리합니다.
+            _log.debug(lambda: f"MCTS 탐색 중 효과 해결 {self.rollout_step_limit}회 초과")
+            reward = 0.5
+        except Exception as e:
+            # 엔진 오류로 끝난 가상 진행은 승패를 알 수 없으므로 중립 보상으로 처리합니다.
+            _log.debug(lambda e=e: f"MCTS 탐색 중 엔진 오류 {type(e).__name__} {e}")
+            reward = 0.5
+        for child, actor in path:
+            child.visits += 1
+            child.value += reward if actor == player_id else 1.0 - reward
+        return True
+
+    def _ucb(self, child: _SearchNode) -> float:
+        """형제 노드 중 선택 가능했던 횟수를 쓰는 UCB 점수를 계산합니다."""
+        if child.visits == 0:
+            return math.inf
+        return child.value / child.visits + self.exploration * math.sqrt(math.log(child.availability) / child.visits)
+
+    def _determinize(self, game: Any, player_id: str, rng: random.Random):
+        """player_id가 볼 수 없는 정보를 무작위로 다시 배치합니다.
+        상대 손패와 상대 덱을 합친 카드들에서 손패 수만큼 새 손패를 뽑고 양쪽 덱 순서를 섞습니다."""
+        gsm = game.game_state_manager
+        opponent = gsm.players[gsm.opponent_id[player_id]]
+        hand_cards = opponent.hand.get_cards()
+        deck_cards = opponent.deck.get_cards()
+        if hand_cards and deck_cards:
+            new_hand_ids = {card.card_id for card in rng.sample(hand_cards + deck_cards, len(hand_cards))}
+            leaving = [card for card in hand_cards if card.card_id not in new_hand_ids]
+            entering = [card for card in deck_cards if card.card_id in new_hand_ids]
+            for card in leaving:
+                gsm.move_card(card.card_id, Zone.HAND, Zone.DECK)
+            for card in entering:
+                gsm.move_card(card.card_id, Zone.DECK, Zone.HAND)
+        for player in gsm.players.values():
+            player.deck.shuffle()
+
+    def _rollout(self, game: Any, player_id: str, rng: random.Random, actions_in_turn: int) -> float:
+        """무작위 행동으로 rollout_turns번 턴이 끝날 때까지 진행하고 player_id 관점의 보상을 0과 1 사이로 반환합니다."""
+        gsm = game.game_state_manager
+        turns_ended = 0
+        while turns_ended < self.rollout_turns and not game.is_game_over():
+            game.process_player_choice()
+            actor = gsm.current_turn_player_id
+            if actions_in_turn >= MAX_ACTIONS_PER_TURN:
+                action = END_TURN_ACTION
+            else:
+                action = rng.choice(game.legal_actions(actor))
+            game.apply_action(actor, action)
+            if action[0] == ActionType.END_TURN:
+                turns_ended += 1
+                actions_in_turn = 0
+            else:
+                actions_in_turn += 1
+        return self._evaluate(game, player_id)
+
+    def _evaluate(self, game: Any, player_id: str) -> float:
+        """player_id 관점의 국면 가치를 0과 1 사이로 반환합니다.
+        승부가 났으면 승리 1, 패배 0, 동시 패배 0.5이고 아니면 리더 체력 차, 필드 추종자 스탯 차, 손패 수 차로 만든 점수를 로지스틱 함수로 변환합니다."""
+        gsm = game.game_state_manager
+        me = gsm.players[player_id]
+        opponent = gsm.players[gsm.opponent_id[player_id]]
+        if me.current_defense <= 0 and opponent.current_defense <= 0:
+            return 0.5
+        if me.current_defense <= 0:
+            return 0.0
+        if opponent.current_defense <= 0:
+            return 1.0
+        score = (me.current_defense - opponent.current_defense
+                 + BOARD_WEIGHT * (self._board_strength(me) - self._board_strength(opponent))
+                 + HAND_WEIGHT * (me.hand.size() - opponent.hand.size()))
+        return 1.0 / (1.0 + math.exp(-score / EVALUATION_SCALE))
+
+    @staticmethod
+    def _board_strength(player: Any) -> int:
+        """필드 추종자의 공격력과 체력 합계를 반환합니다."""
+        return sum(card.current_attack + card.current_defense
+                   for card in player.field.get_cards() if card.get_type() == CardType.FOLLOWER)
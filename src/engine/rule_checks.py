@@ -0,0 +1,78 @@
+# 역할 정의. 행동 유효성 규칙을 로그 없이 판정하는 함수들을 정의합니다. RuleEngine과 Card는 판정 사유별로 로그를 남기고 ActionGenerator는 판정 결과만 사용합니다.
+
+from typing import Any, Optional
+from src.common.enums import CardType, EffectType
+
+FIELD_CARD_TYPES = (CardType.FOLLOWER, CardType.AMULET)  # 플레이하면 필드를 차지하는 카드 타입입니다.
+MAX_FIELD_SIZE = 5  # 필드 최대 크기입니다.
+
+# 행동이 막힌 사유입니다. 판정 함수는 행동이 가능하면 None을 반환합니다.
+BLOCK_NOT_ENOUGH_PP = "not_enough_pp"
+BLOCK_FIELD_FULL = "field_full"
+BLOCK_NO_ENGAGE_EFFECT = "no_engage_effect"
+BLOCK_ALREADY_ENGAGED = "already_engaged"
+BLOCK_DISABLED = "disabled"
+BLOCK_NO_STORM = "no_storm"
+BLOCK_SUMMONED_THIS_TURN = "summoned_this_turn"
+BLOCK_INTIMIDATE = "intimidate"
+BLOCK_AMBUSH = "ambush"
+BLOCK_WARD = "ward"
+# 공격이 가능한 사유입니다. attack_verdict는 공격이 막히면 BLOCK_ 사유를, 가능하면 아래 사유를 반환합니다.
+ATTACK_NOT_SUMMONED = "not_summoned"
+ATTACK_STORM = "storm"
+ATTACK_EVOLVED_RUSH_STORM = "evolved_rush_storm"
+ATTACK_ALLOWED = frozenset((ATTACK_NOT_SUMMONED, ATTACK_STORM, ATTACK_EVOLVED_RUSH_STORM))
+
+
+def play_block(card_cost: int, card_type: CardType, available_pp: int, field_size: int) -> Optional[str]:
+    """카드 플레이가 막힌 사유를 반환합니다. available_pp는 엑스트라 PP 사용분을 더한 값입니다."""
+    if available_pp < card_cost:
+        return BLOCK_NOT_ENOUGH_PP
+    if card_type in FIELD_CARD_TYPES and field_size >= MAX_FIELD_SIZE:
+        return BLOCK_FIELD_FULL
+    return None
+
+
+def engage_block(engage_effect: Optional[Any], is_engaged: bool, current_pp: int) -> Optional[str]:
+    """카드 활성화가 막힌 사유를 반환합니다. engage_effect는 카드의 첫 활성화 효과이며 없으면 None입니다."""
+    if engage_effect is None:
+        return BLOCK_NO_ENGAGE_EFFECT
+    if is_engaged:
+        return BLOCK_ALREADY_ENGAGED
+    cost = engage_effect.get("cost")
+    if cost is not None and current_pp < cost:
+        return BLOCK_NOT_ENOUGH_PP
+    return None
+
+
+def attack_verdict(attacker: Any, target_type: Any) -> str:
+    """공격자가 target_type 대상을 공격할 수 있는지 판정하고 그 사유를 반환합니다. 공격할 수 있으면 ATTACK_ALLOWED 중 하나를 반환합니다.
+    소환된 턴에는 질주가 있어야 리더를, 진화나 돌진이나 질주 상태여야 추종자를 공격할 수 있습니다."""
+    if attacker.has_keyword(EffectType.DISABLE):
+        return BLOCK_DISABLED
+    if attacker.is_engaged:
+        return BLOCK_ALREADY_ENGAGED
+    if not attacker.is_summoned:
+        return ATTACK_NOT_SUMMONED
+    if target_type == CardType.LEADER:
+        return ATTACK_STORM if attacker.has_keyword(EffectType.STORM) else BLOCK_NO_STORM
+    if attacker.is_evolved or attacker.has_keyword(EffectType.RUSH) or attacker.has_keyword(EffectType.STORM):
+        return ATTACK_EVOLVED_RUSH_STORM
+    return BLOCK_SUMMONED_THIS_TURN
+
+
+def attack_block(attacker: Any, target_type: Any) -> Optional[str]:
+    """공격자의 상태 때문에 target_type 대상을 공격할 수 없는 사유를 반환합니다. 공격할 수 있으면 None을 반환합니다."""
+    verdict = attack_verdict(attacker, target_type)
+    return None if verdict in ATTACK_ALLOWED else verdict
+
+
+def target_block(target: Any, ward_on_field: bool) -> Optional[str]:
+    """추종자가 공격 대상이 될 수 없는 사유를 반환합니다. ward_on_field는 대상 쪽 필드에 수호 추종자가 있는지 여부입니다."""
+    if target.has_keyword(EffectType.INTIMIDATE):
+        return BLOCK_INTIMIDATE
+    if target.has_keyword(EffectType.AMBUSH):
+        return BLOCK_AMBUSH
+    if ward_on_field and not target.has_keyword(EffectType.WARD):
+        return BLOCK_WARD
+    return None
@@ -4,6 +4,11 @@ from src.models.card import Card
 from src.common.enums import Zone, CardType, EffectType
 from src.engine.game_state_manager import GameStateManager
 from src.common.effect import Effect
+from src.common.logger import get_logger
+from src.engine.rule_checks import (play_block, engage_block, target_block, BLOCK_NOT_ENOUGH_PP, BLOCK_NO_ENGAGE_EFFECT,
+                                    BLOCK_ALREADY_ENGAGED, BLOCK_INTIMIDATE, BLOCK_AMBUSH)
+
+_log = get_logger("engine.rule")
 
 
 class RuleEngine:
@@ -18,28 +23,23 @@ class RuleEngine:
 
         # 자신의 추종자는 공격 대상으로 선택할 수 없습니다.
         if attacker_card.owner_id == target_card.owner_id:
-            print(f"[LOG] {attacker_card.get_display_name()} (ID: {attacker_card_id})는 자신의 추종자 {target_card.get_display_name()} (ID: {target_card_id})를 공격할 수 없습니다.")
+            _log.info(lambda: f"{attacker_card.get_display_name()} (ID: {attacker_card_id})는 자신의 추종자 {target_card.get_display_name()} (ID: {target_card_id})를 공격할 수 없습니다.")
             return False
 
-        # 위압 - 이 추종자는 공격의 대상이 될 수 없습니다.
-        if target_card.has_keyword(EffectType.INTIMIDATE):
-            print(f"[LOG] {target_card.get_display_name()}은(는) '위압'으로 공격 대상이 될 수 없습니다.")
+        # 위압과 잠복 추종자는 공격 대상이 될 수 없고, 대상 쪽 필드에 수호 추종자가 있으면 수호가 아닌 추종자를 공격할 수 없습니다.
+        has_ward_on_field = self.game_state_manager.zone_has_keyword(target_card.owner_id, Zone.FIELD, EffectType.WARD)
+        reason = target_block(target_card, has_ward_on_field)
+        if reason == BLOCK_INTIMIDATE:
+            _log.info(lambda: f"{target_card.get_display_name()}은(는) '위압'으로 공격 대상이 될 수 없습니다.")
             return False
-
-        # 잠복 - 이 추종자는 공격하기 전까지 공격이나 능력의 대상이 될 수 없습니다.
-        if target_card.has_keyword(EffectType.AMBUSH):
-            print(f"[LOG] {target_card.get_display_name()} (ID: {target_card_id})은(는) '잠복중'으로 공격 대상이 될 수 없습니다.")
+        if reason == BLOCK_AMBUSH:
+            _log.info(lambda: f"{target_card.get_display_name()} (ID: {target_card_id})은(는) '잠복중'으로 공격 대상이 될 수 없습니다.")
             return False
-
-        # 수호 - 상대는 수호가 없는 추종자를 공격할 수 없습니다.
-        # 자신의 전장에 수호 추종자가 있고, 대상 추종자가 수호가 아닐 때
-        opponent_field = self.game_state_manager.get_cards_in_zone(target_card.owner_id, Zone.FIELD)
-        has_ward_on_field = any(f.has_keyword(EffectType.WARD) for f in opponent_field)
-        if has_ward_on_field and not target_card.has_keyword(EffectType.WARD):
-            print(f"[LOG] '수호' 추종자가 필드에 있으므로 {target_card.get_display_name()} (ID: {target_card_id})을(를) 공격할 수 없습니다.")
+        if reason is not None:
+            _log.info(lambda: f"'수호' 추종자가 필드에 있으므로 {target_card.get_display_name()} (ID: {target_card_id})을(를) 공격할 수 없습니다.")
             return False
 
-        print(f"[LOG] {attacker_card.get_display_name()} (ID: {attacker_card_id})가 {target_card.get_display_name()} (ID: {target_card_id})를 공격할 수 있습니다.")
+        _log.info(lambda: f"{attacker_card.get_display_name()} (ID: {attacker_card_id})가 {target_card.get_display_name()} (ID: {target_card_id})를 공격할 수 있습니다.")
         return True  # 기본적으로 공격 가능합니다.
 
     def validate_play_card(self, card_id: str, player_id: str, use_extra_pp: bool) -> bool:
@@ -50,17 +50,18 @@ class RuleEngine:
         current_pp = player.current_pp
         field_count = player.field.size()
 
+        reason = play_block(card.current_cost, card.get_type(), current_pp + (1 if use_extra_pp else 0), field_count)
         # PP 부족
-        if current_pp + (1 if use_extra_pp else 0) < card.current_cost:
-            print(f"[LOG] {player_id}의 PP ({current_pp}) 부족으로 {card.get_display_name()} (ID: {card_id}) 플레이 불가. 필요 PP: {card.current_cost}")
+        if reason == BLOCK_NOT_ENOUGH_PP:
+            _log.info(lambda: f"{player_id}의 PP ({current_pp}) 부족으로 {card.get_display_name()} (ID: {card_id}) 플레이 불가. 필요 PP: {card.current_cost}")
             return False
 
         # 필드 제한 (추종자/마법진)
-        if (card.get_type() in [CardType.FOLLOWER, CardType.AMULET]) and field_count >= 5:
-            print(f"[LOG] {player_id}의 필드 ({field_count}개) 가득 차서 {card.get_display_name()} (ID: {card_id}) 플레이 불가.")
+        if reason is not None:
+            _log.info(lambda: f"{player_id}의 필드 ({field_count}개) 가득 차서 {card.get_display_name()} (ID: {card_id}) 플레이 불가.")
             return False
 
-        print(f"[LOG] {player_id}가 {card.get_display_name()} (ID: {card_id})를 플레이할 수 있습니다.")
+        _log.info(lambda: f"{player_id}가 {card.get_display_name()} (ID: {card_id})를 플레이할 수 있습니다.")
         return True
 
     def validate_engage_card(self, card_id: str, player_id: str) -> bool:
@@ -68,28 +69,25 @@ class RuleEngine:
         card = self.game_state_manager.get_entity_by_id(card_id, Zone.FIELD)
         player = self.game_state_manager.get_entity_by_id(player_id)
         
-        # 활성화 효과가 없는 경우 검증 실패 처리합니다.
         engage_effects = self.game_state_manager.get_card_effects(card_id, EffectType.ENGAGE)
-        if not engage_effects:
-            print(f"[LOG] {card.get_display_name()} (ID: {card_id})는 활성화(Engage) 효과를 가지고 있지 않습니다.")
+        engage_effect: Effect = engage_effects[0] if engage_effects else None
+        reason = engage_block(engage_effect, card.is_engaged, player.current_pp)
+
+        # 활성화 효과가 없는 경우 검증 실패 처리합니다.
+        if reason == BLOCK_NO_ENGAGE_EFFECT:
+            _log.info(lambda: f"{card.get_display_name()} (ID: {card_id})는 활성화(Engage) 효과를 가지고 있지 않습니다.")
             return False
-            
-        engage_effect: Effect = engage_effects[0]
-        
+
         # 이번 턴에 이미 활성화한 상태라면 처리가 불가능합니다.
-        if card.is_engaged:
-            print(f"[LOG] {card.get_display_name()} (ID: {card_id})는 이번 턴에 이미 활성화(Engage)되었습니다.")
+        if reason == BLOCK_ALREADY_ENGAGED:
+            _log.info(lambda: f"{card.get_display_name()} (ID: {card_id})는 이번 턴에 이미 활성화(Engage)되었습니다.")
             return False
 
         # 활성화에 코스트가 존재하고 PP가 부족하면 처리가 불가능합니다.
-        cost = engage_effect.get("cost")
-        if cost is not None:
-            current_pp = player.current_pp
-            # PP가 부족한지 검증합니다.
-            if current_pp < cost:
-                print(f"[LOG] {player_id}의 PP ({current_pp}) 부족으로 {card.get_display_name()} (ID: {card_id}) 활성화 불가. 필요 PP: {cost}")
-                return False
-        print(f"[LOG] {player_id}가 {card.get_display_name()} (ID: {card_id})를 활성화할 수 있습니다.")
+        if reason is not None:
+            _log.info(lambda: f"{player_id}의 PP ({player.current_pp}) 부족으로 {card.get_display_name()} (ID: {card_id}) 활성화 불가. 필요 PP: {engage_effect.get('cost')}")
+            return False
+        _log.info(lambda: f"{player_id}가 {card.get_display_name()} (ID: {card_id})를 활성화할 수 있습니다.")
         return True
 
     def validate_attack(self, attacker_id: str, target_id: str) -> bool:
@@ -98,11 +96,11 @@ class RuleEngine:
         target = self.game_state_manager.get_entity_by_id(target_id)
 
         if not attacker or not target:
-            print(f"[ERROR] validate_attack - 공격자 (ID: {attacker_id}) 또는 대상 (ID: {target_id})을(를) 찾을 수 없습니다.")
+            _log.error(lambda: f"validate_attack - 공격자 (ID: {attacker_id}) 또는 대상 (ID: {target_id})을(를) 찾을 수 없습니다.")
             return False
         # 공격자가 공격 가능한 상태가 아닐 경우 (이미 공격함, 소환됨(돌진, 질주, 진화 예외))
         if not attacker.can_attack(target.get_type()):
-            print(f"[LOG] {attacker.get_display_name()} (ID: {attacker_id})는 {target.get_display_name()} (ID: {target_id})을(를) 공격할 수 없는 상태입니다.")
+            _log.info(lambda: f"{attacker.get_display_name()} (ID: {attacker_id})는 {target.get_display_name()} (ID: {target_id})을(를) 공격할 수 없는 상태입니다.")
             return False
 
         # 타겟팅 규칙 검증
@@ -110,12 +108,11 @@ class RuleEngine:
             return self.can_target_follower(attacker_id, target_id)
         elif target.get_type() == CardType.LEADER:  # 리더 공격
             # 상대의 전장에 수호 추종자 확인
-            opponent_field = self.game_state_manager.get_cards_in_zone(target.player_id, Zone.FIELD)
-            has_ward_on_field = any(f.has_keyword(EffectType.WARD) for f in opponent_field)
+            has_ward_on_field = self.game_state_manager.zone_has_keyword(target.player_id, Zone.FIELD, EffectType.WARD)
             if has_ward_on_field:
-                print(f"[LOG] 상대 필드에 수호 추종자가 있어 리더 ({target.player_id})를 공격할 수 없습니다.")
+                _log.info(lambda: f"상대 필드에 수호 추종자가 있어 리더 ({target.player_id})를 공격할 수 없습니다.")
                 return False
-            print(f"[LOG] {attacker.get_display_name()} (ID: {attacker_id})가 리더 ({target.player_id})를 공격할 수 있습니다.")
+            _log.info(lambda: f"{attacker.get_display_name()} (ID: {attacker_id})가 리더 ({target.player_id})를 공격할 수 있습니다.")
             return True
-        print(f"[ERROR] validate_attack - 알 수 없는 타겟 타입: {target.get_type().value}")
+        _log.error(lambda: f"validate_attack - 알 수 없는 타겟 타입: {target.get_type().value}")
         return False  # 알 수 없는 타겟 타입
\ No newline at end of file
@@ -0,0 +1,26 @@
+# 역할 정의. 게임 국면을 복제하고 되돌리기 위한 간결한 상태 표현을 정의합니다.
+
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from src.common.event import Event
+from src.models.card import Card
+
+
+@dataclass(frozen=True)
+class GameSnapshot:
+    """Game.snapshot이 반환하는 게임 국면 기록입니다.
+    카드와 플레이어 객체는 참조로 보관하고 가변 상태만 복사하므로 같은 Game 인스턴스에서만 복원할 수 있습니다.
+    리스너는 기록하지 않으며 복원할 때 필드의 카드와 문장으로부터 다시 구성합니다."""
+    game_id: int  # 스냅샷을 만든 Game 인스턴스의 식별자입니다.
+    board: Dict[str, Any]  # GameStateManager.snapshot_state의 결과입니다.
+    destroyed_this_turn: Tuple[Card, ...]
+    event_queue: Tuple[Event, ...]
+    rng_state: Tuple[Any, ...]  # 게임 단위 난수 생성기의 상태입니다.
+    decision_rng_state: Optional[Tuple[Any, ...]] = None  # 의사결정 제공자가 난수 생성기를 가지면 그 상태입니다.
+
+
+def get_rng_state(rng: Optional[random.Random]) -> Optional[Tuple[Any, ...]]:
+    """난수 생성기가 있으면 상태를 반환하고 없으면 None을 반환합니다."""
+    return rng.getstate() if isinstance(rng, random.Random) else None
@@ -0,0 +1,142 @@
+# 역할 정의. 게임 국면을 고정 크기 NumPy 배열로 인코딩하여 여러 국면을 한 번에 평가하거나 학습 데이터로 내보내는 인코더입니다.
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from src.common.enums import CardType, EffectType
+from src.common.evaluation import BOARD_WEIGHT, EVALUATION_SCALE, HAND_WEIGHT
+from src.models.field import Field
+from src.models.hand import Hand
+
+FIELD_SLOTS = Field.MAX_FIELD_SIZE  # 진영별 필드 슬롯 수입니다.
+HAND_SLOTS = Hand.MAX_HAND_SIZE  # 진영별 손패 슬롯 수입니다.
+EMPTY_HAND_COST = -1  # 빈 손패 슬롯의 코스트 값입니다.
+
+# 필드 슬롯 특성의 인덱스입니다.
+FIELD_ATTACK = 0
+FIELD_DEFENSE = 1
+FIELD_MAX_DEFENSE = 2
+FIELD_EVOLVED = 3
+FIELD_SUPER_EVOLVED = 4
+FIELD_ENGAGED = 5
+FIELD_SUMMONED = 6
+FIELD_OCCUPIED = 7
+FIELD_FOLLOWER = 8
+FIELD_FEATURES = 9
+
+# 플레이어 특성의 인덱스입니다.
+PLAYER_HP = 0
+PLAYER_MAX_HP = 1
+PLAYER_PP = 2
+PLAYER_MAX_PP = 3
+PLAYER_EP = 4
+PLAYER_SEP = 5
+PLAYER_EXTRA_PP = 6
+PLAYER_HAND_COUNT = 7
+PLAYER_DECK_COUNT = 8
+PLAYER_GRAVEYARD_COUNT = 9
+PLAYER_FEATURES = 10
+
+KEYWORD_TYPES: Tuple[EffectType, ...] = tuple(EffectType)  # 키워드 비트마스크의 비트 순서입니다.
+_KEYWORD_BITS: Dict[EffectType, int] = {keyword: 1 << bit for bit, keyword in enumerate(KEYWORD_TYPES)}
+
+
+def keyword_mask(card: Any) -> int:
+    """카드가 가진 키워드를 KEYWORD_TYPES 순서의 비트마스크로 반환합니다."""
+    mask = 0
+    for keyword in card.get_keywords():
+        mask |= _KEYWORD_BITS[keyword]
+    return mask
+
+
+class StateEncoder:
+    """capacity개 국면을 담는 배열을 미리 할당해 두고 국면을 지정한 위치에 바로 기록하는 인코더입니다.
+
+    모든 배열의 첫 축은 국면 위치이고 둘째 축은 진영으로 0이 인코딩 기준 플레이어, 1이 상대입니다.
+    field (capacity, 2, FIELD_SLOTS, FIELD_FEATURES) int16 - 필드 슬롯별 공격력, 체력, 최대 체력, 진화, 초진화, 공격 완료, 소환된 턴, 점유, 추종자 여부
+    field_keywords (capacity, 2, FIELD_SLOTS) uint64 - 필드 슬롯별 키워드 비트마스크
+    hand_costs (capacity, 2, HAND_SLOTS) int16 - 손패 순서대로의 현재 코스트이며 빈 슬롯은 EMPTY_HAND_COST
+    players (capacity, 2, PLAYER_FEATURES) int16 - 리더 체력, PP, EP, SEP, 엑스트라 PP, 손패와 덱과 묘지 매수
+    상대 손패의 코스트도 그대로 기록하므로 숨은 정보를 가려야 하면 호출한 쪽이 상대 진영의 hand_costs를 지웁니다.
+    """
+
+    def __init__(self, capacity: int):
+        """StateEncoder 클래스의 생성자입니다. capacity개 국면을 담을 배열을 할당합니다."""
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = capacity
+        self.field = np.zeros((capacity, 2, FIELD_SLOTS, FIELD_FEATURES), dtype=np.int16)
+        self.field_keywords = np.zeros((capacity, 2, FIELD_SLOTS), dtype=np.uint64)
+        self.hand_costs = np.full((capacity, 2, HAND_SLOTS), EMPTY_HAND_COST, dtype=np.int16)
+        self.players = np.zeros((capacity, 2, PLAYER_FEATURES), dtype=np.int16)
+
+    def encode(self, index: int, game_state_manager: Any, player_id: str):
+        """game_state_manager의 현재 국면을 player_id 기준으로 index 위치에 기록합니다."""
+        field = self.field
+        field_keywords = self.field_keywords
+        hand_costs = self.hand_costs
+        players = self.players
+        field[index] = 0
+        field_keywords[index] = 0
+        hand_costs[index] = EMPTY_HAND_COST
+        sides = (player_id, game_state_manager.opponent_id[player_id])
+        for side, side_player_id in enumerate(sides):
+            player = game_state_manager.players[side_player_id]
+            players[index, side] = (player.current_defense, player.max_defense, player.current_pp, player.max_pp,
+                                    player.current_ep, player.current_sep, player.extra_pp,
+                                    player.hand.size(), player.deck.size(), player.graveyard.size())
+            for slot, card in enumerate(player.field.get_cards()):
+                field[index, side, slot] = (card.current_attack or 0, card.current_defense or 0, card.max_defense or 0,
+                                            card.is_evolved, card.is_super_evolved, card.is_engaged, card.is_summoned,
+                                            1, card.get_type() == CardType.FOLLOWER)
+                field_keywords[index, side, slot] = keyword_mask(card)
+            costs = [card.current_cost for card in player.hand.get_cards()]
+            if costs:
+                hand_costs[index, side, :len(costs)] = costs
+
+    def encode_many(self, positions: Iterable[Tuple[Any, str]], start: int = 0) -> int:
+        """(게임 상태 관리자, 기준 플레이어 ID) 쌍들을 start 위치부터 차례로 기록하고 기록한 국면 수를 반환합니다.
+        용량을 넘는 국면이 남아 있으면 ValueError를 발생시킵니다."""
+        index = start
+        for game_state_manager, player_id in positions:
+            if index >= self.capacity:
+                raise ValueError(f"StateEncoder capacity {self.capacity} exceeded.")
+            self.encode(index, game_state_manager, player_id)
+            index += 1
+        return index - start
+
+    def heuristic_scores(self, count: Optional[int] = None) -> np.ndarray:
+        """앞 count개 국면의 기준 플레이어 관점 가치를 0과 1 사이 배열로 한 번에 계산합니다.
+        MCTSAgent의 휴리스틱과 같이 승부가 났으면 1, 0, 0.5이고 아니면 리더 체력 차, 필드 추종자 스탯 차, 손패 수 차를 로지스틱 함수로 변환합니다."""
+        count = self.capacity if count is None else count
+        players = self.players[:count].astype(np.float64)
+        field = self.field[:count].astype(np.float64)
+        board = ((field[..., FIELD_ATTACK] + field[..., FIELD_DEFENSE]) * field[..., FIELD_FOLLOWER]).sum(axis=2)
+        my_hp = players[:, 0, PLAYER_HP]
+        opponent_hp = players[:, 1, PLAYER_HP]
+        score = (my_hp - opponent_hp
+                 + BOARD_WEIGHT * (board[:, 0] - board[:, 1])
+                 + HAND_WEIGHT * (players[:, 0, PLAYER_HAND_COUNT] - players[:, 1, PLAYER_HAND_COUNT]))
+        values = 1.0 / (1.0 + np.exp(-score / EVALUATION_SCALE))
+        values = np.where(opponent_hp <= 0, 1.0, values)
+        values = np.where(my_hp <= 0, np.where(opponent_hp <= 0, 0.5, 0.0), values)
+        return values
+
+    def to_matrix(self, count: Optional[int] = None) -> np.ndarray:
+        """앞 count개 국면을 학습용 (count, 특성 수) float32 행렬로 펼칩니다. 키워드 비트마스크는 비트별 0과 1로 풀어 넣습니다."""
+        count = self.capacity if count is None else count
+        bits = np.arange(len(KEYWORD_TYPES), dtype=np.uint64)
+        keyword_bits = (self.field_keywords[:count, ..., None] >> bits) & np.uint64(1)
+        return np.concatenate([
+            self.players[:count].reshape(count, -1),
+            self.field[:count].reshape(count, -1),
+            keyword_bits.reshape(count, -1),
+            self.hand_costs[:count].reshape(count, -1),
+        ], axis=1).astype(np.float32)
+
+    def save(self, path: str, count: Optional[int] = None):
+        """앞 count개 국면의 배열들을 압축된 .npz 파일로 저장합니다."""
+        count = self.capacity if count is None else count
+        np.savez_compressed(path, field=self.field[:count], field_keywords=self.field_keywords[:count],
+                            hand_costs=self.hand_costs[:count], players=self.players[:count])
@@ -1,36 +1,35 @@
 # 역할 정의. 플레이어의 소멸 영역으로 이동한 카드 목록을 관리하는 클래스입니다.
 
-from typing import List
 from src.models.card import Card
+from src.models.zone import CardZone
+from src.common.logger import get_logger
 
+_log = get_logger("model.zone")
 
-class Banished:
+
+class Banished(CardZone):
     """플레이어의 소멸 영역을 관리합니다."""
 
     def __init__(self):
         """Banished 클래스의 생성자입니다."""
-        self._cards: List[Card] = []
+        super().__init__()
 
     def add_card(self, card: Card) -> bool:
         """소멸 영역에 카드를 추가하고 성공 여부를 반환합니다."""
-        self._cards.append(card)
-        print(f"[LOG] 소멸 영역에 카드 {card.get_display_name()} (ID {card.card_id}) 추가됨. 현재 소멸 영역 사이즈 {len(self._cards)}.")
+        self._journal.append(self._cards, card)
+        self._register_card(card)
+        self._keyword_index.add(card)
+        _log.info(lambda: f"소멸 영역에 카드 {card.get_display_name()} (ID {card.card_id}) 추가됨. 현재 소멸 영역 사이즈 {len(self._cards)}.")
         return True
 
     def remove_card(self, card_id: str) -> bool:
         """소멸 영역에서 특정 ID를 가진 카드를 제거합니다."""
         for card in self._cards:
             if card.card_id == card_id:
-                self._cards.remove(card)
-                print(f"[LOG] 소멸 영역에서 카드 {card.get_display_name()} (ID {card_id}) 제거됨. 남은 소멸 영역 사이즈 {len(self._cards)}.")
+                self._journal.remove(self._cards, card)
+                self._keyword_index.remove(card)
+                self._unregister_card(card_id)
+                _log.info(lambda: f"소멸 영역에서 카드 {card.get_display_name()} (ID {card_id}) 제거됨. 남은 소멸 영역 사이즈 {len(self._cards)}.")
                 return True
-        print(f"[LOG] 소멸 영역에서 카드 ID {card_id}를 찾을 수 없어 제거 실패.")
+        _log.info(lambda: f"소멸 영역에서 카드 ID {card_id}를 찾을 수 없어 제거 실패.")
         return False
-
-    def get_cards(self) -> List[Card]:
-        """소멸 영역에 있는 모든 카드의 리스트를 반환합니다."""
-        return list(self._cards)
-
-    def size(self) -> int:
-        """소멸 영역에 있는 카드의 수를 반환합니다."""
-        return len(self._cards)
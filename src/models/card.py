@@ -1,16 +1,61 @@
 # 역할 정의. 게임 내 개별 카드의 인스턴스 데이터와 기본 작동 규칙을 정의하는 클래스입니다.
 
-import copy
 import uuid
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Tuple
 
 from src.common.enums import TargetType, EffectType, CardType, ProcessType
 from src.common.effect import Effect
+from src.common.card_data import ensure_card_references
+from src.common.journal import Journal, DETACHED_JOURNAL
+from src.common.zobrist import ZobristHash
+from src.common.action_cache import ActionCache
+from src.common.logger import get_logger
+from src.engine.rule_checks import (attack_verdict, ATTACK_ALLOWED, ATTACK_NOT_SUMMONED, ATTACK_STORM, ATTACK_EVOLVED_RUSH_STORM,
+                                    BLOCK_DISABLED, BLOCK_ALREADY_ENGAGED, BLOCK_NO_STORM, BLOCK_SUMMONED_THIS_TURN)
+
+_log = get_logger("model.card")
+
+SKYBOUND_ART_TYPES = (EffectType.SKYBOUND_ART, EffectType.SUPER_SKYBOUND_ART)  # 카드별 진화 보너스 게이지를 가지는 효과 타입입니다.
+_SNAPSHOT_SHARED_ATTRS = ('card_data', 'keyword_index')  # 스냅샷에서 복사하지 않는 속성입니다. 정적 데이터와 영역이 관리하는 참조입니다.
+_SNAPSHOT_CONTAINER_ATTRS = ('_keyword_counts', 'activated_abilities', 'fused_cards')  # 스냅샷에서 한 단계 더 복사해야 하는 가변 컨테이너 속성입니다.
+# 국면 해시에 값을 반영하는 카드 속성입니다.
+HASHED_ATTRS = frozenset(('current_cost', 'current_attack', 'current_defense', 'max_defense', 'is_evolved', 'is_super_evolved',
+                          'is_engaged', 'is_summoned', 'countdown_value', 'spellboost_stacks', 'max_attack_count', 'attack_count_this_turn'))
+# 바뀌면 action_facts 캐시를 무효화하는 카드 속성입니다. 행동 생성기가 읽는 코스트, 공격 가능 상태, 효과 목록과 키워드입니다.
+ACTION_ATTRS = frozenset(('current_cost', 'is_evolved', 'is_engaged', 'is_summoned', '_effects', '_keyword_counts'))
+# 공격 판정 사유별로 카드 이름 뒤에 붙여 남기는 로그 문구입니다.
+_ATTACK_VERDICT_MESSAGES = {
+    BLOCK_DISABLED: "는 공격 불가 상태이므로 공격할 수 없습니다.",
+    BLOCK_ALREADY_ENGAGED: "는 이미 공격했습니다.",
+    ATTACK_NOT_SUMMONED: "는 소환된 다음 턴이므로 공격 가능합니다.",
+    ATTACK_STORM: "는 '질주'를 가지고 있어 리더 공격 가능합니다.",
+    BLOCK_NO_STORM: "는 '질주'가 없어 소환된 턴에 리더 공격 불가합니다.",
+    ATTACK_EVOLVED_RUSH_STORM: "는 진화/돌진/질주 상태이므로 추종자 공격 가능합니다.",
+    BLOCK_SUMMONED_THIS_TURN: "는 소환된 턴에 추종자 공격 불가합니다.",
+}
+
+
+def _count_keywords(effects: Iterable[Effect]) -> Dict[EffectType, int]:
+    """효과 목록에서 효과 타입별 개수를 셉니다."""
+    counts: Dict[EffectType, int] = {}
+    for effect in effects:
+        counts[effect.type] = counts.get(effect.type, 0) + 1
+    return counts
 
 
 class Card:
     """게임 내 개별 카드 인스턴스를 관리합니다."""
+    _journal: Journal = DETACHED_JOURNAL  # 게임 상태 변경 저널입니다. 게임 상태 관리자가 카드를 만들 때 연결합니다.
+    _zobrist: ZobristHash = None  # 게임 국면 해시입니다. 게임 상태 관리자가 카드를 만들 때 연결합니다.
+    _action_cache: ActionCache = None  # 합법 행동 구간 캐시입니다. 게임 상태 관리자가 카드를 만들 때 연결합니다.
+    # 행동 생성기가 계산해 둔 카드별 판정 결과입니다. ACTION_ATTRS가 바뀌면 None으로 무효화되며
+    # 일반 속성처럼 저널과 스냅샷에 기록되므로 되돌리기와 복원 후에도 카드 상태와 어긋나지 않습니다.
+    action_facts = None
+
     def __init__(self, card_data: Dict[str, Any], owner_id: str, card_id: str):
+        # 지연 적재된 카드 데이터는 처음 인스턴스화될 때 카드 참조를 해결합니다.
+        if not getattr(card_data, "references_resolved", True):
+            ensure_card_references(card_data)
         self.card_id = card_id  # 고유 ID
         self.card_data = card_data  # CardData에서 로드된 정적 데이터입니다.
         self.owner_id = owner_id
@@ -23,13 +68,22 @@ class Card:
         self.is_engaged = False  # 공격 완료 여부입니다.
         self.is_summoned = True  # 현재 턴 소환 여부입니다.
         self.current_zone = None  # 현재 카드 위치를 의미합니다.
-        self.effects: List[Effect] = copy.deepcopy(card_data.get("effects", []))  # 카드 효과 인스턴스들입니다.
-
-        # 오의와 해방오의 진화 보너스 게이지를 초기화합니다.
-        for effect in self.effects:
-            if effect.type in [EffectType.SKYBOUND_ART, EffectType.SUPER_SKYBOUND_ART]:
-                if not hasattr(effect, "skybound_art_evo_charge"):
-                    effect.skybound_art_evo_charge = 0
+        # 카드 효과 목록입니다. 처음에는 CardData의 효과 목록을 그대로 공유하고 효과가 추가되거나 제거될 때 카드 전용 목록으로 분리합니다.
+        self._effects: List[Effect] = card_data.get("effects", [])
+        self._owns_effects = False
+
+        # 오의와 해방오의 진화 보너스 게이지는 카드마다 따로 누적되므로 해당 효과만 복제하여 게이지를 초기화합니다.
+        if any(effect.type in SKYBOUND_ART_TYPES for effect in self._effects):
+            self._own_effects()
+            for idx, effect in enumerate(self._effects):
+                if effect.type in SKYBOUND_ART_TYPES:
+                    effect = effect.clone()
+                    if not hasattr(effect, "skybound_art_evo_charge"):
+                        effect.skybound_art_evo_charge = 0
+                    self._effects[idx] = effect
+        # 키워드 보유 검사를 상수 시간에 처리하기 위한 효과 타입별 개수입니다. 효과 목록이 바뀔 때마다 함께 갱신합니다.
+        self._keyword_counts = _count_keywords(self._effects)
+        self.keyword_index = None  # 카드가 놓인 영역의 키워드 색인입니다. 키워드를 얻거나 잃으면 이 색인에 알립니다.
 
         # 키워드별 추가 상태들을 설정합니다.
         self.countdown_value = card_data.get("countdown", None)  # 카운트다운 마법진용입니다.
@@ -43,6 +97,107 @@ class Card:
         self.max_attack_count = 1  # 턴당 최대 공격 횟수 제한입니다.
         self.attack_count_this_turn = 0  # 이번 턴 공격한 누적 횟수입니다.
 
+    def __setattr__(self, name: str, value: Any):
+        """속성을 바꿉니다. 게임 저널이 기록 중이면 이전 값을 먼저 기록합니다."""
+        journal = self._journal
+        if journal.active:
+            journal.record_attr(self, name)
+        if name in HASHED_ATTRS and self._zobrist is not None:
+            self._zobrist.replace(self.card_id, name, self.__dict__.get(name), value)
+        if name in ACTION_ATTRS:
+            self.invalidate_action_facts()
+        object.__setattr__(self, name, value)
+
+    def invalidate_action_facts(self):
+        """행동 생성기가 캐시한 판정 결과를 버리고 카드가 놓인 영역의 행동 구간을 무효화하도록 알립니다."""
+        if self.__dict__.get('action_facts') is not None:
+            self.action_facts = None
+        if self._action_cache is not None:
+            self._action_cache.on_card_changed(self.card_id)
+
+    def bind_state_hash(self, zobrist: ZobristHash):
+        """게임 국면 해시를 연결하고 카드의 해시 대상 속성과 보유 키워드를 해시에 넣습니다."""
+        self._zobrist = zobrist
+        zobrist.add_attrs(self.card_id, self, HASHED_ATTRS)
+        for keyword in self._keyword_counts:
+            zobrist.toggle(self.card_id, 'keyword', keyword)
+
+    @property
+    def effects(self) -> List[Effect]:
+        """카드 효과 인스턴스 목록을 반환합니다.
+        CardData와 공유 중일 수 있으므로 목록을 직접 수정하지 말고 add_effect를 쓰거나 새 목록을 대입합니다."""
+        return self._effects
+
+    @effects.setter
+    def effects(self, effects: List[Effect]):
+        """카드 효과 목록을 카드 전용 목록으로 교체합니다."""
+        self._effects = list(effects)
+        self._owns_effects = True
+        old_counts = self._keyword_counts
+        self._keyword_counts = _count_keywords(self._effects)
+        if self.keyword_index is not None:
+            for keyword in old_counts.keys() - self._keyword_counts.keys():
+                self.keyword_index.on_keyword_removed(self, keyword)
+            for keyword in self._keyword_counts.keys() - old_counts.keys():
+                self.keyword_index.on_keyword_added(self, keyword)
+        if self._zobrist is not None:
+            for keyword in old_counts.keys() ^ self._keyword_counts.keys():
+                self._zobrist.toggle(self.card_id, 'keyword', keyword)
+
+    def _own_effects(self):
+        """공유 중인 효과 목록을 카드 전용 목록으로 분리합니다. 효과 객체 자체는 계속 공유합니다."""
+        if not self._owns_effects:
+            self._effects = list(self._effects)
+            self._owns_effects = True
+
+    def add_effect(self, effect: Effect):
+        """카드에 효과를 추가합니다. 공유 중인 목록이면 먼저 카드 전용 목록으로 분리합니다."""
+        self._own_effects()
+        self.invalidate_action_facts()
+        self._journal.append(self._effects, effect)
+        count = self._keyword_counts.get(effect.type, 0)
+        self._journal.set_item(self._keyword_counts, effect.type, count + 1)
+        if count == 0:
+            if self.keyword_index is not None:
+                self.keyword_index.on_keyword_added(self, effect.type)
+            if self._zobrist is not None:
+                self._zobrist.toggle(self.card_id, 'keyword', effect.type)
+
+    def snapshot_state(self) -> Tuple[Dict[str, Any], Tuple[Tuple[Effect, int], ...]]:
+        """카드의 가변 상태를 복원 가능한 형태로 반환합니다.
+        속성 딕셔너리는 얕게 복사하고 가변 컨테이너 속성과 카드 전용 효과 목록만 한 단계 더 복사합니다.
+        효과 객체에 누적되는 진화 보너스 게이지도 함께 기록합니다."""
+        attrs = self.__dict__.copy()
+        for key in _SNAPSHOT_SHARED_ATTRS:
+            attrs.pop(key, None)
+        for key in _SNAPSHOT_CONTAINER_ATTRS:
+            if key in attrs:
+                attrs[key] = attrs[key].copy()
+        charges = ()
+        # 진화 보너스 게이지를 가진 효과는 언제나 카드 전용 목록에 들어 있습니다.
+        if self._owns_effects:
+            attrs['_effects'] = self._effects.copy()
+            charges = tuple((effect, effect.skybound_art_evo_charge) for effect in self._effects
+                            if effect.type in SKYBOUND_ART_TYPES and hasattr(effect, 'skybound_art_evo_charge'))
+        return attrs, charges
+
+    def restore_state(self, state: Tuple[Dict[str, Any], Tuple[Tuple[Effect, int], ...]]):
+        """snapshot_state로 기록한 상태로 카드를 되돌립니다. 스냅샷 이후에 추가된 속성은 제거됩니다.
+        키워드 색인 연결은 끊어지므로 영역을 복원하면서 다시 연결해야 합니다."""
+        attrs, charges = state
+        card_data = self.card_data
+        self.__dict__.clear()
+        self.__dict__.update(attrs)
+        for key in _SNAPSHOT_CONTAINER_ATTRS:
+            if key in attrs:
+                self.__dict__[key] = attrs[key].copy()
+        if self._owns_effects:
+            self._effects = self._effects.copy()
+        self.card_data = card_data
+        self.keyword_index = None
+        for effect, charge in charges:
+            effect.skybound_art_evo_charge = charge
+
     def take_damage(self, amount: int):
         """추종자가 피해를 입는 처리를 담당합니다."""
         # 피해 제한 및 상한 효과가 있는지 검사하여 처리합니다.
@@ -51,57 +206,33 @@ class Card:
                 val = effect.get('value')
                 if isinstance(val, int):
                     if amount > val:
-                        print(f"[LOG] {self.get_display_name()} (ID: {self.card_id})의 피해 제한 효과로 인해 피해가 {amount}에서 {val}으로 감소합니다.")
+                        _log.info(lambda: f"{self.get_display_name()} (ID: {self.card_id})의 피해 제한 효과로 인해 피해가 {amount}에서 {val}으로 감소합니다.")
                         amount = val
         self.current_defense -= amount
-        print(f"[LOG] {self.get_display_name()} (ID: {self.card_id})이(가) {amount} 피해를 입음. 남은 체력: {self.current_defense}")
+        _log.info(lambda: f"{self.get_display_name()} (ID: {self.card_id})이(가) {amount} 피해를 입음. 남은 체력: {self.current_defense}")
         if self.current_defense <= 0:
-            print(f"[LOG] {self.get_display_name()} (ID: {self.card_id})의 체력이 0 이하가 되어 파괴됨.")
+            _log.info(lambda: f"{self.get_display_name()} (ID: {self.card_id})의 체력이 0 이하가 되어 파괴됨.")
             return True  # 파괴됨
         return False
 
     def heal_damage(self, amount: int):
         """추종자가 체력을 회복하는 처리를 담당합니다."""
         self.current_defense = min(self.current_defense+amount, self.max_defense)
-        print(f"[LOG] {self.get_display_name()} (ID: {self.card_id})이(가) {amount} 체력을 회복했습니다. 현재 체력: {self.current_defense}")
+        _log.info(lambda: f"{self.get_display_name()} (ID: {self.card_id})이(가) {amount} 체력을 회복했습니다. 현재 체력: {self.current_defense}")
 
     def can_attack(self, target_type: CardType):
-        """추종자가 지정된 타겟을 공격할 수 있는지 확인합니다."""
-        # 공격 불가 키워드를 가지고 있으면 공격이 불가능합니다.
-        if self.has_keyword(EffectType.DISABLE):
-            print(f"[LOG] {self.get_display_name()} (ID: {self.card_id})는 공격 불가 상태이므로 공격할 수 없습니다.")
-            return False
-
-        # 공격한 턴에는 공격이 불가능합니다.
-        if self.is_engaged:
-            print(f"[LOG] {self.get_display_name()} (ID: {self.card_id})는 이미 공격했습니다.")
-            return False
-
-        # 소환된 다음 턴부터는 제한 없이 가능합니다.
-        if not self.is_summoned:
-            print(f"[LOG] {self.get_display_name()} (ID: {self.card_id})는 소환된 다음 턴이므로 공격 가능합니다.")
-            return True
-
-        # 질주가 아니면 소환된 턴에 리더 공격이 불가능합니다.
-        if target_type == CardType.LEADER:
-            if self.has_keyword(EffectType.STORM):
-                print(f"[LOG] {self.get_display_name()} (ID: {self.card_id})는 '질주'를 가지고 있어 리더 공격 가능합니다.")
-                return True
-            else:
-                print(f"[LOG] {self.get_display_name()} (ID: {self.card_id})는 '질주'가 없어 소환된 턴에 리더 공격 불가합니다.")
-                return False
-
-        # 진화, 돌진, 질주 상태인 경우에만 소환된 턴에 추종자 공격이 가능합니다.
-        if self.is_evolved or self.has_keyword(EffectType.RUSH) or self.has_keyword(EffectType.STORM):
-            print(f"[LOG] {self.get_display_name()} (ID: {self.card_id})는 진화/돌진/질주 상태이므로 추종자 공격 가능합니다.")
-            return True
-        else:
-            print(f"[LOG] {self.get_display_name()} (ID: {self.card_id})는 소환된 턴에 추종자 공격 불가합니다.")
-            return False
+        """추종자가 지정된 타겟을 공격할 수 있는지 확인합니다. 판정 규칙은 rule_checks.attack_verdict를 따르며 판정 사유를 로그로 남깁니다."""
+        verdict = attack_verdict(self, target_type)
+        _log.info(lambda: f"{self.get_display_name()} (ID: {self.card_id}){_ATTACK_VERDICT_MESSAGES[verdict]}")
+        return verdict in ATTACK_ALLOWED
 
     def has_keyword(self, keyword_name: EffectType) -> bool:
         """특정 키워드 능력을 가지고 있는지 확인합니다."""
-        return any(effect.type == keyword_name for effect in self.effects)
+        return keyword_name in self._keyword_counts
+
+    def get_keywords(self) -> List[EffectType]:
+        """카드가 보유한 키워드(효과 타입) 목록을 반환합니다."""
+        return list(self._keyword_counts)
 
     def get_type(self):
         """카드 타입의 정보를 반환합니다."""
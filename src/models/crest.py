@@ -2,6 +2,9 @@
 
 from typing import List, Tuple
 from src.common.enums import EventType
+from src.common.logger import get_logger
+
+_log = get_logger("model.crest")
 
 class Crest:
     """플레이어가 획득하는 문장 효과의 기본 클래스입니다."""
@@ -19,7 +22,7 @@ class Crest:
         """등록했던 모든 리스너들을 이벤트 매니저에서 해제합니다."""
         for event_type, listener_id in self.listeners:
             game.event_manager.unsubscribe(event_type, listener_id)
-        self.listeners.clear()
+        game.game_state_manager.journal.clear_sequence(self.listeners)
 
 
 class MjerrabaineCrest(Crest):
@@ -36,7 +39,6 @@ class MjerrabaineCrest(Crest):
             if event.player_id != self.owner_id:
                 return
             
-            import random
             from src.common.enums import Zone, CardType
             from src.common.event import DestroyedOnFieldEvent
             
@@ -46,7 +48,7 @@ class MjerrabaineCrest(Crest):
             # 아군 전장에 추종자가 단 하나만 존재하는지 확인합니다.
             allied_followers = [c for c in player.field.get_cards() if c.get_type() == CardType.FOLLOWER]
             if len(allied_followers) == 1:
-                print(f"[LOG] {self.name} 문장 효과가 발동합니다.")
+                _log.info(lambda: f"{self.name} 문장 효과가 발동합니다.")
                 opponent = game.game_state_manager.players[opponent_id]
                 
                 # 상대 리더에게 2 피해를 줍니다.
@@ -56,7 +58,7 @@ class MjerrabaineCrest(Crest):
                 opponent_field = game.game_state_manager.get_cards_in_zone(opponent_id, Zone.FIELD)
                 opponent_followers = [c for c in opponent_field if c.get_type() == CardType.FOLLOWER]
                 if opponent_followers:
-                    target_follower = random.choice(opponent_followers)
+                    target_follower = game.rng.choice(opponent_followers)
                     target_follower.take_damage(2)
                     if target_follower.current_defense <= 0:
                         game.game_state_manager.move_card(target_follower.card_id, Zone.FIELD, Zone.GRAVEYARD)
@@ -65,7 +67,7 @@ class MjerrabaineCrest(Crest):
 
         from src.common.listener import Listener
         game.event_manager.subscribe(Listener(listener_id, EventType.TURN_END, on_turn_end))
-        self.listeners.append((EventType.TURN_END, listener_id))
+        game.game_state_manager.journal.append(self.listeners, (EventType.TURN_END, listener_id))
 
 
 def create_crest(name: str, owner_id: str) -> Crest:
@@ -1,40 +1,50 @@
 # 역할 정의. 플레이어의 필드(전장)에 소환된 카드들을 관리하는 클래스입니다.
 
-from typing import List
 from src.models.card import Card  # 상대 경로 임포트입니다.
+from src.models.zone import CardZone
+from src.common.logger import get_logger
 
+_log = get_logger("model.zone")
 
-class Field:
+
+class Field(CardZone):
     """플레이어의 전장을 관리합니다."""
     MAX_FIELD_SIZE = 5  # 전장 최대 크기 설정값입니다.
 
     def __init__(self):
         """Field 클래스의 생성자입니다."""
-        self._cards: List[Card] = []
+        super().__init__()
 
     def add_card(self, card: Card) -> bool:
         """필드에 카드를 추가합니다."""
         if len(self._cards) >= self.MAX_FIELD_SIZE:
-            print(f"[LOG] 필드에 카드 {card.get_display_name()} (ID: {card.card_id}) 추가 실패: 필드 제한 ({self.MAX_FIELD_SIZE}) 초과.")
+            _log.info(lambda: f"필드에 카드 {card.get_display_name()} (ID: {card.card_id}) 추가 실패: 필드 제한 ({self.MAX_FIELD_SIZE}) 초과.")
             return False
-        self._cards.append(card)
-        print(f"[LOG] 필드에 카드 {card.get_display_name()} (ID: {card.card_id}) 추가됨. 현재 필드 사이즈: {len(self._cards)}")
+        self._journal.append(self._cards, card)
+        self._register_card(card)
+        self._keyword_index.add(card)
+        _log.info(lambda: f"필드에 카드 {card.get_display_name()} (ID: {card.card_id}) 추가됨. 현재 필드 사이즈: {len(self._cards)}")
         return True
 
     def remove_card(self, card_id: str) -> bool:
         """필드에서 특정 ID를 가진 카드를 제거합니다."""
         for card in self._cards:
             if card.card_id == card_id:
-                self._cards.remove(card)
-                print(f"[LOG] 필드에서 카드 {card.get_display_name()} (ID: {card_id}) 제거됨. 남은 필드 사이즈: {len(self._cards)}")
+                self._journal.remove(self._cards, card)
+                self._keyword_index.remove(card)
+                self._unregister_card(card_id)
+                _log.info(lambda: f"필드에서 카드 {card.get_display_name()} (ID: {card_id}) 제거됨. 남은 필드 사이즈: {len(self._cards)}")
                 return True
-        print(f"[LOG] 필드에서 카드 ID {card_id}를 찾을 수 없어 제거 실패.")
+        _log.info(lambda: f"필드에서 카드 ID {card_id}를 찾을 수 없어 제거 실패.")
         return False
 
-    def get_cards(self) -> List[Card]:
-        """필드에 있는 모든 카드의 리스트를 반환합니다."""
-        return list(self._cards)
-
-    def size(self) -> int:
-        """필드에 있는 카드의 수를 반환합니다."""
-        return len(self._cards)
\ No newline at end of file
+    def replace_card(self, old_card: Card, new_card: Card):
+        """필드의 기존 카드 자리에 새 카드를 배치합니다. 기존 카드가 없으면 새 카드를 끝에 추가합니다."""
+        if old_card in self._cards:
+            self._journal.replace(self._cards, self._cards.index(old_card), new_card)
+            self._keyword_index.remove(old_card)
+            self._unregister_card(old_card.card_id)
+        else:
+            self._journal.append(self._cards, new_card)
+        self._register_card(new_card)
+        self._keyword_index.add(new_card)
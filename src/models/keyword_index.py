@@ -0,0 +1,72 @@
+# 역할 정의. 영역에 놓인 카드들을 키워드(효과 타입)별 card_id 버킷으로 색인하는 클래스입니다.
+
+from typing import Dict, Iterable, List, Set
+from src.common.enums import EffectType
+from src.models.card import Card
+from src.common.journal import Journal, DETACHED_JOURNAL
+
+
+class KeywordIndex:
+    """영역 하나의 키워드별 card_id 버킷을 관리합니다.
+    영역에 카드가 들어오거나 나갈 때 갱신하고 카드가 영역에 있는 동안 키워드를 얻거나 잃으면 카드가 직접 알려줍니다."""
+
+    _journal: Journal = DETACHED_JOURNAL  # 게임 상태 변경 저널입니다. 영역이 저널에 연결될 때 함께 연결합니다.
+
+    def __init__(self):
+        """KeywordIndex 클래스의 생성자입니다."""
+        self._buckets: Dict[EffectType, Set[str]] = {}
+
+    def bind_journal(self, journal: Journal):
+        """게임 상태 변경 저널을 연결합니다."""
+        self._journal = journal
+
+    def add(self, card: Card):
+        """카드를 보유 키워드의 버킷에 등록하고 키워드 변경 통지를 받도록 연결합니다."""
+        card.keyword_index = self
+        for keyword in card.get_keywords():
+            self.on_keyword_added(card, keyword)
+
+    def remove(self, card: Card):
+        """카드를 모든 버킷에서 제거하고 이 색인과의 연결을 끊습니다."""
+        if card.keyword_index is self:
+            card.keyword_index = None
+        for keyword in card.get_keywords():
+            self.on_keyword_removed(card, keyword)
+
+    def on_keyword_added(self, card: Card, keyword: EffectType):
+        """카드가 키워드를 새로 얻었을 때 해당 버킷에 추가합니다."""
+        bucket = self._buckets.get(keyword)
+        if bucket is None:
+            bucket = self._buckets[keyword] = set()
+        self._journal.set_add(bucket, card.card_id)
+
+    def on_keyword_removed(self, card: Card, keyword: EffectType):
+        """카드가 키워드를 모두 잃었을 때 해당 버킷에서 제거합니다."""
+        bucket = self._buckets.get(keyword)
+        if bucket:
+            self._journal.set_discard(bucket, card.card_id)
+
+    def copy(self) -> 'KeywordIndex':
+        """버킷을 복사한 새 색인을 반환합니다. 카드와의 연결은 복사하지 않습니다."""
+        index = KeywordIndex()
+        index._journal = self._journal
+        index._buckets = {keyword: bucket.copy() for keyword, bucket in self._buckets.items() if bucket}
+        return index
+
+    def attach(self, cards: Iterable[Card]):
+        """버킷을 다시 계산하지 않고 카드들의 키워드 변경 통지만 이 색인으로 연결합니다."""
+        for card in cards:
+            card.keyword_index = self
+
+    def has_keyword(self, keyword: EffectType) -> bool:
+        """키워드를 가진 카드가 하나라도 있는지 상수 시간에 확인합니다."""
+        return bool(self._buckets.get(keyword))
+
+    def get_card_ids(self, keyword: EffectType, cards: Iterable[Card]) -> List[str]:
+        """키워드를 가진 카드의 ID 목록을 영역 내 순서대로 반환합니다. 버킷이 비었거나 하나뿐이면 영역을 순회하지 않습니다."""
+        bucket = self._buckets.get(keyword)
+        if not bucket:
+            return []
+        if len(bucket) == 1:
+            return list(bucket)
+        return [card.card_id for card in cards if card.card_id in bucket]
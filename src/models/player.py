@@ -1,6 +1,7 @@
 # 역할 정의. 게임에 참여하는 각 플레이어 리더의 체력, PP, EP/SEP 자원 및 덱, 패, 전장, 묘지 영역의 총합 상태를 관리하는 클래스입니다.
 
-from typing import List
+import random
+from typing import Any, Dict, List
 
 import src.common.card_data as card_data
 from src.models.card import Card
@@ -12,14 +13,32 @@ from src.models.field import Field
 from src.models.graveyard import Graveyard
 from src.models.banished import Banished
 from src.common.effect import Effect
+from src.common.journal import Journal, DETACHED_JOURNAL
+from src.common.zobrist import ZobristHash
+from src.common.action_cache import ActionCache
+from src.common.logger import get_logger
+
+_log = get_logger("model.player")
+
+# 스냅샷에서 일반 속성으로 복사하지 않는 속성입니다. 영역과 효과, 문장은 따로 기록하고 나머지는 게임 내내 공유되는 참조입니다.
+_SNAPSHOT_SHARED_ATTRS = ('event_manager', 'card_data', 'effects', 'crests', 'hand', 'graveyard', 'field', 'deck',
+                          'banished', 'zone_dict', '_entity_index', '_journal', '_zobrist', '_action_cache')
+# 국면 해시에 값을 반영하는 플레이어 속성입니다.
+HASHED_ATTRS = frozenset(('current_defense', 'max_defense', 'current_pp', 'max_pp', 'current_ep', 'current_sep', 'extra_pp',
+                          'spent_ep_in_turn', 'combo_count', 'rally_count', 'evolution_count'))
+# 바뀌면 행동 캐시에 알리는 플레이어 자원 속성입니다. 행동 생성기가 읽는 PP, 엑스트라 PP, EP, SEP입니다.
+RESOURCE_ATTRS = frozenset(('current_pp', 'extra_pp', 'current_ep', 'current_sep', 'spent_ep_in_turn'))
 
 class Player:
     """개별 플레이어의 상태와 자원을 관리합니다."""
     STARTING_LEADER_HP = 20  # 초기 리더의 체력 기준값입니다.
     MAX_PP = 10  # 최대 플레이 포인트 기준값입니다.
+    _journal: Journal = DETACHED_JOURNAL  # 게임 상태 변경 저널입니다. 게임 상태 관리자에 등록될 때 연결합니다.
+    _zobrist: ZobristHash = None  # 게임 국면 해시입니다. 게임 상태 관리자에 등록될 때 연결합니다.
+    _action_cache: ActionCache = None  # 합법 행동 구간 캐시입니다. 게임 상태 관리자에 등록될 때 연결합니다.
 
-    def __init__(self, player_id: str, event_manager: EventManager):
-        """Player 클래스의 생성자입니다."""
+    def __init__(self, player_id: str, event_manager: EventManager, rng: random.Random = None):
+        """Player 클래스의 생성자입니다. rng는 덱 셔플에 사용할 게임 단위 난수 생성기입니다."""
         self.player_id = player_id
         self.current_defense = self.STARTING_LEADER_HP
         self.max_defense = self.STARTING_LEADER_HP
@@ -45,7 +64,7 @@ class Player:
         self.hand = Hand()
         self.graveyard = Graveyard()
         self.field = Field()
-        self.deck = Deck([])  # 덱은 게임 시작 시 동적으로 할당됩니다.
+        self.deck = Deck([], rng=rng)  # 덱은 게임 시작 시 동적으로 할당됩니다.
         self.banished = Banished()
         self.zone_dict = {
             Zone.HAND: self.hand,
@@ -54,6 +73,79 @@ class Player:
             Zone.DECK: self.deck,
             Zone.BANISHED: self.banished
         }
+        self._entity_index = None  # 게임 상태 관리자의 엔티티 색인 참조입니다.
+
+    def bind_entity_index(self, entity_index: dict):
+        """모든 영역을 게임 상태 관리자의 엔티티 색인에 연결합니다."""
+        self._entity_index = entity_index
+        for zone, zone_obj in self.zone_dict.items():
+            zone_obj.bind_entity_index(entity_index, self.player_id, zone)
+
+    def bind_journal(self, journal: Journal):
+        """게임 상태 변경 저널을 플레이어와 모든 영역에 연결합니다."""
+        self._journal = journal
+        for zone_obj in self.zone_dict.values():
+            zone_obj.bind_journal(journal)
+
+    def __setattr__(self, name: str, value: Any):
+        """속성을 바꿉니다. 게임 저널이 기록 중이면 이전 값을 먼저 기록합니다."""
+        journal = self._journal
+        if journal.active:
+            journal.record_attr(self, name)
+        if name in HASHED_ATTRS and self._zobrist is not None:
+            self._zobrist.replace(self.player_id, name, self.__dict__.get(name), value)
+        if name in RESOURCE_ATTRS and self._action_cache is not None:
+            self._action_cache.on_resources_changed(self.player_id)
+        object.__setattr__(self, name, value)
+
+    def bind_state_hash(self, zobrist: ZobristHash):
+        """게임 국면 해시를 연결하고 플레이어의 해시 대상 속성을 해시에 넣습니다."""
+        self._zobrist = zobrist
+        zobrist.add_attrs(self.player_id, self, HASHED_ATTRS)
+
+    def bind_action_cache(self, action_cache: ActionCache):
+        """합법 행동 구간 캐시를 연결합니다. 자원 속성이 바뀔 때마다 캐시에 알립니다."""
+        self._action_cache = action_cache
+
+    def replace_deck(self, new_deck: Deck):
+        """덱을 새 덱으로 교체하고 엔티티 색인을 갱신합니다."""
+        new_deck.bind_journal(self._journal)
+        if self._entity_index is not None:
+            for card in self.deck.get_cards():
+                self._journal.pop_item(self._entity_index, card.card_id)
+            new_deck.bind_entity_index(self._entity_index, self.player_id, Zone.DECK)
+        self.deck = new_deck
+        self._journal.set_item(self.zone_dict, Zone.DECK, new_deck)
+
+    def snapshot_state(self) -> Dict[str, Any]:
+        """플레이어의 자원 수치, 효과 목록, 문장 카운트, 각 영역의 카드 순서를 복원 가능한 형태로 반환합니다."""
+        return {
+            'attrs': {key: value for key, value in self.__dict__.items() if key not in _SNAPSHOT_SHARED_ATTRS},
+            'effects': (self.effects, tuple(self.effects)),
+            'crests': tuple((crest, crest.count) for crest in self.crests),
+            'zones': tuple((zone, zone_obj, zone_obj.snapshot_state()) for zone, zone_obj in self.zone_dict.items()),
+        }
+
+    def restore_state(self, state: Dict[str, Any]):
+        """snapshot_state로 기록한 상태로 플레이어를 되돌립니다.
+        효과 목록은 리더 CardData와 공유할 수 있으므로 기록해 둔 목록 객체에 내용을 다시 채웁니다.
+        문장의 리스너는 복원하지 않으므로 게임이 리스너를 다시 구성해야 합니다."""
+        self.__dict__.update(state['attrs'])
+        effects_list, effects = state['effects']
+        effects_list[:] = effects
+        self.effects = effects_list
+        self.crests = []
+        for crest, count in state['crests']:
+            crest.count = count
+            self.crests.append(crest)
+        for zone, zone_obj, zone_state in state['zones']:
+            self.zone_dict[zone] = zone_obj
+            zone_obj.restore_state(zone_state)
+        self.hand = self.zone_dict[Zone.HAND]
+        self.graveyard = self.zone_dict[Zone.GRAVEYARD]
+        self.field = self.zone_dict[Zone.FIELD]
+        self.deck = self.zone_dict[Zone.DECK]
+        self.banished = self.zone_dict[Zone.BANISHED]
 
     def take_damage(self, amount: int):
         """리더가 피해를 입었을 때의 처리를 담당합니다."""
@@ -63,83 +155,83 @@ class Player:
                 val = effect.get('value')
                 if isinstance(val, int):
                     if amount > val:
-                        print(f"[LOG] {self.player_id} 리더의 피해 상한 효과로 인해 피해가 {amount}에서 {val}으로 감소합니다.")
+                        _log.info(lambda: f"{self.player_id} 리더의 피해 상한 효과로 인해 피해가 {amount}에서 {val}으로 감소합니다.")
                         amount = val
         self.current_defense -= amount
-        print(f"[LOG] {self.player_id} 리더가 {amount} 피해를 입었습니다. 현재 체력: {self.current_defense}")
+        _log.info(lambda: f"{self.player_id} 리더가 {amount} 피해를 입었습니다. 현재 체력: {self.current_defense}")
         if self.current_defense <= 0:
-            print(f"[LOG] {self.player_id} 리더의 체력이 0 이하가 되어 게임 종료 조건 충족.")
+            _log.info(lambda: f"{self.player_id} 리더의 체력이 0 이하가 되어 게임 종료 조건 충족.")
             return True  # 게임 종료
         return False
 
     def heal_damage(self, amount: int):
         """리더가 체력을 회복했을 때의 처리를 담당합니다."""
         self.current_defense = min(self.current_defense+amount, self.max_defense)
-        print(f"[LOG] {self.player_id} 리더가 {amount} 체력을 회복했습니다. 현재 체력: {self.current_defense}")
+        _log.info(lambda: f"{self.player_id} 리더가 {amount} 체력을 회복했습니다. 현재 체력: {self.current_defense}")
 
     def gain_pp(self, amount: int):
         """PP가 회복되었을 때의 처리를 담당합니다."""
         self.current_pp = min(self.current_pp + amount, self.max_pp)
-        print(f"[LOG] {self.player_id} PP가 {amount} 증가했습니다. 현재 PP: {self.current_pp}")
+        _log.info(lambda: f"{self.player_id} PP가 {amount} 증가했습니다. 현재 PP: {self.current_pp}")
 
     def spend_pp(self, amount: int):
         """PP가 소모되었을 때의 처리를 담당합니다."""
         if self.current_pp >= amount:
             self.current_pp -= amount
-            print(f"[LOG] {self.player_id} PP {amount} 소모. 남은 PP: {self.current_pp}")
+            _log.info(lambda: f"{self.player_id} PP {amount} 소모. 남은 PP: {self.current_pp}")
             return
 
         if self.current_pp + self.extra_pp >= amount:
-            print(f"[LOG] {self.player_id} PP {self.current_pp} 소모. 남은 PP: {0}")
+            _log.info(lambda: f"{self.player_id} PP {self.current_pp} 소모. 남은 PP: {0}")
             extra_amount = amount - self.current_pp
             self.current_pp = 0
             self.spend_extra_pp(extra_amount)
             return
 
-        print(f"[ERROR] 처리 불가능한 PP 사용 요청! 남은 PP: {self.current_pp} 요청 PP: {amount}")
+        _log.error(lambda: f"처리 불가능한 PP 사용 요청! 남은 PP: {self.current_pp} 요청 PP: {amount}")
 
     def refresh_pp(self):
         """PP가 전부 회복되었을 때의 처리를 담당합니다."""
         amount = self.max_pp - self.current_pp
         self.current_pp = self.max_pp
-        print(f"[LOG] {self.player_id} PP가 {amount} 증가했습니다. 현재 PP: {self.current_pp}")
+        _log.info(lambda: f"{self.player_id} PP가 {amount} 증가했습니다. 현재 PP: {self.current_pp}")
 
     def gain_epp(self, amount: int):
         """EPP가 회복되었을 때의 처리를 담당합니다."""
         self.extra_pp = min(self.extra_pp + amount, self.max_extra_pp)
-        print(f"[LOG] {self.player_id} EPP가 {amount} 증가했습니다. 현재 EPP: {self.extra_pp}")
+        _log.info(lambda: f"{self.player_id} EPP가 {amount} 증가했습니다. 현재 EPP: {self.extra_pp}")
 
     def spend_extra_pp(self, amount: int) -> bool:
         """EPP를 사용했을 때의 처리를 담당합니다."""
         if self.extra_pp >= amount:
             self.extra_pp -= amount
-            print(f"[LOG] {self.player_id} EXTRA PP {amount} 소모. 남은 EXTRA PP: {self.extra_pp}")
+            _log.info(lambda: f"{self.player_id} EXTRA PP {amount} 소모. 남은 EXTRA PP: {self.extra_pp}")
 
     def gain_ep(self, amount: int):
         """EP가 회복되었을 때의 처리를 담당합니다."""
         self.current_ep = min(self.current_ep+amount, self.max_ep)
-        print(f"[LOG] {self.player_id} 진화 포인트 {amount} 획득. 현재 EP: {self.current_ep}")
+        _log.info(lambda: f"{self.player_id} 진화 포인트 {amount} 획득. 현재 EP: {self.current_ep}")
 
     def spend_ep(self, amount: int):
         """EP가 소모되었을 때의 처리를 담당합니다."""
         if self.current_ep >= amount:
             self.current_ep -= amount
-            print(f"[LOG] {self.player_id} EP {amount} 소모. 남은 EP: {self.current_ep}")
+            _log.info(lambda: f"{self.player_id} EP {amount} 소모. 남은 EP: {self.current_ep}")
         else:
-            print(f"[ERROR] 처리 불가능한 EP 사용 요청! 남은 EP: {self.current_ep} 요청 EP: {amount}")
+            _log.error(lambda: f"처리 불가능한 EP 사용 요청! 남은 EP: {self.current_ep} 요청 EP: {amount}")
 
     def gain_sep(self, amount: int):
         """SEP가 회복되었을 때의 처리를 담당합니다."""
         self.current_sep = min(self.current_sep+amount, self.max_sep)
-        print(f"[LOG] {self.player_id} 초진화 포인트 {amount} 획득. 현재 SEP: {self.current_sep}")
+        _log.info(lambda: f"{self.player_id} 초진화 포인트 {amount} 획득. 현재 SEP: {self.current_sep}")
 
     def spend_sep(self, amount: int):
         """SEP가 소모되었을 때의 처리를 담당합니다."""
         if self.current_sep >= amount:
             self.current_sep -= amount
-            print(f"[LOG] {self.player_id} SEP {amount} 소모. 남은 SEP: {self.current_sep}")
+            _log.info(lambda: f"{self.player_id} SEP {amount} 소모. 남은 SEP: {self.current_sep}")
         else:
-            print(f"[ERROR] 처리 불가능한 SEP 사용 요청! 남은 SEP: {self.current_sep} 요청 SEP: {amount}")
+            _log.error(lambda: f"처리 불가능한 SEP 사용 요청! 남은 SEP: {self.current_sep} 요청 SEP: {amount}")
 
     @property
     def is_overflow(self) -> bool:
@@ -160,4 +252,8 @@ class Player:
 
     def has_keyword(self, effect_type: EffectType):
         """보유한 효과 중 해당 키워드가 존재하는지 검사합니다."""
-        return any(effect.type == effect_type for effect in self.effects)
\ No newline at end of file
+        return any(effect.type == effect_type for effect in self.effects)
+
+    def add_effect(self, effect: Effect):
+        """리더에게 효과를 추가합니다."""
+        self._journal.append(self.effects, effect)
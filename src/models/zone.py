@@ -0,0 +1,75 @@
+# 역할 정의. 덱, 패, 필드, 묘지, 소멸 영역이 공유하는 카드 목록 관리, 엔티티 색인과 키워드 색인 연결, 저널 연결, 스냅샷을 정의하는 영역 기반 클래스입니다.
+
+from typing import List, Tuple
+from src.common.enums import EffectType, Zone
+from src.models.card import Card
+from src.models.keyword_index import KeywordIndex
+from src.common.journal import Journal, DETACHED_JOURNAL
+
+
+class CardZone:
+    """카드를 순서대로 담는 영역의 기반 클래스입니다.
+    카드를 넣고 뺄 때 게임 상태 관리자의 엔티티 색인에 (카드, 소유자 ID, 영역)을 함께 등록하고 지우며
+    영역 안 카드의 키워드별 버킷을 유지하여 키워드 보유 검사를 카드 수와 무관하게 처리합니다.
+    스냅샷에는 카드 순서와 키워드 색인 사본만 담고 엔티티 색인은 게임 상태 관리자가 따로 복원합니다."""
+    _journal: Journal = DETACHED_JOURNAL  # 게임 상태 변경 저널입니다. 플레이어가 게임 상태 관리자에 등록될 때 연결합니다.
+
+    def __init__(self, cards: List[Card] = None):
+        """CardZone 클래스의 생성자입니다. cards는 처음 담을 카드 목록이며 복사하지 않고 그대로 씁니다."""
+        self._cards: List[Card] = cards if cards is not None else []
+        self._entity_index = None  # 게임 상태 관리자의 엔티티 색인 참조입니다.
+        self._owner_id = None
+        self._zone = None
+        self._keyword_index = KeywordIndex()  # 영역 내 카드의 키워드별 card_id 버킷입니다.
+        for card in self._cards:
+            self._keyword_index.add(card)
+
+    def bind_journal(self, journal: Journal):
+        """게임 상태 변경 저널을 영역과 영역의 키워드 색인에 연결합니다."""
+        self._journal = journal
+        self._keyword_index.bind_journal(journal)
+
+    def bind_entity_index(self, entity_index: dict, owner_id: str, zone: Zone):
+        """게임 상태 관리자의 엔티티 색인을 연결하고 현재 영역의 카드들을 등록합니다."""
+        self._entity_index = entity_index
+        self._owner_id = owner_id
+        self._zone = zone
+        for card in self._cards:
+            self._journal.set_item(entity_index, card.card_id, (card, owner_id, zone))
+
+    def _register_card(self, card: Card):
+        """엔티티 색인이 연결되어 있으면 카드를 이 영역의 항목으로 등록합니다."""
+        if self._entity_index is not None:
+            self._journal.set_item(self._entity_index, card.card_id, (card, self._owner_id, self._zone))
+
+    def _unregister_card(self, card_id: str):
+        """엔티티 색인이 연결되어 있으면 카드 항목을 지웁니다."""
+        if self._entity_index is not None:
+            self._journal.pop_item(self._entity_index, card_id)
+
+    def snapshot_state(self) -> Tuple[Tuple[Card, ...], KeywordIndex]:
+        """스냅샷용으로 영역의 카드 순서와 키워드 색인 사본을 반환합니다."""
+        return tuple(self._cards), self._keyword_index.copy()
+
+    def restore_state(self, state: Tuple[Tuple[Card, ...], KeywordIndex]):
+        """스냅샷의 카드 순서로 영역을 되돌리고 키워드 색인을 연결합니다. 엔티티 색인은 게임 상태 관리자가 복원합니다."""
+        cards, keyword_index = state
+        self._cards = list(cards)
+        self._keyword_index = keyword_index.copy()
+        self._keyword_index.attach(self._cards)
+
+    def has_card_with_keyword(self, keyword: EffectType) -> bool:
+        """영역에 해당 키워드를 가진 카드가 있는지 반환합니다."""
+        return self._keyword_index.has_keyword(keyword)
+
+    def get_card_ids_with_keyword(self, keyword: EffectType) -> List[str]:
+        """영역에서 해당 키워드를 가진 카드의 ID 목록을 영역 내 순서대로 반환합니다."""
+        return self._keyword_index.get_card_ids(keyword, self._cards)
+
+    def get_cards(self) -> List[Card]:
+        """영역에 있는 모든 카드의 리스트를 반환합니다."""
+        return list(self._cards)
+
+    def size(self) -> int:
+        """영역에 있는 카드의 수를 반환합니다."""
+        return len(self._cards)
@@ -0,0 +1,90 @@
+# 역할 정의. 테스트에서 실제 카드 데이터베이스와 덱으로 헤드리스 게임을 만들고 무작위 행동으로 진행하는 도우미 함수들을 정의합니다.
+
+import os
+import random
+from typing import Any, Iterator, List, Tuple
+
+import src.common.card_data as card_data
+from src.models.card import HASHED_ATTRS as CARD_HASHED_ATTRS
+from src.models.player import HASHED_ATTRS as PLAYER_HASHED_ATTRS
+from src.common.deck_utils import load_deck_card_ids
+from src.common.logger import configure_logging
+from src.engine.decision_provider import RandomDecisionProvider
+from src.engine.main_game_logic import Game
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CARD_DB_PATH = os.path.join(REPO_ROOT, 'card_database', '3_parsed_database', 'card_database_parsed.json')
+DECK_PATHS = (os.path.join(REPO_ROOT, 'decks', '리셰나_네메시스.json'), os.path.join(REPO_ROOT, 'decks', '밀티오_나이트메어.json'))
+# 예제 덱에서 엔진 오류를 일으키는 카드를 같은 직업의 카드로 바꾸는 대체 표입니다.
+# 10771310은 효과 처리 중 Process에 value가 없어 실패하고 10474120은 선택 효과에 choices가 없어 실패합니다.
+DECK_SUBSTITUTES = {'10771310': '10071310', '10474120': '10071130'}
+GAME_SEEDS = tuple(range(8))  # 대체한 덱으로 모두 엔진 오류 없이 승부가 나는 테스트 게임 시드입니다.
+MAX_GAME_ROUNDS = 1000  # 한 게임에서 game_rounds가 내주는 최대 라운드 수입니다. 넘으면 게임이 끝나지 않는 것으로 봅니다.
+
+
+def load_cards():
+    """카드 데이터베이스를 한 번만 적재합니다. 엔진 로그는 끕니다."""
+    configure_logging("OFF")
+    if not card_data.BASIC_CARD_DATABASE:
+        card_data.load_card_databases(CARD_DB_PATH)
+
+
+def load_deck(path: str) -> List[Any]:
+    """덱 파일의 card_id 목록을 DECK_SUBSTITUTES로 대체한 뒤 CardData 목록으로 바꿉니다."""
+    return [card_data.get_card_data_by_id(DECK_SUBSTITUTES.get(card_id, card_id)) for card_id in load_deck_card_ids(path)]
+
+
+def create_game(seed: int) -> Game:
+    """두 예제 덱으로 시드를 고정한 헤드리스 게임을 만듭니다."""
+    load_cards()
+    return Game("player1", "player2", load_deck(DECK_PATHS[0]), load_deck(DECK_PATHS[1]),
+                decision_provider=RandomDecisionProvider(rng=random.Random(seed)), headless=True, seed=seed)
+
+
+def game_rounds(seeds: Tuple[int, ...] = GAME_SEEDS) -> Iterator[Tuple[int, Game, random.Random]]:
+    """시드마다 새 게임과 같은 시드의 행동 선택 난수 생성기를 만들어 게임이 끝날 때까지 (시드, 게임, 난수 생성기)를 반복해서 내줍니다.
+    받는 쪽은 라운드마다 검사를 하고 행동을 하나 이상 적용해야 하며 MAX_GAME_ROUNDS 안에 끝나지 않으면 AssertionError를 발생시킵니다."""
+    for seed in seeds:
+        game = create_game(seed)
+        rng = random.Random(seed)
+        for _ in range(MAX_GAME_ROUNDS):
+            if game.is_game_over():
+                break
+            yield seed, game, rng
+        else:
+            raise AssertionError(f"seed {seed} 게임이 {MAX_GAME_ROUNDS} 라운드 안에 끝나지 않았습니다.")
+
+
+def play_random_actions(game: Game, rng: random.Random, steps: int) -> List[Tuple[str, Tuple[Any, ...]]]:
+    """현재 턴 플레이어의 가능한 행동 중 하나를 무작위로 골라 최대 steps번 적용하고 적용한 (플레이어 ID, 행동) 목록을 반환합니다."""
+    applied = []
+    for _ in range(steps):
+        if game.is_game_over():
+            break
+        player_id = game.game_state_manager.current_turn_player_id
+        game.process_player_choice()
+        action = rng.choice(game.legal_actions(player_id))
+        game.apply_action(player_id, action)
+        applied.append((player_id, action))
+    return applied
+
+
+def board_fingerprint(game: Game) -> Tuple[Any, ...]:
+    """국면을 비교할 수 있는 튜플로 요약합니다.
+    영역별 카드 순서와 카드 상태, 영역의 키워드 버킷, 묘지 그림자 수, 플레이어 자원, 엔티티 색인, 턴 진행 정보, 국면 해시를 담습니다."""
+    gsm = game.game_state_manager
+    players = []
+    for player_id, player in sorted(gsm.players.items()):
+        zones = []
+        for zone, zone_obj in player.zone_dict.items():
+            cards = tuple((card.card_id, tuple(card.__dict__.get(name) for name in sorted(CARD_HASHED_ATTRS)),
+                           tuple(sorted((keyword.name, count) for keyword, count in card._keyword_counts.items())))
+                          for card in player.get_cards_in_zone(zone))
+            keyword_index = getattr(zone_obj, '_keyword_index', None)
+            buckets = () if keyword_index is None else tuple(sorted(
+                (keyword.name, tuple(sorted(bucket))) for keyword, bucket in keyword_index._buckets.items() if bucket))
+            zones.append((zone.name, cards, buckets))
+        resources = tuple(player.__dict__.get(name) for name in sorted(PLAYER_HASHED_ATTRS))
+        players.append((player_id, tuple(zones), resources, player.graveyard.shadows_count))
+    entity_index = tuple(sorted((card_id, owner_id, zone.name) for card_id, (_, owner_id, zone) in gsm._entity_index.items()))
+    return tuple(players), entity_index, gsm.turn_number, gsm.current_turn_player_id, gsm.game_phase, gsm.state_hash
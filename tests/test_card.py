@@ -0,0 +1,133 @@
+# 역할 정의. 카드 인스턴스의 효과 목록 copy-on-write 동작과 키워드 개수 표를 검증하는 테스트 클래스입니다.
+
+import unittest
+
+import src.common.card_data as card_data
+from src.common.effect import Effect
+from src.common.journal import Journal
+from src.common.enums import EffectType
+from src.models.card import Card, SKYBOUND_ART_TYPES
+from tests.game_helper import load_cards
+
+WARD_CARD_ID = '10001120'  # 수호, 유언, 진화시 효과를 가진 카드입니다.
+SKYBOUND_CARD_ID = '10413310'  # 해방오의와 다른 효과들을 함께 가진 카드입니다.
+
+
+class TestCardEffectsCopyOnWrite(unittest.TestCase):
+    """Card.effects의 공유와 분리를 검증하는 클래스입니다."""
+
+    def setUp(self):
+        """실제 카드 데이터베이스를 적재합니다."""
+        load_cards()
+
+    def test_shared_until_changed(self):
+        """같은 CardData의 카드들이 효과 목록을 공유하다가 효과를 추가하거나 목록을 바꾼 카드만 전용 목록을 가지는지 검증합니다."""
+        data = card_data.get_card_data_by_id(WARD_CARD_ID)
+        original = list(data.effects)
+        first, second, third = (Card(data, 'player1', str(n)) for n in range(3))
+        self.assertIs(first.effects, data.effects)
+        self.assertIs(second.effects, data.effects)
+
+        first.add_effect(Effect(type=EffectType.RUSH))
+        self.assertIsNot(first.effects, data.effects)
+        self.assertEqual(first.effects, original + [first.effects[-1]])
+        self.assertEqual(data.effects, original)
+        self.assertIs(second.effects, data.effects)
+
+        second.effects = [effect for effect in second.effects if effect.type != EffectType.WARD]
+        self.assertEqual(data.effects, original)
+        self.assertEqual(len(second.effects), len(original) - 1)
+        self.assertIs(third.effects, data.effects)
+        # 분리된 목록도 효과 객체 자체는 공유합니다.
+        self.assertIs(first.effects[0], original[0])
+
+    def test_skybound_art_cloned_per_card(self):
+        """오의와 해방오의 효과만 카드마다 복제되어 진화 보너스 게이지가 카드별로 따로 누적되는지 검증합니다."""
+        data = card_data.get_card_data_by_id(SKYBOUND_CARD_ID)
+        first, second = Card(data, 'player1', '1'), Card(data, 'player1', '2')
+        for card in (first, second):
+            self.assertIsNot(card.effects, data.effects)
+            for effect, shared in zip(card.effects, data.effects):
+                if shared.type in SKYBOUND_ART_TYPES:
+                    self.assertIsNot(effect, shared)
+                    self.assertEqual(effect.skybound_art_evo_charge, 0)
+                else:
+                    self.assertIs(effect, shared)
+        skybound = [index for index, effect in enumerate(data.effects) if effect.type in SKYBOUND_ART_TYPES]
+        self.assertTrue(skybound)
+        first.effects[skybound[0]].skybound_art_evo_charge = 3
+        self.assertEqual(second.effects[skybound[0]].skybound_art_evo_charge, 0)
+        self.assertNotIn('skybound_art_evo_charge', data.effects[skybound[0]].__dict__)
+
+    def test_snapshot_restores_own_effects(self):
+        """스냅샷 이후의 효과 추가와 진화 보너스 게이지 변화가 복원으로 되돌아가고 공유 목록은 그대로인지 검증합니다."""
+        data = card_data.get_card_data_by_id(SKYBOUND_CARD_ID)
+        card = Card(data, 'player1', '1')
+        skybound = next(effect for effect in card.effects if effect.type in SKYBOUND_ART_TYPES)
+        effects = list(card.effects)
+        state = card.snapshot_state()
+        card.add_effect(Effect(type=EffectType.WARD))
+        skybound.skybound_art_evo_charge = 2
+        card.restore_state(state)
+        self.assertEqual(card.effects, effects)
+        self.assertEqual(skybound.skybound_art_evo_charge, 0)
+
+        shared = Card(card_data.get_card_data_by_id(WARD_CARD_ID), 'player1', '2')
+        state = shared.snapshot_state()
+        shared.add_effect(Effect(type=EffectType.RUSH))
+        shared.restore_state(state)
+        self.assertIs(shared.effects, shared.card_data.effects)
+
+
+
+class TestCardKeywordCounts(unittest.TestCase):
+    """Card._keyword_counts로 처리하는 has_keyword와 get_keywords를 검증하는 클래스입니다."""
+
+    def setUp(self):
+        """실제 카드 데이터베이스를 적재합니다."""
+        load_cards()
+
+    def test_matches_effect_types(self):
+        """모든 카드에서 키워드 개수 표가 효과 목록의 효과 타입별 개수와 같은지 검증합니다."""
+        for db in (card_data.BASIC_CARD_DATABASE, card_data.LEGENDS_RISE_CARD_DATABASE, card_data.TOKEN_CARD_DATABASE):
+            for card_id, data in db.items():
+                card = Card(data, 'player1', card_id)
+                expected = {}
+                for effect in card.effects:
+                    expected[effect.type] = expected.get(effect.type, 0) + 1
+                self.assertEqual(card._keyword_counts, expected, card_id)
+                self.assertEqual(set(card.get_keywords()), set(expected), card_id)
+                for keyword in (EffectType.WARD, EffectType.RUSH, EffectType.STORM):
+                    self.assertEqual(card.has_keyword(keyword), keyword in expected, card_id)
+
+    def test_add_and_remove(self):
+        """같은 키워드를 두 번 얻으면 하나를 잃어도 키워드가 남고 모두 잃어야 사라지는지 검증합니다."""
+        card = Card(card_data.get_card_data_by_id(WARD_CARD_ID), 'player1', '1')
+        self.assertFalse(card.has_keyword(EffectType.RUSH))
+        first, second = Effect(type=EffectType.RUSH), Effect(type=EffectType.RUSH)
+        card.add_effect(first)
+        card.add_effect(second)
+        self.assertEqual(card._keyword_counts[EffectType.RUSH], 2)
+        card.effects = [effect for effect in card.effects if effect is not first]
+        self.assertTrue(card.has_keyword(EffectType.RUSH))
+        card.effects = [effect for effect in card.effects if effect is not second]
+        self.assertFalse(card.has_keyword(EffectType.RUSH))
+        self.assertNotIn(EffectType.RUSH, card.get_keywords())
+
+    def test_undo_restores_counts(self):
+        """저널을 되돌리면 add_effect로 늘어난 키워드 개수와 효과 목록이 표식 시점으로 돌아가는지 검증합니다."""
+        card = Card(card_data.get_card_data_by_id(WARD_CARD_ID), 'player1', '1')
+        card._journal = journal = Journal()
+        counts = dict(card._keyword_counts)
+        mark = journal.mark()
+        card.add_effect(Effect(type=EffectType.WARD))
+        card.add_effect(Effect(type=EffectType.RUSH))
+        self.assertEqual(card._keyword_counts[EffectType.WARD], counts[EffectType.WARD] + 1)
+        journal.undo_to(mark)
+        self.assertEqual(card._keyword_counts, counts)
+        self.assertFalse(card.has_keyword(EffectType.RUSH))
+        self.assertIs(card.effects, card.card_data.effects)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,291 @@
+# 역할 정의. 카드 데이터베이스의 스냅샷 캐시, 지연 적재, 이름과 한글명과 별칭 조회 인덱스, 효과 원문에서 미리 계산한 카드 필드를 검증하는 테스트 클래스입니다.
+
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+import src.common.card_data as card_data
+from src.common.compiled_effect import _COMPILED_ATTR
+from src.common.enums import CardType, ClassType
+from src.models.card import Card
+from tests.game_helper import CARD_DB_PATH, load_cards
+
+DATABASES = (card_data.BASIC_CARD_DATABASE, card_data.LEGENDS_RISE_CARD_DATABASE, card_data.TOKEN_CARD_DATABASE)
+SAMPLE_SECTIONS = {'BASIC_CARD_DATABASE': 6, 'TOKEN_CARD_DATABASE': 4}  # 임시 카드 JSON에 옮길 섹션별 앞쪽 카드 수입니다.
+# 임시 카드 JSON에 더 옮길 카드입니다. 10101120은 BASIC 섹션의 10001210을 패에 추가하는 카드 참조를 가집니다.
+SAMPLE_EXTRA_IDS = {'LEGENDS_RISE_CARD_DATABASE': ('10101120',)}
+SAMPLE_SIZE = sum(SAMPLE_SECTIONS.values()) + sum(len(card_ids) for card_ids in SAMPLE_EXTRA_IDS.values())
+
+
+def write_sample_json(directory: str) -> str:
+    """실제 카드 JSON에서 섹션별로 앞쪽 카드 몇 장과 SAMPLE_EXTRA_IDS의 카드를 옮긴 임시 카드 JSON을 만들고 경로를 반환합니다."""
+    with open(CARD_DB_PATH, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    sample = {section: dict(list(data[section].items())[:count]) for section, count in SAMPLE_SECTIONS.items()}
+    for section, card_ids in SAMPLE_EXTRA_IDS.items():
+        sample.setdefault(section, {}).update((card_id, data[section][card_id]) for card_id in card_ids)
+    path = os.path.join(directory, 'cards.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(sample, f, ensure_ascii=False)
+    return path
+
+
+class CardDatabaseTestCase(unittest.TestCase):
+    """전역 카드 데이터베이스를 비운 채로 검사하고 끝나면 원래 내용으로 되돌리는 기반 클래스입니다.
+    다른 모듈이 전역 데이터베이스 객체를 직접 참조하므로 객체는 그대로 두고 내용만 바꿉니다."""
+
+    def setUp(self):
+        """실제 카드 데이터베이스를 적재해 보관한 뒤 전역 데이터베이스를 비우고 임시 디렉터리를 만듭니다."""
+        load_cards()
+        self.saved_databases = [dict(db) for db in DATABASES]
+        self.saved_kor_names = dict(card_data.KOR_NAME_MAP)
+        self.saved_pending = dict(card_data._PENDING_CARDS), dict(card_data._PENDING_NAME_INDEX), dict(card_data._LAZY_DUMMY_CARDS)
+        for db in DATABASES:
+            db.clear()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.json_path = write_sample_json(self.tmp_dir.name)
+
+    def tearDown(self):
+        """전역 데이터베이스와 지연 적재 상태를 setUp 이전 내용으로 되돌립니다."""
+        for db, saved in zip(DATABASES, self.saved_databases):
+            db.clear()
+            db.update(saved)
+        card_data.KOR_NAME_MAP.clear()
+        card_data.KOR_NAME_MAP.update(self.saved_kor_names)
+        card_data._reset_lazy_state()
+        for state, saved in zip((card_data._PENDING_CARDS, card_data._PENDING_NAME_INDEX, card_data._LAZY_DUMMY_CARDS), self.saved_pending):
+            state.update(saved)
+
+    def reload(self, **kwargs):
+        """전역 데이터베이스를 비우고 임시 카드 JSON을 다시 적재합니다."""
+        for db in DATABASES:
+            db.clear()
+        card_data.load_card_databases(self.json_path, **kwargs)
+
+    def loaded_cards(self):
+        """적재된 카드의 (card_id, 이름, 코스트) 목록을 반환합니다."""
+        return sorted((card_id, data.name, data.cost) for db in DATABASES for card_id, data in db.items())
+
+
+class TestCardDatabaseSnapshot(CardDatabaseTestCase):
+    """load_card_databases의 내용 해시 스냅샷 캐시를 검증하는 클래스입니다."""
+
+    def snapshot_files(self):
+        """임시 카드 JSON 옆 스냅샷 디렉터리의 스냅샷 파일 경로 목록을 반환합니다."""
+        snapshot_dir = os.path.join(self.tmp_dir.name, card_data.SNAPSHOT_DIR_NAME)
+        return sorted(os.path.join(snapshot_dir, name) for name in os.listdir(snapshot_dir)) if os.path.isdir(snapshot_dir) else []
+
+    def test_snapshot_reused(self):
+        """처음 적재하면 내용 해시 키의 스냅샷을 저장하고 다시 적재하면 JSON 변환 없이 같은 카드를 스냅샷에서 불러오는지 검증합니다."""
+        self.reload()
+        cards = self.loaded_cards()
+        self.assertEqual(len(cards), SAMPLE_SIZE)
+        snapshot_path = card_data.get_snapshot_path(self.json_path, card_data.compute_snapshot_key(self.json_path))
+        self.assertEqual(self.snapshot_files(), [snapshot_path])
+
+        with mock.patch.object(card_data, '_load_card_data_from_dict', side_effect=AssertionError("JSON에서 다시 변환했습니다.")):
+            self.reload()
+        self.assertEqual(self.loaded_cards(), cards)
+        # 스냅샷에서 불러온 카드도 효과 컴파일까지 끝나 있어야 합니다.
+        for db in DATABASES:
+            for data in db.values():
+                for effect in data.effects:
+                    self.assertIn(_COMPILED_ATTR, effect.__dict__, data.card_id)
+
+    def test_snapshot_invalidated_on_content_change(self):
+        """원본 JSON 내용이 바뀌면 키가 달라져 바뀐 내용으로 다시 만들고 이전 스냅샷을 지우는지 검증합니다."""
+        self.reload()
+        old_key = card_data.compute_snapshot_key(self.json_path)
+        old_snapshot = self.snapshot_files()
+
+        with open(self.json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        card_id, card_info = next(iter(data['BASIC_CARD_DATABASE'].items()))
+        card_info['cost'] += 5
+        with open(self.json_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        new_key = card_data.compute_snapshot_key(self.json_path)
+        self.assertNotEqual(new_key, old_key)
+
+        self.reload()
+        self.assertEqual(card_data.BASIC_CARD_DATABASE[card_id].cost, card_info['cost'])
+        self.assertEqual(self.snapshot_files(), [card_data.get_snapshot_path(self.json_path, new_key)])
+        self.assertNotEqual(self.snapshot_files(), old_snapshot)
+
+    def test_corrupt_snapshot_rebuilt(self):
+        """스냅샷 파일이 손상되었으면 JSON에서 다시 만들고 스냅샷을 새로 쓰는지 검증합니다."""
+        self.reload()
+        cards = self.loaded_cards()
+        snapshot_path, = self.snapshot_files()
+        with open(snapshot_path, 'wb') as f:
+            f.write(b'not a pickle')
+        self.reload()
+        self.assertEqual(self.loaded_cards(), cards)
+        self.assertIsNotNone(card_data._load_snapshot(snapshot_path))
+
+    def test_without_snapshot(self):
+        """use_snapshot이 False이면 스냅샷을 읽지도 쓰지도 않는지 검증합니다."""
+        self.reload(use_snapshot=False)
+        self.assertEqual(len(self.loaded_cards()), SAMPLE_SIZE)
+        self.assertEqual(self.snapshot_files(), [])
+
+
+
+class TestLazyCardLoading(CardDatabaseTestCase):
+    """sections를 지정한 지연 적재와 ensure_card_references를 검증하는 클래스입니다."""
+
+    def sample_ids(self, section: str):
+        """임시 카드 JSON의 섹션에 들어 있는 card_id 목록을 반환합니다."""
+        with open(self.json_path, 'r', encoding='utf-8') as f:
+            return list(json.load(f)[section])
+
+    def test_sections_loaded_on_demand(self):
+        """지정한 섹션만 CardData로 만들고 다른 섹션의 카드는 card_id나 이름으로 조회될 때 한 장씩 만드는지 검증합니다."""
+        self.reload(sections=['TOKEN_CARD_DATABASE'])
+        token_ids, basic_ids = self.sample_ids('TOKEN_CARD_DATABASE'), self.sample_ids('BASIC_CARD_DATABASE')
+        self.assertEqual(sorted(card_data.TOKEN_CARD_DATABASE), sorted(token_ids))
+        self.assertEqual(len(card_data.BASIC_CARD_DATABASE), 0)
+        self.assertFalse(os.path.isdir(os.path.join(self.tmp_dir.name, card_data.SNAPSHOT_DIR_NAME)))
+
+        data = card_data.get_card_data_by_id(basic_ids[0])
+        self.assertEqual(data.card_id, basic_ids[0])
+        self.assertEqual(list(card_data.BASIC_CARD_DATABASE), [basic_ids[0]])
+        self.assertIs(card_data.get_card_data_by_id(basic_ids[0]), data)
+
+        with open(self.json_path, 'r', encoding='utf-8') as f:
+            name = json.load(f)['BASIC_CARD_DATABASE'][basic_ids[1]]['name']
+        self.assertEqual(card_data.find_card_data_by_name(name).card_id, basic_ids[1])
+        self.assertEqual(len(card_data.BASIC_CARD_DATABASE), 2)
+        self.assertIsNone(card_data.get_card_data_by_id('no such card'))
+
+    def test_references_resolved_on_instantiation(self):
+        """지연 적재한 카드는 처음 인스턴스화될 때 참조 해결과 효과 컴파일을 하고 그 결과가 즉시 적재와 같은지 검증합니다."""
+        self.reload(use_snapshot=False)
+        eager = {card_id: repr(data.effects) for db in DATABASES for card_id, data in db.items()}
+
+        self.reload(sections=['TOKEN_CARD_DATABASE'])
+        for card_id in eager:
+            data = card_data.get_card_data_by_id(card_id)
+            self.assertFalse(data.references_resolved, card_id)
+            Card(data, 'player1', card_id)
+            self.assertTrue(data.references_resolved, card_id)
+            for effect in data.effects:
+                self.assertIn(_COMPILED_ATTR, effect.__dict__, card_id)
+            self.assertEqual(repr(data.effects), eager[card_id], card_id)
+        # 대기 중이던 카드를 가리키는 참조도 데이터베이스에 들어간 같은 CardData로 해결됩니다.
+        referenced = card_data.get_card_data_by_id('10101120').effects[0].processes[0].value
+        self.assertIs(referenced, card_data.BASIC_CARD_DATABASE['10001210'])
+        # 이미 해결된 카드는 다시 해결하지 않습니다.
+        with mock.patch.object(card_data, '_resolve_effect_references_recursive', side_effect=AssertionError("다시 해결했습니다.")):
+            card_data.ensure_card_references(card_data.get_card_data_by_id(card_id))
+
+    def test_unknown_section(self):
+        """알 수 없는 섹션 이름을 주면 ValueError가 발생하는지 검증합니다."""
+        with self.assertRaises(ValueError):
+            self.reload(sections=['NO_SUCH_DATABASE'])
+
+
+def make_card(card_id: str, name: str, name_ko: str = None, raw_effects_text: str = "") -> card_data.CardData:
+    """이름과 효과 원문만 다른 1코스트 중립 추종자 카드 데이터를 만듭니다."""
+    return card_data.CardData(card_id, name, 1, CardType.FOLLOWER, ClassType.NEUTRAL, 1, 1,
+                              raw_effects_text=raw_effects_text, name_ko=name_ko)
+
+
+class TestCardDatabaseIndex(unittest.TestCase):
+    """CardDatabase의 영문명, 한글명, 정규화 별칭 보조 인덱스를 검증하는 클래스입니다."""
+
+    def test_lookups(self):
+        """card_id, 영문명, 한글명, 접두사와 대소문자와 공백이 다른 별칭으로 같은 카드를 찾는지 검증합니다."""
+        goblin = make_card('1', 'Goblin', '고블린')
+        db = card_data.CardDatabase({'1': goblin, '2': make_card('2', 'Fighter')})
+        self.assertIs(db['1'], goblin)
+        self.assertIs(db['Goblin'], goblin)
+        self.assertIn('Goblin', db)
+        self.assertIs(db.get_by_name('Goblin'), goblin)
+        self.assertIs(db.get_by_name_ko('고블린'), goblin)
+        self.assertIs(db.get_by_alias('  a  GOBLIN '), goblin)
+        self.assertIs(db.get_by_alias('고블린'), goblin)
+        self.assertIsNone(db.get_by_name('goblin'))
+        self.assertIsNone(db.get_by_alias('Hobgoblin'))
+        self.assertIsNone(db.get('Hobgoblin'))
+
+    def test_name_conflicts(self):
+        """이름이 겹치면 먼저 삽입한 카드가 우선하고 그 카드를 지우거나 다른 이름으로 바꾸면 남은 카드가 인덱스를 이어받는지 검증합니다."""
+        first, second = make_card('1', 'Goblin', '고블린'), make_card('2', 'Goblin', '고블린')
+        db = card_data.CardDatabase()
+        db['1'] = first
+        db['2'] = second
+        self.assertIs(db.get_by_name('Goblin'), first)
+        self.assertIs(db.get_by_alias('the goblin'), first)
+
+        db['1'] = make_card('1', 'Fighter')
+        self.assertIs(db.get_by_name('Goblin'), second)
+        self.assertIs(db.get_by_name_ko('고블린'), second)
+        self.assertIs(db.get_by_name('Fighter'), db['1'])
+
+        del db['2']
+        self.assertIsNone(db.get_by_name('Goblin'))
+        self.assertIsNone(db.get_by_alias('goblin'))
+        self.assertEqual(db.pop('1').name, 'Fighter')
+        self.assertIsNone(db.get_by_name('Fighter'))
+        self.assertIsNone(db.pop('1', None))
+
+    def test_clear_and_pickle(self):
+        """clear가 인덱스까지 비우고 직렬화한 뒤 되살리면 항목에서 인덱스를 다시 만드는지 검증합니다."""
+        db = card_data.CardDatabase({'1': make_card('1', 'Goblin', '고블린')})
+        restored = pickle.loads(pickle.dumps(db))
+        self.assertEqual(restored.get_by_name_ko('고블린').card_id, '1')
+        self.assertEqual(restored.get_by_alias('goblin').card_id, '1')
+        db.clear()
+        self.assertIsNone(db.get_by_name('Goblin'))
+        self.assertIsNone(db.get_by_alias('goblin'))
+
+    def test_find_card_data_by_name(self):
+        """실제 카드 데이터베이스에서 영문명, 한글명, 관사가 붙은 별칭으로 card_id 조회와 같은 카드를 찾는지 검증합니다."""
+        load_cards()
+        data = card_data.get_card_data_by_id('10001110')
+        self.assertIs(card_data.find_card_data_by_name(data.name), data)
+        self.assertIs(card_data.find_card_data_by_name(data.name_ko), data)
+        self.assertIs(card_data.find_card_data_by_name(f"an {data.name.upper()}"), data)
+        self.assertIsNone(card_data.find_card_data_by_name('No Such Card Name'))
+
+
+
+class TestCardDataTextParameters(unittest.TestCase):
+    """CardData가 생성 시점에 효과 원문에서 추출해 두는 필드를 검증하는 클래스입니다."""
+
+    def test_parsed_values(self):
+        """콤보와 연계 수치, instead와 discarded 여부, 변수 X의 정의를 대소문자와 관계없이 추출하는지 검증합니다."""
+        data = make_card('1', 'Sample', raw_effects_text=(
+            "Fanfare: Deal X damage to an enemy follower. X is the number of cards in your hand.\n"
+            "COMBO (5): Deal 4 damage instead.\nrally (15): Draw a card.\nWhen this card is Discarded, gain 1 PP."))
+        self.assertEqual(data.combo_requirement, 5)
+        self.assertEqual(data.rally_requirement, 15)
+        self.assertTrue(data.has_instead)
+        self.assertTrue(data.has_discard_trigger)
+        self.assertEqual(data.variable_definition, 'the number of cards in your hand')
+
+    def test_defaults(self):
+        """수치나 문구가 없으면 기본 조건과 False, None을 쓰는지 검증합니다."""
+        for text in ("", "Ward", "Combo: Draw a card."):
+            data = make_card('1', 'Sample', raw_effects_text=text)
+            self.assertEqual(data.combo_requirement, card_data.DEFAULT_COMBO_REQUIREMENT, text)
+            self.assertEqual(data.rally_requirement, card_data.DEFAULT_RALLY_REQUIREMENT, text)
+            self.assertFalse(data.has_instead, text)
+            self.assertFalse(data.has_discard_trigger, text)
+            self.assertIsNone(data.variable_definition, text)
+        self.assertIsNone(make_card('1', 'Sample', raw_effects_text="X is .").variable_definition)
+
+    def test_survives_pickle(self):
+        """스냅샷에 담기도록 직렬화한 뒤에도 미리 계산한 필드가 그대로인지 검증합니다."""
+        data = make_card('1', 'Sample', raw_effects_text="Combo (4): Deal 3 damage instead.")
+        restored = pickle.loads(pickle.dumps(data))
+        self.assertEqual((restored.combo_requirement, restored.has_instead), (4, True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+# 역할 정의. 효과를 컴파일한 고정 배치 레코드가 효과마다 한 번만 만들어져 공유되고 효과 해결이 변수 해석이 필요할 때만 복제하고 다시 컴파일하는지 검증하는 테스트 클래스입니다.
+
+import unittest
+from unittest import mock
+
+import src.common.card_data as card_data
+import src.engine.effect_processor as effect_processor_module
+from src.common.compiled_effect import _COMPILED_ATTR, compile_effect, get_compiled_effect
+from src.common.condition import compile_condition
+from src.common.effect import Effect, Process
+from src.common.enums import EffectType, ProcessType, TargetType
+from tests.game_helper import create_game, load_cards
+
+
+def draw_effect(value, condition=None) -> Effect:
+    """자기 리더가 value장 뽑는 출격 효과를 만듭니다. condition을 주면 효과 전체 조건으로 넣습니다."""
+    attributes = {'type': EffectType.FANFARE, 'processes': [{'process': 'DRAW', 'target': 'OWN_LEADER', 'value': value}]}
+    if condition is not None:
+        attributes['condition'] = condition
+    return Effect(**attributes)
+
+
+class TestCompiledEffect(unittest.TestCase):
+    """CompiledEffect와 get_compiled_effect를 검증하는 클래스입니다."""
+
+    def test_cached_on_effect(self):
+        """컴파일 결과가 효과 객체에 저장되어 다시 컴파일하지 않고 복제본과도 공유되며 compile_effect는 저장하지 않는지 검증합니다."""
+        effect = draw_effect(1)
+        compiled = get_compiled_effect(effect)
+        self.assertIs(get_compiled_effect(effect), compiled)
+        self.assertIs(effect.__dict__[_COMPILED_ATTR], compiled)
+        self.assertIs(get_compiled_effect(effect.clone()), compiled)
+
+        fresh = compile_effect(effect)
+        self.assertIsNot(fresh, compiled)
+        self.assertIs(get_compiled_effect(effect), compiled)
+
+    def test_fields(self):
+        """효과 타입, 효과 조건의 판정 함수, 프로세스별 타입과 대상, 변수 포함 여부를 미리 해석해 두는지 검증합니다."""
+        effect = draw_effect(2, condition='CARD_TYPE_FOLLOWER')
+        effect.processes.append(Process(process=ProcessType.STAT_BUFF, target='NO_SUCH_TARGET', value='X'))
+        compiled = compile_effect(effect)
+        self.assertEqual(compiled.type, EffectType.FANFARE)
+        self.assertEqual(compiled.condition, 'CARD_TYPE_FOLLOWER')
+        self.assertIs(compiled.condition_predicate, compile_condition('CARD_TYPE_FOLLOWER'))
+        self.assertEqual([process.process_type for process in compiled.processes], [ProcessType.DRAW, ProcessType.STAT_BUFF])
+        self.assertEqual(compiled.processes[0].target, TargetType.OWN_LEADER)
+        # 알 수 없는 대상 문자열은 실행 시 처리를 따르도록 그대로 둡니다.
+        self.assertEqual(compiled.processes[1].target, 'NO_SUCH_TARGET')
+        self.assertTrue(compiled.has_variables)
+
+        compiled = compile_effect(draw_effect(2))
+        self.assertIsNone(compiled.condition_predicate)
+        self.assertFalse(compiled.has_variables)
+        self.assertTrue(compile_effect(draw_effect('X')).has_variables)
+        self.assertTrue(compile_effect(draw_effect('3')).has_variables)
+
+    def test_matches_card_database(self):
+        """모든 카드의 최상위 효과가 컴파일되어 있고 프로세스 레코드가 프로세스의 타입, 조건, 대상, 원문과 같은지 검증합니다."""
+        load_cards()
+        for db in (card_data.BASIC_CARD_DATABASE, card_data.LEGENDS_RISE_CARD_DATABASE, card_data.TOKEN_CARD_DATABASE):
+            for card_id, data in db.items():
+                for effect in data.effects:
+                    compiled = effect.__dict__.get(_COMPILED_ATTR)
+                    self.assertIsNotNone(compiled, card_id)
+                    self.assertEqual(compiled.type, effect.type, card_id)
+                    self.assertEqual(len(compiled.processes), len(effect.processes), card_id)
+                    for record, process in zip(compiled.processes, effect.processes):
+                        self.assertEqual(record.process_type, getattr(process, 'process', None), card_id)
+                        self.assertEqual(record.condition, getattr(process, 'condition', None), card_id)
+                        self.assertEqual(record.raw_action_text, getattr(process, 'raw_action_text', None), card_id)
+                        if process.get('target') is not None:
+                            self.assertEqual(record.target, process.get('target'), card_id)
+
+
+
+class TestResolveEffectCopies(unittest.TestCase):
+    """resolve_effect가 공유 효과를 복제 없이 읽고 변수 X를 해석할 때만 복제본을 만들어 다시 컴파일하는지 검증하는 클래스입니다."""
+
+    def setUp(self):
+        """게임을 만들고 현재 턴 플레이어의 손패 카드 하나를 시전자로 정합니다."""
+        self.game = create_game(0)
+        gsm = self.game.game_state_manager
+        player = gsm.players[gsm.current_turn_player_id]
+        self.caster = player.hand.get_cards()[0]
+        self.deck = player.deck
+
+    def resolve(self, effect: Effect):
+        """시전자로 효과를 해결합니다."""
+        self.game.effect_processor.resolve_effect(effect, self.caster.card_id, self.game.game_state_manager, None)
+
+    def test_no_variables_reuses_shared_effect(self):
+        """변수가 없는 효과는 복제하거나 다시 컴파일하지 않고 원본 효과의 컴파일 결과로 해결하는지 검증합니다."""
+        effect = draw_effect(2)
+        compiled = get_compiled_effect(effect)
+        deck_size = self.deck.size()
+        with mock.patch.object(Effect, 'clone', side_effect=AssertionError("효과를 복제했습니다.")), \
+                mock.patch.object(effect_processor_module, 'compile_effect', side_effect=AssertionError("다시 컴파일했습니다.")):
+            self.resolve(effect)
+        self.assertEqual(self.deck.size(), deck_size - 2)
+        self.assertIs(get_compiled_effect(effect), compiled)
+
+    def test_variables_resolved_on_private_copy(self):
+        """시전자가 X를 정의하면 복제본에서 X를 해석하고 다시 컴파일하며 공유 효과와 그 컴파일 결과는 그대로인지 검증합니다."""
+        effect = draw_effect('X')
+        compiled = get_compiled_effect(effect)
+        deck_size = self.deck.size()
+        with mock.patch.object(self.game.effect_processor, '_get_variable_value', return_value=3), \
+                mock.patch.object(Effect, 'clone', autospec=True, side_effect=Effect.clone) as clone, \
+                mock.patch.object(effect_processor_module, 'compile_effect', wraps=compile_effect) as recompile:
+            self.resolve(effect)
+        self.assertEqual(self.deck.size(), deck_size - 3)
+        self.assertEqual(clone.call_count, 1)
+        self.assertEqual(recompile.call_count, 1)
+        self.assertEqual(effect.processes[0].value, 'X')
+        self.assertIs(get_compiled_effect(effect), compiled)
+
+    def test_undefined_variable_not_copied(self):
+        """변수가 있어도 시전자가 X를 정의하지 않으면 복제하지 않는지 검증합니다."""
+        effect = draw_effect('X')
+        with mock.patch.object(self.game.effect_processor, '_get_variable_value', return_value=None), \
+                mock.patch.object(Effect, 'clone', side_effect=AssertionError("효과를 복제했습니다.")):
+            self.resolve(effect)
+        self.assertEqual(effect.processes[0].value, 'X')
+
+
+if __name__ == '__main__':
+    unittest.main()
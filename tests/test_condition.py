@@ -0,0 +1,59 @@
+# 역할 정의. 조건 문자열을 판정 함수로 컴파일하는 규칙과 판정 함수 캐시를 검증하는 테스트 클래스입니다.
+
+import unittest
+
+import src.common.card_data as card_data
+from src.common.condition import _PREDICATE_CACHE, compile_condition
+from src.models.card import Card
+from tests.game_helper import load_cards
+
+FOLLOWER_CARD_ID = '10001110'  # 2코스트 중립 추종자 Indomitable Fighter입니다.
+
+
+class TestCompileCondition(unittest.TestCase):
+    """compile_condition과 evaluate_condition을 검증하는 클래스입니다."""
+
+    def setUp(self):
+        """실제 카드 데이터베이스를 적재하고 판정할 카드를 만듭니다."""
+        load_cards()
+        self.card = Card(card_data.get_card_data_by_id(FOLLOWER_CARD_ID), 'player1', '1')
+
+    def test_predicates(self):
+        """카드 타입, 직업, 이름, 코스트 조건과 해석할 수 없는 값, 알 수 없는 조건, 빈 조건의 판정 결과를 검증합니다."""
+        cases = {
+            'CARD_TYPE_FOLLOWER': True,
+            'CARD_TYPE_SPELL': False,
+            'CARD_TYPE_NO_SUCH_TYPE': False,
+            'CLASS_TYPE_NEUTRAL': True,
+            'CLASS_TYPE_RUNECRAFT': False,
+            'NAME_Indomitable Fighter': True,
+            'NAME_Goblin': False,
+            'COST_IS_2': True,
+            'COST_IS_3': False,
+            'COST_IS_TWO': False,
+            'SOMETHING_ELSE': True,
+            '': True,
+        }
+        for condition_str, expected in cases.items():
+            self.assertEqual(compile_condition(condition_str)(self.card), expected, condition_str)
+            self.assertEqual(card_data.evaluate_condition(self.card, condition_str), expected, condition_str)
+
+    def test_reads_current_state(self):
+        """캐시된 판정 함수도 호출할 때의 카드 상태를 읽는지 검증합니다."""
+        predicate = compile_condition('COST_IS_2')
+        self.card.current_cost = 5
+        self.assertFalse(predicate(self.card))
+        self.assertTrue(compile_condition('COST_IS_5')(self.card))
+
+    def test_cached(self):
+        """같은 조건 문자열은 한 번만 해석하여 캐시에 둔 같은 판정 함수를 돌려주는지 검증합니다."""
+        condition_str = 'COST_IS_7'
+        _PREDICATE_CACHE.pop(condition_str, None)
+        predicate = compile_condition(condition_str)
+        self.assertIs(_PREDICATE_CACHE[condition_str], predicate)
+        self.assertIs(compile_condition(condition_str), predicate)
+        self.assertIsNot(compile_condition('COST_IS_8'), predicate)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# 역할 정의. 적응형 매치업 실행의 조기 종료 조건인 SPRT와 신뢰구간 폭 판정을 검증하는 테스트 클래스입니다.
+
+import math
+import unittest
+
+from match_simulator import (EarlyStopping, MatchupStats, OUTCOME_DECK_A, OUTCOME_DECK_B, OUTCOME_ERROR,
+                             STOP_CI_WIDTH, STOP_SPRT_H0, STOP_SPRT_H1, simulate_matchups)
+from tests.game_helper import DECK_PATHS, load_cards
+
+
+def games_until_stop(early_stopping, outcome, limit=200):
+    """같은 결과를 계속 누적하여 조기 종료가 판정될 때까지의 (게임 수, 종료 사유)를 반환합니다."""
+    stats = MatchupStats()
+    for _ in range(limit):
+        stats.add(outcome, 10, True)
+        reason = early_stopping.check(stats)
+        if reason is not None:
+            return stats.games, reason
+    return stats.games, None
+
+
+class TestEarlyStopping(unittest.TestCase):
+    """EarlyStopping의 판정 규칙을 검증하는 클래스입니다."""
+
+    def test_sprt_bounds(self):
+        """SPRT 경계가 왈드의 근사 경계 ln((1 - beta) / alpha)와 ln(beta / (1 - alpha))인지 검증합니다."""
+        early_stopping = EarlyStopping(sprt=(0.5, 0.6), alpha=0.05, beta=0.1)
+        self.assertAlmostEqual(early_stopping.upper_bound, math.log(0.9 / 0.05))
+        self.assertAlmostEqual(early_stopping.lower_bound, math.log(0.1 / 0.95))
+
+    def test_sprt_stops_at_first_crossing(self):
+        """전승이면 로그 우도비가 상한을 처음 넘는 게임에서 p1을, 전패면 하한을 처음 넘는 게임에서 p0을 채택하는지 검증합니다."""
+        early_stopping = EarlyStopping(sprt=(0.5, 0.6), min_games=1)
+        win_step, loss_step = math.log(0.6 / 0.5), math.log(0.4 / 0.5)
+        self.assertEqual(games_until_stop(early_stopping, OUTCOME_DECK_A),
+                         (math.ceil(early_stopping.upper_bound / win_step), STOP_SPRT_H1))
+        self.assertEqual(games_until_stop(early_stopping, OUTCOME_DECK_B),
+                         (math.ceil(early_stopping.lower_bound / loss_step), STOP_SPRT_H0))
+
+    def test_min_games_and_errors(self):
+        """min_games판이 끝나기 전에는 판정하지 않고 오류 게임은 끝난 게임으로 세지 않는지 검증합니다."""
+        early_stopping = EarlyStopping(sprt=(0.5, 0.6), min_games=30)
+        self.assertEqual(games_until_stop(early_stopping, OUTCOME_DECK_A), (30, STOP_SPRT_H1))
+        self.assertEqual(games_until_stop(early_stopping, OUTCOME_ERROR), (200, None))
+
+    def test_ci_width(self):
+        """승률 신뢰구간 폭이 목표 이하가 되는 첫 게임에서 멈추는지 검증합니다."""
+        early_stopping = EarlyStopping(target_ci_width=0.3, min_games=1)
+        stats = MatchupStats()
+        for index in range(200):
+            stats.add(OUTCOME_DECK_A if index % 2 == 0 else OUTCOME_DECK_B, 10, True)
+            low, high = stats.win_rate_interval()
+            self.assertEqual(early_stopping.check(stats), STOP_CI_WIDTH if high - low <= 0.3 else None)
+            if high - low <= 0.3:
+                break
+        self.assertLess(stats.games, 200)
+
+    def test_invalid_arguments(self):
+        """조건이 없거나 범위를 벗어난 인자면 ValueError가 발생하는지 검증합니다."""
+        for kwargs in ({}, {"target_ci_width": 1.5}, {"sprt": (0.6, 0.5)}, {"sprt": (0.5, 0.6), "alpha": 0.0}):
+            with self.assertRaises(ValueError):
+                EarlyStopping(**kwargs)
+
+
+class TestAdaptiveMatchups(unittest.TestCase):
+    """실제 게임을 진행하는 적응형 simulate_matchups를 검증하는 클래스입니다."""
+
+    @classmethod
+    def setUpClass(cls):
+        """카드 데이터베이스를 적재합니다."""
+        load_cards()
+
+    def test_stops_early_and_reproducibly(self):
+        """조건이 충족되면 최대 게임 수 전에 멈추고 멈추는 지점과 결과가 워커 수와 관계없이 같은지 검증합니다."""
+        summaries = [simulate_matchups(DECK_PATHS[0], DECK_PATHS[1], n_games=40, workers=workers,
+                                       early_stopping=EarlyStopping(target_ci_width=0.8, min_games=3))
+                     for workers in (1, 2)]
+        self.assertEqual(summaries[0]["stop_reason"], STOP_CI_WIDTH)
+        self.assertLess(summaries[0]["games"], 40)
+        self.assertEqual(summaries[0], summaries[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
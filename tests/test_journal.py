@@ -0,0 +1,83 @@
+# 역할 정의. 변경 저널의 undo_to가 영역, 키워드 버킷, 묘지 그림자를 포함한 국면을 표식 시점으로 되돌리는지 검증하는 테스트 클래스입니다.
+
+import random
+import unittest
+
+from src.common.journal import Journal
+from tests.game_helper import board_fingerprint, create_game, game_rounds, play_random_actions
+
+
+class TestJournalUndo(unittest.TestCase):
+    """Game.mark와 Game.undo_to를 실제 게임 진행 중에 검증하는 클래스입니다."""
+
+    def test_undo_to_mark(self):
+        """표식 뒤에 진행한 행동을 되돌리면 국면 요약이 표식 시점과 같아지고 같은 선택으로 다시 진행하면 같은 국면이 되는지 검증합니다.
+        진행 중 묘지 그림자와 키워드 버킷이 실제로 바뀐 경우가 있어야 합니다."""
+        shadows_changed = buckets_changed = False
+        for seed, game, rng in game_rounds():
+            mark = game.mark()
+            before = board_fingerprint(game)
+            states = rng.getstate(), game.gui.rng.getstate()
+            actions = play_random_actions(game, rng, 5)
+            after = board_fingerprint(game)
+            for (_, zones_before, _, shadows_before), (_, zones_after, _, shadows_after) in zip(before[0], after[0]):
+                shadows_changed |= shadows_before != shadows_after
+                buckets_changed |= [zone[2] for zone in zones_before] != [zone[2] for zone in zones_after]
+
+            game.undo_to(mark)
+            self.assertEqual(board_fingerprint(game), before, f"seed {seed}")
+            rng.setstate(states[0])
+            game.gui.rng.setstate(states[1])
+            self.assertEqual(play_random_actions(game, rng, 5), actions, f"seed {seed}")
+            self.assertEqual(board_fingerprint(game), after, f"seed {seed}")
+            game.stop_journal()
+        self.assertTrue(shadows_changed)
+        self.assertTrue(buckets_changed)
+
+    def test_nested_marks(self):
+        """안쪽 표식으로 되돌린 뒤 바깥 표식으로 다시 되돌릴 수 있는지 검증합니다."""
+        game = create_game(0)
+        rng = random.Random(0)
+        play_random_actions(game, rng, 6)
+        outer = game.mark()
+        outer_state = board_fingerprint(game)
+        play_random_actions(game, rng, 3)
+        inner = game.mark()
+        inner_state = board_fingerprint(game)
+        play_random_actions(game, rng, 3)
+        game.undo_to(inner)
+        self.assertEqual(board_fingerprint(game), inner_state)
+        game.undo_to(outer)
+        self.assertEqual(board_fingerprint(game), outer_state)
+        game.stop_journal()
+
+
+class TestJournal(unittest.TestCase):
+    """Journal의 기본 역연산을 검증하는 클래스입니다."""
+
+    def test_container_operations(self):
+        """리스트, 딕셔너리, 집합 변경이 역순으로 되돌아가는지 검증합니다."""
+        journal = Journal()
+        items, mapping, members = [1, 2, 3], {"a": 1}, {"x"}
+        mark = journal.mark()
+        journal.append(items, 4)
+        journal.remove(items, 2)
+        journal.set_item(mapping, "a", 5)
+        journal.set_item(mapping, "b", 6)
+        journal.set_add(members, "y")
+        journal.set_discard(members, "x")
+        journal.undo_to(mark)
+        self.assertEqual(items, [1, 2, 3])
+        self.assertEqual(mapping, {"a": 1})
+        self.assertEqual(members, {"x"})
+
+    def test_invalid_mark(self):
+        """쌓인 역연산 수를 벗어난 표식이면 ValueError가 발생하는지 검증합니다."""
+        journal = Journal()
+        journal.mark()
+        with self.assertRaises(ValueError):
+            journal.undo_to(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# 역할 정의. 영역별 키워드 색인의 버킷이 카드의 영역 이동과 키워드 획득, 상실을 따라 갱신되는지 검증하는 테스트 클래스입니다.
+
+import unittest
+
+import src.common.card_data as card_data
+from src.common.effect import Effect
+from src.common.enums import EffectType
+from src.models.card import Card
+from src.models.field import Field
+from src.models.graveyard import Graveyard
+from src.models.hand import Hand
+from tests.game_helper import game_rounds, load_cards, play_random_actions
+
+WARD_CARD_ID = '10001120'  # 수호를 가진 카드입니다.
+PLAIN_CARD_ID = '10001110'  # 키워드 효과 없이 강화 효과만 가진 카드입니다.
+
+
+def bucket_ids(zone, keyword):
+    """영역 키워드 색인에서 keyword 버킷의 card_id 집합을 반환합니다."""
+    return set(zone._keyword_index._buckets.get(keyword, ()))
+
+
+class TestKeywordIndex(unittest.TestCase):
+    """CardZone의 키워드 색인을 검증하는 클래스입니다."""
+
+    def setUp(self):
+        """실제 카드 데이터베이스를 적재합니다."""
+        load_cards()
+
+    def test_follows_zone_moves(self):
+        """카드가 손패에서 필드를 거쳐 묘지로 옮겨가면 키워드 버킷도 따라 옮겨가고 이전 영역에는 남지 않는지 검증합니다."""
+        hand, field, graveyard = Hand(), Field(), Graveyard()
+        ward = Card(card_data.get_card_data_by_id(WARD_CARD_ID), 'player1', 'ward')
+        hand.add_card(ward)
+        self.assertTrue(hand.has_card_with_keyword(EffectType.WARD))
+        self.assertIs(ward.keyword_index, hand._keyword_index)
+
+        hand.remove_card('ward')
+        field.add_card(ward)
+        self.assertFalse(hand.has_card_with_keyword(EffectType.WARD))
+        self.assertEqual(field.get_card_ids_with_keyword(EffectType.WARD), ['ward'])
+        self.assertIs(ward.keyword_index, field._keyword_index)
+
+        field.remove_card('ward')
+        graveyard.add_card(ward)
+        self.assertFalse(field.has_card_with_keyword(EffectType.WARD))
+        self.assertTrue(graveyard.has_card_with_keyword(EffectType.WARD))
+        # 다른 영역으로 옮긴 뒤에 얻은 키워드는 이전 영역에 알리지 않습니다.
+        ward.add_effect(Effect(type=EffectType.RUSH))
+        self.assertEqual(bucket_ids(graveyard, EffectType.RUSH), {'ward'})
+        self.assertEqual(bucket_ids(field, EffectType.RUSH), set())
+
+    def test_keyword_gain_and_loss(self):
+        """필드에 있는 카드가 키워드를 얻거나 모두 잃으면 그 영역의 버킷만 갱신되고 영역 내 순서대로 card_id를 돌려주는지 검증합니다."""
+        field = Field()
+        cards = [Card(card_data.get_card_data_by_id(PLAIN_CARD_ID), 'player1', f'plain{n}') for n in range(3)]
+        for card in cards:
+            field.add_card(card)
+        self.assertFalse(field.has_card_with_keyword(EffectType.STORM))
+
+        storm = Effect(type=EffectType.STORM)
+        cards[2].add_effect(storm)
+        cards[0].add_effect(Effect(type=EffectType.STORM))
+        self.assertEqual(field.get_card_ids_with_keyword(EffectType.STORM), ['plain0', 'plain2'])
+        cards[2].add_effect(Effect(type=EffectType.STORM))
+        cards[2].effects = [effect for effect in cards[2].effects if effect is not storm]
+        self.assertEqual(field.get_card_ids_with_keyword(EffectType.STORM), ['plain0', 'plain2'])
+        cards[2].effects = [effect for effect in cards[2].effects if effect.type != EffectType.STORM]
+        self.assertEqual(field.get_card_ids_with_keyword(EffectType.STORM), ['plain0'])
+
+        ward = Card(card_data.get_card_data_by_id(WARD_CARD_ID), 'player1', 'ward')
+        field.replace_card(cards[0], ward)
+        self.assertFalse(field.has_card_with_keyword(EffectType.STORM))
+        self.assertEqual(field.get_card_ids_with_keyword(EffectType.WARD), ['ward'])
+        self.assertIsNone(cards[0].keyword_index)
+
+    def test_matches_zone_contents_in_game(self):
+        """실제 게임을 진행하는 동안 모든 영역의 키워드 버킷이 영역 안 카드의 키워드로 다시 만든 버킷과 같은지 검증합니다."""
+        for seed, game, rng in game_rounds():
+            for player in game.game_state_manager.players.values():
+                for zone, zone_obj in player.zone_dict.items():
+                    expected = {}
+                    for card in zone_obj.get_cards():
+                        self.assertIs(card.keyword_index, zone_obj._keyword_index, f"seed {seed} {zone.name}")
+                        for keyword in card.get_keywords():
+                            expected.setdefault(keyword, set()).add(card.card_id)
+                    buckets = {keyword: bucket for keyword, bucket in zone_obj._keyword_index._buckets.items() if bucket}
+                    self.assertEqual(buckets, expected, f"seed {seed} {zone.name}")
+            play_random_actions(game, rng, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
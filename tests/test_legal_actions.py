@@ -0,0 +1,94 @@
+# 역할 정의. 행동 생성기의 합법 행동이 RuleEngine의 유효성 판정과 일치하고 행동 캐시가 되돌리기와 복원 뒤에도 맞는지 검증하는 테스트 클래스입니다.
+
+import unittest
+
+from src.common.enums import ActionType, CardType
+from tests.game_helper import game_rounds, play_random_actions
+
+
+def rule_engine_actions(game, player_id):
+    """RuleEngine으로 판정한 카드 플레이, 공격, 활성화 행동 집합을 반환합니다. 카드 플레이는 (카드 ID, 엑스트라 PP 사용 여부)로 나타냅니다."""
+    gsm = game.game_state_manager
+    rule_engine = game.rule_engine
+    player = gsm.players[player_id]
+    opponent = gsm.players[gsm.opponent_id[player_id]]
+    plays, attacks, engages = set(), set(), set()
+    for use_extra_pp in ((False, True) if player.extra_pp > 0 else (False,)):
+        for card in player.hand.get_cards():
+            if rule_engine.validate_play_card(card.card_id, player_id, use_extra_pp):
+                plays.add((card.card_id, use_extra_pp))
+    targets = [card.card_id for card in opponent.field.get_cards() if card.get_type() == CardType.FOLLOWER]
+    targets.append(opponent.player_id)
+    for card in player.field.get_cards():
+        if card.get_type() == CardType.FOLLOWER:
+            for target_id in targets:
+                if rule_engine.validate_attack(card.card_id, target_id):
+                    attacks.add((card.card_id, target_id))
+        if rule_engine.validate_engage_card(card.card_id, player_id):
+            engages.add(card.card_id)
+    return plays, attacks, engages
+
+
+def generated_actions(actions):
+    """행동 생성기의 행동 목록을 rule_engine_actions와 같은 형태의 집합으로 바꿉니다."""
+    plays = {(action[1], action[3]) for action in actions if action[0] == ActionType.PLAY_CARD}
+    attacks = {(action[1], action[2]) for action in actions if action[0] == ActionType.ATTACK}
+    engages = {action[1] for action in actions if action[0] == ActionType.ENGAGE}
+    return plays, attacks, engages
+
+
+def fresh_legal_actions(game, player_id):
+    """모든 카드의 판정 캐시와 행동 구간 캐시를 버리고 합법 행동을 다시 계산합니다.
+    저널에 남지 않도록 인스턴스 딕셔너리와 구간 딕셔너리를 직접 고치며 다시 계산한 구간도 캐시에 남기지 않습니다."""
+    gsm = game.game_state_manager
+    for card in gsm.cards:
+        card.__dict__.pop('action_facts', None)
+    segments = dict(gsm.action_cache.segments)
+    gsm.action_cache.segments.clear()
+    with gsm.journal.paused():
+        actions = game.legal_actions(player_id)
+    gsm.action_cache.segments.clear()
+    gsm.action_cache.segments.update(segments)
+    return actions
+
+
+class TestLegalActions(unittest.TestCase):
+    """legal_actions를 실제 게임 진행 중에 RuleEngine과 비교하는 클래스입니다."""
+
+    def test_matches_rule_engine(self):
+        """매 행동 전에 카드 플레이, 공격, 활성화 행동이 RuleEngine 판정과 같은지 검증합니다. 공격이 가능한 국면이 한 번 이상 나와야 합니다."""
+        saw_attack = False
+        for seed, game, rng in game_rounds():
+            player_id = game.game_state_manager.current_turn_player_id
+            game.process_player_choice()
+            expected = rule_engine_actions(game, player_id)
+            self.assertEqual(generated_actions(game.legal_actions(player_id)), expected, f"seed {seed}")
+            saw_attack |= bool(expected[1])
+            play_random_actions(game, rng, 1)
+        self.assertTrue(saw_attack)
+
+    def test_cache_after_undo_and_restore(self):
+        """구간별 행동 캐시와 카드별 판정 캐시를 쓴 결과가 캐시 없이 다시 계산한 결과와 진행, 되돌리기, 복원 뒤에 모두 같은지 검증합니다."""
+        for seed, game, rng in game_rounds():
+            player_id = game.game_state_manager.current_turn_player_id
+            cached = game.legal_actions(player_id)
+            self.assertEqual(cached, fresh_legal_actions(game, player_id), f"seed {seed}")
+
+            snapshot = game.snapshot()
+            mark = game.mark()
+            states = rng.getstate(), game.gui.rng.getstate()
+            play_random_actions(game, rng, 4)
+            game.undo_to(mark)
+            game.stop_journal()
+            self.assertEqual(game.legal_actions(player_id), cached, f"seed {seed}")
+
+            play_random_actions(game, rng, 4)
+            game.restore(snapshot)
+            self.assertEqual(game.legal_actions(player_id), cached, f"seed {seed}")
+            rng.setstate(states[0])
+            game.gui.rng.setstate(states[1])
+            play_random_actions(game, rng, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
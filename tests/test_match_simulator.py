@@ -0,0 +1,75 @@
+# 역할 정의. 매치업 시뮬레이터의 스트리밍 통계와 윌슨 신뢰구간, 오류 유형 집계를 검증하는 테스트 클래스입니다.
+
+import unittest
+
+from match_simulator import (MatchupStats, OUTCOME_DECK_A, OUTCOME_DECK_B, OUTCOME_DRAW, OUTCOME_ERROR,
+                             format_matchup_summary, simulate_matchups)
+from tests.game_helper import DECK_PATHS, load_cards
+
+
+class TestMatchupStats(unittest.TestCase):
+    """MatchupStats의 승률과 신뢰구간, 오류 집계를 검증하는 클래스입니다."""
+
+    def test_wilson_interval(self):
+        """10판 중 8승의 95% 윌슨 신뢰구간이 알려진 값과 같고 무승부는 반승으로 세는지 검증합니다."""
+        stats = MatchupStats()
+        for index in range(10):
+            stats.add(OUTCOME_DECK_A if index < 8 else OUTCOME_DECK_B, 10, True)
+        low, high = stats.win_rate_interval(0.95)
+        self.assertAlmostEqual(stats.win_rate, 0.8)
+        self.assertAlmostEqual(low, 0.4902, places=4)
+        self.assertAlmostEqual(high, 0.9433, places=4)
+
+        stats.add(OUTCOME_DRAW, 10, True)
+        self.assertAlmostEqual(stats.win_rate, 8.5 / 11)
+
+    def test_interval_edges(self):
+        """끝난 게임이 없으면 (0, 1)이고 전승이어도 구간이 [0, 1] 안에 머무는지 검증합니다."""
+        stats = MatchupStats()
+        self.assertEqual(stats.win_rate_interval(), (0.0, 1.0))
+        for _ in range(5):
+            stats.add(OUTCOME_DECK_A, 8, False)
+        low, high = stats.win_rate_interval()
+        self.assertLess(low, 1.0)
+        self.assertEqual(high, 1.0)
+
+    def test_error_types(self):
+        """오류 게임이 승률에서 빠지고 예외 타입별로 세어지며 요약에 경고가 붙는지 검증합니다."""
+        stats = MatchupStats()
+        stats.add(OUTCOME_DECK_A, 12, True)
+        stats.add(OUTCOME_ERROR, 0, True, ("AttributeError", "boom"))
+        stats.add(OUTCOME_ERROR, 0, False, ("AttributeError", "other"))
+        stats.add(OUTCOME_ERROR, 0, False, ("FuzzGameTimeout", "slow"))
+        self.assertEqual(stats.completed, 1)
+        self.assertEqual(stats.win_rate, 1.0)
+        summary = stats.to_dict()
+        self.assertEqual(summary["error_types"], {"AttributeError": 2, "FuzzGameTimeout": 1})
+        self.assertEqual(summary["error_messages"]["AttributeError"], "boom")
+        summary["stop_reason"] = None
+        text = format_matchup_summary(summary)
+        self.assertIn("AttributeError 2판", text)
+        self.assertIn("[경고]", text)
+
+
+class TestSimulateMatchups(unittest.TestCase):
+    """실제 게임을 진행하는 simulate_matchups의 집계를 검증하는 클래스입니다."""
+
+    @classmethod
+    def setUpClass(cls):
+        """카드 데이터베이스를 적재합니다."""
+        load_cards()
+
+    def test_counts_are_consistent(self):
+        """완료 게임과 오류 게임의 합이 전체 게임 수이고 오류 유형별 개수의 합이 오류 수인지 검증합니다."""
+        summary = simulate_matchups(DECK_PATHS[0], DECK_PATHS[1], n_games=6, workers=1)
+        self.assertEqual(summary["games"], 6)
+        self.assertEqual(summary["completed"] + summary["errors"], 6)
+        self.assertEqual(summary["deck_a_wins"] + summary["deck_b_wins"] + summary["draws"], summary["completed"])
+        self.assertEqual(sum(summary["error_types"].values()), summary["errors"])
+        low, high = summary["deck_a_win_rate_ci"]
+        self.assertLessEqual(low, summary["deck_a_win_rate"])
+        self.assertLessEqual(summary["deck_a_win_rate"], high)
+
+
+if __name__ == '__main__':
+    unittest.main()
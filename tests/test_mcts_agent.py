@@ -0,0 +1,114 @@
+# 역할 정의. MCTS 에이전트가 시간 예산과 효과 해결 횟수 한도를 지키고 탐색 뒤 게임 상태를 그대로 두며 루트 병렬 탐색도 합법 행동을 고르는지 검증하는 테스트 클래스입니다.
+
+import multiprocessing
+import random
+import time
+import unittest
+
+from src.engine.mcts_agent import MCTSAgent
+from tests.game_helper import board_fingerprint, create_game, play_random_actions
+
+TIME_SLACK = 0.5  # 시간 예산 검사에서 허용하는 초과 시간(초)입니다. 마지막 효과 해결과 루트 복원에 드는 시간을 덮습니다.
+
+
+def midgame_position(seed: int):
+    """몇 턴 진행하여 현재 턴 플레이어에게 행동이 둘 이상 있는 국면의 (게임, 플레이어 ID)를 반환합니다."""
+    game = create_game(seed)
+    rng = random.Random(seed)
+    play_random_actions(game, rng, 12)
+    while True:
+        player_id = game.game_state_manager.current_turn_player_id
+        game.process_player_choice()
+        if len(game.legal_actions(player_id)) > 1:
+            return game, player_id
+        play_random_actions(game, rng, 1)
+
+
+def position_state(game):
+    """탐색 전후를 비교할 국면 요약, 국면 해시, 게임 난수 상태, 의사결정 제공자 난수 상태를 반환합니다."""
+    return board_fingerprint(game), game.game_state_manager.recompute_state_hash(), game.rng.getstate(), game.gui.rng.getstate()
+
+
+class TestMCTSAgent(unittest.TestCase):
+    """MCTSAgent의 예산 준수와 상태 보존을 검증하는 클래스입니다."""
+
+    def test_time_budget(self):
+        """시간 예산만 주면 예산 안에 행동을 고르고, 효과 해결이 느려도 해결 때마다 예산을 검사하여 예산을 크게 넘기지 않는지 검증합니다."""
+        game, player_id = midgame_position(0)
+        agent = MCTSAgent(time_budget=0.3, rng=random.Random(0))
+        start = time.monotonic()
+        agent.choose_action(game, player_id)
+        self.assertLess(time.monotonic() - start, 0.3 + TIME_SLACK)
+
+        effect_processor = game.effect_processor
+        resolve_effect = effect_processor.resolve_effect
+
+        def slow_resolve_effect(*args, **kwargs):
+            time.sleep(0.05)
+            return resolve_effect(*args, **kwargs)
+
+        effect_processor.resolve_effect = slow_resolve_effect
+        start = time.monotonic()
+        agent.choose_action(game, player_id)
+        self.assertLess(time.monotonic() - start, 0.3 + TIME_SLACK)
+        self.assertIs(effect_processor.resolve_effect, slow_resolve_effect)
+
+    def test_iteration_budget(self):
+        """시간 예산 없이 반복 횟수 예산만 주면 정확히 그 횟수만큼 탐색하는지 검증합니다."""
+        game, player_id = midgame_position(1)
+        agent = MCTSAgent(time_budget=None, iterations=6, rng=random.Random(1))
+        stats, iteration_count = agent._search(game, player_id, 1, None, agent.iterations)
+        self.assertEqual(iteration_count, 6)
+        self.assertLessEqual(sum(visits for visits, _ in stats.values()), 6)
+
+    def test_resolve_budget(self):
+        """탐색 반복 한 번의 효과 해결 횟수가 rollout_step_limit을 넘지 않고 탐색 뒤 resolve_effect가 원래대로 돌아오는지 검증합니다."""
+        game, player_id = midgame_position(2)
+        effect_processor = game.effect_processor
+        agent = MCTSAgent(time_budget=None, iterations=4, rng=random.Random(2), rollout_step_limit=3)
+        agent._search(game, player_id, 2, None, agent.iterations)
+        self.assertNotIn("resolve_effect", effect_processor.__dict__)
+
+        calls = []
+        resolve_effect = effect_processor.resolve_effect
+
+        def counting_resolve_effect(*args, **kwargs):
+            calls.append(args)
+            return resolve_effect(*args, **kwargs)
+
+        effect_processor.resolve_effect = counting_resolve_effect
+        _, iteration_count = agent._search(game, player_id, 2, None, agent.iterations)
+        self.assertEqual(iteration_count, 4)
+        self.assertGreater(len(calls), 0)
+        self.assertLessEqual(len(calls), 3 * iteration_count)
+        self.assertIs(effect_processor.resolve_effect, counting_resolve_effect)
+
+    def test_state_unchanged(self):
+        """choose_action 뒤에 국면 요약, 국면 해시, 게임과 의사결정 제공자의 난수 상태, 합법 행동이 호출 전과 같은지 검증합니다."""
+        game, player_id = midgame_position(3)
+        before = position_state(game)
+        legal_actions = game.legal_actions(player_id)
+        agent = MCTSAgent(time_budget=None, iterations=20, rng=random.Random(3))
+        action = agent.choose_action(game, player_id)
+        self.assertIn(action, legal_actions)
+        self.assertEqual(position_state(game), before)
+        self.assertEqual(game.legal_actions(player_id), legal_actions)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "루트 병렬 탐색은 fork가 필요합니다.")
+    def test_root_parallel(self):
+        """워커 두 개로 루트 병렬 탐색을 하면 합법 행동을 고르고 게임 상태를 그대로 두는지 검증합니다."""
+        game, player_id = midgame_position(4)
+        before = position_state(game)
+        legal_actions = game.legal_actions(player_id)
+        agent = MCTSAgent(time_budget=None, iterations=8, workers=2, rng=random.Random(4))
+        try:
+            self.assertIn(agent.choose_action(game, player_id), legal_actions)
+            self.assertIsNotNone(agent._pool)
+        finally:
+            agent.close()
+        self.assertIsNone(agent._pool)
+        self.assertEqual(position_state(game), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+# 역할 정의. 게임 스냅샷과 복원이 국면을 그대로 되돌리고 복원 뒤의 진행도 같게 재현하는지 검증하는 테스트 클래스입니다.
+
+import unittest
+
+from tests.game_helper import board_fingerprint, create_game, game_rounds, play_random_actions
+
+
+class TestSnapshotRestore(unittest.TestCase):
+    """Game.snapshot과 Game.restore의 왕복을 실제 게임 진행 중에 검증하는 클래스입니다."""
+
+    def test_round_trip(self):
+        """스냅샷 뒤에 진행한 행동을 복원하면 국면 요약이 스냅샷 시점과 같아지고,
+        같은 선택으로 다시 진행하면 같은 행동과 국면이 재현되는지 검증합니다. 게임 난수 상태도 함께 복원되어야 합니다."""
+        rounds = 0
+        for seed, game, rng in game_rounds():
+            snapshot = game.snapshot()
+            before = board_fingerprint(game)
+            states = rng.getstate(), game.gui.rng.getstate()
+            actions = play_random_actions(game, rng, 5)
+            after = board_fingerprint(game)
+
+            game.restore(snapshot)
+            self.assertEqual(board_fingerprint(game), before, f"seed {seed} round {rounds}")
+            rng.setstate(states[0])
+            game.gui.rng.setstate(states[1])
+            self.assertEqual(play_random_actions(game, rng, 5), actions, f"seed {seed} round {rounds}")
+            self.assertEqual(board_fingerprint(game), after, f"seed {seed} round {rounds}")
+            rounds += 1
+        self.assertGreater(rounds, 5)
+
+    def test_restore_rejects_other_game(self):
+        """다른 게임의 스냅샷으로 복원하면 ValueError가 발생하는지 검증합니다."""
+        snapshot = create_game(0).snapshot()
+        with self.assertRaises(ValueError):
+            create_game(1).restore(snapshot)
+
+
+if __name__ == '__main__':
+    unittest.main()
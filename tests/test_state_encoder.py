@@ -0,0 +1,149 @@
+# 역할 정의. NumPy 국면 인코더의 배열 배치, 키워드 비트마스크, 배열 재사용, 일괄 휴리스틱 평가를 검증하는 테스트 클래스입니다.
+
+import random
+import unittest
+
+import numpy as np
+
+from src.common.enums import CardType
+from src.engine.mcts_agent import MCTSAgent
+from src.engine.state_encoder import (EMPTY_HAND_COST, FIELD_FEATURES, FIELD_SLOTS, HAND_SLOTS, KEYWORD_TYPES,
+                                      PLAYER_FEATURES, StateEncoder, keyword_mask)
+from tests.game_helper import MAX_GAME_ROUNDS, game_rounds, play_random_actions
+
+
+class KeywordCard:
+    """get_keywords만 가진 키워드 비트마스크 검사용 카드입니다."""
+
+    def __init__(self, keywords):
+        """KeywordCard 클래스의 생성자입니다."""
+        self.keywords = keywords
+
+    def get_keywords(self):
+        """카드가 가진 키워드 집합을 반환합니다."""
+        return self.keywords
+
+
+def expected_sides(game, player_id):
+    """인코딩 순서대로 기준 플레이어와 상대의 (플레이어 특성, 필드 카드 목록, 손패 코스트 목록)을 반환합니다."""
+    gsm = game.game_state_manager
+    sides = []
+    for side_player_id in (player_id, gsm.opponent_id[player_id]):
+        player = gsm.players[side_player_id]
+        sides.append(([player.current_defense, player.max_defense, player.current_pp, player.max_pp,
+                       player.current_ep, player.current_sep, player.extra_pp,
+                       player.hand.size(), player.deck.size(), player.graveyard.size()],
+                      player.field.get_cards(), [card.current_cost for card in player.hand.get_cards()]))
+    return sides
+
+
+def encoder_arrays(encoder):
+    """인코더의 배열들을 고정된 순서로 반환합니다."""
+    return encoder.field, encoder.field_keywords, encoder.hand_costs, encoder.players
+
+
+class TestStateEncoder(unittest.TestCase):
+    """StateEncoder와 keyword_mask를 실제 게임 국면으로 검증하는 클래스입니다."""
+
+    def test_layout(self):
+        """배열 모양과 자료형, 그리고 진영 0이 기준 플레이어인 진영별 플레이어 특성, 필드 슬롯, 손패 코스트 배치를 검증합니다."""
+        encoder = StateEncoder(3)
+        self.assertEqual((encoder.field.shape, encoder.field.dtype), ((3, 2, FIELD_SLOTS, FIELD_FEATURES), np.int16))
+        self.assertEqual((encoder.field_keywords.shape, encoder.field_keywords.dtype), ((3, 2, FIELD_SLOTS), np.uint64))
+        self.assertEqual((encoder.hand_costs.shape, encoder.hand_costs.dtype), ((3, 2, HAND_SLOTS), np.int16))
+        self.assertEqual((encoder.players.shape, encoder.players.dtype), ((3, 2, PLAYER_FEATURES), np.int16))
+
+        saw_field = False
+        for seed, game, rng in game_rounds((0,)):
+            player_id = game.game_state_manager.current_turn_player_id
+            encoder.encode(1, game.game_state_manager, player_id)
+            for side, (player_features, field_cards, hand_costs) in enumerate(expected_sides(game, player_id)):
+                self.assertEqual(encoder.players[1, side].tolist(), player_features)
+                for slot in range(FIELD_SLOTS):
+                    row = encoder.field[1, side, slot].tolist()
+                    if slot >= len(field_cards):
+                        self.assertEqual(row, [0] * FIELD_FEATURES)
+                        self.assertEqual(int(encoder.field_keywords[1, side, slot]), 0)
+                        continue
+                    card = field_cards[slot]
+                    self.assertEqual(row, [card.current_attack or 0, card.current_defense or 0, card.max_defense or 0,
+                                           int(card.is_evolved), int(card.is_super_evolved), int(card.is_engaged),
+                                           int(card.is_summoned), 1, int(card.get_type() == CardType.FOLLOWER)])
+                    self.assertEqual(int(encoder.field_keywords[1, side, slot]), keyword_mask(card))
+                    saw_field = True
+                self.assertEqual(encoder.hand_costs[1, side].tolist(),
+                                 hand_costs + [EMPTY_HAND_COST] * (HAND_SLOTS - len(hand_costs)))
+            play_random_actions(game, rng, 1)
+        self.assertTrue(saw_field)
+        # 기록하지 않은 위치는 초기값 그대로입니다.
+        self.assertFalse(encoder.field[0].any() or encoder.players[2].any())
+        self.assertTrue((encoder.hand_costs[0] == EMPTY_HAND_COST).all())
+
+    def test_keyword_mask(self):
+        """키워드마다 서로 다른 비트를 쓰고 카드의 비트마스크가 가진 키워드의 비트 합이며 to_matrix가 같은 비트로 풀어내는지 검증합니다."""
+        self.assertEqual([keyword_mask(KeywordCard({keyword})) for keyword in KEYWORD_TYPES],
+                         [1 << bit for bit in range(len(KEYWORD_TYPES))])
+        self.assertEqual(keyword_mask(KeywordCard(set(KEYWORD_TYPES))), (1 << len(KEYWORD_TYPES)) - 1)
+
+        saw_keyword = False
+        encoder = StateEncoder(1)
+        offset = 2 * PLAYER_FEATURES + 2 * FIELD_SLOTS * FIELD_FEATURES
+        for seed, game, rng in game_rounds((1,)):
+            player_id = game.game_state_manager.current_turn_player_id
+            for _, field_cards, _ in expected_sides(game, player_id):
+                for card in field_cards:
+                    keywords = set(card.get_keywords())
+                    mask = keyword_mask(card)
+                    self.assertEqual({keyword for bit, keyword in enumerate(KEYWORD_TYPES) if mask >> bit & 1}, keywords)
+                    saw_keyword |= bool(keywords)
+            encoder.encode(0, game.game_state_manager, player_id)
+            keyword_bits = encoder.to_matrix()[0, offset:offset + 2 * FIELD_SLOTS * len(KEYWORD_TYPES)]
+            expected_bits = [float(int(mask) >> bit & 1) for mask in encoder.field_keywords[0].ravel()
+                             for bit in range(len(KEYWORD_TYPES))]
+            self.assertEqual(keyword_bits.tolist(), expected_bits, f"seed {seed}")
+            play_random_actions(game, rng, 1)
+        self.assertTrue(saw_keyword)
+
+    def test_buffer_reuse(self):
+        """게임을 진행하며 같은 위치에 계속 다시 기록해도 배열을 새로 할당하지 않고
+        카드가 빠진 필드 슬롯과 손패 슬롯에 이전 국면의 값이 남지 않아 새 인코더의 결과와 같은지 검증합니다."""
+        encoder = StateEncoder(2)
+        arrays = encoder_arrays(encoder)
+        for seed, game, rng in game_rounds((2,)):
+            player_id = game.game_state_manager.current_turn_player_id
+            encoder.encode(0, game.game_state_manager, player_id)
+            fresh = StateEncoder(1)
+            fresh.encode(0, game.game_state_manager, player_id)
+            for reused, expected in zip(encoder_arrays(encoder), encoder_arrays(fresh)):
+                np.testing.assert_array_equal(reused[0], expected[0], f"seed {seed}")
+            play_random_actions(game, rng, 1)
+        for before, after in zip(arrays, encoder_arrays(encoder)):
+            self.assertIs(before, after)
+
+        self.assertEqual(encoder.encode_many([(game.game_state_manager, player_id)] * 2), 2)
+        with self.assertRaises(ValueError):
+            encoder.encode_many([(game.game_state_manager, player_id)] * 2, start=1)
+
+    def test_heuristic_scores_match_agent(self):
+        """일괄 휴리스틱 평가가 승부가 난 국면을 포함해 MCTSAgent의 국면 평가와 같은 값인지 검증합니다."""
+        agent = MCTSAgent(iterations=1, rng=random.Random(3))
+        encoder = StateEncoder(MAX_GAME_ROUNDS + 1)
+        expected = []
+        for seed, game, rng in game_rounds((3,)):
+            player_id = game.game_state_manager.current_turn_player_id
+            encoder.encode(len(expected), game.game_state_manager, player_id)
+            expected.append(agent._evaluate(game, player_id))
+            play_random_actions(game, rng, 1)
+        encoder.encode(len(expected), game.game_state_manager, player_id)
+        expected.append(agent._evaluate(game, player_id))
+        self.assertIn(expected[-1], (0.0, 0.5, 1.0))
+        np.testing.assert_allclose(encoder.heuristic_scores(len(expected)), expected)
+
+    def test_rejects_empty_capacity(self):
+        """용량이 1보다 작으면 ValueError가 발생하는지 검증합니다."""
+        with self.assertRaises(ValueError):
+            StateEncoder(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# 역할 정의. 증분 갱신한 조브리스트 국면 해시가 국면 전체에서 다시 계산한 해시와 일치하는지 검증하는 테스트 클래스입니다.
+
+import random
+import unittest
+
+from src.common.enums import Zone
+from src.common.zobrist import zobrist_key
+from tests.game_helper import game_rounds, play_random_actions
+
+
+class TestStateHash(unittest.TestCase):
+    """state_hash와 recompute_state_hash를 실제 게임 진행 중에 비교하는 클래스입니다."""
+
+    def test_incremental_hash_matches_recompute(self):
+        """행동을 적용할 때마다 증분 해시가 다시 계산한 해시와 같은지 검증합니다."""
+        for seed, game, rng in game_rounds():
+            gsm = game.game_state_manager
+            self.assertEqual(gsm.state_hash, gsm.recompute_state_hash(), f"seed {seed} turn {gsm.turn_number}")
+            play_random_actions(game, rng, 1)
+            self.assertEqual(gsm.state_hash, gsm.recompute_state_hash(), f"seed {seed} turn {gsm.turn_number}")
+
+    def test_hash_after_undo_and_restore(self):
+        """저널 되돌리기와 스냅샷 복원 뒤에 해시가 원래 값과 다시 계산한 값 모두와 같은지 검증합니다."""
+        for seed, game, rng in game_rounds():
+            gsm = game.game_state_manager
+            original = gsm.state_hash
+            mark = game.mark()
+            play_random_actions(game, random.Random(rng.random()), 4)
+            game.undo_to(mark)
+            self.assertEqual(gsm.state_hash, original, f"seed {seed}")
+            self.assertEqual(gsm.recompute_state_hash(), original, f"seed {seed}")
+            game.stop_journal()
+
+            snapshot = game.snapshot()
+            play_random_actions(game, random.Random(rng.random()), 4)
+            game.restore(snapshot)
+            self.assertEqual(gsm.state_hash, original, f"seed {seed}")
+            self.assertEqual(gsm.recompute_state_hash(), original, f"seed {seed}")
+            play_random_actions(game, rng, 3)
+
+    def test_key_table(self):
+        """키 표에서 찾은 키가 호출마다 같고 값이나 엔티티가 다르면 달라지며 None은 해시에 영향을 주지 않는지 검증합니다."""
+        self.assertEqual(zobrist_key('3', 'current_attack', 2), zobrist_key('3', 'current_attack', 2))
+        self.assertNotEqual(zobrist_key('3', 'current_attack', 2), zobrist_key('3', 'current_attack', 3))
+        self.assertNotEqual(zobrist_key('3', 'current_attack', 2), zobrist_key('4', 'current_attack', 2))
+        self.assertNotEqual(zobrist_key('3', ('zone', 'player1'), Zone.FIELD), zobrist_key('3', ('zone', 'player1'), Zone.HAND))
+        self.assertEqual(zobrist_key('3', 'countdown_value', None), 0)
+        # 키 표 범위를 벗어난 값도 결정적인 키를 가집니다.
+        self.assertEqual(zobrist_key('3', 'current_defense', 1000), zobrist_key('3', 'current_defense', 1000))
+        self.assertNotEqual(zobrist_key('3', 'current_defense', 1000), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
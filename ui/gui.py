@@ -1,8 +1,11 @@
 # 역할 정의. Tkinter를 기반으로 게임 화면을 표시하고 플레이어 입력을 받는 GUI 클래스입니다.
 
+import threading
 import tkinter as tk
 from tkinter import ttk
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+from src.engine.decision_provider import DecisionProvider
 
 if TYPE_CHECKING:
     from src.engine.game_state_manager import GameStateManager
@@ -10,7 +13,10 @@ if TYPE_CHECKING:
     from src.common.enums import CardType
 
 
-class GameGUI:
+BACKGROUND_POLL_MS = 50  # 작업 스레드가 끝났는지 확인하는 간격(밀리초)입니다.
+
+
+class GameGUI(DecisionProvider):
     """게임 상태를 Tkinter 기반 창에 시각적으로 표현하는 GUI 클래스입니다."""
     def __init__(self, game_state_manager: 'GameStateManager'):
         """GameGUI 클래스의 생성자입니다."""
@@ -183,6 +189,35 @@ class GameGUI:
                 self.mulligan_selected_card_ids.append(card_id)
         self.mulligan_window.destroy()
 
+    def run_in_background(self, func: Callable[..., Any], *args: Any) -> Any:
+        """func(*args)를 작업 스레드에서 실행하고 끝날 때까지 Tk 이벤트를 처리하며 기다린 뒤 반환값을 돌려줍니다.
+        AI 탐색처럼 오래 걸리는 계산 중에도 창이 멈추지 않게 할 때 씁니다. func는 위젯을 건드리면 안 되며
+        완료 여부는 root.after 콜백이 메인 스레드에서 확인합니다. func에서 난 예외는 메인 스레드에서 다시 발생시킵니다."""
+        result: Dict[str, Any] = {}
+
+        def work():
+            """작업 스레드에서 func를 실행하고 결과나 예외를 담아 둡니다."""
+            try:
+                result["value"] = func(*args)
+            except BaseException as exc:
+                result["error"] = exc
+
+        done = tk.BooleanVar(master=self.root, value=False)
+        worker = threading.Thread(target=work, daemon=True)
+        worker.start()
+        self.root.after(BACKGROUND_POLL_MS, self._poll_background, worker, done)
+        self.root.wait_variable(done)
+        if "error" in result:
+            raise result["error"]
+        return result["value"]
+
+    def _poll_background(self, worker: threading.Thread, done: tk.BooleanVar):
+        """작업 스레드가 끝났으면 run_in_background의 대기를 풀고 아니면 다시 예약합니다."""
+        if worker.is_alive():
+            self.root.after(BACKGROUND_POLL_MS, self._poll_background, worker, done)
+        else:
+            done.set(True)
+
     def get_user_choice(self, prompt: str, choices: dict[str, any]) -> any:
         """사용자에게 선택지를 제시하고 선택된 값을 반환합니다."""
         self.user_choice_var = tk.StringVar()